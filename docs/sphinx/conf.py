@@ -56,6 +56,7 @@
     "../../python_modules/libraries/dagster-databricks",
     "../../python_modules/libraries/dagster-duckdb",
     "../../python_modules/libraries/dagster-duckdb-pandas",
+    "../../python_modules/libraries/dagster-duckdb-pyarrow",
     "../../python_modules/libraries/dagster-duckdb-pyspark",
 
     ### autodoc_dagster extension
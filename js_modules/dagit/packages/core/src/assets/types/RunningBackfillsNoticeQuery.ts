@@ -13,7 +13,7 @@ export interface RunningBackfillsNoticeQuery_partitionBackfillsOrError_PythonErr
 
 export interface RunningBackfillsNoticeQuery_partitionBackfillsOrError_PartitionBackfills_results {
   __typename: "PartitionBackfill";
-  partitionSetName: string;
+  partitionSetName: string | null;
   backfillId: string;
 }
 
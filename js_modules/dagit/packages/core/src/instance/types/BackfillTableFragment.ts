@@ -64,7 +64,7 @@ export interface BackfillTableFragment {
   partitionNames: string[];
   numPartitions: number;
   timestamp: number;
-  partitionSetName: string;
+  partitionSetName: string | null;
   partitionSet: BackfillTableFragment_partitionSet | null;
   partitionStatuses: BackfillTableFragment_partitionStatuses;
   assetSelection: BackfillTableFragment_assetSelection[] | null;
@@ -64,7 +64,7 @@ export interface InstanceBackfillsQuery_partitionBackfillsOrError_PartitionBackf
   numRequested: number;
   numPartitions: number;
   timestamp: number;
-  partitionSetName: string;
+  partitionSetName: string | null;
   partitionSet: InstanceBackfillsQuery_partitionBackfillsOrError_PartitionBackfills_results_partitionSet | null;
   error: InstanceBackfillsQuery_partitionBackfillsOrError_PartitionBackfills_results_error | null;
   partitionNames: string[];
@@ -68,7 +68,7 @@ export interface JobBackfillsQuery_partitionSetOrError_PartitionSet_backfills {
   partitionNames: string[];
   numPartitions: number;
   timestamp: number;
-  partitionSetName: string;
+  partitionSetName: string | null;
   partitionSet: JobBackfillsQuery_partitionSetOrError_PartitionSet_backfills_partitionSet | null;
   partitionStatuses: JobBackfillsQuery_partitionSetOrError_PartitionSet_backfills_partitionStatuses;
   assetSelection: JobBackfillsQuery_partitionSetOrError_PartitionSet_backfills_assetSelection[] | null;
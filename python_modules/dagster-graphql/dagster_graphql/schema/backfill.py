@@ -111,7 +111,7 @@ class Meta:
     fromFailure = graphene.NonNull(graphene.Boolean)
     reexecutionSteps = non_null_list(graphene.String)
     assetSelection = graphene.List(graphene.NonNull(GrapheneAssetKey))
-    partitionSetName = graphene.NonNull(graphene.String)
+    partitionSetName = graphene.String()
     timestamp = graphene.NonNull(graphene.Float)
     partitionSet = graphene.Field("dagster_graphql.schema.partition_sets.GraphenePartitionSet")
     runs = graphene.Field(
@@ -135,7 +135,9 @@ def __init__(self, backfill_job):
 
         super().__init__(
             backfillId=backfill_job.backfill_id,
-            partitionSetName=backfill_job.partition_set_origin.partition_set_name,
+            partitionSetName=backfill_job.partition_set_origin.partition_set_name
+            if backfill_job.partition_set_origin
+            else None,
             status=backfill_job.status,
             fromFailure=bool(backfill_job.from_failure),
             reexecutionSteps=backfill_job.reexecution_steps,
@@ -146,6 +148,8 @@ def __init__(self, backfill_job):
 
     def _get_partition_set(self, graphene_info):
         origin = self._backfill_job.partition_set_origin
+        if not origin:
+            return None
         location_name = origin.external_repository_origin.repository_location_origin.location_name
         repository_name = origin.external_repository_origin.repository_name
         if not graphene_info.context.has_repository_location(location_name):
@@ -255,7 +259,11 @@ def resolve_partitionSet(self, graphene_info):
         )
 
     def resolve_partitionStatuses(self, graphene_info):
-        partition_set_name = self._backfill_job.partition_set_origin.partition_set_name
+        partition_set_name = (
+            self._backfill_job.partition_set_origin.partition_set_name
+            if self._backfill_job.partition_set_origin
+            else None
+        )
         partition_run_data = self._get_partition_run_data(graphene_info)
         return partition_statuses_from_run_partition_data(
             partition_set_name,
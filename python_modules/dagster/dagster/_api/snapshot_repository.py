@@ -3,18 +3,23 @@
 import dagster._check as check
 from dagster._core.errors import DagsterUserCodeProcessError
 from dagster._core.host_representation.external_data import (
+    ExternalPipelineData,
     ExternalRepositoryData,
     ExternalRepositoryErrorData,
 )
 from dagster._serdes import deserialize_as
+from dagster._utils.error import SerializableErrorInfo
 
 if TYPE_CHECKING:
     from dagster._core.host_representation import RepositoryLocation
+    from dagster._core.host_representation.handle import RepositoryHandle
     from dagster._grpc.client import DagsterGrpcClient
 
 
 def sync_get_streaming_external_repositories_data_grpc(
-    api_client: "DagsterGrpcClient", repository_location: "RepositoryLocation"
+    api_client: "DagsterGrpcClient",
+    repository_location: "RepositoryLocation",
+    defer_snapshots: bool = False,
 ) -> Mapping[str, ExternalRepositoryData]:
     from dagster._core.host_representation import ExternalRepositoryOrigin, RepositoryLocation
 
@@ -27,7 +32,8 @@ def sync_get_streaming_external_repositories_data_grpc(
                 external_repository_origin=ExternalRepositoryOrigin(
                     repository_location.origin,
                     repository_name,
-                )
+                ),
+                defer_snapshots=defer_snapshots,
             )
         )
 
@@ -46,3 +52,20 @@ def sync_get_streaming_external_repositories_data_grpc(
 
         repo_datas[repository_name] = result
     return repo_datas
+
+
+def sync_get_external_job_data_grpc(
+    api_client: "DagsterGrpcClient", repository_handle: "RepositoryHandle", job_name: str
+) -> ExternalPipelineData:
+    from dagster._core.host_representation.handle import RepositoryHandle
+
+    check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
+    check.str_param(job_name, "job_name")
+
+    result = api_client.external_job(repository_handle.get_external_origin(), job_name)
+    if result.serialized_error:
+        raise DagsterUserCodeProcessError.from_error_info(
+            deserialize_as(result.serialized_error, SerializableErrorInfo)
+        )
+
+    return deserialize_as(result.serialized_job_data, ExternalPipelineData)
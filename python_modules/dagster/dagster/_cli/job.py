@@ -30,7 +30,7 @@
 from dagster._core.execution.backfill import (
     BulkActionStatus,
     PartitionBackfill,
-    create_backfill_run,
+    create_backfill_runs,
 )
 from dagster._core.host_representation import (
     ExternalPipeline,
@@ -836,15 +836,14 @@ def _execute_backfill_command_at_location(
 
         assert isinstance(partition_execution_data, ExternalPartitionSetExecutionParamData)
 
-        for partition_data in partition_execution_data.partition_data:
-            pipeline_run = create_backfill_run(
-                instance,
-                repo_location,
-                external_pipeline,
-                partition_set,
-                backfill_job,
-                partition_data,
-            )
+        for pipeline_run in create_backfill_runs(
+            instance,
+            repo_location,
+            external_pipeline,
+            partition_set,
+            backfill_job,
+            partition_execution_data.partition_data,
+        ):
             if pipeline_run:
                 instance.submit_run(pipeline_run.run_id, workspace)
 
@@ -1,4 +1,4 @@
-from typing import Dict, Generator, cast
+from typing import Dict, Generator, Set, cast
 
 import dagster._check as check
 from dagster._config import Field
@@ -31,10 +31,59 @@ def iterate_config_types(config_type: ConfigType) -> Generator[ConfigType, None,
     yield config_type
 
 
+def _iterate_unique_config_types(
+    config_type: ConfigType, seen_keys: Set[str]
+) -> Generator[ConfigType, None, None]:
+    # like iterate_config_types, but does not descend in to types that have already been seen,
+    # since every type with the same key has the same structure
+    if config_type.key in seen_keys:
+        return
+    seen_keys.add(config_type.key)
+
+    if config_type.kind == ConfigTypeKind.MAP:
+        yield from _iterate_unique_config_types(config_type.key_type, seen_keys)  # type: ignore
+        yield from _iterate_unique_config_types(config_type.inner_type, seen_keys)  # type: ignore
+
+    if config_type.kind == ConfigTypeKind.ARRAY or config_type.kind == ConfigTypeKind.NONEABLE:
+        yield from _iterate_unique_config_types(config_type.inner_type, seen_keys)  # type: ignore
+
+    if ConfigTypeKind.has_fields(config_type.kind):
+        fields = cast(Dict[str, Field], config_type.fields)  # type: ignore
+        for field in fields.values():
+            yield from _iterate_unique_config_types(field.config_type, seen_keys)
+
+    if config_type.kind == ConfigTypeKind.SCALAR_UNION:
+        yield from _iterate_unique_config_types(config_type.scalar_type, seen_keys)  # type: ignore
+        yield from _iterate_unique_config_types(config_type.non_scalar_type, seen_keys)  # type: ignore
+
+    yield config_type
+
+
+def config_types_by_key(config_type: ConfigType) -> Dict[str, ConfigType]:
+    """All of the config types reachable from a config type, including itself, by key."""
+    check.inst_param(config_type, "config_type", ConfigType)
+
+    # config types do not change once constructed, so this is computed once per type
+    types_by_key = getattr(config_type, "_config_types_by_key", None)
+    if types_by_key is None:
+        types_by_key = {ct.key: ct for ct in _iterate_unique_config_types(config_type, set())}
+        setattr(config_type, "_config_types_by_key", types_by_key)
+
+    return types_by_key
+
+
 def config_schema_snapshot_from_config_type(
     config_type: ConfigType,
 ) -> ConfigSchemaSnapshot:
     check.inst_param(config_type, "config_type", ConfigType)
-    return ConfigSchemaSnapshot(
-        {ct.key: snap_from_config_type(ct) for ct in iterate_config_types(config_type)}
-    )
+
+    # validating or resolving defaults against a schema starts by building its snapshot, so cache
+    # it on the type rather than re-walking large run config schemas on every call
+    snapshot = getattr(config_type, "_config_schema_snapshot", None)
+    if snapshot is None:
+        snapshot = ConfigSchemaSnapshot(
+            {key: snap_from_config_type(ct) for key, ct in config_types_by_key(config_type).items()}
+        )
+        setattr(config_type, "_config_schema_snapshot", snapshot)
+
+    return snapshot
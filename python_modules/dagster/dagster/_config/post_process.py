@@ -1,5 +1,5 @@
 import sys
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Callable, Dict, List, Optional, cast
 
 import dagster._check as check
 from dagster._utils import ensure_single_item, frozendict, frozenlist
@@ -13,21 +13,38 @@
 
 
 def post_process_config(config_type: ConfigType, config_value: Any) -> EvaluateValueResult:
-    ctx = TraversalContext.from_config_type(
-        config_type=check.inst_param(config_type, "config_type", ConfigType),
-        stack=EvaluationStack(entries=[]),
-        traversal_type=TraversalType.RESOLVE_DEFAULTS_AND_POSTPROCESS,
+    return _process_config(
+        check.inst_param(config_type, "config_type", ConfigType),
+        config_value,
+        TraversalType.RESOLVE_DEFAULTS_AND_POSTPROCESS,
     )
-    return _recursively_process_config(ctx, config_value)
 
 
 def resolve_defaults(config_type: ConfigType, config_value: Any) -> EvaluateValueResult:
+    return _process_config(
+        check.inst_param(config_type, "config_type", ConfigType),
+        config_value,
+        TraversalType.RESOLVE_DEFAULTS,
+    )
+
+
+def _process_config(
+    config_type: ConfigType, config_value: Any, traversal_type: TraversalType
+) -> EvaluateValueResult:
+    try:
+        return EvaluateValueResult.for_value(
+            _get_compiled_resolver(config_type, traversal_type)(config_value)
+        )
+    except _RequiresTraversal:
+        pass
+
+    # values the compiled resolver does not handle, like values that fail post-processing, are
+    # processed again by traversing the config type, which builds the errors
     ctx = TraversalContext.from_config_type(
-        config_type=check.inst_param(config_type, "config_type", ConfigType),
+        config_type=config_type,
         stack=EvaluationStack(entries=[]),
-        traversal_type=TraversalType.RESOLVE_DEFAULTS,
+        traversal_type=traversal_type,
     )
-
     return _recursively_process_config(ctx, config_value)
 
 
@@ -243,3 +260,207 @@ def _recurse_in_to_map(context: TraversalContext, config_value: Any) -> Evaluate
     return EvaluateValueResult.for_value(
         frozendict({key: result.value for key, result in results.items()})
     )
+
+
+# Compiled resolvers
+#
+# Like validation, resolving defaults and post-processing a value with _recursively_process_config
+# builds a TraversalContext and an EvaluateValueResult for every value in it. Instead, each config
+# type is compiled once into a resolver function, cached on the type, which returns the same value
+# as _recursively_process_config in a single pass, or raises _RequiresTraversal. Resolvers read the
+# fields and inner types of their type on every call, since shapes are interned by key and
+# re-initialized with the fields they are constructed with. Defaults are still resolved and
+# post-processed on every call, since post-processing can read from the environment.
+
+
+class _RequiresTraversal(Exception):
+    pass
+
+
+def _get_compiled_resolver(
+    config_type: ConfigType, traversal_type: TraversalType
+) -> Callable[[Any], Any]:
+    resolvers = getattr(config_type, "_compiled_resolvers", None)
+    if resolvers is None:
+        resolvers = {}
+        setattr(config_type, "_compiled_resolvers", resolvers)
+    if traversal_type not in resolvers:
+        resolvers[traversal_type] = _compile_resolver(config_type, traversal_type)
+    return resolvers[traversal_type]
+
+
+def _compile_resolver(
+    config_type: ConfigType, traversal_type: TraversalType
+) -> Callable[[Any], Any]:
+    resolver = _compile_defaults_resolver(config_type, traversal_type)
+
+    # skip types that do not override post_process, which returns the value unchanged
+    if (
+        traversal_type != TraversalType.RESOLVE_DEFAULTS_AND_POSTPROCESS
+        or type(config_type).post_process is ConfigType.post_process
+    ):
+        return resolver
+
+    def _resolve_and_post_process(config_value: Any) -> Any:
+        config_value = resolver(config_value)
+        try:
+            return config_type.post_process(config_value)
+        except PostProcessingError as exc:
+            raise _RequiresTraversal() from exc
+
+    return _resolve_and_post_process
+
+
+def _compile_defaults_resolver(
+    config_type: ConfigType, traversal_type: TraversalType
+) -> Callable[[Any], Any]:
+    kind = config_type.kind
+
+    if kind in (ConfigTypeKind.SCALAR, ConfigTypeKind.ENUM, ConfigTypeKind.ANY):
+        return lambda config_value: config_value
+    elif kind == ConfigTypeKind.SELECTOR:
+        return _compile_selector_resolver(config_type, traversal_type)
+    elif ConfigTypeKind.is_shape(kind):
+        return _compile_shape_resolver(config_type, traversal_type)
+    elif kind == ConfigTypeKind.ARRAY:
+        return _compile_array_resolver(config_type, traversal_type)
+    elif kind == ConfigTypeKind.MAP:
+        return _compile_map_resolver(config_type, traversal_type)
+    elif kind == ConfigTypeKind.NONEABLE:
+        return lambda config_value: (
+            None
+            if config_value is None
+            else _get_compiled_resolver(config_type.inner_type, traversal_type)(  # type: ignore
+                config_value
+            )
+        )
+    elif kind == ConfigTypeKind.SCALAR_UNION:
+        return lambda config_value: _get_compiled_resolver(
+            config_type.non_scalar_type  # type: ignore
+            if isinstance(config_value, (dict, list))
+            else config_type.scalar_type,  # type: ignore
+            traversal_type,
+        )(config_value)
+    else:
+        return _requires_traversal
+
+
+def _requires_traversal(_config_value: Any) -> Any:
+    raise _RequiresTraversal()
+
+
+def _compile_selector_resolver(
+    config_type: ConfigType, traversal_type: TraversalType
+) -> Callable[[Any], Any]:
+    def _resolve_selector(config_value: Any) -> Any:
+        fields = config_type.fields  # type: ignore
+        if config_value:
+            if not isinstance(config_value, dict) or len(config_value) != 1:
+                raise _RequiresTraversal()
+            field_name, incoming_field_value = next(iter(config_value.items()))
+        else:
+            if len(fields) != 1:
+                raise _RequiresTraversal()
+            field_name, field_def = next(iter(fields.items()))
+            incoming_field_value = field_def.default_value if field_def.default_provided else None
+
+        field_def = fields.get(field_name)
+        if field_def is None:
+            raise _RequiresTraversal()
+
+        field_type = field_def.config_type
+        return frozendict(
+            {
+                field_name: _get_compiled_resolver(field_type, traversal_type)(
+                    {}
+                    if incoming_field_value is None and ConfigTypeKind.has_fields(field_type.kind)
+                    else incoming_field_value
+                )
+            }
+        )
+
+    return _resolve_selector
+
+
+def _compile_shape_resolver(
+    config_type: ConfigType, traversal_type: TraversalType
+) -> Callable[[Any], Any]:
+    # for permissive composite fields, incoming fields that are not defined are passed through
+    is_permissive = config_type.kind == ConfigTypeKind.PERMISSIVE_SHAPE
+
+    def _resolve_shape(config_value: Any) -> Any:
+        if config_value is None:
+            config_value = {}
+        elif not isinstance(config_value, dict) or not all(
+            isinstance(key, str) for key in config_value
+        ):
+            raise _RequiresTraversal()
+
+        fields = config_type.fields  # type: ignore
+        field_aliases = getattr(config_type, "field_aliases", None) or {}
+
+        processed_fields = {}
+        for field_name, field_def in fields.items():
+            if field_name in config_value:
+                field_value = config_value[field_name]
+            elif field_name in field_aliases and field_aliases[field_name] in config_value:
+                field_value = config_value[field_aliases[field_name]]
+            elif field_def.default_provided:
+                field_value = field_def.default_value
+            elif field_def.is_required:
+                raise _RequiresTraversal()
+            else:
+                continue
+
+            processed_fields[field_name] = _get_compiled_resolver(
+                field_def.config_type, traversal_type
+            )(field_value)
+
+        if is_permissive:
+            for field_name, field_value in config_value.items():
+                if field_name not in fields:
+                    processed_fields[field_name] = field_value
+
+        return frozendict(processed_fields)
+
+    return _resolve_shape
+
+
+def _compile_array_resolver(
+    config_type: ConfigType, traversal_type: TraversalType
+) -> Callable[[Any], Any]:
+    def _resolve_array(config_value: Any) -> Any:
+        if not config_value:
+            return []
+
+        inner_type = config_type.inner_type  # type: ignore
+        if inner_type.kind != ConfigTypeKind.NONEABLE and any(
+            item is None for item in config_value
+        ):
+            raise _RequiresTraversal()
+
+        item_resolver = _get_compiled_resolver(inner_type, traversal_type)
+        return frozenlist([item_resolver(item) for item in config_value])
+
+    return _resolve_array
+
+
+def _compile_map_resolver(
+    config_type: ConfigType, traversal_type: TraversalType
+) -> Callable[[Any], Any]:
+    def _resolve_map(config_value: Any) -> Any:
+        if not config_value:
+            return {}
+
+        inner_type = config_type.inner_type  # type: ignore
+        if any(key is None for key in config_value.keys()):
+            raise _RequiresTraversal()
+        if inner_type.kind != ConfigTypeKind.NONEABLE and any(
+            value is None for value in config_value.values()
+        ):
+            raise _RequiresTraversal()
+
+        value_resolver = _get_compiled_resolver(inner_type, traversal_type)
+        return frozendict({key: value_resolver(value) for key, value in config_value.items()})
+
+    return _resolve_map
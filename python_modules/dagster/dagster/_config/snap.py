@@ -254,6 +254,17 @@ def snap_from_field(name, field):
 # type-ignores here are temporary until config type system overhauled
 def snap_from_config_type(config_type: ConfigType) -> ConfigTypeSnap:
     check.inst_param(config_type, "config_type", ConfigType)
+
+    # config types do not change once constructed, so their snaps are built once per type
+    config_type_snap = getattr(config_type, "_config_type_snap", None)
+    if config_type_snap is None:
+        config_type_snap = _build_snap_from_config_type(config_type)
+        setattr(config_type, "_config_type_snap", config_type_snap)
+
+    return config_type_snap
+
+
+def _build_snap_from_config_type(config_type: ConfigType) -> ConfigTypeSnap:
     return ConfigTypeSnap(
         key=config_type.key,
         given_name=config_type.given_name,
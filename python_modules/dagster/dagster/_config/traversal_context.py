@@ -5,8 +5,8 @@
 
 from .config_type import ConfigType
 from .field import Field
-from .iterate_types import config_schema_snapshot_from_config_type, iterate_config_types
-from .snap import ConfigFieldSnap, ConfigSchemaSnapshot, ConfigTypeSnap, snap_from_config_type
+from .iterate_types import config_schema_snapshot_from_config_type, config_types_by_key
+from .snap import ConfigFieldSnap, ConfigSchemaSnapshot, ConfigTypeSnap
 from .stack import EvaluationStack
 
 
@@ -131,23 +131,21 @@ def __init__(
         )
         self._config_type = check.inst_param(config_type, "config_type", ConfigType)
         self._traversal_type = check.inst_param(traversal_type, "traversal_type", TraversalType)
-        self._all_config_types = check.dict_param(
-            all_config_types, "all_config_types", key_type=str, value_type=ConfigType
-        )
+        # shared by every context in a traversal, so not re-checked entry by entry
+        self._all_config_types = check.dict_param(all_config_types, "all_config_types")
 
     @staticmethod
     def from_config_type(
         config_type: ConfigType, stack: EvaluationStack, traversal_type: TraversalType
     ) -> "TraversalContext":
-        all_config_types = list(iterate_config_types(config_type))
         config_schema_snapshot = config_schema_snapshot_from_config_type(config_type)
         return TraversalContext(
             config_schema_snapshot=config_schema_snapshot,
-            config_type_snap=snap_from_config_type(config_type),
+            config_type_snap=config_schema_snapshot.get_config_snap(config_type.key),
             config_type=config_type,
             stack=stack,
             traversal_type=traversal_type,
-            all_config_types={ct.key: ct for ct in all_config_types},
+            all_config_types=config_types_by_key(config_type),
         )
 
     @property
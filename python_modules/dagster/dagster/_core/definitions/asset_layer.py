@@ -81,6 +81,13 @@ def __new__(
         )
 
 
+def _asset_partitions_for_output(context: "OutputContext") -> AbstractSet[str]:
+    partition_key_range = context.asset_partition_key_range
+    if partition_key_range.start == partition_key_range.end:
+        return {partition_key_range.start}
+    return set(context.asset_partition_keys)
+
+
 def _resolve_input_to_destinations(
     name: str, node_def: NodeDefinition, handle: NodeHandle
 ) -> Sequence[NodeInputHandle]:
@@ -613,7 +620,7 @@ def from_graph_and_assets_node_mapping(
                 node_output_handle = NodeOutputHandle(
                     check.not_none(inner_node_handle), inner_output_def.name
                 )
-                partition_fn = lambda context: {context.partition_key}
+                partition_fn = _asset_partitions_for_output
                 asset_info_by_output[node_output_handle] = AssetOutputInfo(
                     asset_key,
                     partitions_fn=partition_fn if assets_def.partitions_def else None,
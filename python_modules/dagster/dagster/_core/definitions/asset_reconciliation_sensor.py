@@ -1,24 +1,36 @@
 # pylint: disable=anomalous-backslash-in-string
 import json
-from collections import defaultdict
-from datetime import datetime
-from typing import TYPE_CHECKING, Dict, Mapping, Optional, Set, Tuple, cast
+import threading
+import weakref
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Dict,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
-import pendulum
 import toposort
 
 import dagster._check as check
 from dagster._annotations import experimental
 from dagster._core.definitions.asset_selection import AssetSelection
 from dagster._core.storage.pipeline_run import IN_PROGRESS_RUN_STATUSES, RunsFilter
-from dagster._utils import utc_datetime_from_timestamp
+from dagster._serdes import serialize_dagster_namedtuple
 
-from .asset_selection import AssetSelection
+from .asset_selection import AssetSelection, Resolver
 from .events import AssetKey
 from .run_request import RunRequest
 from .sensor_definition import DefaultSensorStatus, MultiAssetSensorDefinition
 from .utils import check_valid_name
 
+# maximum number of materialization records read per query when consuming new materializations
+MATERIALIZATION_RECORDS_BATCH_SIZE = 1000
+
 if TYPE_CHECKING:
     from dagster._core.definitions import AssetsDefinition, SourceAsset
     from dagster._core.storage.event_log.base import EventLogRecord
@@ -30,15 +42,196 @@ def _get_upstream_mapping(
     source_assets,
 ) -> Mapping[AssetKey, Set[AssetKey]]:
     """Computes a mapping of assets in self._selection to their parents in the asset graph"""
-    upstream = defaultdict(set)
-    selection_resolved = list(selection.resolve([*assets, *source_assets]))
-    for a in selection_resolved:
-        a_parents = list(
-            AssetSelection.keys(a).upstream(depth=1).resolve([*assets, *source_assets])
+    # resolve the asset graph once, rather than once per selected asset
+    resolver = Resolver([*assets, *source_assets])
+    upstream_graph = resolver.asset_dep_graph["upstream"]
+    return {
+        a: {
+            AssetKey.from_user_string(p)
+            for p in upstream_graph.get(a.to_user_string(), set())
+            if p != a.to_user_string()
+        }
+        for a in resolver.resolve(selection)
+    }
+
+
+class _ReconciliationGraph(NamedTuple):
+    """The parents of each monitored asset, along with the monitored assets in topological order.
+    Computed once per repository definition.
+    """
+
+    upstream: Mapping[AssetKey, AbstractSet[AssetKey]]
+    toposorted_assets: Sequence[AssetKey]
+
+
+def _build_reconciliation_graph(selection, repository_def) -> _ReconciliationGraph:
+    upstream = _get_upstream_mapping(
+        selection=selection,
+        assets=repository_def._assets_defs_by_key.values(),  # pylint: disable=protected-access
+        source_assets=repository_def.source_assets_by_key.values(),
+    )
+    # sort the assets topologically so that we process them in order, and only keep the ones we
+    # are monitoring
+    toposorted_assets = [
+        asset
+        for layer in toposort.toposort(upstream)
+        for asset in layer
+        if asset in upstream.keys()
+    ]
+    return _ReconciliationGraph(upstream=upstream, toposorted_assets=toposorted_assets)
+
+
+class _LatestMaterializationCache:
+    """Tracks the latest materialization record of each parent asset monitored by a sensor.
+
+    The first time an asset key is requested, its latest materialization is fetched directly.
+    Afterwards, new materializations for all tracked asset keys are consumed with a single query
+    for the materialization records after a global storage id cursor, so that each tick only reads
+    the records written since the previous tick, regardless of the size of the asset graph.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latest_records: Dict[AssetKey, "EventLogRecord"] = {}
+        self._tracked_keys: Set[AssetKey] = set()
+        self._cursor: Optional[int] = None
+        # the timestamp of the materialization at the cursor, used to detect that the event log has
+        # been wiped even if its storage ids have been reused since
+        self._cursor_timestamp: Optional[float] = None
+
+    def get_latest_records(
+        self, instance, asset_keys: AbstractSet[AssetKey]
+    ) -> Mapping[AssetKey, "EventLogRecord"]:
+        from dagster._core.events import DagsterEventType
+        from dagster._core.storage.event_log.base import EventRecordsFilter
+
+        with self._lock:
+            if self._cursor is None or not self._consume_new_records(instance):
+                # cold start, or the event log has been wiped since the previous tick. Read the
+                # global cursor before fetching the latest record of each asset key, so that no
+                # materialization written in between is skipped
+                latest_records = instance.get_event_records(
+                    EventRecordsFilter(event_type=DagsterEventType.ASSET_MATERIALIZATION),
+                    ascending=False,
+                    limit=1,
+                )
+                self._latest_records = {}
+                self._tracked_keys = set()
+                self._cursor = 0
+                self._cursor_timestamp = None
+                if latest_records:
+                    self._advance_cursor(latest_records[0])
+
+            for asset_key in asset_keys - self._tracked_keys:
+                event_records = instance.get_event_records(
+                    EventRecordsFilter(
+                        event_type=DagsterEventType.ASSET_MATERIALIZATION,
+                        asset_key=asset_key,
+                    ),
+                    ascending=False,
+                    limit=1,
+                )
+                if event_records:
+                    self._update(event_records[0])
+                self._tracked_keys.add(asset_key)
+
+            return {
+                asset_key: self._latest_records[asset_key]
+                for asset_key in asset_keys
+                if asset_key in self._latest_records
+            }
+
+    def _consume_new_records(self, instance) -> bool:
+        """Updates the tracked records with the materializations written after the cursor.
+
+        Returns False if the materialization at the cursor no longer exists, in which case the
+        event log has been wiped and the cached records are stale.
+        """
+        from dagster._core.events import DagsterEventType
+        from dagster._core.storage.event_log.base import EventRecordsFilter
+
+        # the first query also reads the materialization at the cursor, to check that it still
+        # exists without issuing another query
+        check_cursor_record = bool(self._cursor)
+        after_cursor = self._cursor - 1 if check_cursor_record else self._cursor
+        while True:
+            event_records = instance.get_event_records(
+                EventRecordsFilter(
+                    event_type=DagsterEventType.ASSET_MATERIALIZATION,
+                    after_cursor=after_cursor,
+                ),
+                ascending=True,
+                limit=MATERIALIZATION_RECORDS_BATCH_SIZE,
+            )
+            new_records = event_records
+            if check_cursor_record:
+                if not event_records or not self._is_cursor_record(event_records[0]):
+                    return False
+                new_records = event_records[1:]
+                check_cursor_record = False
+
+            for event_record in new_records:
+                asset_key = event_record.event_log_entry.dagster_event.asset_key
+                if asset_key in self._tracked_keys:
+                    self._update(event_record)
+                self._advance_cursor(event_record)
+
+            if len(event_records) < MATERIALIZATION_RECORDS_BATCH_SIZE:
+                return True
+            after_cursor = self._cursor
+
+    def _is_cursor_record(self, event_record: "EventLogRecord") -> bool:
+        return (
+            event_record.storage_id == self._cursor
+            and event_record.event_log_entry.timestamp == self._cursor_timestamp
         )
-        # filter out a because upstream() includes the assets in the original AssetSelection
-        upstream[a] = {p for p in a_parents if p != a}
-    return upstream
+
+    def _advance_cursor(self, event_record: "EventLogRecord"):
+        if event_record.storage_id > check.not_none(self._cursor):
+            self._cursor = event_record.storage_id
+            self._cursor_timestamp = event_record.event_log_entry.timestamp
+
+    def _update(self, event_record: "EventLogRecord"):
+        asset_key = event_record.event_log_entry.dagster_event.asset_key
+        current = self._latest_records.get(asset_key)
+        if current is None or current.storage_id < event_record.storage_id:
+            self._latest_records[asset_key] = event_record
+
+
+class _TickCache:
+    """Memoizes the run lookups made while evaluating a single sensor tick, since many parent
+    assets are typically materialized by the same runs.
+    """
+
+    def __init__(self):
+        self._planned_asset_keys_by_run: Dict[str, AbstractSet[AssetKey]] = {}
+        self._in_progress_planned_asset_keys: Optional[AbstractSet[AssetKey]] = None
+
+    def get_planned_asset_keys_for_run(self, instance, run_id: str) -> AbstractSet[AssetKey]:
+        from dagster._core.events import DagsterEventType
+
+        if run_id not in self._planned_asset_keys_by_run:
+            records = instance.get_records_for_run(
+                run_id=run_id,
+                of_type=DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
+            ).records
+            self._planned_asset_keys_by_run[run_id] = {
+                record.event_log_entry.dagster_event.event_specific_data.asset_key
+                for record in records
+            }
+        return self._planned_asset_keys_by_run[run_id]
+
+    def get_in_progress_planned_asset_keys(self, instance) -> AbstractSet[AssetKey]:
+        """The asset keys planned to be materialized by any of the runs currently in progress."""
+        if self._in_progress_planned_asset_keys is None:
+            in_progress_runs = instance.get_runs(
+                filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES)
+            )
+            planned_asset_keys: Set[AssetKey] = set()
+            for run in in_progress_runs:
+                planned_asset_keys.update(self.get_planned_asset_keys_for_run(instance, run.run_id))
+            self._in_progress_planned_asset_keys = planned_asset_keys
+        return self._in_progress_planned_asset_keys
 
 
 def _get_parent_updates(
@@ -48,8 +241,9 @@ def _get_parent_updates(
     cursor_tuple: Tuple[float, int],
     will_materialize_set: Set[AssetKey],
     wait_for_in_progress_runs: bool,
-    planned_materialization_cache: Dict[AssetKey, "EventLogRecord"],
-) -> Tuple[Mapping[AssetKey, Tuple[bool, Tuple[float, int]]], Dict[AssetKey, "EventLogRecord"],]:
+    latest_materialization_records: Mapping[AssetKey, "EventLogRecord"],
+    tick_cache: _TickCache,
+) -> Mapping[AssetKey, Tuple[bool, Tuple[float, int]]]:
     """The bulk of the logic in the sensor is in this function. At the end of the function we return a
     dictionary that maps each asset to a Tuple. The Tuple contains a boolean, indicating if the asset
     has materialized or will materialize, and a tuple(float, int) representing the timestamp and storage id
@@ -67,6 +261,9 @@ def _get_parent_updates(
             We check if the parent assets are in this list when determining their materialization status
         wait_for_in_progress_runs: If the user wants the sensor to wait for in progress runs of parent
             assets to complete before materializing current_asset.
+        latest_materialization_records: The latest materialization record of each parent asset,
+            fetched in bulk for all of the monitored assets at the start of the tick.
+        tick_cache: Memoized run lookups shared by all of the monitored assets in this tick.
 
     Here's how we get there:
 
@@ -93,10 +290,6 @@ def _get_parent_updates(
     materialize if any of the parents are updated, the sensor will still choose to not materialize
     the asset) and immediately return.
     """
-    from dagster._core.event_api import RunShardedEventsCursor
-    from dagster._core.events import DagsterEventType
-    from dagster._core.storage.event_log.base import EventRecordsFilter
-
     parent_asset_event_records: Dict[AssetKey, Tuple[bool, Tuple[float, int]]] = {}
 
     for p in parent_assets:
@@ -110,76 +303,30 @@ def _get_parent_updates(
         # TODO - when source asset versioning lands, add a check here that will see if the version has
         # updated if p is a source asset
         else:
-            if wait_for_in_progress_runs:
-                # if p is currently being materialized, then we don't want to materialize current_asset
-
-                # get the most recent planned materialization
-                if p in planned_materialization_cache.keys():
-                    # put it in a list so the indexing later works
-                    materialization_planned_event_records = [planned_materialization_cache[p]]
-                else:
-                    materialization_planned_event_records = context.instance.get_event_records(
-                        EventRecordsFilter(
-                            event_type=DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
-                            asset_key=p,
-                        ),
-                        ascending=False,
-                        limit=1,
-                    )
-
-                if materialization_planned_event_records:
-                    # add it to the cache
-                    planned_materialization_cache[p] = materialization_planned_event_records[0]
-                    # see if the most recent planned materialization is part of an in progress run
-                    in_progress = context.instance.get_runs(
-                        filters=RunsFilter(
-                            run_ids=[
-                                materialization_planned_event_records[0].event_log_entry.run_id
-                            ],
-                            statuses=IN_PROGRESS_RUN_STATUSES,
-                        )
-                    )
-                    if in_progress:
-                        # we don't want to materialize current_asset because p is
-                        # being materialized. We'll materialize the asset on the next tick when the
-                        # materialization of p is complete
-                        parent_asset_event_records = {pp: (False, (0.0, 0)) for pp in parent_assets}
-
-                        return (
-                            parent_asset_event_records,
-                            planned_materialization_cache,
-                        )
-            # check if there is a completed materialization for p
-
-            event_records = context.instance.get_event_records(
-                EventRecordsFilter(
-                    event_type=DagsterEventType.ASSET_MATERIALIZATION,
-                    asset_key=p,
-                    after_cursor=RunShardedEventsCursor(
-                        run_updated_after=cast(
-                            datetime,
-                            pendulum.parse(
-                                utc_datetime_from_timestamp(cursor_tuple[0]).isoformat()
-                            ),
-                        ),
-                        id=cursor_tuple[1],
-                    ),
-                ),
-                ascending=False,
-                limit=1,
+            # if p is currently being materialized, then we don't want to materialize current_asset.
+            # The planned materializations of all of the runs in progress are read once per tick
+            if wait_for_in_progress_runs and p in tick_cache.get_in_progress_planned_asset_keys(
+                context.instance
+            ):
+                # we don't want to materialize current_asset because p is
+                # being materialized. We'll materialize the asset on the next tick when the
+                # materialization of p is complete
+                return {pp: (False, (0.0, 0)) for pp in parent_assets}
+
+            # check if there is a completed materialization for p since the cursor
+            latest_record = latest_materialization_records.get(p)
+            event_records = (
+                [latest_record]
+                if latest_record and latest_record.storage_id > cursor_tuple[1]
+                else []
             )
 
             if event_records:
                 # if the run for the materialization of p also materialized current_asset, we
                 # don't consider p "updated" when determining if current_asset should materialize
-                other_materialized_asset_records = context.instance.get_records_for_run(
-                    run_id=event_records[0].event_log_entry.run_id,
-                    of_type=DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
-                ).records
-                other_materialized_assets = [
-                    event.event_log_entry.dagster_event.event_specific_data.asset_key
-                    for event in other_materialized_asset_records
-                ]
+                other_materialized_assets = tick_cache.get_planned_asset_keys_for_run(
+                    context.instance, event_records[0].event_log_entry.run_id
+                )
                 if current_asset in other_materialized_assets:
                     # we still update the cursor for p so this materialization isn't considered
                     # on the next sensor tick
@@ -197,10 +344,7 @@ def _get_parent_updates(
                 # p has not been materialized and will not be materialized by the sensor
                 parent_asset_event_records[p] = (False, (0.0, 0))
 
-    return (
-        parent_asset_event_records,
-        planned_materialization_cache,
-    )
+    return parent_asset_event_records
 
 
 def _make_sensor(
@@ -226,32 +370,50 @@ def _make_sensor(
     We keep track of timestamp and storage id so that we can support sharded event log storages (SqliteEventLogStorage).
     """
 
+    # the asset graph and the latest materializations of the monitored parent assets are cached
+    # across ticks, so that each tick only processes what has changed since the previous one. Only
+    # the graph of the latest repository definition is kept, keyed by the definition itself
+    graph_cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+    # the instance of a sensor context is rebuilt from its ref on each tick, so persistent
+    # instances are keyed by their ref, while ephemeral instances are keyed by the object itself
+    materialization_caches_by_ref: Dict[str, _LatestMaterializationCache] = {}
+    ephemeral_materialization_caches: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+    cache_lock = threading.Lock()
+
+    def _get_graph(repository_def) -> _ReconciliationGraph:
+        with cache_lock:
+            if repository_def not in graph_cache:
+                graph_cache.clear()
+                graph_cache[repository_def] = _build_reconciliation_graph(selection, repository_def)
+            return graph_cache[repository_def]
+
+    def _get_materialization_cache(instance) -> _LatestMaterializationCache:
+        with cache_lock:
+            if not instance.is_persistent:
+                if instance not in ephemeral_materialization_caches:
+                    ephemeral_materialization_caches[instance] = _LatestMaterializationCache()
+                return ephemeral_materialization_caches[instance]
+
+            key = serialize_dagster_namedtuple(instance.get_ref())
+            if key not in materialization_caches_by_ref:
+                materialization_caches_by_ref[key] = _LatestMaterializationCache()
+            return materialization_caches_by_ref[key]
+
     def sensor_fn(context):
-        asset_defs_by_key = (
-            context._repository_def._assets_defs_by_key  # pylint: disable=protected-access
-        )
-        source_asset_defs_by_key = (
-            context._repository_def.source_assets_by_key  # pylint: disable=protected-access
-        )
-        upstream: Mapping[AssetKey, Set[AssetKey]] = _get_upstream_mapping(
-            selection=selection,
-            assets=asset_defs_by_key.values(),
-            source_assets=source_asset_defs_by_key.values(),
-        )
+        graph = _get_graph(context._repository_def)  # pylint: disable=protected-access
+        upstream = graph.upstream
 
         cursor_dict: Dict[str, int] = json.loads(context.cursor) if context.cursor else {}
         should_materialize: Set[AssetKey] = set()
         cursor_update_dict: Dict[str, int] = {}
-        # keep track of the in planned materializations for each parent so we don't repeat
-        # calls to the db
-        planned_materialization_cache: Dict[AssetKey, "EventLogRecord"] = {}
+        tick_cache = _TickCache()
 
-        # sort the assets topologically so that we process them in order
-        toposort_assets = list(toposort.toposort(upstream))
-        # unpack the list of sets into a list and only keep the ones we are monitoring
-        toposort_assets = [
-            asset for layer in toposort_assets for asset in layer if asset in upstream.keys()
-        ]
+        parent_assets: Set[AssetKey] = set()
+        for a in graph.toposorted_assets:
+            parent_assets.update(upstream[a])
+        latest_materialization_records = _get_materialization_cache(
+            context.instance
+        ).get_latest_records(context.instance, parent_assets)
 
         # if the event storage is sharded we want to compare timestamps, otherwise we compare
         # storage ids. In the cursor, timestamp is index 0 and storage_id is 1
@@ -259,17 +421,18 @@ def sensor_fn(context):
 
         # determine which assets should materialize based on the materialization status of their
         # parents
-        for a in toposort_assets:
+        for a in graph.toposorted_assets:
             a_cursor = cursor_dict.get(str(a), (0.0, 0))
             cursor_update_dict[str(a)] = a_cursor
-            (parent_update_records, planned_materialization_cache,) = _get_parent_updates(
+            parent_update_records = _get_parent_updates(
                 context,
                 current_asset=a,
                 parent_assets=upstream[a],
                 cursor_tuple=a_cursor,
                 will_materialize_set=should_materialize,
                 wait_for_in_progress_runs=wait_for_in_progress_runs,
-                planned_materialization_cache=planned_materialization_cache,
+                latest_materialization_records=latest_materialization_records,
+                tick_cache=tick_cache,
             )
 
             condition = all if wait_for_all_upstream else any
@@ -17,7 +17,7 @@
 
 import dagster._check as check
 from dagster._annotations import public
-from dagster._builtins import Int
+from dagster._builtins import Bool, Int
 from dagster._config import Field, Selector, UserConfigSchema
 from dagster._core.definitions.configurable import (
     ConfiguredDefinitionConfigSchema,
@@ -335,6 +335,8 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
         retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore
         start_method=start_method,
         explicit_forkserver_preload=check.opt_list_elem(start_cfg, "preload_modules", of_type=str),
+        reuse_processes=config.get("reuse_processes", False),
+        reuse_resources=config.get("reuse_resources", False),
     )
 
 
@@ -386,6 +388,27 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
                 "https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods."
             ),
         ),
+        "reuse_processes": Field(
+            Bool,
+            default_value=False,
+            description=(
+                "Whether to keep a pool of up to `max_concurrent` worker processes that each "
+                "execute many steps one after the other, instead of starting a new process for "
+                "every step. This avoids paying the cost of starting a process and loading the "
+                "job for each step. Resources are still initialized separately for each step, "
+                "unless `reuse_resources` is set."
+            ),
+        ),
+        "reuse_resources": Field(
+            Bool,
+            default_value=False,
+            description=(
+                "Whether the resources initialized for a step are kept by its worker process and "
+                "reused by the next steps it executes that require the same resources, instead of "
+                "being initialized for every step. They are torn down when the worker process "
+                "exits. Requires `reuse_processes`."
+            ),
+        ),
         "retries": get_retries_config(),
     },
     description="Execute each step in an individual process.",
@@ -708,7 +708,7 @@ def _swap_default_io_man(resources: Mapping[str, ResourceDefinition], job: Pipel
     Used to create the user facing experience of the default io_manager
     switching to in-memory when using execute_in_process.
     """
-    from dagster._core.storage.mem_io_manager import mem_io_manager
+    from dagster._core.storage.mem_io_manager import in_process_mem_io_manager
 
     if (
         # pylint: disable=comparison-with-callable
@@ -716,7 +716,7 @@ def _swap_default_io_man(resources: Mapping[str, ResourceDefinition], job: Pipel
         and job.version_strategy is None
     ):
         updated_resources = dict(resources)
-        updated_resources[DEFAULT_IO_MANAGER_KEY] = mem_io_manager
+        updated_resources[DEFAULT_IO_MANAGER_KEY] = in_process_mem_io_manager
         return updated_resources
 
     return resources
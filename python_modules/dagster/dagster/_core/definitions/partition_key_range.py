@@ -1,8 +1,10 @@
 from typing import NamedTuple
 
 from dagster._annotations import PublicAttr
+from dagster._serdes import whitelist_for_serdes
 
 
+@whitelist_for_serdes
 class PartitionKeyRange(NamedTuple):
     # Inclusive on both sides
     start: PublicAttr[str]
@@ -1,8 +1,24 @@
+import bisect
 import re
+import threading
 from datetime import datetime
-from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Union, cast
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Union,
+    cast,
+)
 
 import pendulum
+from croniter import croniter
 
 import dagster._check as check
 from dagster._annotations import PublicAttr, public
@@ -32,6 +48,187 @@ class TimeWindow(NamedTuple):
     end: PublicAttr[datetime]
 
 
+def _get_fixed_cadence_unit(cron_schedule: str) -> Optional[str]:
+    """If the cron schedule ticks at a fixed cadence, returns the pendulum unit ("hours", "days",
+    "weeks" or "months") by which consecutive ticks are separated. This mirrors the special-cased
+    intervals in cron_string_iterator, so that the closed-form arithmetic in
+    _FixedCadenceTimeWindowIndex matches iterating over the schedule.
+    """
+    cron_parts, _ = croniter.expand(cron_schedule)
+    if len(cron_parts) != 5:
+        return None
+
+    is_numeric = [len(part) == 1 and part[0] != "*" for part in cron_parts]
+    is_wildcard = [len(part) == 1 and part[0] == "*" for part in cron_parts]
+
+    if all(is_numeric[0:3]) and all(is_wildcard[3:]):
+        # adding months to a day that does not exist in every month clamps the day, which makes
+        # the iterated ticks drift, so only the days that exist in every month have a closed form
+        return "months" if cron_parts[2][0] <= 28 else None
+    elif all(is_numeric[0:2]) and is_numeric[4] and all(is_wildcard[2:4]):
+        return "weeks"
+    elif all(is_numeric[0:2]) and all(is_wildcard[2:]):
+        return "days"
+    elif is_numeric[0] and all(is_wildcard[1:]):
+        return "hours"
+    else:
+        return None
+
+
+class _FixedCadenceTimeWindowIndex:
+    """Converts between window indices and times in O(1) for schedules that tick at a fixed cadence.
+    Index 0 is the window that starts at first_start, and negative indices are windows before it.
+    """
+
+    def __init__(self, first_start: datetime, unit: str, timezone: str):
+        self._first_start = first_start
+        self._first_timestamp = first_start.timestamp()
+        self._unit = unit
+        self._timezone = timezone
+
+    def start_for_index(self, index: int) -> datetime:
+        start = self._first_start.add(**{self._unit: index})
+        if self._unit != "hours" and start.hour != self._first_start.hour:
+            # the tick falls in a time that doesn't exist due to a DST transition, so it happens at
+            # the start of the next hour instead, as in cron_string_iterator
+            start = start.replace(minute=0)
+        return start
+
+    def index_for_timestamp(self, timestamp: float) -> Optional[int]:
+        """The index of the window that contains the given timestamp."""
+        if self._unit == "hours":
+            return int((timestamp - self._first_timestamp) // 3600)
+
+        if self._unit == "months":
+            dt = pendulum.from_timestamp(timestamp, tz=self._timezone)
+            index = (dt.year - self._first_start.year) * 12 + dt.month - self._first_start.month
+        else:
+            interval = 86400 * (7 if self._unit == "weeks" else 1)
+            index = int((timestamp - self._first_timestamp) // interval)
+
+        # DST transitions can throw the estimate off by one window in either direction
+        while self.start_for_index(index).timestamp() > timestamp:
+            index -= 1
+        while self.start_for_index(index + 1).timestamp() <= timestamp:
+            index += 1
+        return index
+
+
+class _CronTimeWindowIndex:
+    """Memoizes the window starts of an arbitrary cron schedule, so that each window only needs to
+    be iterated over once. Index 0 is the window that starts at first_start. Windows before it
+    are not covered by this index.
+    """
+
+    def __init__(self, time_windows: Iterator[TimeWindow]):
+        self._time_windows = time_windows
+        self._lock = threading.Lock()
+        first_window = next(self._time_windows)
+        self._starts: List[datetime] = [first_window.start, first_window.end]
+        self._timestamps: List[float] = [
+            first_window.start.timestamp(),
+            first_window.end.timestamp(),
+        ]
+
+    def _add_window(self):
+        end = next(self._time_windows).end
+        self._starts.append(end)
+        self._timestamps.append(end.timestamp())
+
+    def start_for_index(self, index: int) -> datetime:
+        check.invariant(index >= 0, "Windows before the first window are not indexed")
+        with self._lock:
+            while len(self._starts) <= index:
+                self._add_window()
+            return self._starts[index]
+
+    def index_for_timestamp(self, timestamp: float) -> Optional[int]:
+        """The index of the window that contains the given timestamp, or None if the timestamp is
+        before the first window.
+        """
+        if timestamp < self._timestamps[0]:
+            return None
+
+        with self._lock:
+            while self._timestamps[-1] <= timestamp:
+                self._add_window()
+            return bisect.bisect_right(self._timestamps, timestamp) - 1
+
+
+@lru_cache(maxsize=512)
+def _get_time_window_index(
+    partitions_def: "TimeWindowPartitionsDefinition",
+) -> Union[_FixedCadenceTimeWindowIndex, _CronTimeWindowIndex]:
+    time_windows = iter(
+        partitions_def._iterate_time_windows(  # pylint: disable=protected-access
+            partitions_def.start
+        )
+    )
+    unit = _get_fixed_cadence_unit(partitions_def.cron_schedule)
+    if unit is None:
+        return _CronTimeWindowIndex(time_windows)
+
+    return _FixedCadenceTimeWindowIndex(next(time_windows).start, unit, partitions_def.timezone)
+
+
+class _TimeWindowPartitions(Sequence[Partition[TimeWindow]]):
+    """The partitions of a TimeWindowPartitionsDefinition. Each partition is computed from the time
+    window index when it is accessed, so indexing or slicing a long-running partitions definition
+    does not create every partition since its start.
+    """
+
+    def __init__(self, partitions_def: "TimeWindowPartitionsDefinition", num_partitions: int):
+        self._time_window_index = _get_time_window_index(partitions_def)
+        self._fmt = partitions_def.fmt
+        self._num_partitions = num_partitions
+
+    def _partition(self, start: datetime, end: datetime) -> Partition[TimeWindow]:
+        return Partition(value=TimeWindow(start, end), name=start.strftime(self._fmt))
+
+    def _partitions_in_range(self, indices: range) -> Iterator[Partition[TimeWindow]]:
+        if indices.step != 1:
+            for index in indices:
+                yield self._partition(
+                    self._time_window_index.start_for_index(index),
+                    self._time_window_index.start_for_index(index + 1),
+                )
+            return
+
+        if not indices:
+            return
+
+        start = self._time_window_index.start_for_index(indices.start)
+        for index in indices:
+            end = self._time_window_index.start_for_index(index + 1)
+            yield self._partition(start, end)
+            start = end
+
+    def __len__(self) -> int:
+        return self._num_partitions
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._partitions_in_range(range(*index.indices(self._num_partitions))))
+
+        check.int_param(index, "index")
+        if index < 0:
+            index += self._num_partitions
+        if not 0 <= index < self._num_partitions:
+            raise IndexError("partition index out of range")
+        return next(self._partitions_in_range(range(index, index + 1)))
+
+    def __iter__(self) -> Iterator[Partition[TimeWindow]]:
+        return self._partitions_in_range(range(self._num_partitions))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
 class TimeWindowPartitionsDefinition(
     PartitionsDefinition[TimeWindow],  # pylint: disable=unsubscriptable-object
     NamedTuple(
@@ -114,32 +311,55 @@ def __new__(  # pylint: disable=arguments-differ
     def get_partitions(
         self, current_time: Optional[datetime] = None
     ) -> Sequence[Partition[TimeWindow]]:
+        return _TimeWindowPartitions(self, self._get_num_partitions(current_time))
+
+    def get_partition_keys(self, current_time: Optional[datetime] = None) -> Sequence[str]:
+        time_window_index = _get_time_window_index(self)
+        return [
+            time_window_index.start_for_index(index).strftime(self.fmt)
+            for index in range(self._get_num_partitions(current_time))
+        ]
+
+    def get_last_partition_key(self, current_time: Optional[datetime] = None) -> str:
+        num_partitions = self._get_num_partitions(current_time)
+        if num_partitions == 0:
+            return super(TimeWindowPartitionsDefinition, self).get_last_partition_key(current_time)
+
+        return _get_time_window_index(self).start_for_index(num_partitions - 1).strftime(self.fmt)
+
+    def get_first_partition_key(self, current_time: Optional[datetime] = None) -> str:
+        if self._get_num_partitions(current_time) == 0:
+            return super(TimeWindowPartitionsDefinition, self).get_first_partition_key(current_time)
+
+        return _get_time_window_index(self).start_for_index(0).strftime(self.fmt)
+
+    def _get_num_partitions(self, current_time: Optional[datetime] = None) -> int:
         current_timestamp = (
             pendulum.instance(current_time, tz=self.timezone)
             if current_time
             else pendulum.now(self.timezone)
         ).timestamp()
 
-        partitions_past_current_time = 0
-        partitions: List[Partition[TimeWindow]] = []
-        for time_window in self._iterate_time_windows(self.start):
-            if (
-                time_window.end.timestamp() <= current_timestamp
-                or partitions_past_current_time < self.end_offset
-            ):
-                partitions.append(
-                    Partition(value=time_window, name=time_window.start.strftime(self.fmt))
-                )
-
-                if time_window.end.timestamp() > current_timestamp:
-                    partitions_past_current_time += 1
-            else:
-                break
-
-        if self.end_offset < 0:
-            partitions = partitions[: self.end_offset]
-
-        return partitions
+        # the windows that have ended by the current time, i.e. those before the window that
+        # contains the current time
+        num_ended_windows = max(
+            _get_time_window_index(self).index_for_timestamp(current_timestamp) or 0, 0
+        )
+        return max(num_ended_windows + self.end_offset, 0)
+
+    def _time_window_starting_at_or_after(self, dt: datetime) -> TimeWindow:
+        time_window_index = _get_time_window_index(self)
+        timestamp = dt.timestamp()
+        index = time_window_index.index_for_timestamp(timestamp)
+        if index is None:
+            # before the windows covered by the index
+            return next(iter(self._iterate_time_windows(dt)))
+
+        if time_window_index.start_for_index(index).timestamp() < timestamp:
+            index += 1
+        return TimeWindow(
+            time_window_index.start_for_index(index), time_window_index.start_for_index(index + 1)
+        )
 
     def __str__(self) -> str:
         schedule_str = (
@@ -156,7 +376,7 @@ def time_window_for_partition_key(self, partition_key: str) -> TimeWindow:
         partition_key_dt = pendulum.instance(
             datetime.strptime(partition_key, self.fmt), tz=self.timezone
         )
-        return next(iter(self._iterate_time_windows(partition_key_dt)))
+        return self._time_window_starting_at_or_after(partition_key_dt)
 
     def start_time_for_partition_key(self, partition_key: str) -> datetime:
         partition_key_dt = pendulum.instance(
@@ -164,7 +384,7 @@ def start_time_for_partition_key(self, partition_key: str) -> datetime:
         )
         # the datetime format might not include granular components, so we need to recover them
         # we make the assumption that the parsed partition key is <= the start datetime
-        return next(iter(self._iterate_time_windows(partition_key_dt))).start
+        return self._time_window_starting_at_or_after(partition_key_dt).start
 
     def end_time_for_partition_key(self, partition_key: str) -> datetime:
         return self.time_window_for_partition_key(partition_key).end
@@ -180,15 +400,19 @@ def get_partition_keys_in_range(self, partition_key_range: PartitionKeyRange) ->
         start_time = self.start_time_for_partition_key(partition_key_range.start)
         end_time = self.start_time_for_partition_key(partition_key_range.end)
 
-        result: List[str] = []
-        for time_window in self._iterate_time_windows(start_time):
-            if time_window.start <= end_time:
-                result.append(time_window.start.strftime(self.fmt))
-            else:
-                break
-
-        current_partitions = [partition.name for partition in self.get_partitions()]
-        return [partition for partition in result if partition in current_partitions]
+        # only the keys in the range that are also current partitions are returned, so the range
+        # is clamped to the indices of the current partitions
+        time_window_index = _get_time_window_index(self)
+        start_index = max(time_window_index.index_for_timestamp(start_time.timestamp()) or 0, 0)
+        end_index = time_window_index.index_for_timestamp(end_time.timestamp())
+        if end_index is None:
+            return []
+
+        end_index = min(end_index, self._get_num_partitions() - 1)
+        return [
+            time_window_index.start_for_index(index).strftime(self.fmt)
+            for index in range(start_index, end_index + 1)
+        ]
 
     @public  # type: ignore
     @property
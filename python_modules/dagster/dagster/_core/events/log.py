@@ -23,6 +23,11 @@
 
 
 class EventLogEntrySerializer(DefaultNamedTupleSerializer):
+    @classmethod
+    def supports_compact(cls) -> bool:
+        # the message field is only needed by older versions, which can't load the compact format
+        return True
+
     @classmethod
     def value_to_storage_dict(
         cls,
@@ -2,6 +2,7 @@
 from contextlib import contextmanager
 from typing import (
     Any,
+    Callable,
     Dict,
     FrozenSet,
     Iterator,
@@ -23,6 +24,7 @@
 from dagster._core.definitions.pipeline_definition import PipelineSubsetDefinition
 from dagster._core.definitions.reconstruct import ReconstructableJob, ReconstructablePipeline
 from dagster._core.definitions.repository_definition import RepositoryLoadData
+from dagster._core.definitions.resource_definition import ScopedResourcesBuilder
 from dagster._core.errors import DagsterExecutionInterruptedError, DagsterInvariantViolationError
 from dagster._core.events import DagsterEvent, EngineEventData
 from dagster._core.execution.context.system import PlanOrchestrationContext
@@ -42,7 +44,7 @@
 from dagster._core.system_config.objects import ResolvedRunConfig
 from dagster._core.telemetry import log_repo_stats, telemetry_wrapper
 from dagster._core.utils import str_format_set
-from dagster._utils import merge_dicts
+from dagster._utils import EventGenerationManager, merge_dicts
 from dagster._utils.error import serializable_error_info_from_exc_info
 from dagster._utils.interrupts import capture_interrupts
 
@@ -918,6 +920,9 @@ def execute_plan_iterator(
     instance: DagsterInstance,
     retry_mode: Optional[RetryMode] = None,
     run_config: Optional[Mapping[str, object]] = None,
+    scoped_resources_builder_cm: Optional[
+        Callable[..., EventGenerationManager[ScopedResourcesBuilder]]
+    ] = None,
 ) -> Iterator[DagsterEvent]:
     check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
     check.inst_param(pipeline, "pipeline", IPipeline)
@@ -940,6 +945,7 @@ def execute_plan_iterator(
                 run_config=run_config,
                 pipeline_run=pipeline_run,
                 instance=instance,
+                scoped_resources_builder_cm=scoped_resources_builder_cm,
             ),
         )
     )
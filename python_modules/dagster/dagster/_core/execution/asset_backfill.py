@@ -0,0 +1,372 @@
+from typing import (
+    AbstractSet,
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from toposort import toposort_flatten
+
+import dagster._check as check
+from dagster._core.definitions.asset_group import AssetGroup
+from dagster._core.definitions.events import AssetKey
+from dagster._core.definitions.partition_key_range import PartitionKeyRange
+from dagster._core.errors import DagsterBackfillFailedError
+from dagster._core.host_representation import (
+    ExternalRepository,
+    PipelineSelector,
+    RepositoryLocation,
+)
+from dagster._core.host_representation.external_data import ExternalAssetNode
+from dagster._core.instance import DagsterInstance
+from dagster._core.snap import ExecutionPlanSnapshot
+from dagster._core.storage.pipeline_run import PipelineRun, PipelineRunStatus
+from dagster._core.storage.tags import (
+    ASSET_PARTITION_RANGE_END_TAG,
+    ASSET_PARTITION_RANGE_START_TAG,
+    PARTITION_NAME_TAG,
+    PARTITION_SET_TAG,
+)
+from dagster._core.telemetry import BACKFILL_RUN_CREATED, hash_name, log_action
+from dagster._core.utils import make_new_run_id
+from dagster._core.workspace.workspace import IWorkspace
+from dagster._utils import merge_dicts
+
+from .backfill import BulkActionStatus, PartitionBackfill
+
+
+class AssetBackfillRun(
+    NamedTuple(
+        "_AssetBackfillRun",
+        [
+            ("job_name", str),
+            ("asset_keys", FrozenSet[AssetKey]),
+            ("partition_key_range", PartitionKeyRange),
+        ],
+    )
+):
+    """A run planned by an asset backfill: a job materializing a subset of the backfilled assets,
+    for a range of consecutive partitions."""
+
+    def __new__(
+        cls,
+        job_name: str,
+        asset_keys: AbstractSet[AssetKey],
+        partition_key_range: PartitionKeyRange,
+    ):
+        return super(AssetBackfillRun, cls).__new__(
+            cls,
+            check.str_param(job_name, "job_name"),
+            frozenset(check.iterable_param(asset_keys, "asset_keys", of_type=AssetKey)),
+            check.inst_param(partition_key_range, "partition_key_range", PartitionKeyRange),
+        )
+
+    @property
+    def tags(self) -> Mapping[str, str]:
+        if self.partition_key_range.start == self.partition_key_range.end:
+            return {PARTITION_NAME_TAG: self.partition_key_range.start}
+        return {
+            ASSET_PARTITION_RANGE_START_TAG: self.partition_key_range.start,
+            ASSET_PARTITION_RANGE_END_TAG: self.partition_key_range.end,
+        }
+
+    @staticmethod
+    def key_for_run(
+        pipeline_run: PipelineRun,
+    ) -> Optional[Tuple[str, FrozenSet[AssetKey], str, str]]:
+        """The key of the planned run that an existing run of the backfill was launched for."""
+        if not pipeline_run.asset_selection:
+            return None
+
+        tags = pipeline_run.tags
+        if ASSET_PARTITION_RANGE_START_TAG in tags and ASSET_PARTITION_RANGE_END_TAG in tags:
+            start, end = tags[ASSET_PARTITION_RANGE_START_TAG], tags[ASSET_PARTITION_RANGE_END_TAG]
+        elif PARTITION_NAME_TAG in tags:
+            start = end = tags[PARTITION_NAME_TAG]
+        else:
+            return None
+
+        return (pipeline_run.pipeline_name, frozenset(pipeline_run.asset_selection), start, end)
+
+    @property
+    def key(self) -> Tuple[str, FrozenSet[AssetKey], str, str]:
+        return (
+            self.job_name,
+            self.asset_keys,
+            self.partition_key_range.start,
+            self.partition_key_range.end,
+        )
+
+
+def _get_asset_nodes(
+    external_repo: ExternalRepository, asset_selection: Sequence[AssetKey]
+) -> Mapping[AssetKey, ExternalAssetNode]:
+    if not asset_selection:
+        raise DagsterBackfillFailedError("An asset backfill must select at least one asset.")
+
+    asset_nodes = {
+        asset_node.asset_key: asset_node for asset_node in external_repo.get_external_asset_nodes()
+    }
+
+    missing = [asset_key for asset_key in asset_selection if asset_key not in asset_nodes]
+    if missing:
+        raise DagsterBackfillFailedError(
+            f"Could not find assets {', '.join(key.to_user_string() for key in missing)} in "
+            f"repository {external_repo.name}."
+        )
+
+    partitions_def_data = asset_nodes[asset_selection[0]].partitions_def_data
+    if partitions_def_data is None or any(
+        asset_nodes[asset_key].partitions_def_data != partitions_def_data
+        for asset_key in asset_selection
+    ):
+        raise DagsterBackfillFailedError(
+            "All of the assets in an asset backfill must share the same partitions definition."
+        )
+
+    return asset_nodes
+
+
+def get_asset_backfill_partition_keys(
+    external_repo: ExternalRepository,
+    asset_selection: Sequence[AssetKey],
+    partition_key_range: PartitionKeyRange,
+) -> Sequence[str]:
+    """The partition keys in the range of an asset backfill, in order."""
+    asset_nodes = _get_asset_nodes(external_repo, asset_selection)
+    partitions_def_data = check.not_none(asset_nodes[asset_selection[0]].partitions_def_data)
+    partition_keys = partitions_def_data.get_partitions_definition().get_partition_keys_in_range(
+        partition_key_range
+    )
+    if not partition_keys:
+        raise DagsterBackfillFailedError(
+            f"No partitions in the range {partition_key_range.start} to {partition_key_range.end}."
+        )
+    return partition_keys
+
+
+def _get_job_name(asset_node: ExternalAssetNode) -> str:
+    # the base asset job contains every asset with the same partitions definition, so using it
+    # where possible puts as many of the backfilled assets as possible in the same run
+    base_job_names = [
+        job_name for job_name in asset_node.job_names if AssetGroup.is_base_job_name(job_name)
+    ]
+    job_names = sorted(base_job_names or asset_node.job_names)
+    if not job_names:
+        raise DagsterBackfillFailedError(
+            f"Asset {asset_node.asset_key.to_user_string()} can't be backfilled, since it isn't "
+            "materialized by any job."
+        )
+    return job_names[0]
+
+
+def plan_asset_backfill(
+    external_repo: ExternalRepository,
+    asset_selection: Sequence[AssetKey],
+    partition_key_range: PartitionKeyRange,
+    max_partitions_per_run: Optional[int] = None,
+) -> Sequence[Sequence[AssetBackfillRun]]:
+    """Plans the runs of an asset backfill, in the order they must be launched.
+
+    The selected assets are grouped by the job that materializes them. Where a selected asset
+    depends on a selected asset in another job, directly or through unselected assets, it is
+    materialized by a later group than its upstream asset, so that the runs of each group only
+    launch once the runs of the previous groups have completed. Each group is launched as one run
+    per range of up to ``max_partitions_per_run`` consecutive partitions.
+
+    Returns:
+        Sequence[Sequence[AssetBackfillRun]]: The planned runs of each group, in order.
+    """
+    check.sequence_param(asset_selection, "asset_selection", of_type=AssetKey)
+    check.inst_param(partition_key_range, "partition_key_range", PartitionKeyRange)
+    check.opt_int_param(max_partitions_per_run, "max_partitions_per_run")
+
+    asset_nodes = _get_asset_nodes(external_repo, asset_selection)
+    partition_keys = get_asset_backfill_partition_keys(
+        external_repo, asset_selection, partition_key_range
+    )
+    selected = set(asset_selection)
+    job_names = {asset_key: _get_job_name(asset_nodes[asset_key]) for asset_key in selected}
+
+    selected_upstream_cache: Dict[AssetKey, AbstractSet[AssetKey]] = {}
+
+    def _get_selected_upstream(asset_key: AssetKey) -> AbstractSet[AssetKey]:
+        # the nearest selected assets upstream of the asset, skipping over unselected assets
+        if asset_key not in selected_upstream_cache:
+            upstream: set = set()
+            asset_node = asset_nodes.get(asset_key)
+            for dependency in asset_node.dependencies if asset_node else []:
+                if dependency.upstream_asset_key in selected:
+                    upstream.add(dependency.upstream_asset_key)
+                else:
+                    upstream.update(_get_selected_upstream(dependency.upstream_asset_key))
+            selected_upstream_cache[asset_key] = upstream
+        return selected_upstream_cache[asset_key]
+
+    upstream_by_asset = {asset_key: _get_selected_upstream(asset_key) for asset_key in selected}
+    levels: Dict[AssetKey, int] = {}
+    for asset_key in toposort_flatten(upstream_by_asset, sort=True):
+        levels[asset_key] = max(
+            [
+                levels[upstream_key] + (job_names[upstream_key] != job_names[asset_key])
+                for upstream_key in upstream_by_asset[asset_key]
+            ],
+            default=0,
+        )
+
+    asset_keys_by_group: Dict[Tuple[int, str], List[AssetKey]] = {}
+    for asset_key in selected:
+        asset_keys_by_group.setdefault((levels[asset_key], job_names[asset_key]), []).append(
+            asset_key
+        )
+
+    chunk_size = max_partitions_per_run or 1
+    partition_key_ranges = [
+        PartitionKeyRange(chunk[0], chunk[-1])
+        for chunk in (
+            partition_keys[i : i + chunk_size] for i in range(0, len(partition_keys), chunk_size)
+        )
+    ]
+
+    planned_runs: List[List[AssetBackfillRun]] = [[] for _ in range(max(levels.values()) + 1)]
+    for (level, job_name), asset_keys in sorted(asset_keys_by_group.items()):
+        planned_runs[level].extend(
+            AssetBackfillRun(job_name, set(asset_keys), partition_key_range)
+            for partition_key_range in partition_key_ranges
+        )
+    return planned_runs
+
+
+def build_asset_backfill(
+    backfill_id: str,
+    external_repo: ExternalRepository,
+    asset_selection: Sequence[AssetKey],
+    partition_key_range: PartitionKeyRange,
+    backfill_timestamp: float,
+    tags: Optional[Mapping[str, str]] = None,
+    max_partitions_per_run: Optional[int] = None,
+) -> PartitionBackfill:
+    """Builds a backfill of a range of partitions of a set of assets, which can span many jobs.
+
+    Unless ``max_partitions_per_run`` is set, each run materializes a single partition. Runs that
+    materialize several partitions are tagged with the range of partitions they target, rather
+    than a partition name, so the assets should only be backfilled this way if their IO managers
+    handle partition ranges.
+    """
+    check.inst_param(external_repo, "external_repo", ExternalRepository)
+
+    # planned up front, so that a backfill that can't be launched is rejected before it is stored
+    plan_asset_backfill(external_repo, asset_selection, partition_key_range, max_partitions_per_run)
+
+    return PartitionBackfill(
+        backfill_id=backfill_id,
+        partition_set_origin=None,
+        status=BulkActionStatus.REQUESTED,
+        partition_names=list(
+            get_asset_backfill_partition_keys(external_repo, asset_selection, partition_key_range)
+        ),
+        from_failure=False,
+        reexecution_steps=None,
+        tags=dict(tags) if tags else None,
+        backfill_timestamp=backfill_timestamp,
+        asset_selection=list(asset_selection),
+        repository_origin=external_repo.get_external_origin(),
+        partition_key_range=partition_key_range,
+        max_partitions_per_run=max_partitions_per_run,
+    )
+
+
+def submit_asset_backfill_runs(
+    instance: DagsterInstance,
+    workspace: IWorkspace,
+    repo_location: RepositoryLocation,
+    external_repo: ExternalRepository,
+    backfill_job: PartitionBackfill,
+    planned_runs: Sequence[AssetBackfillRun],
+):
+    """Creates the planned runs of an asset backfill in a single batch, and submits them, yielding
+    the id of each submitted run."""
+    check.inst_param(backfill_job, "backfill_job", PartitionBackfill)
+    check.sequence_param(planned_runs, "planned_runs", of_type=AssetBackfillRun)
+
+    from dagster._daemon.daemon import get_telemetry_daemon_session_id
+
+    runs_kwargs = []
+    external_pipelines = {}
+    execution_plan_snapshots: Dict[Tuple[str, FrozenSet[AssetKey]], ExecutionPlanSnapshot] = {}
+    for planned_run in planned_runs:
+        # the runs of a job for the same assets only differ in the partitions they target, so
+        # they share the same subset of the job and the same execution plan
+        plan_key = (planned_run.job_name, planned_run.asset_keys)
+        if plan_key not in external_pipelines:
+            external_pipeline = repo_location.get_external_pipeline(
+                PipelineSelector(
+                    location_name=repo_location.name,
+                    repository_name=external_repo.name,
+                    pipeline_name=planned_run.job_name,
+                    solid_selection=None,
+                    asset_selection=sorted(planned_run.asset_keys, key=lambda key: key.path),
+                )
+            )
+            external_pipelines[plan_key] = external_pipeline
+            execution_plan_snapshots[plan_key] = repo_location.get_external_execution_plan(
+                external_pipeline,
+                {},
+                external_pipeline.get_default_mode_name(),
+                step_keys_to_execute=None,
+                known_state=None,
+                instance=instance,
+            ).execution_plan_snapshot
+        external_pipeline = external_pipelines[plan_key]
+
+        log_action(
+            instance,
+            BACKFILL_RUN_CREATED,
+            metadata={
+                "DAEMON_SESSION_ID": get_telemetry_daemon_session_id(),
+                "repo_hash": hash_name(repo_location.name),
+                "pipeline_name_hash": hash_name(external_pipeline.name),
+            },
+        )
+
+        partition_tags = dict(planned_run.tags)
+        partition_set_name = f"{planned_run.job_name}_partition_set"
+        if PARTITION_NAME_TAG in partition_tags and external_repo.has_external_partition_set(
+            partition_set_name
+        ):
+            partition_tags[PARTITION_SET_TAG] = partition_set_name
+
+        runs_kwargs.append(
+            dict(
+                pipeline_snapshot=external_pipeline.pipeline_snapshot,
+                execution_plan_snapshot=execution_plan_snapshots[plan_key],
+                parent_pipeline_snapshot=external_pipeline.parent_pipeline_snapshot,
+                pipeline_name=external_pipeline.name,
+                run_id=make_new_run_id(),
+                solids_to_execute=external_pipeline.solids_to_execute,
+                run_config={},
+                mode=external_pipeline.get_default_mode_name(),
+                step_keys_to_execute=None,
+                tags=merge_dicts(
+                    external_pipeline.tags,
+                    partition_tags,
+                    PipelineRun.tags_for_backfill_id(backfill_job.backfill_id),
+                    backfill_job.tags,
+                ),
+                root_run_id=None,
+                parent_run_id=None,
+                status=PipelineRunStatus.NOT_STARTED,
+                external_pipeline_origin=external_pipeline.get_external_origin(),
+                pipeline_code_origin=external_pipeline.get_python_origin(),
+                asset_selection=planned_run.asset_keys,
+            )
+        )
+
+    for pipeline_run in instance.create_runs(runs_kwargs):
+        instance.submit_run(pipeline_run.run_id, workspace)
+        yield pipeline_run.run_id
@@ -3,6 +3,7 @@
 
 import dagster._check as check
 from dagster._core.definitions import AssetKey
+from dagster._core.definitions.partition_key_range import PartitionKeyRange
 from dagster._core.execution.plan.resume_retry import ReexecutionStrategy
 from dagster._core.execution.plan.state import KnownExecutionState
 from dagster._core.host_representation import (
@@ -15,8 +16,12 @@
     ExternalPartitionExecutionParamData,
     ExternalPartitionSetExecutionParamData,
 )
-from dagster._core.host_representation.origin import ExternalPartitionSetOrigin
+from dagster._core.host_representation.origin import (
+    ExternalPartitionSetOrigin,
+    ExternalRepositoryOrigin,
+)
 from dagster._core.instance import DagsterInstance
+from dagster._core.snap import ExecutionPlanSnapshot
 from dagster._core.storage.pipeline_run import PipelineRun, PipelineRunStatus, RunsFilter
 from dagster._core.storage.tags import (
     PARENT_RUN_ID_TAG,
@@ -27,7 +32,7 @@
 from dagster._core.telemetry import BACKFILL_RUN_CREATED, hash_name, log_action
 from dagster._core.utils import make_new_run_id
 from dagster._core.workspace.workspace import IWorkspace
-from dagster._serdes import whitelist_for_serdes
+from dagster._serdes import serialize_value, whitelist_for_serdes
 from dagster._utils import merge_dicts
 from dagster._utils.error import SerializableErrorInfo
 
@@ -50,7 +55,7 @@ class PartitionBackfill(
         "_PartitionBackfill",
         [
             ("backfill_id", str),
-            ("partition_set_origin", ExternalPartitionSetOrigin),
+            ("partition_set_origin", Optional[ExternalPartitionSetOrigin]),
             ("status", BulkActionStatus),
             ("partition_names", List[str]),
             ("from_failure", bool),
@@ -60,13 +65,25 @@ class PartitionBackfill(
             ("last_submitted_partition_name", Optional[str]),
             ("error", Optional[SerializableErrorInfo]),
             ("asset_selection", Optional[List[AssetKey]]),
+            ("repository_origin", Optional[ExternalRepositoryOrigin]),
+            ("partition_key_range", Optional[PartitionKeyRange]),
+            ("max_partitions_per_run", Optional[int]),
         ],
     ),
 ):
+    """A request to launch runs for a set of partitions.
+
+    A backfill either targets a partition set, launching a run of its job for each partition name,
+    or targets a set of assets and a range of their partition keys. Asset backfills have no
+    partition set: the runs that materialize the assets are planned per job, each covering up to
+    ``max_partitions_per_run`` consecutive partitions, and are launched in topological order of the
+    jobs.
+    """
+
     def __new__(
         cls,
         backfill_id: str,
-        partition_set_origin: ExternalPartitionSetOrigin,
+        partition_set_origin: Optional[ExternalPartitionSetOrigin],
         status: BulkActionStatus,
         partition_names: List[str],
         from_failure: bool,
@@ -76,15 +93,40 @@ def __new__(
         last_submitted_partition_name: Optional[str] = None,
         error: Optional[SerializableErrorInfo] = None,
         asset_selection: Optional[List[AssetKey]] = None,
+        repository_origin: Optional[ExternalRepositoryOrigin] = None,
+        partition_key_range: Optional[PartitionKeyRange] = None,
+        max_partitions_per_run: Optional[int] = None,
     ):
         check.invariant(
             not (asset_selection and reexecution_steps),
             "Can't supply both an asset_selection and reexecution_steps to a PartitionBackfill.",
         )
+        if partition_set_origin is None:
+            check.invariant(
+                repository_origin is not None
+                and partition_key_range is not None
+                and bool(asset_selection),
+                "A PartitionBackfill without a partition set must target a repository, an "
+                "asset_selection and a partition_key_range.",
+            )
+            check.invariant(
+                not from_failure and not reexecution_steps,
+                "Asset backfills can't re-execute previous runs.",
+            )
+        else:
+            check.invariant(
+                repository_origin is None and partition_key_range is None,
+                "A PartitionBackfill of a partition set can't also target a repository or a "
+                "partition_key_range.",
+            )
+        check.invariant(
+            max_partitions_per_run is None or max_partitions_per_run > 0,
+            "max_partitions_per_run must be positive.",
+        )
         return super(PartitionBackfill, cls).__new__(
             cls,
             check.str_param(backfill_id, "backfill_id"),
-            check.inst_param(
+            check.opt_inst_param(
                 partition_set_origin, "partition_set_origin", ExternalPartitionSetOrigin
             ),
             check.inst_param(status, "status", BulkActionStatus),
@@ -96,11 +138,24 @@ def __new__(
             check.opt_str_param(last_submitted_partition_name, "last_submitted_partition_name"),
             check.opt_inst_param(error, "error", SerializableErrorInfo),
             check.opt_list_param(asset_selection, "asset_selection", of_type=AssetKey),
+            check.opt_inst_param(repository_origin, "repository_origin", ExternalRepositoryOrigin),
+            check.opt_inst_param(partition_key_range, "partition_key_range", PartitionKeyRange),
+            check.opt_int_param(max_partitions_per_run, "max_partitions_per_run"),
         )
 
+    @property
+    def is_asset_backfill(self) -> bool:
+        return self.partition_set_origin is None
+
+    @property
+    def external_repository_origin(self) -> ExternalRepositoryOrigin:
+        if self.partition_set_origin is None:
+            return check.not_none(self.repository_origin)
+        return self.partition_set_origin.external_repository_origin
+
     @property
     def selector_id(self):
-        return self.partition_set_origin.get_selector_id()
+        return self.partition_set_origin.get_selector_id() if self.partition_set_origin else None
 
     def with_status(self, status):
         check.inst_param(status, "status", BulkActionStatus)
@@ -116,6 +171,9 @@ def with_status(self, status):
             self.last_submitted_partition_name,
             self.error,
             self.asset_selection,
+            self.repository_origin,
+            self.partition_key_range,
+            self.max_partitions_per_run,
         )
 
     def with_partition_checkpoint(self, last_submitted_partition_name):
@@ -132,6 +190,9 @@ def with_partition_checkpoint(self, last_submitted_partition_name):
             last_submitted_partition_name,
             self.error,
             self.asset_selection,
+            self.repository_origin,
+            self.partition_key_range,
+            self.max_partitions_per_run,
         )
 
     def with_error(self, error):
@@ -148,6 +209,9 @@ def with_error(self, error):
             self.last_submitted_partition_name,
             error,
             self.asset_selection,
+            self.repository_origin,
+            self.partition_key_range,
+            self.max_partitions_per_run,
         )
 
 
@@ -192,36 +256,131 @@ def submit_backfill_runs(instance, workspace, repo_location, backfill_job, parti
         external_pipeline = external_repo.get_full_external_job(
             external_partition_set.pipeline_name
         )
-    for partition_data in result.partition_data:
-        pipeline_run = create_backfill_run(
+
+    # the runs are created in groups that double in size, so that a caller that stops consuming the
+    # run ids part way, e.g. because the backfill was canceled, is left with few unsubmitted runs
+    partition_data_list = result.partition_data
+    execution_plan_snapshots: Dict[str, ExecutionPlanSnapshot] = {}
+    group_size = 1
+    while partition_data_list:
+        pipeline_runs = create_backfill_runs(
             instance,
             repo_location,
             external_pipeline,
             external_partition_set,
             backfill_job,
-            partition_data,
+            partition_data_list[:group_size],
+            execution_plan_snapshots,
         )
-        if pipeline_run:
-            # we skip runs in certain cases, e.g. we are running a `from_failure` backfill job
-            # and the partition has had a successful run since the time the backfill was
-            # scheduled
-            instance.submit_run(pipeline_run.run_id, workspace)
-            yield pipeline_run.run_id
-        yield None
+        partition_data_list = partition_data_list[group_size:]
+        group_size *= 2
+
+        unsubmitted_run_ids = [
+            pipeline_run.run_id for pipeline_run in pipeline_runs if pipeline_run
+        ]
+        try:
+            for pipeline_run in pipeline_runs:
+                if pipeline_run:
+                    # we skip runs in certain cases, e.g. we are running a `from_failure` backfill
+                    # job and the partition has had a successful run since the time the backfill
+                    # was scheduled
+                    instance.submit_run(pipeline_run.run_id, workspace)
+                    unsubmitted_run_ids.remove(pipeline_run.run_id)
+                    yield pipeline_run.run_id
+                yield None
+        except GeneratorExit:
+            # the runs of the group that were created but won't be submitted
+            for run_id in unsubmitted_run_ids:
+                instance.delete_run(run_id)
+            raise
+
+
+def create_backfill_runs(
+    instance,
+    repo_location,
+    external_pipeline,
+    external_partition_set,
+    backfill_job,
+    partition_data_list,
+    execution_plan_snapshots=None,
+) -> List[Optional[PipelineRun]]:
+    """Creates the runs for a chunk of backfill partitions, returning None for each partition that
+    was skipped.
+
+    Unless the backfill re-executes failed runs, the runs are written to run storage in a single
+    batch, and partitions with the same run config share a single execution plan, rather than
+    fetching it from the repository location for each partition. Pass ``execution_plan_snapshots``
+    to also share the plans with the runs of other chunks.
+    """
+    check.sequence_param(
+        partition_data_list, "partition_data_list", of_type=ExternalPartitionExecutionParamData
+    )
+    check.opt_dict_param(execution_plan_snapshots, "execution_plan_snapshots")
+    if execution_plan_snapshots is None:
+        execution_plan_snapshots = {}
+
+    if backfill_job.from_failure:
+        return [
+            create_backfill_run(
+                instance,
+                repo_location,
+                external_pipeline,
+                external_partition_set,
+                backfill_job,
+                partition_data,
+            )
+            for partition_data in partition_data_list
+        ]
+
+    return list(
+        instance.create_runs(
+            [
+                _get_backfill_run_kwargs(
+                    instance,
+                    repo_location,
+                    external_pipeline,
+                    external_partition_set,
+                    backfill_job,
+                    partition_data,
+                    execution_plan_snapshots,
+                )
+                for partition_data in partition_data_list
+            ]
+        )
+    )
 
 
 def create_backfill_run(
     instance, repo_location, external_pipeline, external_partition_set, backfill_job, partition_data
 ):
-    from dagster._daemon.daemon import get_telemetry_daemon_session_id
-
-    check.inst_param(instance, "instance", DagsterInstance)
-    check.inst_param(repo_location, "repo_location", RepositoryLocation)
-    check.inst_param(external_pipeline, "external_pipeline", ExternalPipeline)
-    check.inst_param(external_partition_set, "external_partition_set", ExternalPartitionSet)
     check.inst_param(backfill_job, "backfill_job", PartitionBackfill)
     check.inst_param(partition_data, "partition_data", ExternalPartitionExecutionParamData)
 
+    if backfill_job.from_failure:
+        return _create_backfill_run_from_failure(
+            instance,
+            repo_location,
+            external_pipeline,
+            external_partition_set,
+            backfill_job,
+            partition_data,
+        )
+
+    return instance.create_run(
+        **_get_backfill_run_kwargs(
+            instance,
+            repo_location,
+            external_pipeline,
+            external_partition_set,
+            backfill_job,
+            partition_data,
+        )
+    )
+
+
+def _log_backfill_run_created(instance, repo_location, external_pipeline):
+    from dagster._daemon.daemon import get_telemetry_daemon_session_id
+
     log_action(
         instance,
         BACKFILL_RUN_CREATED,
@@ -232,16 +391,68 @@ def create_backfill_run(
         },
     )
 
-    tags = merge_dicts(
+
+def _get_backfill_run_tags(external_pipeline, backfill_job, partition_data):
+    return merge_dicts(
         external_pipeline.tags,
         partition_data.tags,
         PipelineRun.tags_for_backfill_id(backfill_job.backfill_id),
         backfill_job.tags,
     )
 
+
+def _create_backfill_run_from_failure(
+    instance, repo_location, external_pipeline, external_partition_set, backfill_job, partition_data
+):
+    _log_backfill_run_created(instance, repo_location, external_pipeline)
+
+    last_run = _fetch_last_run(instance, external_partition_set, partition_data.name)
+    if not last_run or last_run.status != PipelineRunStatus.FAILURE:
+        return None
+    return instance.create_reexecuted_run(
+        last_run,
+        repo_location,
+        external_pipeline,
+        ReexecutionStrategy.FROM_FAILURE,
+        extra_tags=_get_backfill_run_tags(external_pipeline, backfill_job, partition_data),
+        run_config=partition_data.run_config,
+        mode=external_partition_set.mode,
+        use_parent_run_tags=False,  # don't inherit tags from the previous run
+    )
+
+
+def _get_backfill_run_kwargs(
+    instance,
+    repo_location,
+    external_pipeline,
+    external_partition_set,
+    backfill_job,
+    partition_data,
+    execution_plan_snapshots=None,
+):
+    """The arguments of ``DagsterInstance.create_run`` for the run of a backfill partition.
+
+    If ``execution_plan_snapshots`` is passed, execution plans that don't depend on the state of a
+    previous run are cached in it by run config, and reused for other partitions with the same
+    run config.
+    """
+    check.inst_param(instance, "instance", DagsterInstance)
+    check.inst_param(repo_location, "repo_location", RepositoryLocation)
+    check.inst_param(external_pipeline, "external_pipeline", ExternalPipeline)
+    check.inst_param(external_partition_set, "external_partition_set", ExternalPartitionSet)
+    check.inst_param(backfill_job, "backfill_job", PartitionBackfill)
+    check.inst_param(partition_data, "partition_data", ExternalPartitionExecutionParamData)
+    check.invariant(
+        not backfill_job.from_failure, "Runs that re-execute from failure are created separately"
+    )
+
+    _log_backfill_run_created(instance, repo_location, external_pipeline)
+
+    tags = _get_backfill_run_tags(external_pipeline, backfill_job, partition_data)
+
     solids_to_execute = None
     solid_selection = None
-    if not backfill_job.from_failure and not backfill_job.reexecution_steps:
+    if not backfill_job.reexecution_steps:
         step_keys_to_execute = None
         parent_run_id = None
         root_run_id = None
@@ -250,22 +461,7 @@ def create_backfill_run(
             solids_to_execute = frozenset(external_partition_set.solid_selection)
             solid_selection = external_partition_set.solid_selection
 
-    elif backfill_job.from_failure:
-        last_run = _fetch_last_run(instance, external_partition_set, partition_data.name)
-        if not last_run or last_run.status != PipelineRunStatus.FAILURE:
-            return None
-        return instance.create_reexecuted_run(
-            last_run,
-            repo_location,
-            external_pipeline,
-            ReexecutionStrategy.FROM_FAILURE,
-            extra_tags=tags,
-            run_config=partition_data.run_config,
-            mode=external_partition_set.mode,
-            use_parent_run_tags=False,  # don't inherit tags from the previous run
-        )
-
-    elif backfill_job.reexecution_steps:
+    else:
         last_run = _fetch_last_run(instance, external_partition_set, partition_data.name)
         parent_run_id = last_run.run_id if last_run else None
         root_run_id = (last_run.root_run_id or last_run.run_id) if last_run else None
@@ -286,18 +482,29 @@ def create_backfill_run(
             solids_to_execute = frozenset(external_partition_set.solid_selection)
             solid_selection = external_partition_set.solid_selection
 
-    external_execution_plan = repo_location.get_external_execution_plan(
-        external_pipeline,
-        partition_data.run_config,
-        external_partition_set.mode,
-        step_keys_to_execute=step_keys_to_execute,
-        known_state=known_state,
-        instance=instance,
-    )
+    # the execution plan only varies between partitions with their run config, unless it depends
+    # on the state of a previous run
+    plan_cache_key = None
+    execution_plan_snapshot = None
+    if execution_plan_snapshots is not None and known_state is None:
+        plan_cache_key = serialize_value(partition_data.run_config)
+        execution_plan_snapshot = execution_plan_snapshots.get(plan_cache_key)
 
-    return instance.create_run(
+    if not execution_plan_snapshot:
+        execution_plan_snapshot = repo_location.get_external_execution_plan(
+            external_pipeline,
+            partition_data.run_config,
+            external_partition_set.mode,
+            step_keys_to_execute=step_keys_to_execute,
+            known_state=known_state,
+            instance=instance,
+        ).execution_plan_snapshot
+        if execution_plan_snapshots is not None and plan_cache_key:
+            execution_plan_snapshots[plan_cache_key] = execution_plan_snapshot
+
+    return dict(
         pipeline_snapshot=external_pipeline.pipeline_snapshot,
-        execution_plan_snapshot=external_execution_plan.execution_plan_snapshot,
+        execution_plan_snapshot=execution_plan_snapshot,
         parent_pipeline_snapshot=external_pipeline.parent_pipeline_snapshot,
         pipeline_name=external_pipeline.name,
         run_id=make_new_run_id(),
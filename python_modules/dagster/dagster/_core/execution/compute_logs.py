@@ -3,6 +3,7 @@
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 import uuid
 import warnings
@@ -13,6 +14,11 @@
 from dagster._seven import IS_WINDOWS, wait_for_process
 from dagster._utils import ensure_file
 
+# how often the in-process tail checks the captured file for appended output
+TAIL_POLL_INTERVAL = 0.1
+TAIL_CHUNK_SIZE = 65536
+TAIL_JOIN_TIMEOUT = 5
+
 WIN_PY36_COMPUTE_LOG_DISABLED_MSG = """\u001b[33mWARNING: Compute log capture is disabled for the current environment. Set the environment variable `PYTHONLEGACYWINDOWSSTDIO` to enable.\n\u001b[0m"""
 
 
@@ -31,6 +37,21 @@ def mirror_stream_to_file(stream, filepath):
             yield pids
 
 
+@contextmanager
+def tee_stream_to_file(stream, filepath):
+    """Like `mirror_stream_to_file`, but mirrors the captured output back to the stream from a
+    thread in the current process rather than from tail subprocesses."""
+    if IS_WINDOWS:
+        with mirror_stream_to_file(stream, filepath):
+            yield
+        return
+
+    ensure_file(filepath)
+    with execute_thread_tail(filepath, stream):
+        with redirect_to_file(stream, filepath):
+            yield
+
+
 def should_disable_io_stream_redirect():
     # See https://stackoverflow.com/a/52377087
     # https://www.python.org/dev/peps/pep-0528/
@@ -142,6 +163,60 @@ def execute_posix_tail(path, stream):
             _clean_up_subprocess(watcher_process)
 
 
+@contextmanager
+def execute_thread_tail(path, stream):
+    # copy the file descriptor before it gets redirected, so that the thread writes the appended
+    # contents of the file to the original destination of the stream
+    fd = _fileno(stream)
+    if not fd:
+        yield
+        return
+
+    copied_fd = os.dup(fd)
+    shutdown_event = threading.Event()
+    tail_thread = threading.Thread(
+        target=_tail_file_to_fd,
+        args=(path, os.path.getsize(path), copied_fd, shutdown_event),
+        name="compute-log-tail",
+        daemon=True,
+    )
+    tail_thread.start()
+    try:
+        yield
+    finally:
+        # the thread exits once it has written out everything appended to the file
+        shutdown_event.set()
+        tail_thread.join(TAIL_JOIN_TIMEOUT)
+        if not tail_thread.is_alive():
+            os.close(copied_fd)
+
+
+def _tail_file_to_fd(path, offset, fd, shutdown_event):
+    with open(path, "rb") as f:
+        f.seek(offset)
+        while True:
+            # check before reading, so that output written before shutdown is never skipped
+            is_shutting_down = shutdown_event.is_set()
+            data = f.read(TAIL_CHUNK_SIZE)
+            if data:
+                try:
+                    _write_all(fd, data)
+                except OSError:
+                    # the original destination went away, the file still has the output
+                    return
+            elif is_shutting_down:
+                return
+            else:
+                shutdown_event.wait(TAIL_POLL_INTERVAL)
+
+
+def _write_all(fd, data):
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
 def _clean_up_subprocess(subprocess_obj):
     try:
         if subprocess_obj:
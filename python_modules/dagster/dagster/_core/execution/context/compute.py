@@ -288,7 +288,8 @@ def has_partition_key(self) -> bool:
     def partition_key(self) -> str:
         """The partition key for the current run.
 
-        Raises an error if the current run is not a partitioned run.
+        Raises an error if the current run is not a partitioned run, or if it targets a range of
+        partitions.
         """
         return self._step_execution_context.partition_key
 
@@ -49,7 +49,11 @@
 from dagster._core.log_manager import DagsterLogManager
 from dagster._core.storage.io_manager import IOManager
 from dagster._core.storage.pipeline_run import PipelineRun
-from dagster._core.storage.tags import PARTITION_NAME_TAG
+from dagster._core.storage.tags import (
+    ASSET_PARTITION_RANGE_END_TAG,
+    ASSET_PARTITION_RANGE_START_TAG,
+    PARTITION_NAME_TAG,
+)
 from dagster._core.system_config.objects import ResolvedRunConfig
 from dagster._core.types.dagster_type import DagsterType
 
@@ -331,6 +335,13 @@ def log(self) -> DagsterLogManager:
     @property
     def partition_key(self) -> str:
         tags = self._plan_data.pipeline_run.tags
+        if PARTITION_NAME_TAG not in tags and ASSET_PARTITION_RANGE_START_TAG in tags:
+            raise DagsterInvariantViolationError(
+                "Tried to access partition_key for a run that targets the range of partitions "
+                f"from {tags[ASSET_PARTITION_RANGE_START_TAG]} to "
+                f"{tags.get(ASSET_PARTITION_RANGE_END_TAG)}. Use asset_partition_key_range to "
+                "access the partitions of the run instead."
+            )
         check.invariant(
             PARTITION_NAME_TAG in tags, "Tried to access partition_key for a non-partitioned run"
         )
@@ -360,12 +371,64 @@ def partition_time_window(self) -> str:
     def has_partition_key(self) -> bool:
         return PARTITION_NAME_TAG in self._plan_data.pipeline_run.tags
 
+    @property
+    def asset_partition_key_range(self) -> PartitionKeyRange:
+        """The range of partitions targeted by the run, which is either the range set by the asset
+        partition range tags, or the single partition of a partitioned run."""
+        from dagster._core.definitions.job_definition import JobDefinition
+
+        tags = self._plan_data.pipeline_run.tags
+        start = tags.get(ASSET_PARTITION_RANGE_START_TAG)
+        end = tags.get(ASSET_PARTITION_RANGE_END_TAG)
+        if start is None and end is None:
+            return PartitionKeyRange(self.partition_key, self.partition_key)
+
+        if start is None or end is None:
+            set_tag = (
+                ASSET_PARTITION_RANGE_START_TAG if end is None else ASSET_PARTITION_RANGE_END_TAG
+            )
+            raise DagsterInvariantViolationError(
+                "A run that targets a range of partitions must have both the "
+                f"{ASSET_PARTITION_RANGE_START_TAG} and {ASSET_PARTITION_RANGE_END_TAG} tags, but "
+                f"only the {set_tag} tag is set."
+            )
+
+        pipeline_def = self._execution_data.pipeline_def
+        partitions_def = (
+            pipeline_def.partitions_def if isinstance(pipeline_def, JobDefinition) else None
+        )
+        if partitions_def is not None and not _is_partition_key_range_ordered(
+            partitions_def, start, end
+        ):
+            raise DagsterInvariantViolationError(
+                f"Invalid range of partitions from {start} to {end}: the start of the range must be "
+                f"a partition of job '{pipeline_def.name}' that does not come after its end."
+            )
+
+        return PartitionKeyRange(start, end)
+
     def for_type(self, dagster_type: DagsterType) -> "TypeCheckContext":
         return TypeCheckContext(
             self.run_id, self.log, self._execution_data.scoped_resources_builder, dagster_type
         )
 
 
+def _is_partition_key_range_ordered(
+    partitions_def: PartitionsDefinition, start: str, end: str
+) -> bool:
+    if isinstance(partitions_def, TimeWindowPartitionsDefinition):
+        return partitions_def.start_time_for_partition_key(
+            start
+        ) <= partitions_def.start_time_for_partition_key(end)
+
+    partition_keys = partitions_def.get_partition_keys()
+    return (
+        start in partition_keys
+        and end in partition_keys
+        and partition_keys.index(start) <= partition_keys.index(end)
+    )
+
+
 class StepExecutionContext(PlanExecutionContext, IStepContext):
     """Context for the execution of a step. Users should not instantiate this class directly.
 
@@ -766,9 +829,7 @@ def asset_partition_key_range_for_input(self, input_name: str) -> PartitionKeyRa
 
             if assets_def is not None and upstream_asset_partitions_def is not None:
                 partition_key_range = (
-                    PartitionKeyRange(self.partition_key, self.partition_key)
-                    if assets_def.partitions_def
-                    else None
+                    self.asset_partition_key_range if assets_def.partitions_def else None
                 )
                 return get_upstream_partitions_for_partition_range(
                     assets_def,
@@ -803,7 +864,7 @@ def has_asset_partitions_for_output(self, output_name: str) -> bool:
 
     def asset_partition_key_range_for_output(self, output_name: str) -> PartitionKeyRange:
         if self._partitions_def_for_output(output_name) is not None:
-            return PartitionKeyRange(self.partition_key, self.partition_key)
+            return self.asset_partition_key_range
 
         check.failed("The output has no asset partitions")
 
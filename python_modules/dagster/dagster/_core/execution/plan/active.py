@@ -1,5 +1,8 @@
+import heapq
+import itertools
 import time
-from typing import Callable, Dict, Iterator, List, Optional, Set, cast
+from collections import defaultdict
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple, cast
 
 import dagster._check as check
 from dagster._core.errors import (
@@ -52,7 +55,18 @@ def __init__(
         self._step_outputs: Set[StepOutputHandle] = set(self._plan.known_state.ready_outputs)
 
         # All steps to be executed start out here in _pending
-        self._pending: Dict[str, Set[str]] = self._plan.get_executable_step_deps()
+        self._pending: Dict[str, Set[str]] = {}
+
+        # Rather than rescanning all of _pending on every _update, index which pending steps depend
+        # on each step and how many of their deps have yet to complete, so that completing a step
+        # only checks its direct dependents
+        self._step_deps: Dict[str, Set[str]] = {}
+        self._dependents: Dict[str, Set[str]] = defaultdict(set)
+        self._remaining_dep_counts: Dict[str, int] = {}
+        self._pending_order: Dict[str, int] = {}
+        self._pending_counter = itertools.count()
+        # pending steps whose deps have all completed, or one of whose deps failed
+        self._pending_to_check: Set[str] = set()
 
         # track mapping keys from DynamicOutputs, step_key, output_name -> list of keys
         # to _gathering while in flight
@@ -63,8 +77,10 @@ def __init__(
         )
         self._new_dynamic_mappings: bool = False
 
-        # steps move in to these buckets as a result of _update calls
-        self._executable: List[str] = []
+        # steps move in to these buckets as a result of _update calls, with _executable kept as a
+        # heap ordered by sort key and then by when each step became executable
+        self._executable: List[Tuple[float, int, str]] = []
+        self._executable_counter = itertools.count()
         self._pending_skip: List[str] = []
         self._pending_retry: List[str] = []
         self._pending_abandon: List[str] = []
@@ -84,6 +100,14 @@ def __init__(
 
         self._interrupted: bool = False
 
+        for step_key, deps in self._plan.get_executable_step_deps().items():
+            self._add_pending(step_key, deps)
+
+        # track the steps that still need to load each output produced in this plan, so that the
+        # output can be released once nothing left to execute will load it
+        self._output_consumers: Dict[StepOutputHandle, Set[str]] = self._get_output_consumers()
+        self._outputs_to_release: List[StepOutputHandle] = []
+
         # Start the show by loading _executable with the set of _pending steps that have no deps
         self._update()
 
@@ -100,7 +124,10 @@ def __exit__(self, exc_type, exc_value, traceback):
 
         if not self.is_complete:
             pending_action = (
-                self._executable + self._pending_abandon + self._pending_retry + self._pending_skip
+                [step_key for _, _, step_key in self._executable]
+                + self._pending_abandon
+                + self._pending_retry
+                + self._pending_skip
             )
             state_str = "{pending_str}{in_flight_str}{action_str}{retry_str}".format(
                 in_flight_str="\nSteps still in flight: {}".format(self._in_flight)
@@ -149,23 +176,26 @@ def _update(self) -> None:
         new_steps_to_skip = []
         new_steps_to_abandon = []
 
-        successful_or_skipped_steps = self._success | self._skipped
-        failed_or_abandoned_steps = self._failed | self._abandoned
-
         if self._new_dynamic_mappings:
             new_step_deps = self._plan.resolve(self._successful_dynamic_outputs)
             for step_key, deps in new_step_deps.items():
-                self._pending[step_key] = deps
+                self._add_pending(step_key, deps)
 
             self._new_dynamic_mappings = False
 
-        for step_key, requirements in self._pending.items():
+        # check steps in the order they were added to _pending
+        steps_to_check = sorted(self._pending_to_check, key=self._pending_order.__getitem__)
+        self._pending_to_check.clear()
+
+        for step_key in steps_to_check:
+            requirements = self._pending[step_key]
+
             # If any upstream deps failed - this is not executable
-            if requirements.intersection(failed_or_abandoned_steps):
+            if any(dep in self._failed or dep in self._abandoned for dep in requirements):
                 new_steps_to_abandon.append(step_key)
 
             # If all the upstream steps of a step are complete or skipped
-            elif requirements.issubset(successful_or_skipped_steps):
+            elif self._remaining_dep_counts[step_key] == 0:
                 step = self.get_step_by_key(step_key)
 
                 # The base case is downstream step won't skip
@@ -193,26 +223,75 @@ def _update(self) -> None:
                     new_steps_to_execute.append(step_key)
 
         for key in new_steps_to_execute:
-            self._executable.append(key)
-            del self._pending[key]
+            self._push_executable(key)
+            self._remove_pending(key)
 
         for key in new_steps_to_skip:
             self._pending_skip.append(key)
-            del self._pending[key]
+            self._remove_pending(key)
 
         for key in new_steps_to_abandon:
             self._pending_abandon.append(key)
-            del self._pending[key]
-
-        ready_to_retry = []
-        tick_time = time.time()
-        for key, at_time in self._waiting_to_retry.items():
-            if tick_time >= at_time:
-                ready_to_retry.append(key)
-
-        for key in ready_to_retry:
-            self._executable.append(key)
-            del self._waiting_to_retry[key]
+            self._remove_pending(key)
+
+        if self._waiting_to_retry:
+            ready_to_retry = []
+            tick_time = time.time()
+            for key, at_time in self._waiting_to_retry.items():
+                if tick_time >= at_time:
+                    ready_to_retry.append(key)
+
+            for key in ready_to_retry:
+                self._push_executable(key)
+                del self._waiting_to_retry[key]
+
+    def _add_pending(self, step_key: str, deps: Set[str]) -> None:
+        self._pending[step_key] = deps
+        self._step_deps[step_key] = deps
+        self._pending_order[step_key] = next(self._pending_counter)
+
+        remaining_dep_count = 0
+        any_dep_failed = False
+        for dep in deps:
+            self._dependents[dep].add(step_key)
+            if dep in self._failed or dep in self._abandoned:
+                any_dep_failed = True
+            elif dep not in self._success and dep not in self._skipped:
+                remaining_dep_count += 1
+
+        self._remaining_dep_counts[step_key] = remaining_dep_count
+        if remaining_dep_count == 0 or any_dep_failed:
+            self._pending_to_check.add(step_key)
+
+    def _remove_pending(self, step_key: str) -> None:
+        del self._pending[step_key]
+        del self._pending_order[step_key]
+        del self._remaining_dep_counts[step_key]
+
+    def _update_dependents(self, step_key: str, completed: bool) -> None:
+        """Record that a step has reached a terminal state for each pending step that depends on
+        it, either by completing (succeeding or skipping) or by failing or being abandoned.
+        """
+        for dependent in self._dependents.get(step_key, ()):
+            if dependent not in self._pending:
+                continue
+
+            if completed:
+                self._remaining_dep_counts[dependent] -= 1
+                if self._remaining_dep_counts[dependent] == 0:
+                    self._pending_to_check.add(dependent)
+            else:
+                self._pending_to_check.add(dependent)
+
+    def _push_executable(self, step_key: str) -> None:
+        heapq.heappush(
+            self._executable,
+            (
+                self._sort_key_fn(self.get_step_by_key(step_key)),
+                next(self._executable_counter),
+                step_key,
+            ),
+        )
 
     def sleep_til_ready(self) -> None:
         now = time.time()
@@ -247,17 +326,13 @@ def get_steps_to_execute(self, limit: Optional[int] = None) -> List[ExecutionSte
         check.opt_int_param(limit, "limit")
         self._update()
 
-        steps = sorted(
-            [self.get_step_by_key(key) for key in self._executable],
-            key=self._sort_key_fn,
-        )
-
-        if limit is not None:
-            steps = steps[:limit]
+        steps = []
+        while self._executable and (limit is None or len(steps) < limit):
+            _, _, step_key = heapq.heappop(self._executable)
+            steps.append(self.get_step_by_key(step_key))
 
         for step in steps:
             self._in_flight.add(step.key)
-            self._executable.remove(step.key)
             self._prep_for_dynamic_outputs(step)
 
         return steps
@@ -340,20 +415,28 @@ def plan_events_iterator(self, pipeline_context) -> Iterator[DagsterEvent]:
     def mark_failed(self, step_key: str) -> None:
         self._failed.add(step_key)
         self._mark_complete(step_key)
+        self._update_dependents(step_key, completed=False)
+        self._retain_inputs(step_key)
 
     def mark_success(self, step_key: str) -> None:
         self._success.add(step_key)
         self._mark_complete(step_key)
+        self._update_dependents(step_key, completed=True)
         self._resolve_any_dynamic_outputs(step_key)
+        self._release_inputs(step_key)
 
     def mark_skipped(self, step_key: str) -> None:
         self._skipped.add(step_key)
         self._mark_complete(step_key)
+        self._update_dependents(step_key, completed=True)
         self._resolve_any_dynamic_outputs(step_key)
+        self._release_inputs(step_key)
 
     def mark_abandoned(self, step_key: str) -> None:
         self._abandoned.add(step_key)
         self._mark_complete(step_key)
+        self._update_dependents(step_key, completed=False)
+        self._retain_inputs(step_key)
 
     def mark_interrupted(self) -> None:
         self._interrupted = True
@@ -373,11 +456,13 @@ def mark_up_for_retry(self, step_key: str, at_time: Optional[float] = None) -> N
             if at_time:
                 self._waiting_to_retry[step_key] = at_time
             else:
-                self._pending[step_key] = self._plan.get_executable_step_deps()[step_key]
+                self._add_pending(step_key, self._step_deps[step_key])
 
         elif self._retry_mode.deferred:
             # do not attempt to execute again
             self._abandoned.add(step_key)
+            self._update_dependents(step_key, completed=False)
+            self._retain_inputs(step_key)
 
         self._retry_state.mark_attempt(step_key)
 
@@ -486,6 +571,56 @@ def _resolve_any_dynamic_outputs(self, step_key: str):
             self._successful_dynamic_outputs[step_key] = self._gathering_dynamic_outputs[step_key]
             self._new_dynamic_mappings = True
 
+    def _get_output_consumers(self) -> Dict[StepOutputHandle, Set[str]]:
+        step_keys_to_execute = set(self._pending.keys())
+
+        # the consumers of outputs that feed in to dynamic steps are not known until the steps
+        # resolve, so outputs of their upstream steps are never released
+        unresolved_dep_keys: Set[str] = set()
+        for step in self._plan.steps:
+            if not isinstance(step, ExecutionStep):
+                unresolved_dep_keys.update(step.get_all_dependency_keys())
+
+        consumers: Dict[StepOutputHandle, Set[str]] = {}
+        for step_key in step_keys_to_execute:
+            for step_input in self.get_step_by_key(step_key).step_inputs:
+                for handle in step_input.get_step_output_handle_dependencies():
+                    if (
+                        handle.step_key in step_keys_to_execute
+                        and handle.step_key not in unresolved_dep_keys
+                    ):
+                        consumers.setdefault(handle, set()).add(step_key)
+
+        return consumers
+
+    def _release_inputs(self, step_key: str) -> None:
+        for step_input in self.get_step_by_key(step_key).step_inputs:
+            for handle in step_input.get_step_output_handle_dependencies():
+                consumers = self._output_consumers.get(handle)
+                if consumers is None:
+                    continue
+
+                consumers.discard(step_key)
+                if not consumers:
+                    del self._output_consumers[handle]
+                    # skipped outputs have nothing to release
+                    if handle in self._step_outputs:
+                        self._outputs_to_release.append(handle)
+
+    def _retain_inputs(self, step_key: str) -> None:
+        # keep the inputs of steps that did not complete so they are available when re-executing
+        # from failure
+        for step_input in self.get_step_by_key(step_key).step_inputs:
+            for handle in step_input.get_step_output_handle_dependencies():
+                self._output_consumers.pop(handle, None)
+
+    def get_outputs_to_release(self) -> List[StepOutputHandle]:
+        """Outputs produced during this execution that all of their downstream steps have since
+        succeeded or skipped past, and so will not be loaded again."""
+        outputs = self._outputs_to_release
+        self._outputs_to_release = []
+        return outputs
+
     def rebuild_from_events(self, dagster_events: List[DagsterEvent]) -> List[ExecutionStep]:
         """
         Replay events to rebuild the execution state and continue after a failure.
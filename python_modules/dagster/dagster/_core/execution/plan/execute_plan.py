@@ -14,6 +14,7 @@
 )
 from dagster._core.events import DagsterEvent, EngineEventData
 from dagster._core.execution.context.system import PlanExecutionContext, StepExecutionContext
+from dagster._core.execution.plan.active import ActiveExecution
 from dagster._core.execution.plan.execute_step import core_dagster_event_sequence_for_step
 from dagster._core.execution.plan.objects import (
     ErrorSource,
@@ -22,6 +23,7 @@
     UserFailureData,
     step_failure_event_from_exc_info,
 )
+from dagster._core.execution.plan.outputs import StepOutputHandle
 from dagster._core.execution.plan.plan import ExecutionPlan
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
@@ -33,10 +35,6 @@ def inner_plan_execution_iterator(
     check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
 
     with execution_plan.start(retry_mode=pipeline_context.retry_mode) as active_execution:
-
-        # It would be good to implement a reference tracking algorithm here to
-        # garbage collect results that are no longer needed by any steps
-        # https://github.com/dagster-io/dagster/issues/811
         while not active_execution.is_complete:
             step = active_execution.get_next_step()
             step_context = cast(
@@ -110,6 +108,35 @@ def inner_plan_execution_iterator(
             for hook_event in _trigger_hook(step_context, step_event_list):
                 yield hook_event
 
+            # let IO managers free outputs that no remaining step will load
+            for step_output_handle in active_execution.get_outputs_to_release():
+                yield from _release_output(pipeline_context, active_execution, step_output_handle)
+
+
+def _release_output(
+    pipeline_context: PlanExecutionContext,
+    active_execution: ActiveExecution,
+    step_output_handle: StepOutputHandle,
+) -> Iterator[DagsterEvent]:
+    step_context = cast(
+        StepExecutionContext,
+        pipeline_context.for_step(
+            active_execution.get_step_by_key(step_output_handle.step_key),
+            active_execution.get_known_state(),
+        ),
+    )
+    try:
+        output_manager = step_context.get_io_manager(step_output_handle)
+        output_manager.release_output(step_context.get_output_context(step_output_handle))
+    except Exception:
+        yield DagsterEvent.engine_event(
+            plan_context=step_context,
+            message=f'Exception while releasing output "{step_output_handle.output_name}"',
+            event_specific_data=EngineEventData(
+                error=serializable_error_info_from_exc_info(sys.exc_info())
+            ),
+        )
+
 
 def _trigger_hook(
     step_context: StepExecutionContext, step_event_list: List[DagsterEvent]
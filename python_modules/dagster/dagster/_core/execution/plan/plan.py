@@ -43,7 +43,7 @@
 )
 from dagster._core.execution.retries import RetryMode
 from dagster._core.instance import DagsterInstance, InstanceRef
-from dagster._core.storage.mem_io_manager import mem_io_manager
+from dagster._core.storage.mem_io_manager import in_process_mem_io_manager, mem_io_manager
 from dagster._core.system_config.objects import ResolvedRunConfig
 from dagster._core.utils import toposort
 
@@ -866,6 +866,35 @@ def build_subset_plan(
             repository_load_data=self.repository_load_data,
         )
 
+    def with_known_state(self, known_state: KnownExecutionState) -> "ExecutionPlan":
+        """Returns a copy of a plan built for the whole pipeline, in which the steps downstream of
+        the dynamic outputs of the known state are resolved, like building the plan with the known
+        state would. Steps can then be subset from it without building the plan again.
+        """
+        check.inst_param(known_state, "known_state", KnownExecutionState)
+
+        # resolving steps adds them to the step dicts, so they are copied
+        step_dict = dict(self.step_dict)
+        step_dict_by_key = dict(self.step_dict_by_key)
+        executable_map, resolvable_map = _compute_step_maps(
+            step_dict,
+            step_dict_by_key,
+            self.step_handles_to_execute,
+            known_state,
+        )
+
+        return ExecutionPlan(
+            step_dict,
+            executable_map,
+            resolvable_map,
+            self.step_handles_to_execute,
+            known_state,
+            self.artifacts_persisted,
+            step_dict_by_key,
+            executor_name=self.executor_name,
+            repository_load_data=self.repository_load_data,
+        )
+
     def get_version_for_step_output_handle(
         self, step_output_handle: StepOutputHandle
     ) -> Optional[str]:
@@ -1183,6 +1212,7 @@ def _update_from_resolved_dynamic_outputs(
 ) -> None:
     resolved_steps = []
     key_sets_to_clear = []
+    step_handles_to_execute_set = set(step_handles_to_execute)
 
     # find entries in the resolvable map whose requirements are now all ready
     for required_keys, unresolved_step_handles in resolvable_map.items():
@@ -1193,7 +1223,7 @@ def _update_from_resolved_dynamic_outputs(
 
         for unresolved_step_handle in unresolved_step_handles:
             # don't resolve steps we are not executing
-            if unresolved_step_handle not in step_handles_to_execute:
+            if unresolved_step_handle not in step_handles_to_execute_set:
                 continue
 
             resolvable_step = step_dict[unresolved_step_handle]
@@ -1228,7 +1258,10 @@ def can_isolate_steps(pipeline_def: PipelineDefinition, mode_def: ModeDefinition
         for output_def in solid_def.output_defs
     ]
     for output_def in output_defs:
-        if mode_def.resource_defs[output_def.io_manager_key] == mem_io_manager:
+        if mode_def.resource_defs[output_def.io_manager_key] in (
+            mem_io_manager,
+            in_process_mem_io_manager,
+        ):
             return False
 
     return True
@@ -1363,7 +1396,7 @@ def _compute_artifacts_persisted(
                     # no IO manager is configured
                     not manager_def
                     # IO manager is non persistent
-                    or manager_def == mem_io_manager
+                    or manager_def in (mem_io_manager, in_process_mem_io_manager)
                 ):
                     return False
     return True
@@ -1403,7 +1436,7 @@ def _get_executable_step_deps(
     # for things transitively downstream of unresolved collect steps
     unresolved_set = set()
 
-    step_keys_to_execute = [handle.to_key() for handle in step_handles_to_execute]
+    step_keys_to_execute = {handle.to_key() for handle in step_handles_to_execute}
 
     for key, handle in executable_map.items():
         step = cast(ExecutionStep, step_dict[handle])
@@ -1461,7 +1494,7 @@ def _compute_step_maps(step_dict, step_dict_by_key, step_handles_to_execute, kno
             step_keys=missing_steps,
         )
 
-    step_keys_to_execute = [step_handle.to_key() for step_handle in step_handles_to_execute]
+    step_keys_to_execute = {step_handle.to_key() for step_handle in step_handles_to_execute}
 
     executable_map = {}
     resolvable_map: Dict[str, List[UnresolvedStepHandle]] = defaultdict(list)
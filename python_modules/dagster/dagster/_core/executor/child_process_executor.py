@@ -5,13 +5,17 @@
 import queue
 import sys
 from abc import ABC, abstractmethod
-from typing import NamedTuple
+from contextlib import ExitStack
+from typing import Any, Callable, ContextManager, Dict, Hashable, List, NamedTuple, TypeVar
 
 import dagster._check as check
 from dagster._core.errors import DagsterExecutionInterruptedError
+from dagster._utils import start_termination_thread
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster._utils.interrupts import capture_interrupts
 
+T = TypeVar("T")
+
 
 class ChildProcessEvent:
     pass
@@ -47,6 +51,43 @@ def execute(self):
 
         Yields a sequence of events to be handled by _execute_command_in_child_process."""
 
+    def execute_in_worker(self, worker_state: "ChildProcessWorkerState"):
+        """This method is invoked instead of execute when the command runs in a ChildProcessWorker,
+        which executes many commands in the same process. Commands can keep the state that does not
+        need to be rebuilt for each command in the worker_state.
+
+        Yields the same sequence of events as execute."""
+        check.inst_param(worker_state, "worker_state", ChildProcessWorkerState)
+        return self.execute()
+
+
+class ChildProcessWorkerState:
+    """State kept by a ChildProcessWorker process across the commands it executes. Each value is
+    created by the first command that needs it, and closed when the worker process exits.
+    """
+
+    def __init__(self):
+        self._values: Dict[Hashable, Any] = {}
+        self._exit_stack = ExitStack()
+
+    def get_or_create(self, key: Hashable, create_fn: Callable[[], ContextManager[T]]) -> T:
+        """Returns the value kept for the key, or enters the context manager returned by create_fn
+        and keeps its value for the next commands. The context manager is exited when the worker
+        process exits."""
+        if key not in self._values:
+            self._values[key] = self._exit_stack.enter_context(create_fn())
+        return self._values[key]
+
+    def close(self):
+        self._values = {}
+        self._exit_stack.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, _exception_type, _exception_value, _traceback):
+        self.close()
+
 
 class ChildProcessCrashException(Exception):
     """Thrown when the child process crashes."""
@@ -56,18 +97,24 @@ def __init__(self, exit_code=None):
         super().__init__()
 
 
-def _execute_command_in_child_process(event_queue, command):
+def _execute_command_in_child_process(event_queue, command, worker_state=None):
     """Wraps the execution of a ChildProcessCommand.
 
     Handles errors and communicates across a queue with the parent process."""
 
     check.inst_param(command, "command", ChildProcessCommand)
+    check.opt_inst_param(worker_state, "worker_state", ChildProcessWorkerState)
 
     with capture_interrupts():
         pid = os.getpid()
         event_queue.put(ChildProcessStartEvent(pid=pid))
         try:
-            for step_event in command.execute():
+            events = (
+                command.execute()
+                if worker_state is None
+                else command.execute_in_worker(worker_state)
+            )
+            for step_event in events:
                 event_queue.put(step_event)
             event_queue.put(ChildProcessDoneEvent(pid=pid))
 
@@ -83,6 +130,20 @@ def _execute_command_in_child_process(event_queue, command):
             )
 
 
+def _execute_commands_in_worker_process(command_queue, event_queue, term_event):
+    """Executes the ChildProcessCommands put on the command queue one at a time, until a None
+    sentinel is received. Each command is wrapped as in _execute_command_in_child_process."""
+
+    start_termination_thread(term_event)
+    with ChildProcessWorkerState() as worker_state:
+        while True:
+            command = command_queue.get()
+            if command is None:
+                break
+
+            _execute_command_in_child_process(event_queue, command, worker_state)
+
+
 TICK = 20.0 * 1.0 / 1000.0
 """The minimum interval at which to check for child process liveness -- default 20ms."""
 
@@ -165,3 +226,116 @@ def execute_child_process_command(multiprocessing_ctx, command):
         process.join()
     finally:
         event_queue.close()
+
+
+WORKER_SHUTDOWN_TIMEOUT = 30
+"""Seconds to wait for an idle worker process to exit before terminating it."""
+
+
+class ChildProcessWorker:
+    """A child process that executes many ChildProcessCommands sequentially, so that the cost of
+    starting the process and importing user code is only paid once.
+
+    The worker owns its termination event, since multiprocessing events can only be shared with a
+    child process when it is started. The commands it executes should not start their own
+    termination thread.
+    """
+
+    def __init__(self, multiprocessing_ctx):
+        self._command_queue = multiprocessing_ctx.Queue()
+        self._event_queue = multiprocessing_ctx.Queue()
+        self._term_event = multiprocessing_ctx.Event()
+        self._process = multiprocessing_ctx.Process(
+            target=_execute_commands_in_worker_process,
+            args=(self._command_queue, self._event_queue, self._term_event),
+        )
+        self._process.daemon = True
+        self._process.start()
+
+    @property
+    def term_event(self):
+        return self._term_event
+
+    def is_alive(self) -> bool:
+        return self._process.is_alive()
+
+    def execute_command(self, command):
+        """Execute a ChildProcessCommand in the worker process. Yields the same values as
+        execute_child_process_command, and raises ChildProcessCrashException if the worker process
+        dies while executing the command.
+        """
+        check.inst_param(command, "command", ChildProcessCommand)
+
+        self._command_queue.put(command)
+
+        completed_properly = False
+        while not completed_properly:
+            event = _poll_for_event(self._process, self._event_queue)
+
+            if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                break
+
+            yield event
+
+            if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
+                completed_properly = True
+
+        if not completed_properly:
+            raise ChildProcessCrashException(exit_code=self._process.exitcode)
+
+    def shutdown(self):
+        if self._process.is_alive():
+            self._command_queue.put(None)
+            self._process.join(timeout=WORKER_SHUTDOWN_TIMEOUT)
+
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+
+        self._command_queue.close()
+        self._event_queue.close()
+
+
+class ChildProcessWorkerPool:
+    """A pool of up to max_workers ChildProcessWorkers, which are started as they are needed and
+    reused once they are released. Crashed and interrupted workers are discarded and replaced.
+    """
+
+    def __init__(self, multiprocessing_ctx, max_workers: int):
+        self._multiprocessing_ctx = multiprocessing_ctx
+        self._max_workers = check.int_param(max_workers, "max_workers")
+        self._idle_workers: List[ChildProcessWorker] = []
+        self._busy_workers: List[ChildProcessWorker] = []
+
+    def acquire(self) -> ChildProcessWorker:
+        check.invariant(
+            len(self._busy_workers) < self._max_workers,
+            "All of the workers in the pool are busy",
+        )
+        if self._idle_workers:
+            worker = self._idle_workers.pop()
+        else:
+            worker = ChildProcessWorker(self._multiprocessing_ctx)
+        self._busy_workers.append(worker)
+        return worker
+
+    def release(self, worker: ChildProcessWorker):
+        self._busy_workers.remove(worker)
+        # the termination thread of a worker exits once its termination event has been set, so an
+        # interrupted worker is replaced rather than reused with an event that stays set
+        if worker.is_alive() and not worker.term_event.is_set():
+            self._idle_workers.append(worker)
+        else:
+            worker.shutdown()
+
+    def shutdown(self):
+        for worker in self._idle_workers + self._busy_workers:
+            worker.shutdown()
+        self._idle_workers = []
+        self._busy_workers = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, _exception_type, _exception_value, _traceback):
+        self.shutdown()
@@ -1,10 +1,13 @@
 import multiprocessing
 import os
 import sys
-from typing import List, Optional
+from collections import OrderedDict
+from contextlib import nullcontext
+from typing import Dict, FrozenSet, List, Optional
 
 from dagster import MetadataEntry
 from dagster import _check as check
+from dagster._core.definitions.resource_definition import ScopedResourcesBuilder
 from dagster._core.errors import (
     DagsterExecutionInterruptedError,
     DagsterSubprocessError,
@@ -16,10 +19,12 @@
 from dagster._core.execution.context_creation_pipeline import create_context_free_log_manager
 from dagster._core.execution.plan.objects import StepFailureData
 from dagster._core.execution.plan.plan import ExecutionPlan
+from dagster._core.execution.resources_init import resource_initialization_manager
 from dagster._core.execution.retries import RetryMode
 from dagster._core.executor.base import Executor
 from dagster._core.instance import DagsterInstance
-from dagster._utils import start_termination_thread
+from dagster._core.system_config.objects import ResolvedRunConfig
+from dagster._utils import EventGenerationManager, start_termination_thread
 from dagster._utils.error import serializable_error_info_from_exc_info
 from dagster._utils.timing import format_duration, time_execution_scope
 
@@ -28,6 +33,8 @@
     ChildProcessCrashException,
     ChildProcessEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorker,
+    ChildProcessWorkerPool,
     execute_child_process_command,
 )
 
@@ -46,6 +53,7 @@ def __init__(
         retry_mode,
         known_state,
         repository_load_data,
+        reuse_resources=False,
     ):
         self.run_config = run_config
         self.pipeline_run = pipeline_run
@@ -56,6 +64,7 @@ def __init__(
         self.retry_mode = retry_mode
         self.known_state = known_state
         self.repository_load_data = repository_load_data
+        self.reuse_resources = reuse_resources
 
     def execute(self):
         pipeline = self.recon_pipeline
@@ -70,26 +79,109 @@ def execute(self):
                 repository_load_data=self.repository_load_data,
             )
 
-            log_manager = create_context_free_log_manager(instance, self.pipeline_run)
+            yield from self._execute_step(instance, execution_plan)
 
-            yield DagsterEvent.step_worker_started(
-                log_manager,
-                self.pipeline_run.pipeline_name,
-                message='Executing step "{}" in subprocess.'.format(self.step_key),
-                metadata_entries=[
-                    MetadataEntry("pid", value=str(os.getpid())),
-                ],
-                step_key=self.step_key,
-            )
+    def execute_in_worker(self, worker_state):
+        # the steps executed by a worker process all belong to the same run, so the instance and the
+        # plan of the whole job are built for its first step, and the plan of each step is subset
+        # from it. The worker owns the termination thread.
+        pipeline = self.recon_pipeline
+        if self.repository_load_data is not None:
+            pipeline = pipeline.with_repository_load_data(self.repository_load_data)
+        pipeline_def = pipeline.get_definition()
 
-            yield from execute_plan_iterator(
-                execution_plan,
-                pipeline,
-                self.pipeline_run,
-                run_config=self.run_config,
-                retry_mode=self.retry_mode.for_inner_plan(),
-                instance=instance,
+        instance = worker_state.get_or_create(
+            "instance", lambda: DagsterInstance.from_ref(self.instance_ref)
+        )
+        resolved_run_config = worker_state.get_or_create(
+            "resolved_run_config",
+            lambda: nullcontext(
+                ResolvedRunConfig.build(pipeline_def, self.run_config, mode=self.pipeline_run.mode)
+            ),
+        )
+        job_execution_plan = worker_state.get_or_create(
+            "execution_plan",
+            lambda: nullcontext(
+                ExecutionPlan.build(
+                    pipeline,
+                    resolved_run_config,
+                    repository_load_data=self.repository_load_data,
+                )
+            ),
+        )
+        execution_plan = job_execution_plan.with_known_state(self.known_state).build_subset_plan(
+            [self.step_key], pipeline_def, resolved_run_config
+        )
+
+        scoped_resources_builder_cm = None
+        if self.reuse_resources:
+            scoped_resources_builder_cm = worker_state.get_or_create(
+                "resources", _WorkerResources
+            ).resource_initialization_manager
+
+        yield from self._execute_step(instance, execution_plan, scoped_resources_builder_cm)
+
+    def _execute_step(self, instance, execution_plan, scoped_resources_builder_cm=None):
+        log_manager = create_context_free_log_manager(instance, self.pipeline_run)
+
+        yield DagsterEvent.step_worker_started(
+            log_manager,
+            self.pipeline_run.pipeline_name,
+            message='Executing step "{}" in subprocess.'.format(self.step_key),
+            metadata_entries=[
+                MetadataEntry("pid", value=str(os.getpid())),
+            ],
+            step_key=self.step_key,
+        )
+
+        yield from execute_plan_iterator(
+            execution_plan,
+            self.recon_pipeline,
+            self.pipeline_run,
+            run_config=self.run_config,
+            retry_mode=self.retry_mode.for_inner_plan(),
+            instance=instance,
+            scoped_resources_builder_cm=scoped_resources_builder_cm,
+        )
+
+
+class _WorkerResources:
+    """The resources initialized for the steps executed by a worker process, which are torn down
+    when the worker process exits. Resources are initialized again for each set of resource keys
+    that a step requires.
+    """
+
+    def __init__(self):
+        self._managers: Dict[
+            FrozenSet[str], EventGenerationManager[ScopedResourcesBuilder]
+        ] = OrderedDict()
+
+    def resource_initialization_manager(self, resource_keys_to_init, **kwargs):
+        return EventGenerationManager(
+            self._resource_initialization_event_generator(resource_keys_to_init, **kwargs),
+            ScopedResourcesBuilder,
+        )
+
+    def _resource_initialization_event_generator(self, resource_keys_to_init, **kwargs):
+        key = frozenset(resource_keys_to_init or [])
+        if key not in self._managers:
+            manager = resource_initialization_manager(
+                resource_keys_to_init=resource_keys_to_init, **kwargs
             )
+            yield from manager.generate_setup_events()
+            self._managers[key] = manager
+
+        yield self._managers[key].get_object()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, _exception_type, _exception_value, _traceback):
+        # the teardown events are logged as they are created, so there is nothing to yield them to
+        for manager in reversed(self._managers.values()):
+            for _ in manager.generate_teardown_events():
+                pass
+        self._managers = OrderedDict()
 
 
 class MultiprocessExecutor(Executor):
@@ -99,6 +191,8 @@ def __init__(
         max_concurrent: int,
         start_method: Optional[str] = None,
         explicit_forkserver_preload: Optional[List[str]] = None,
+        reuse_processes: bool = False,
+        reuse_resources: bool = False,
     ):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         max_concurrent = max_concurrent if max_concurrent else multiprocessing.cpu_count()
@@ -116,6 +210,13 @@ def __init__(
             )
         self._start_method = start_method
         self._explicit_forkserver_preload = explicit_forkserver_preload
+        self._reuse_processes = check.bool_param(reuse_processes, "reuse_processes")
+        self._reuse_resources = check.bool_param(reuse_resources, "reuse_resources")
+        if self._reuse_resources and not self._reuse_processes:
+            raise DagsterUnmetExecutorRequirementsError(
+                "Resources can only be reused by the steps executed in the same worker process, "
+                "so reuse_resources requires reuse_processes to be set."
+            )
 
     @property
     def retries(self):
@@ -160,14 +261,17 @@ def execute(self, plan_context, execution_plan):
             ),
         )
 
-        # It would be good to implement a reference tracking algorithm here so we could
-        # garbage collect results that are no longer needed by any steps
-        # https://github.com/dagster-io/dagster/issues/811
+        # Outputs are only released to IO managers during in-process execution, since resources
+        # are not initialized in this parent process
         with time_execution_scope() as timer_result:
-            with execution_plan.start(retry_mode=self.retries) as active_execution:
+            with execution_plan.start(
+                retry_mode=self.retries
+            ) as active_execution, ChildProcessWorkerPool(multiproc_ctx, limit) as worker_pool:
                 active_iters = {}
                 errors = {}
                 term_events = {}
+                # the workers executing each step, if processes are reused
+                workers: Dict[str, ChildProcessWorker] = {}
                 stopping = False
 
                 while (not stopping and not active_execution.is_complete) or active_iters:
@@ -194,7 +298,11 @@ def execute(self, plan_context, execution_plan):
 
                         for step in steps:
                             step_context = plan_context.for_step(step)
-                            term_events[step.key] = multiproc_ctx.Event()
+                            if self._reuse_processes:
+                                workers[step.key] = worker_pool.acquire()
+                                term_events[step.key] = workers[step.key].term_event
+                            else:
+                                term_events[step.key] = multiproc_ctx.Event()
                             active_iters[step.key] = execute_step_out_of_process(
                                 multiproc_ctx,
                                 pipeline,
@@ -205,6 +313,8 @@ def execute(self, plan_context, execution_plan):
                                 self.retries,
                                 active_execution.get_known_state(),
                                 execution_plan.repository_load_data,
+                                worker=workers.get(step.key),
+                                reuse_resources=self._reuse_resources,
                             )
 
                     # process active iterators
@@ -251,6 +361,8 @@ def execute(self, plan_context, execution_plan):
                     for key in empty_iters:
                         del active_iters[key]
                         del term_events[key]
+                        if key in workers:
+                            worker_pool.release(workers.pop(key))
                         active_execution.verify_complete(plan_context, key)
 
                     # process skipped and abandoned steps
@@ -308,26 +420,38 @@ def execute_step_out_of_process(
     retries,
     known_state,
     repository_load_data,
+    worker: Optional[ChildProcessWorker] = None,
+    reuse_resources: bool = False,
 ):
     command = MultiprocessExecutorChildProcessCommand(
         run_config=step_context.run_config,
         pipeline_run=step_context.pipeline_run,
         step_key=step.key,
         instance_ref=step_context.instance.get_ref(),
-        term_event=term_events[step.key],
+        term_event=term_events[step.key] if worker is None else None,
         recon_pipeline=pipeline,
         retry_mode=retries,
         known_state=known_state,
         repository_load_data=repository_load_data,
+        reuse_resources=reuse_resources,
     )
 
-    yield DagsterEvent.step_worker_starting(
-        step_context,
-        'Launching subprocess for "{}".'.format(step.key),
-        metadata_entries=[],
-    )
+    if worker is None:
+        yield DagsterEvent.step_worker_starting(
+            step_context,
+            'Launching subprocess for "{}".'.format(step.key),
+            metadata_entries=[],
+        )
+        command_iterator = execute_child_process_command(multiproc_ctx, command)
+    else:
+        yield DagsterEvent.step_worker_starting(
+            step_context,
+            'Executing "{}" in a reused worker process.'.format(step.key),
+            metadata_entries=[],
+        )
+        command_iterator = worker.execute_command(command)
 
-    for ret in execute_child_process_command(multiproc_ctx, command):
+    for ret in command_iterator:
         if ret is None or isinstance(ret, DagsterEvent):
             yield ret
         elif isinstance(ret, ChildProcessEvent):
@@ -1,7 +1,8 @@
 import os
 import sys
 import time
-from typing import Dict, List, Optional, cast
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, cast
 
 import pendulum
 
@@ -10,6 +11,7 @@
 from dagster._core.execution.context.system import PlanOrchestrationContext
 from dagster._core.execution.plan.objects import StepFailureData
 from dagster._core.execution.plan.plan import ExecutionPlan
+from dagster._core.execution.plan.state import KnownExecutionState
 from dagster._core.execution.plan.step import ExecutionStep
 from dagster._core.execution.retries import RetryMode
 from dagster._core.executor.step_delegating.step_handler.base import StepHandler, StepHandlerContext
@@ -37,6 +39,7 @@ def __init__(
         check_step_health_interval_seconds: Optional[int] = None,
         max_concurrent: Optional[int] = None,
         should_verify_step: bool = False,
+        launch_parallelism: Optional[int] = None,
     ):
         self._step_handler = step_handler
         self._retries = retries
@@ -57,19 +60,32 @@ def __init__(
         )
         self._should_verify_step = should_verify_step
 
+        self._launch_parallelism = check.opt_int_param(
+            launch_parallelism, "launch_parallelism", default=1
+        )
+        check.invariant(self._launch_parallelism > 0, "launch_parallelism must be > 0")
+
     @property
     def retries(self):
         return self._retries
 
     def _pop_events(self, instance, run_id) -> List[DagsterEvent]:
-        events = instance.logs_after(run_id, self._event_cursor, of_type=set(DagsterEventType))
-        self._event_cursor += len(events)
-        dagster_events = [event.dagster_event for event in events]
+        # the cursor tracks the last storage id that was read, so each poll only reads new events
+        # rather than re-reading the run's event log up to an offset
+        connection = instance.get_records_for_run(
+            run_id, cursor=self._event_cursor, of_type=set(DagsterEventType)
+        )
+        self._event_cursor = connection.cursor
+        dagster_events = [record.event_log_entry.dagster_event for record in connection.records]
         check.invariant(None not in dagster_events, "Query should not return a non dagster event")
         return dagster_events
 
     def _get_step_handler_context(
-        self, plan_context, steps, active_execution
+        self,
+        plan_context,
+        steps,
+        active_execution,
+        known_state: Optional[KnownExecutionState] = None,
     ) -> StepHandlerContext:
         return StepHandlerContext(
             instance=plan_context.plan_data.instance,
@@ -81,17 +97,46 @@ def _get_step_handler_context(
                 step_keys_to_execute=[step.key for step in steps],
                 instance_ref=plan_context.plan_data.instance.get_ref(),
                 retry_mode=self.retries.for_inner_plan(),
-                known_state=active_execution.get_known_state(),
+                known_state=known_state or active_execution.get_known_state(),
                 should_verify_step=self._should_verify_step,
             ),
             pipeline_run=plan_context.pipeline_run,
         )
 
+    def _launch_steps(
+        self,
+        plan_context: PlanOrchestrationContext,
+        steps: Sequence[ExecutionStep],
+        active_execution,
+    ):
+        if not steps:
+            return
+
+        known_state = active_execution.get_known_state()
+        step_handler_contexts = [
+            self._get_step_handler_context(plan_context, [step], active_execution, known_state)
+            for step in steps
+        ]
+
+        if self._launch_parallelism == 1 or len(steps) == 1:
+            list(self._step_handler.launch_steps(step_handler_contexts))
+            return
+
+        # split the steps into one batch per launch thread
+        num_batches = min(self._launch_parallelism, len(step_handler_contexts))
+        batches = [step_handler_contexts[i::num_batches] for i in range(num_batches)]
+        with ThreadPoolExecutor(
+            max_workers=num_batches, thread_name_prefix="step_delegating_launch"
+        ) as launch_pool:
+            list(
+                launch_pool.map(lambda batch: list(self._step_handler.launch_steps(batch)), batches)
+            )
+
     def execute(self, plan_context: PlanOrchestrationContext, execution_plan: ExecutionPlan):
         check.inst_param(plan_context, "plan_context", PlanOrchestrationContext)
         check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
 
-        self._event_cursor = -1  # pylint: disable=attribute-defined-outside-init
+        self._event_cursor: Optional[str] = None  # pylint: disable=attribute-defined-outside-init
 
         DagsterEvent.engine_event(
             plan_context,
@@ -99,189 +144,191 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
             EngineEventData(),
         )
 
-        with execution_plan.start(retry_mode=self.retries) as active_execution:
-            running_steps: Dict[str, ExecutionStep] = {}
-
-            if plan_context.resume_from_failure:
-                DagsterEvent.engine_event(
-                    plan_context,
-                    "Resuming execution from failure",
-                    EngineEventData(),
-                )
-
-                prior_events = self._pop_events(
-                    plan_context.instance,
-                    plan_context.run_id,
-                )
-                for dagster_event in prior_events:
-                    yield dagster_event
-
-                possibly_in_flight_steps = active_execution.rebuild_from_events(prior_events)
-                for step in possibly_in_flight_steps:
-
-                    step_handler_context = self._get_step_handler_context(
-                        plan_context, [step], active_execution
-                    )
+        try:
+            with execution_plan.start(retry_mode=self.retries) as active_execution:
+                running_steps: Dict[str, ExecutionStep] = {}
 
+                if plan_context.resume_from_failure:
                     DagsterEvent.engine_event(
-                        step_handler_context.get_step_context(step.key),
-                        f"Checking on status of in-progress step {step.key} from previous run",
+                        plan_context,
+                        "Resuming execution from failure",
                         EngineEventData(),
                     )
 
-                    should_retry_step = False
-                    health_check = None
+                    prior_events = self._pop_events(
+                        plan_context.instance,
+                        plan_context.run_id,
+                    )
+                    for dagster_event in prior_events:
+                        yield dagster_event
+
+                    possibly_in_flight_steps = active_execution.rebuild_from_events(prior_events)
+                    steps_to_relaunch = []
+                    for step in possibly_in_flight_steps:
+
+                        step_handler_context = self._get_step_handler_context(
+                            plan_context, [step], active_execution
+                        )
 
-                    try:
-                        health_check = self._step_handler.check_step_health(step_handler_context)
-                    except Exception:
-                        # For now we assume that an exception indicates that the step should be resumed.
-                        # This should probably be a separate should_resume_step method on the step handler.
                         DagsterEvent.engine_event(
                             step_handler_context.get_step_context(step.key),
-                            f"Including {step.key} in the new run since it raised an error when checking whether it was running",
-                            EngineEventData(
-                                error=serializable_error_info_from_exc_info(sys.exc_info())
-                            ),
+                            f"Checking on status of in-progress step {step.key} from previous run",
+                            EngineEventData(),
                         )
-                        should_retry_step = True
-                    else:
-                        if not health_check.is_healthy:
+
+                        should_retry_step = False
+                        health_check = None
+
+                        try:
+                            health_check = self._step_handler.check_step_health(
+                                step_handler_context
+                            )
+                        except Exception:
+                            # For now we assume that an exception indicates that the step should be resumed.
+                            # This should probably be a separate should_resume_step method on the step handler.
                             DagsterEvent.engine_event(
                                 step_handler_context.get_step_context(step.key),
-                                f"Including step {step.key} in the new run since it is not currently running: {health_check.unhealthy_reason}",
+                                f"Including {step.key} in the new run since it raised an error when checking whether it was running",
+                                EngineEventData(
+                                    error=serializable_error_info_from_exc_info(sys.exc_info())
+                                ),
                             )
                             should_retry_step = True
-
-                    if should_retry_step:
-                        # health check failed, launch the step
-                        list(
-                            self._step_handler.launch_step(
-                                self._get_step_handler_context(
-                                    plan_context, [step], active_execution
+                        else:
+                            if not health_check.is_healthy:
+                                DagsterEvent.engine_event(
+                                    step_handler_context.get_step_context(step.key),
+                                    f"Including step {step.key} in the new run since it is not currently running: {health_check.unhealthy_reason}",
                                 )
-                            )
-                        )
+                                should_retry_step = True
 
-                    running_steps[step.key] = step
+                        if should_retry_step:
+                            # health check failed, launch the step
+                            steps_to_relaunch.append(step)
 
-            last_check_step_health_time = pendulum.now("UTC")
+                        running_steps[step.key] = step
 
-            # Order of events is important here. During an interation, we call handle_event, then get_steps_to_execute,
-            # then is_complete. get_steps_to_execute updates the state of ActiveExecution, and without it
-            # is_complete can return true when we're just between steps.
-            while not active_execution.is_complete:
+                    self._launch_steps(plan_context, steps_to_relaunch, active_execution)
 
-                if active_execution.check_for_interrupts():
-                    active_execution.mark_interrupted()
-                    if not plan_context.instance.run_will_resume(plan_context.run_id):
-                        DagsterEvent.engine_event(
-                            plan_context,
-                            "Executor received termination signal, forwarding to steps",
-                            EngineEventData.interrupted(list(running_steps.keys())),
-                        )
-                        for _, step in running_steps.items():
-                            list(
-                                self._step_handler.terminate_step(
-                                    self._get_step_handler_context(
-                                        plan_context, [step], active_execution
+                last_check_step_health_time = pendulum.now("UTC")
+
+                # Order of events is important here. During an interation, we call handle_event, then get_steps_to_execute,
+                # then is_complete. get_steps_to_execute updates the state of ActiveExecution, and without it
+                # is_complete can return true when we're just between steps.
+                while not active_execution.is_complete:
+
+                    if active_execution.check_for_interrupts():
+                        active_execution.mark_interrupted()
+                        if not plan_context.instance.run_will_resume(plan_context.run_id):
+                            DagsterEvent.engine_event(
+                                plan_context,
+                                "Executor received termination signal, forwarding to steps",
+                                EngineEventData.interrupted(list(running_steps.keys())),
+                            )
+                            for _, step in running_steps.items():
+                                list(
+                                    self._step_handler.terminate_step(
+                                        self._get_step_handler_context(
+                                            plan_context, [step], active_execution
+                                        )
                                     )
                                 )
+                        else:
+                            DagsterEvent.engine_event(
+                                plan_context,
+                                "Executor received termination signal, not forwarding to steps because "
+                                "run will be resumed",
+                                EngineEventData(
+                                    metadata_entries=[
+                                        MetadataEntry(
+                                            "steps_in_flight", value=str(running_steps.keys())
+                                        )
+                                    ]
+                                ),
                             )
-                    else:
-                        DagsterEvent.engine_event(
-                            plan_context,
-                            "Executor received termination signal, not forwarding to steps because "
-                            "run will be resumed",
-                            EngineEventData(
-                                metadata_entries=[
-                                    MetadataEntry(
-                                        "steps_in_flight", value=str(running_steps.keys())
-                                    )
-                                ]
-                            ),
-                        )
 
-                    return
+                        return
 
-                for dagster_event in self._pop_events(
-                    plan_context.instance,
-                    plan_context.run_id,
-                ):  # type: ignore
+                    for dagster_event in self._pop_events(
+                        plan_context.instance,
+                        plan_context.run_id,
+                    ):  # type: ignore
 
-                    yield dagster_event
-                    # STEP_SKIPPED events are only emitted by ActiveExecution, which already handles
-                    # and yields them.
+                        yield dagster_event
+                        # STEP_SKIPPED events are only emitted by ActiveExecution, which already handles
+                        # and yields them.
 
-                    if dagster_event.is_step_skipped:
-                        assert isinstance(dagster_event.step_key, str)
-                        active_execution.verify_complete(plan_context, dagster_event.step_key)
-                    else:
-                        active_execution.handle_event(dagster_event)
-                        if (
-                            dagster_event.is_step_success
-                            or dagster_event.is_step_failure
-                            or dagster_event.is_resource_init_failure
-                        ):
+                        if dagster_event.is_step_skipped:
                             assert isinstance(dagster_event.step_key, str)
-                            del running_steps[dagster_event.step_key]
                             active_execution.verify_complete(plan_context, dagster_event.step_key)
+                        else:
+                            active_execution.handle_event(dagster_event)
+                            if (
+                                dagster_event.is_step_success
+                                or dagster_event.is_step_failure
+                                or dagster_event.is_resource_init_failure
+                            ):
+                                assert isinstance(dagster_event.step_key, str)
+                                del running_steps[dagster_event.step_key]
+                                active_execution.verify_complete(
+                                    plan_context, dagster_event.step_key
+                                )
 
-                # process skips from failures or uncovered inputs
-                list(active_execution.plan_events_iterator(plan_context))
+                    # process skips from failures or uncovered inputs
+                    list(active_execution.plan_events_iterator(plan_context))
 
-                curr_time = pendulum.now("UTC")
-                if (
-                    curr_time - last_check_step_health_time
-                ).total_seconds() >= self._check_step_health_interval_seconds:
-                    last_check_step_health_time = curr_time
-                    for _, step in running_steps.items():
+                    curr_time = pendulum.now("UTC")
+                    if (
+                        curr_time - last_check_step_health_time
+                    ).total_seconds() >= self._check_step_health_interval_seconds:
+                        last_check_step_health_time = curr_time
+                        for _, step in running_steps.items():
 
-                        step_context = plan_context.for_step(step)
+                            step_context = plan_context.for_step(step)
 
-                        try:
-                            health_check_result = self._step_handler.check_step_health(
-                                self._get_step_handler_context(
-                                    plan_context, [step], active_execution
+                            try:
+                                health_check_result = self._step_handler.check_step_health(
+                                    self._get_step_handler_context(
+                                        plan_context, [step], active_execution
+                                    )
                                 )
-                            )
-                            if not health_check_result.is_healthy:
+                                if not health_check_result.is_healthy:
+                                    DagsterEvent.step_failure_event(
+                                        step_context=step_context,
+                                        step_failure_data=StepFailureData(
+                                            error=None,
+                                            user_failure_data=None,
+                                        ),
+                                        message=f"Step {step.key} failed health check: {health_check_result.unhealthy_reason}",
+                                    )
+                            except Exception:
+                                serializable_error = serializable_error_info_from_exc_info(
+                                    sys.exc_info()
+                                )
+                                # Log a step failure event if there was an error during the health
+                                # check
                                 DagsterEvent.step_failure_event(
-                                    step_context=step_context,
+                                    step_context=plan_context.for_step(step),
                                     step_failure_data=StepFailureData(
-                                        error=None,
+                                        error=serializable_error,
                                         user_failure_data=None,
                                     ),
-                                    message=f"Step {step.key} failed health check: {health_check_result.unhealthy_reason}",
                                 )
-                        except Exception:
-                            serializable_error = serializable_error_info_from_exc_info(
-                                sys.exc_info()
-                            )
-                            # Log a step failure event if there was an error during the health
-                            # check
-                            DagsterEvent.step_failure_event(
-                                step_context=plan_context.for_step(step),
-                                step_failure_data=StepFailureData(
-                                    error=serializable_error,
-                                    user_failure_data=None,
-                                ),
-                            )
 
-                if self._max_concurrent is not None:
-                    max_steps_to_run = self._max_concurrent - len(running_steps)
-                    check.invariant(
-                        max_steps_to_run >= 0, "More steps are active than max_concurrent"
-                    )
-                else:
-                    max_steps_to_run = None  # disables limit
-
-                for step in active_execution.get_steps_to_execute(max_steps_to_run):
-                    running_steps[step.key] = step
-                    list(
-                        self._step_handler.launch_step(
-                            self._get_step_handler_context(plan_context, [step], active_execution)
+                    if self._max_concurrent is not None:
+                        max_steps_to_run = self._max_concurrent - len(running_steps)
+                        check.invariant(
+                            max_steps_to_run >= 0, "More steps are active than max_concurrent"
                         )
-                    )
+                    else:
+                        max_steps_to_run = None  # disables limit
+
+                    steps_to_launch = active_execution.get_steps_to_execute(max_steps_to_run)
+                    for step in steps_to_launch:
+                        running_steps[step.key] = step
+                    self._launch_steps(plan_context, steps_to_launch, active_execution)
 
-                time.sleep(self._sleep_seconds)
+                    time.sleep(self._sleep_seconds)
+        finally:
+            # e.g. stop any background threads the step handler started for the run
+            self._step_handler.dispose()
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Iterator, List, NamedTuple, Optional
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence
 
 from dagster import DagsterInstance
 from dagster import _check as check
@@ -84,6 +84,16 @@ def name(self) -> str:
     def launch_step(self, step_handler_context: StepHandlerContext) -> Iterator[DagsterEvent]:
         pass
 
+    def launch_steps(
+        self, step_handler_contexts: Sequence[StepHandlerContext]
+    ) -> Iterator[DagsterEvent]:
+        """Launch a batch of steps that became ready to execute at the same time, each with its own
+        context. Step handlers that can launch several steps more cheaply than one at a time - e.g.
+        by setting up a client once for the whole batch - should override this.
+        """
+        for step_handler_context in step_handler_contexts:
+            yield from self.launch_step(step_handler_context)
+
     @abstractmethod
     def check_step_health(self, step_handler_context: StepHandlerContext) -> CheckStepHealthResult:
         pass
@@ -91,3 +101,8 @@ def check_step_health(self, step_handler_context: StepHandlerContext) -> CheckSt
     @abstractmethod
     def terminate_step(self, step_handler_context: StepHandlerContext) -> Iterator[DagsterEvent]:
         pass
+
+    def dispose(self):
+        """Do any resource cleanup that should happen once the executor has finished executing the
+        steps of the run.
+        """
@@ -49,6 +49,7 @@
 )
 from .pipeline_index import PipelineIndex
 from .repository_location import (
+    ExternalJobDataCache,
     GrpcServerRepositoryLocation,
     InProcessRepositoryLocation,
     RepositoryLocation,
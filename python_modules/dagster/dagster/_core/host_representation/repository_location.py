@@ -17,7 +17,10 @@
     sync_get_external_partition_tags_grpc,
 )
 from dagster._api.snapshot_pipeline import sync_get_external_pipeline_subset_grpc
-from dagster._api.snapshot_repository import sync_get_streaming_external_repositories_data_grpc
+from dagster._api.snapshot_repository import (
+    sync_get_external_job_data_grpc,
+    sync_get_streaming_external_repositories_data_grpc,
+)
 from dagster._api.snapshot_schedule import sync_get_external_schedule_execution_data_grpc
 from dagster._api.snapshot_sensor import sync_get_external_sensor_execution_data_grpc
 from dagster._core.code_pointer import CodePointer
@@ -34,7 +37,10 @@
     ExternalRepository,
 )
 from dagster._core.host_representation.external_data import (
+    ExternalJobRef,
     ExternalPartitionNamesData,
+    ExternalPipelineData,
+    ExternalRepositoryData,
     ExternalScheduleExecutionErrorData,
     ExternalSensorExecutionErrorData,
 )
@@ -512,6 +518,51 @@ def get_external_notebook_data(self, notebook_path: str) -> bytes:
         return get_notebook_data(notebook_path)
 
 
+class ExternalJobDataCache:
+    """
+    Holds the job snapshots fetched from gRPC servers, keyed by the snapshot ids in the job refs
+    that the servers return for repositories loaded with deferred snapshots. The same cache is
+    passed to the new GrpcServerRepositoryLocation when a location is reloaded, so that only the
+    jobs whose snapshots changed are fetched again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._job_datas: Dict[Tuple[str, Optional[str]], ExternalPipelineData] = {}
+
+    @staticmethod
+    def _key(job_ref: ExternalJobRef) -> Tuple[str, Optional[str]]:
+        return (job_ref.snapshot_id, job_ref.parent_snapshot_id)
+
+    def get(self, job_ref: ExternalJobRef) -> Optional[ExternalPipelineData]:
+        with self._lock:
+            job_data = self._job_datas.get(self._key(job_ref))
+
+        if job_data is None:
+            return None
+
+        # presets are not part of the job snapshot, so they always come from the current ref
+        return ExternalPipelineData(
+            name=job_ref.name,
+            pipeline_snapshot=job_data.pipeline_snapshot,
+            active_presets=job_ref.active_presets,
+            parent_pipeline_snapshot=job_data.parent_pipeline_snapshot,
+            is_job=not job_ref.is_legacy_pipeline,
+        )
+
+    def set(self, job_ref: ExternalJobRef, job_data: ExternalPipelineData) -> None:
+        with self._lock:
+            self._job_datas[self._key(job_ref)] = job_data
+
+    def retain(self, job_refs: List[ExternalJobRef]) -> None:
+        """Drop the snapshots that are not referenced by any of the given job refs."""
+        keys = {self._key(job_ref) for job_ref in job_refs}
+        with self._lock:
+            self._job_datas = {
+                key: job_data for key, job_data in self._job_datas.items() if key in keys
+            }
+
+
 class GrpcServerRepositoryLocation(RepositoryLocation):
     def __init__(
         self,
@@ -524,6 +575,7 @@ def __init__(
         watch_server: Optional[bool] = True,
         grpc_server_registry: Optional[GrpcServerRegistry] = None,
         grpc_metadata: Optional[List[Tuple[str, str]]] = None,
+        external_job_data_cache: Optional[ExternalJobDataCache] = None,
     ):
         from dagster._grpc.client import DagsterGrpcClient, client_heartbeat_thread
 
@@ -550,6 +602,13 @@ def __init__(
         self._heartbeat = check.bool_param(heartbeat, "heartbeat")
         self._watch_server = check.bool_param(watch_server, "watch_server")
 
+        # When a cache is provided, repositories are loaded with deferred snapshots and each job
+        # snapshot is fetched from the server the first time it is needed, unless the cache
+        # already holds it
+        self._external_job_data_cache = check.opt_inst_param(
+            external_job_data_cache, "external_job_data_cache", ExternalJobDataCache
+        )
+
         self.server_id = None
         self._external_repositories_data = None
 
@@ -604,6 +663,7 @@ def __init__(
             self._external_repositories_data = sync_get_streaming_external_repositories_data_grpc(
                 self.client,
                 self,
+                defer_snapshots=self._external_job_data_cache is not None,
             )
 
             self.external_repositories = {
@@ -613,6 +673,9 @@ def __init__(
                         repository_name=repo_name,
                         repository_location=self,
                     ),
+                    ref_to_data_fn=self._get_external_job_data_fn(repo_name)
+                    if repo_data.external_job_refs is not None
+                    else None,
                 )
                 for repo_name, repo_data in self._external_repositories_data.items()
             }
@@ -660,6 +723,32 @@ def host(self) -> str:
     def use_ssl(self) -> bool:
         return self._use_ssl
 
+    @property
+    def external_job_refs(self) -> List[ExternalJobRef]:
+        return [
+            job_ref
+            for repo_data in cast(
+                Mapping[str, ExternalRepositoryData], self._external_repositories_data
+            ).values()
+            for job_ref in (repo_data.external_job_refs or [])
+        ]
+
+    def _get_external_job_data_fn(self, repository_name: str):
+        job_data_cache = check.not_none(self._external_job_data_cache)
+
+        def _get_external_job_data(job_ref: ExternalJobRef) -> ExternalPipelineData:
+            job_data = job_data_cache.get(job_ref)
+            if job_data is None:
+                job_data = sync_get_external_job_data_grpc(
+                    self.client,
+                    self.get_repository(repository_name).handle,
+                    job_ref.name,
+                )
+                job_data_cache.set(job_ref, job_data)
+            return job_data
+
+        return _get_external_job_data
+
     def _reload_current_image(self) -> Optional[str]:
         return deserialize_as(
             self.client.get_current_image(),
@@ -2,6 +2,7 @@
 import logging.config
 import os
 import sys
+import threading
 import time
 import warnings
 import weakref
@@ -67,6 +68,7 @@
 from .config import (
     DAGSTER_CONFIG_YAML_FILENAME,
     DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT,
+    DEFAULT_TICK_COMPACTION_INTERVAL_SECONDS,
     get_default_tick_retention_settings,
     get_tick_retention_settings,
     is_dagster_home_set,
@@ -153,38 +155,133 @@ def __init__(self, instance):
         super(_EventListenerLogHandler, self).__init__()
 
     def emit(self, record):
-        from dagster._core.events import EngineEventData
-        from dagster._core.events.log import StructuredLoggerMessage, construct_event_record
-
-        event = construct_event_record(
-            StructuredLoggerMessage(
-                name=record.name,
-                message=record.msg,
-                level=record.levelno,
-                meta=record.dagster_meta,
-                record=record,
-            )
-        )
+        event = _event_from_log_record(record)
 
         try:
             self._instance.handle_new_event(event)
         except Exception as e:
-            sys.stderr.write(f"Exception while writing logger call to event log: {str(e)}\n")
-            if event.dagster_event:
-                # Swallow user-generated log failures so that the entire step/run doesn't fail, but
-                # raise failures writing system-generated log events since they are the source of
-                # truth for the state of the run
-                raise
-            elif event.run_id:
-                self._instance.report_engine_event(
-                    "Exception while writing logger call to event log",
-                    pipeline_name=event.pipeline_name,
-                    run_id=event.run_id,
-                    step_key=event.step_key,
-                    engine_event_data=EngineEventData(
-                        error=serializable_error_info_from_exc_info(sys.exc_info()),
-                    ),
-                )
+            _handle_event_write_failure(self._instance, [event], e)
+
+
+class _BufferedEventListenerLogHandler(logging.Handler):
+    """Log handler that accumulates events and writes them to the instance in batches, reducing
+    the number of round trips made to event log storage by chatty runs.
+
+    The buffer is flushed once it holds `max_buffered_events` events, once its oldest event has
+    been waiting for `flush_interval_seconds`, and always immediately after receiving a step
+    boundary event, a run event, or an error-level record, so that run and step state is never
+    delayed.
+    """
+
+    def __init__(self, instance, max_buffered_events, flush_interval_seconds):
+        self._instance = instance
+        self._max_buffered_events = check.int_param(max_buffered_events, "max_buffered_events")
+        self._flush_interval_seconds = check.numeric_param(
+            flush_interval_seconds, "flush_interval_seconds"
+        )
+        self._buffer: List["EventLogEntry"] = []
+        self._flush_timer: Optional[threading.Timer] = None
+        super(_BufferedEventListenerLogHandler, self).__init__()
+
+    def emit(self, record):
+        event = _event_from_log_record(record)
+        self._buffer.append(event)
+
+        if (
+            len(self._buffer) >= self._max_buffered_events
+            or record.levelno >= logging.ERROR
+            or _is_event_buffer_flush_trigger(event)
+        ):
+            self._flush_buffer(raise_on_failure=True)
+        elif self._flush_timer is None:
+            self._flush_timer = threading.Timer(self._flush_interval_seconds, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self):
+        # called from the flush timer thread and by logging.shutdown at interpreter exit
+        self.acquire()
+        try:
+            self._flush_buffer(raise_on_failure=False)
+        finally:
+            self.release()
+
+    def close(self):
+        self.flush()
+        super(_BufferedEventListenerLogHandler, self).close()
+
+    def _flush_buffer(self, raise_on_failure):
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+        if not self._buffer:
+            return
+
+        events, self._buffer = self._buffer, []
+        try:
+            self._instance.handle_new_events(events)
+        except Exception as e:
+            if not raise_on_failure:
+                sys.stderr.write(f"Exception while writing buffered events to event log: {e}\n")
+                return
+            _handle_event_write_failure(self._instance, events, e)
+
+
+_EVENT_BUFFER_FLUSH_EVENT_TYPES = {
+    "STEP_START",
+    "STEP_SUCCESS",
+    "STEP_FAILURE",
+    "STEP_SKIPPED",
+    "STEP_RESTARTED",
+    "STEP_UP_FOR_RETRY",
+}
+
+
+def _is_event_buffer_flush_trigger(event):
+    if not event.is_dagster_event:
+        return False
+    return (
+        event.dagster_event.event_type_value in _EVENT_BUFFER_FLUSH_EVENT_TYPES
+        or event.dagster_event.is_pipeline_event
+    )
+
+
+def _event_from_log_record(record):
+    from dagster._core.events.log import StructuredLoggerMessage, construct_event_record
+
+    return construct_event_record(
+        StructuredLoggerMessage(
+            name=record.name,
+            message=record.msg,
+            level=record.levelno,
+            meta=record.dagster_meta,
+            record=record,
+        )
+    )
+
+
+def _handle_event_write_failure(instance, events, error):
+    from dagster._core.events import EngineEventData
+
+    sys.stderr.write(f"Exception while writing logger call to event log: {str(error)}\n")
+    if any(event.dagster_event for event in events):
+        # Swallow user-generated log failures so that the entire step/run doesn't fail, but
+        # raise failures writing system-generated log events since they are the source of
+        # truth for the state of the run
+        raise error
+
+    event = events[-1]
+    if event.run_id:
+        instance.report_engine_event(
+            "Exception while writing logger call to event log",
+            pipeline_name=event.pipeline_name,
+            run_id=event.run_id,
+            step_key=event.step_key,
+            engine_event_data=EngineEventData(
+                error=serializable_error_info_from_exc_info(sys.exc_info()),
+            ),
+        )
 
 
 class InstanceType(Enum):
@@ -674,6 +771,10 @@ def code_server_process_startup_timeout(self) -> int:
             "local_startup_timeout", DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT
         )
 
+    @property
+    def code_server_defer_job_snapshots(self) -> bool:
+        return self.code_server_settings.get("defer_job_snapshots", False)
+
     @property
     def run_monitoring_max_resume_run_attempts(self) -> int:
         default_max_resume_run_attempts = 3 if self.run_launcher.supports_resume_run else 0
@@ -699,6 +800,24 @@ def run_retries_enabled(self) -> bool:
     def run_retries_max_retries(self) -> int:
         return self.get_settings("run_retries").get("max_retries")
 
+    # event log buffering
+
+    @property
+    def event_log_buffer_settings(self) -> Dict:
+        return self.get_settings("event_log_buffer")
+
+    @property
+    def event_log_buffer_enabled(self) -> bool:
+        return self.event_log_buffer_settings.get("enabled", False)
+
+    @property
+    def event_log_buffer_max_buffered_events(self) -> int:
+        return self.event_log_buffer_settings.get("max_buffered_events", 100)
+
+    @property
+    def event_log_buffer_flush_interval_seconds(self) -> float:
+        return self.event_log_buffer_settings.get("flush_interval_seconds", 1.0)
+
     # python logs
 
     @property
@@ -920,7 +1039,11 @@ def _construct_run_with_snapshots(
         solid_selection=None,
         external_pipeline_origin=None,
         pipeline_code_origin=None,
+        persisted_snapshot_ids=None,
     ):
+        # persisted_snapshot_ids optionally maps the python ids of snapshot objects that have
+        # already been persisted to their snapshot ids, so that runs created together that share
+        # snapshots don't each hash and look them up again
 
         # https://github.com/dagster-io/dagster/issues/2403
         if tags and IS_AIRFLOW_INGEST_PIPELINE_STR in tags:
@@ -934,19 +1057,26 @@ def _construct_run_with_snapshots(
             "that do not successfully compile execution plans in the scheduled case.",
         )
 
-        pipeline_snapshot_id = (
-            self._ensure_persisted_pipeline_snapshot(pipeline_snapshot, parent_pipeline_snapshot)
-            if pipeline_snapshot
-            else None
-        )
+        if persisted_snapshot_ids is None:
+            persisted_snapshot_ids = {}
 
-        execution_plan_snapshot_id = (
-            self._ensure_persisted_execution_plan_snapshot(
-                execution_plan_snapshot, pipeline_snapshot_id, step_keys_to_execute
-            )
-            if execution_plan_snapshot and pipeline_snapshot_id
-            else None
-        )
+        pipeline_snapshot_id = None
+        if pipeline_snapshot:
+            pipeline_snapshot_id = persisted_snapshot_ids.get(id(pipeline_snapshot))
+            if not pipeline_snapshot_id:
+                pipeline_snapshot_id = self._ensure_persisted_pipeline_snapshot(
+                    pipeline_snapshot, parent_pipeline_snapshot
+                )
+                persisted_snapshot_ids[id(pipeline_snapshot)] = pipeline_snapshot_id
+
+        execution_plan_snapshot_id = None
+        if execution_plan_snapshot and pipeline_snapshot_id:
+            execution_plan_snapshot_id = persisted_snapshot_ids.get(id(execution_plan_snapshot))
+            if not execution_plan_snapshot_id:
+                execution_plan_snapshot_id = self._ensure_persisted_execution_plan_snapshot(
+                    execution_plan_snapshot, pipeline_snapshot_id, step_keys_to_execute
+                )
+                persisted_snapshot_ids[id(execution_plan_snapshot)] = execution_plan_snapshot_id
 
         return DagsterRun(
             pipeline_name=pipeline_name,
@@ -1108,6 +1238,37 @@ def create_run(
 
         return pipeline_run
 
+    def create_runs(self, runs_kwargs: Sequence[Mapping[str, Any]]) -> Sequence[PipelineRun]:
+        """Create many runs at once, writing them to run storage in a single batch.
+
+        Snapshots that are shared by several of the runs, like the pipeline snapshot of runs of the
+        same job, are only persisted once.
+
+        Args:
+            runs_kwargs (Sequence[Mapping[str, Any]]): The arguments of ``create_run`` for each
+                run.
+        """
+        check.sequence_param(runs_kwargs, "runs_kwargs", of_type=Mapping)
+
+        persisted_snapshot_ids: Dict[int, str] = {}
+        pipeline_runs = self._run_storage.add_runs(
+            [
+                self._construct_run_with_snapshots(
+                    **run_kwargs, persisted_snapshot_ids=persisted_snapshot_ids
+                )
+                for run_kwargs in runs_kwargs
+            ]
+        )
+
+        for pipeline_run, run_kwargs in zip(pipeline_runs, runs_kwargs):
+            execution_plan_snapshot = run_kwargs.get("execution_plan_snapshot")
+            if execution_plan_snapshot:
+                self._log_asset_materialization_planned_events(
+                    pipeline_run, execution_plan_snapshot
+                )
+
+        return pipeline_runs
+
     def create_reexecuted_run(
         self,
         parent_run: DagsterRun,
@@ -1301,6 +1462,18 @@ def get_runs(
     def get_runs_count(self, filters: Optional[RunsFilter] = None) -> int:
         return self._run_storage.get_runs_count(filters)
 
+    @traced
+    def get_runs_by_priority(
+        self, filters: RunsFilter, limit: Optional[int] = None, offset: int = 0
+    ) -> List[PipelineRun]:
+        return self._run_storage.get_runs_by_priority(filters, limit, offset)
+
+    @traced
+    def get_run_tag_counts(
+        self, filters: RunsFilter, tag_keys: Sequence[str]
+    ) -> Mapping[Tuple[str, str], int]:
+        return self._run_storage.get_run_tag_counts(filters, tag_keys)
+
     @traced
     def get_run_groups(
         self,
@@ -1498,7 +1671,14 @@ def _get_yaml_python_handlers(self):
         return []
 
     def _get_event_log_handler(self):
-        event_log_handler = _EventListenerLogHandler(self)
+        if self.event_log_buffer_enabled:
+            event_log_handler = _BufferedEventListenerLogHandler(
+                self,
+                max_buffered_events=self.event_log_buffer_max_buffered_events,
+                flush_interval_seconds=self.event_log_buffer_flush_interval_seconds,
+            )
+        else:
+            event_log_handler = _EventListenerLogHandler(self)
         event_log_handler.setLevel(10)
         return event_log_handler
 
@@ -1521,6 +1701,22 @@ def handle_new_event(self, event):
         for sub in self._subscribers[run_id]:
             sub(event)
 
+    def handle_new_events(self, events):
+        """Store a batch of events in a single call to event log storage, then update run storage
+        and notify subscribers for each event in order.
+        """
+        if not events:
+            return
+
+        self._event_storage.store_events(events)
+
+        for event in events:
+            if event.is_dagster_event and event.dagster_event.is_pipeline_event:
+                self._run_storage.handle_run_event(event.run_id, event.dagster_event)
+
+            for sub in self._subscribers[event.run_id]:
+                sub(event)
+
     def add_event_listener(self, run_id, cb):
         self._subscribers[run_id].append(cb)
 
@@ -2001,6 +2197,12 @@ def update_tick(self, tick: "InstigatorTick"):
     def purge_ticks(self, origin_id, selector_id, before, tick_statuses=None):
         self._schedule_storage.purge_ticks(origin_id, selector_id, before, tick_statuses)
 
+    def update_ticks(self, ticks: Sequence["InstigatorTick"]):
+        self._schedule_storage.update_ticks(ticks)
+
+    def purge_ticks_before(self, before, instigator_type=None, tick_statuses=None):
+        self._schedule_storage.purge_ticks_before(before, instigator_type, tick_statuses)
+
     def wipe_all_schedules(self):
         if self._scheduler:
             self._scheduler.wipe(self)
@@ -2039,6 +2241,7 @@ def get_required_daemon_types(self):
             MonitoringDaemon,
             SchedulerDaemon,
             SensorDaemon,
+            TickCompactionDaemon,
         )
         from dagster._daemon.run_coordinator.queued_run_coordinator_daemon import (
             QueuedRunCoordinatorDaemon,
@@ -2056,6 +2259,8 @@ def get_required_daemon_types(self):
             daemons.append(MonitoringDaemon.daemon_type())
         if self.run_retries_enabled:
             daemons.append(EventLogConsumerDaemon.daemon_type())
+        if self.tick_compaction_enabled:
+            daemons.append(TickCompactionDaemon.daemon_type())
         return daemons
 
     def get_daemon_statuses(
@@ -2099,6 +2304,20 @@ def should_start_background_run_thread(self) -> bool:
         """
         return False
 
+    @property
+    def tick_compaction_settings(self) -> Dict:
+        return self.get_settings("retention").get("compaction") or {}
+
+    @property
+    def tick_compaction_enabled(self) -> bool:
+        return bool(self.tick_compaction_settings.get("enabled"))
+
+    @property
+    def tick_compaction_interval_seconds(self) -> int:
+        return self.tick_compaction_settings.get(
+            "interval_seconds", DEFAULT_TICK_COMPACTION_INTERVAL_SECONDS
+        )
+
     def get_tick_retention_settings(
         self, instigator_type: "InstigatorType"
     ) -> Dict["TickStatus", int]:
@@ -183,11 +183,25 @@ def _tick_retention_config_schema():
     )
 
 
+DEFAULT_TICK_COMPACTION_INTERVAL_SECONDS = 3600
+
+
 def retention_config_schema():
     return Field(
         {
             "schedule": _tick_retention_config_schema(),
             "sensor": _tick_retention_config_schema(),
+            "compaction": Field(
+                {
+                    "enabled": Field(Bool, is_required=False, default_value=False),
+                    "interval_seconds": Field(
+                        int,
+                        is_required=False,
+                        default_value=DEFAULT_TICK_COMPACTION_INTERVAL_SECONDS,
+                    ),
+                },
+                is_required=False,
+            ),
         },
         is_required=False,
     )
@@ -219,7 +233,10 @@ def sensors_daemon_config():
     return Field(
         {
             "use_threads": Field(Bool, is_required=False, default_value=False),
+            "use_processes": Field(Bool, is_required=False, default_value=False),
             "num_workers": Field(int, is_required=False),
+            "max_concurrent_evaluations_per_location": Field(int, is_required=False),
+            "coalesce_skipped_ticks": Field(Bool, is_required=False, default_value=False),
         },
         is_required=False,
     )
@@ -263,6 +280,13 @@ def dagster_instance_config_schema():
                 "cancellation_thread_poll_interval_seconds": Field(int, is_required=False),
             },
         ),
+        "event_log_buffer": Field(
+            {
+                "enabled": Field(Bool, is_required=False),
+                "max_buffered_events": Field(int, is_required=False),
+                "flush_interval_seconds": Field(float, is_required=False),
+            },
+        ),
         "run_retries": Field(
             {
                 "enabled": Field(bool, is_required=False, default_value=False),
@@ -270,7 +294,11 @@ def dagster_instance_config_schema():
             }
         ),
         "code_servers": Field(
-            {"local_startup_timeout": Field(int, is_required=False)}, is_required=False
+            {
+                "local_startup_timeout": Field(int, is_required=False),
+                "defer_job_snapshots": Field(bool, is_required=False),
+            },
+            is_required=False,
         ),
         "retention": retention_config_schema(),
         "sensors": sensors_daemon_config(),
@@ -373,6 +373,7 @@ def from_dir(base_dir, config_filename=DAGSTER_CONFIG_YAML_FILENAME, overrides=N
             "python_logs",
             "run_monitoring",
             "run_retries",
+            "event_log_buffer",
             "code_servers",
             "retention",
             "sensors",
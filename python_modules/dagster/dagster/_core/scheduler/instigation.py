@@ -343,6 +343,11 @@ def with_cursor(self, cursor):
     def with_origin_run(self, origin_run_id):
         return self._replace(tick_data=self.tick_data.with_origin_run(origin_run_id))
 
+    def with_evaluation_latency_histogram(self, evaluation_latency_histogram):
+        return self._replace(
+            tick_data=self.tick_data.with_evaluation_latency_histogram(evaluation_latency_histogram)
+        )
+
     @property
     def instigator_origin_id(self):
         return self.tick_data.instigator_origin_id
@@ -395,6 +400,14 @@ def origin_run_ids(self):
     def failure_count(self) -> int:
         return self.tick_data.failure_count
 
+    @property
+    def evaluation_latency_histogram(self) -> Optional["LatencyHistogram"]:
+        return self.tick_data.evaluation_latency_histogram
+
+    @property
+    def skipped_tick_count(self) -> Optional[int]:
+        return self.tick_data.skipped_tick_count
+
 
 register_serdes_tuple_fallbacks({"JobTick": InstigatorTick})
 # for internal backcompat
@@ -450,6 +463,79 @@ def value_to_storage_dict(
         )
 
 
+# Upper bounds, in seconds, of the buckets that instigator evaluation latencies are counted in
+DEFAULT_LATENCY_BUCKET_BOUNDS = [0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0]
+
+
+@whitelist_for_serdes
+class LatencyHistogram(
+    NamedTuple(
+        "_LatencyHistogram",
+        [
+            ("bucket_bounds", List[float]),
+            ("bucket_counts", List[int]),
+            ("total_seconds", float),
+        ],
+    )
+):
+    """
+    A histogram of the latencies of repeated operations, e.g. the evaluations of a sensor.
+
+    Args:
+        bucket_bounds (List[float]): The inclusive upper bound, in seconds, of each bucket. Latencies
+            above the last bound are counted in an additional overflow bucket.
+        bucket_counts (List[int]): The number of latencies counted in each bucket, including the
+            overflow bucket.
+        total_seconds (float): The sum of all counted latencies.
+    """
+
+    def __new__(
+        cls,
+        bucket_bounds: Optional[List[float]] = None,
+        bucket_counts: Optional[List[int]] = None,
+        total_seconds: Optional[float] = None,
+    ):
+        bucket_bounds = check.opt_list_param(
+            bucket_bounds, "bucket_bounds", of_type=(int, float)
+        ) or list(DEFAULT_LATENCY_BUCKET_BOUNDS)
+        bucket_counts = check.opt_list_param(bucket_counts, "bucket_counts", of_type=int) or [
+            0 for _ in range(len(bucket_bounds) + 1)
+        ]
+        check.invariant(
+            len(bucket_counts) == len(bucket_bounds) + 1,
+            "Latency histograms need one more bucket count than bucket bounds",
+        )
+        return super(LatencyHistogram, cls).__new__(
+            cls,
+            [float(bound) for bound in bucket_bounds],
+            bucket_counts,
+            float(check.opt_numeric_param(total_seconds, "total_seconds", 0.0)),
+        )
+
+    @property
+    def count(self) -> int:
+        return sum(self.bucket_counts)
+
+    @property
+    def mean_seconds(self) -> Optional[float]:
+        return self.total_seconds / self.count if self.count else None
+
+    def with_latency(self, seconds: float) -> "LatencyHistogram":
+        check.numeric_param(seconds, "seconds")
+        bucket_index = next(
+            (i for i, bound in enumerate(self.bucket_bounds) if seconds <= bound),
+            len(self.bucket_bounds),
+        )
+        return LatencyHistogram(
+            self.bucket_bounds,
+            [
+                count + 1 if i == bucket_index else count
+                for i, count in enumerate(self.bucket_counts)
+            ],
+            self.total_seconds + seconds,
+        )
+
+
 @whitelist_for_serdes(serializer=TickDataSerializer)
 class TickData(
     NamedTuple(
@@ -468,6 +554,8 @@ class TickData(
             ("origin_run_ids", List[str]),
             ("failure_count", int),
             ("selector_id", Optional[str]),
+            ("evaluation_latency_histogram", Optional[LatencyHistogram]),
+            ("skipped_tick_count", Optional[int]),
         ],
     )
 ):
@@ -489,6 +577,13 @@ class TickData(
         origin_run_ids (List[str]): The runs originated from the schedule/sensor.
         failure_count (int): The number of times this tick has failed. If the status is not
             FAILED, this is the number of previous failures before it reached the current state.
+        selector_id (Optional[str]): The selector id of the instigator for this tick
+        evaluation_latency_histogram (Optional[LatencyHistogram]): The latencies of all the
+            evaluations of the instigator made by the daemon process that evaluated this tick,
+            including the evaluation of this tick.
+        skipped_tick_count (Optional[int]): The number of consecutive skipped ticks that this tick
+            stands for, if skipped ticks are coalesced. The other data of the tick is that of the
+            latest of them.
     """
 
     def __new__(
@@ -506,6 +601,8 @@ def __new__(
         origin_run_ids: Optional[List[str]] = None,
         failure_count: Optional[int] = None,
         selector_id: Optional[str] = None,
+        evaluation_latency_histogram: Optional[LatencyHistogram] = None,
+        skipped_tick_count: Optional[int] = None,
     ):
         _validate_tick_args(instigator_type, status, run_ids, error, skip_reason)
         return super(TickData, cls).__new__(
@@ -523,6 +620,10 @@ def __new__(
             origin_run_ids=check.opt_list_param(origin_run_ids, "origin_run_ids", of_type=str),
             failure_count=check.opt_int_param(failure_count, "failure_count", 0),
             selector_id=check.opt_str_param(selector_id, "selector_id"),
+            evaluation_latency_histogram=check.opt_inst_param(
+                evaluation_latency_histogram, "evaluation_latency_histogram", LatencyHistogram
+            ),
+            skipped_tick_count=check.opt_int_param(skipped_tick_count, "skipped_tick_count"),
         )
 
     def with_status(self, status, error=None, timestamp=None, failure_count=None):
@@ -592,6 +693,32 @@ def with_origin_run(self, origin_run_id):
             )
         )
 
+    def with_evaluation_latency_histogram(self, evaluation_latency_histogram):
+        return TickData(
+            **merge_dicts(
+                self._asdict(),
+                {
+                    "evaluation_latency_histogram": check.opt_inst_param(
+                        evaluation_latency_histogram,
+                        "evaluation_latency_histogram",
+                        LatencyHistogram,
+                    )
+                },
+            )
+        )
+
+    def with_skipped_tick_count(self, skipped_tick_count):
+        return TickData(
+            **merge_dicts(
+                self._asdict(),
+                {
+                    "skipped_tick_count": check.opt_int_param(
+                        skipped_tick_count, "skipped_tick_count"
+                    )
+                },
+            )
+        )
+
 
 register_serdes_tuple_fallbacks({"JobTickData": TickData})
 # for internal backcompat
@@ -75,6 +75,14 @@ class PipelineSnapshotSerializer(DefaultNamedTupleSerializer):
     def skip_when_empty(cls) -> Set[str]:
         return {"metadata"}  # Maintain stable snapshot ID for back-compat purposes
 
+    @classmethod
+    def supports_compact(cls) -> bool:
+        return True
+
+    @classmethod
+    def value_from_unpacked(cls, unpacked_dict, klass):
+        return _pipeline_snapshot_from_storage(**unpacked_dict)
+
     @classmethod
     def value_from_storage_dict(
         cls,
@@ -0,0 +1,69 @@
+"""add instigator run keys table
+
+Revision ID: 7f2b1a5c9d3e
+Revises: a00dd8d936a1
+Create Date: 2022-11-02 10:12:44.318250
+
+"""
+import sqlalchemy as db
+from alembic import op
+
+from dagster._core.storage.migration.utils import has_index, has_table
+from dagster._core.storage.sql import get_current_timestamp
+
+# revision identifiers, used by Alembic.
+revision = "7f2b1a5c9d3e"
+down_revision = "a00dd8d936a1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not has_table("runs"):
+        return
+
+    if not has_table("instigator_run_keys"):
+        op.create_table(
+            "instigator_run_keys",
+            db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+            db.Column("selector_id", db.String(255), nullable=False),
+            db.Column("run_key", db.Text, nullable=False),
+            db.Column(
+                "run_id",
+                db.String(255),
+                db.ForeignKey("runs.run_id", ondelete="CASCADE"),
+                nullable=False,
+            ),
+            db.Column("status", db.String(63), nullable=False),
+            db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
+            db.Column("update_timestamp", db.DateTime, server_default=get_current_timestamp()),
+        )
+
+    if not has_index("instigator_run_keys", "idx_instigator_run_keys"):
+        op.create_index(
+            "idx_instigator_run_keys",
+            "instigator_run_keys",
+            ["selector_id", "run_key"],
+            unique=False,
+            mysql_length={"selector_id": 64, "run_key": 64},
+        )
+
+    if not has_index("instigator_run_keys", "idx_instigator_run_keys_run_id"):
+        op.create_index(
+            "idx_instigator_run_keys_run_id",
+            "instigator_run_keys",
+            ["run_id"],
+            unique=False,
+            mysql_length={"run_id": 64},
+        )
+
+
+def downgrade():
+    if has_index("instigator_run_keys", "idx_instigator_run_keys_run_id"):
+        op.drop_index("idx_instigator_run_keys_run_id")
+
+    if has_index("instigator_run_keys", "idx_instigator_run_keys"):
+        op.drop_index("idx_instigator_run_keys")
+
+    if has_table("instigator_run_keys"):
+        op.drop_table("instigator_run_keys")
@@ -240,21 +240,30 @@ def fetch(self):
         if not self.observer:
             return
 
-        should_fetch = True
-        while should_fetch:
-            update = self.manager.read_logs_file(
-                self.run_id,
-                self.key,
-                self.io_type,
-                self.cursor,
-                max_bytes=MAX_BYTES_CHUNK_READ,
-            )
-            if not self.cursor or update.cursor != self.cursor:
-                self.observer.on_next(update)
-                self.cursor = update.cursor
-            should_fetch = update.data and len(update.data.encode("utf-8")) >= MAX_BYTES_CHUNK_READ
+        for update in read_log_updates(
+            self.manager, self.run_id, self.key, self.io_type, self.cursor
+        ):
+            self.observer.on_next(update)
+            self.cursor = update.cursor
 
     def complete(self):
         if not self.observer:
             return
         self.observer.on_completed()
+
+
+def read_log_updates(manager, run_id, key, io_type, cursor):
+    """Reads the logs written since the cursor, in chunks of at most MAX_BYTES_CHUNK_READ bytes."""
+    should_fetch = True
+    while should_fetch:
+        update = manager.read_logs_file(
+            run_id,
+            key,
+            io_type,
+            cursor,
+            max_bytes=MAX_BYTES_CHUNK_READ,
+        )
+        if not cursor or update.cursor != cursor:
+            yield update
+            cursor = update.cursor
+        should_fetch = update.data and len(update.data.encode("utf-8")) >= MAX_BYTES_CHUNK_READ
@@ -184,6 +184,18 @@ def store_event(self, event: EventLogEntry):
             event (EventLogEntry): The event to store.
         """
 
+    def store_events(self, events: Sequence[EventLogEntry]):
+        """Store a batch of events, preserving their order.
+
+        Storages that can write several events in a single round trip should override this
+        method. The default implementation stores each event individually.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        for event in events:
+            self.store_event(event)
+
     @abstractmethod
     def delete_events(self, run_id: str):
         """Remove events for a given run id"""
@@ -1,5 +1,7 @@
+import logging
 import threading
-from typing import Callable, List, MutableMapping, NamedTuple, Optional
+import weakref
+from typing import Callable, Dict, List, MutableMapping, NamedTuple, Optional
 
 import dagster._check as check
 from dagster._core.events.log import EventLogEntry
@@ -23,13 +25,13 @@ class CallbackAfterCursor(NamedTuple):
 
 
 class SqlPollingEventWatcher:
-    """Event Log Watcher that uses a multithreaded polling approach to retrieving new events for run_ids
-    This class' job is to manage a collection of threads that each poll the event log for a given run_id
-    Uses one thread (SqlPollingRunIdEventWatcherThread) per watched run_id
+    """Event Log Watcher that uses a polling approach to retrieving new events for run_ids
+    This class' job is to manage the callbacks registered for each watched run_id, which are all
+    served by a single shared thread (SqlPollingEventWatcherThread) that fetches the new events
+    for every watched run_id with one query per polling interval.
 
     LOCKING INFO:
-        ORDER: _dict_lock -> run_id_thread.callback_fn_list_lock
-        INVARIANTS: _dict_lock protects _run_id_to_watcher_dict
+        INVARIANTS: _dict_lock protects _run_id_to_callbacks and _run_id_to_cursor
     """
 
     def __init__(self, event_log_storage: SqlEventLogStorage):
@@ -37,15 +39,18 @@ def __init__(self, event_log_storage: SqlEventLogStorage):
             event_log_storage, "event_log_storage", SqlEventLogStorage
         )
 
-        # INVARIANT: dict_lock protects _run_id_to_watcher_dict
+        # INVARIANT: dict_lock protects _run_id_to_callbacks and _run_id_to_cursor
         self._dict_lock: threading.Lock = threading.Lock()
-        self._run_id_to_watcher_dict: MutableMapping[str, SqlPollingRunIdEventWatcherThread] = {}
+        self._run_id_to_callbacks: MutableMapping[str, List[CallbackAfterCursor]] = {}
+        # storage id of the last record fetched for each watched run_id
+        self._run_id_to_cursor: MutableMapping[str, int] = {}
+        self._watcher_thread: Optional[SqlPollingEventWatcherThread] = None
         self._disposed = False
 
     def has_run_id(self, run_id: str) -> bool:
         run_id = check.str_param(run_id, "run_id")
         with self._dict_lock:
-            _has_run_id = run_id in self._run_id_to_watcher_dict
+            _has_run_id = run_id in self._run_id_to_callbacks
         return _has_run_id
 
     def watch_run(
@@ -54,23 +59,108 @@ def watch_run(
         run_id = check.str_param(run_id, "run_id")
         cursor = check.opt_str_param(cursor, "cursor")
         callback = check.callable_param(callback, "callback")
+        storage_id = _storage_id_from_cursor(cursor)
         with self._dict_lock:
-            if run_id not in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id] = SqlPollingRunIdEventWatcherThread(
-                    self._event_log_storage, run_id
-                )
-                self._run_id_to_watcher_dict[run_id].daemon = True
-                self._run_id_to_watcher_dict[run_id].start()
-            self._run_id_to_watcher_dict[run_id].add_callback(cursor, callback)
+            if run_id not in self._run_id_to_callbacks:
+                self._run_id_to_callbacks[run_id] = []
+                self._run_id_to_cursor[run_id] = storage_id
+            else:
+                # fetch the events the new callback needs from an earlier cursor. The callbacks
+                # that are already watching skip the events they have already been called with.
+                self._run_id_to_cursor[run_id] = min(storage_id, self._run_id_to_cursor[run_id])
+            self._run_id_to_callbacks[run_id].append(CallbackAfterCursor(cursor, callback))
+
+            if not self._watcher_thread:
+                self._watcher_thread = SqlPollingEventWatcherThread(self)
+                self._watcher_thread.daemon = True
+                self._watcher_thread.start()
 
     def unwatch_run(self, run_id: str, handler: Callable[[EventLogEntry, str], None]):
         run_id = check.str_param(run_id, "run_id")
         handler = check.callable_param(handler, "handler")
         with self._dict_lock:
-            if run_id in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id].remove_callback(handler)
-                if self._run_id_to_watcher_dict[run_id].should_thread_exit.is_set():
-                    del self._run_id_to_watcher_dict[run_id]
+            if run_id in self._run_id_to_callbacks:
+                self._run_id_to_callbacks[run_id] = [
+                    callback_with_cursor
+                    for callback_with_cursor in self._run_id_to_callbacks[run_id]
+                    if callback_with_cursor.callback != handler
+                ]
+                if not self._run_id_to_callbacks[run_id]:
+                    del self._run_id_to_callbacks[run_id]
+                    del self._run_id_to_cursor[run_id]
+
+    def poll(self):
+        """Fetch the new EventLogEntrys for all watched run_ids in a single query, and fire each
+        callback (taking into account the callback.cursor) on the new EventLogEntrys of its run.
+        """
+        with self._dict_lock:
+            run_cursors = dict(self._run_id_to_cursor)
+            callbacks_by_run_id = {
+                run_id: list(callbacks) for run_id, callbacks in self._run_id_to_callbacks.items()
+            }
+
+        if not run_cursors:
+            return
+
+        event_records = self._event_log_storage.get_records_for_runs(run_cursors)
+
+        max_storage_id_by_run_id: Dict[str, int] = {}
+        for event_record in event_records:
+            run_id = event_record.event_log_entry.run_id
+            max_storage_id_by_run_id[run_id] = max(
+                event_record.storage_id, max_storage_id_by_run_id.get(run_id, -1)
+            )
+
+            with self._dict_lock:
+                callbacks = list(self._run_id_to_callbacks.get(run_id, []))
+
+            for callback_with_cursor in callbacks:
+                # callbacks that started watching since the poll started are called on the next
+                # poll, from their own cursor
+                if not any(
+                    callback_with_cursor is polled_callback
+                    for polled_callback in callbacks_by_run_id.get(run_id, [])
+                ):
+                    continue
+
+                if _storage_id_from_cursor(callback_with_cursor.cursor) < event_record.storage_id:
+                    try:
+                        callback_with_cursor.callback(
+                            event_record.event_log_entry,
+                            str(EventLogCursor.from_storage_id(event_record.storage_id)),
+                        )
+                    except Exception:
+                        logging.exception(
+                            "Exception in callback for event watch on run %s.", run_id
+                        )
+
+        with self._dict_lock:
+            for run_id, storage_id in max_storage_id_by_run_id.items():
+                if run_id not in self._run_id_to_callbacks:
+                    continue
+
+                # advance the cursor of each polled callback past the fetched events, so that
+                # lowering the cursor of the run for a new callback does not call it again
+                callbacks = [
+                    CallbackAfterCursor(
+                        str(
+                            EventLogCursor.from_storage_id(
+                                max(storage_id, _storage_id_from_cursor(callback.cursor))
+                            )
+                        ),
+                        callback.callback,
+                    )
+                    if any(
+                        callback is polled_callback
+                        for polled_callback in callbacks_by_run_id[run_id]
+                    )
+                    else callback
+                    for callback in self._run_id_to_callbacks[run_id]
+                ]
+                self._run_id_to_callbacks[run_id] = callbacks
+                self._run_id_to_cursor[run_id] = min(
+                    _storage_id_from_cursor(callback.cursor) for callback in callbacks
+                )
 
     def __del__(self):
         self.close()
@@ -79,94 +169,52 @@ def close(self):
         if not self._disposed:
             self._disposed = True
             with self._dict_lock:
-                for watcher_thread in self._run_id_to_watcher_dict.values():
-                    if not watcher_thread.should_thread_exit.is_set():
-                        watcher_thread.should_thread_exit.set()
-                for run_id in self._run_id_to_watcher_dict:
-                    self._run_id_to_watcher_dict[run_id].join()
-                del self._run_id_to_watcher_dict
+                watcher_thread = self._watcher_thread
+                self._watcher_thread = None
+                self._run_id_to_callbacks = {}
+                self._run_id_to_cursor = {}
 
+            if watcher_thread:
+                watcher_thread.should_thread_exit.set()
+                if watcher_thread.is_alive() and watcher_thread is not threading.current_thread():
+                    watcher_thread.join()
 
-class SqlPollingRunIdEventWatcherThread(threading.Thread):
-    """subclass of Thread that watches a given run_id for new Events by polling every POLLING_CADENCE
 
-    Holds a list of callbacks (_callback_fn_list) each passed in by an `Observer`. Note that
-        the callbacks have a cursor associated; this means that the callbacks should be
-        only executed on EventLogEntrys with an associated id >= callback.cursor
-    Exits when `self.should_thread_exit` is set.
+def _storage_id_from_cursor(cursor: Optional[str]) -> int:
+    return EventLogCursor.parse(cursor).storage_id() if cursor else -1
 
-    LOCKING INFO:
-        INVARIANTS: _callback_fn_list_lock protects _callback_fn_list
 
+class SqlPollingEventWatcherThread(threading.Thread):
+    """subclass of Thread that polls for new Events for all of the run_ids watched by a
+    SqlPollingEventWatcher every POLLING_CADENCE
+
+    Exits when `self.should_thread_exit` is set.
     """
 
-    def __init__(self, event_log_storage: SqlEventLogStorage, run_id: str):
-        super(SqlPollingRunIdEventWatcherThread, self).__init__()
-        self._event_log_storage = check.inst_param(
-            event_log_storage, "event_log_storage", SqlEventLogStorage
+    def __init__(self, event_watcher: SqlPollingEventWatcher):
+        super(SqlPollingEventWatcherThread, self).__init__()
+        # hold a weak reference so that the thread does not keep the watcher from being collected
+        self._event_watcher_ref = weakref.ref(
+            check.inst_param(event_watcher, "event_watcher", SqlPollingEventWatcher)
         )
-        self._run_id = check.str_param(run_id, "run_id")
-        self._callback_fn_list_lock: threading.Lock = threading.Lock()
-        self._callback_fn_list: List[CallbackAfterCursor] = []
         self._should_thread_exit = threading.Event()
-        self.name = f"mysql-event-watch-run-id-{self._run_id}"
+        self.name = "sql-event-watch"
 
     @property
     def should_thread_exit(self) -> threading.Event:
         return self._should_thread_exit
 
-    def add_callback(self, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]):
-        """Observer has started watching this run.
-            Add a callback to execute on new EventLogEntrys after the given cursor
-
-        Args:
-            cursor (Optional[str]): event log cursor for the callback to execute
-            callback (Callable[[EventLogEntry, str], None]): callback to update the Dagster UI
-        """
-        cursor = check.opt_str_param(cursor, "cursor")
-        callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list.append(CallbackAfterCursor(cursor, callback))
-
-    def remove_callback(self, callback: Callable[[EventLogEntry, str], None]):
-        """Observer has stopped watching this run;
-            Remove a callback from the list of callbacks to execute on new EventLogEntrys
-
-            Also kill thread if no callbacks remaining (i.e. no Observers are watching this run_id)
-
-        Args:
-            callback (Callable[[EventLogEntry, str], None]): callback to remove from list of callbacks
-        """
-        callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list = [
-                callback_with_cursor
-                for callback_with_cursor in self._callback_fn_list
-                if callback_with_cursor.callback != callback
-            ]
-            if not self._callback_fn_list:
-                self._should_thread_exit.set()
-
     def run(self):
         """Polling function to update Observers with EventLogEntrys from Event Log DB.
-        Wakes every POLLING_CADENCE &
-            1. executes a SELECT query to get new EventLogEntrys
-            2. fires each callback (taking into account the callback.cursor) on the new EventLogEntrys
-        Uses max_index_so_far as a cursor in the DB to make sure that only new records are retrieved
+        Wakes every POLLING_CADENCE & fetches the new EventLogEntrys for all watched runs
         """
-        cursor = None
         while not self._should_thread_exit.wait(POLLING_CADENCE):
-            conn = self._event_log_storage.get_records_for_run(self._run_id, cursor=cursor)
-            cursor = conn.cursor if conn.cursor else cursor
-            for event_record in conn.records:
-                with self._callback_fn_list_lock:
-                    for callback_with_cursor in self._callback_fn_list:
-                        if (
-                            callback_with_cursor.cursor is None
-                            or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
-                            < event_record.storage_id
-                        ):
-                            callback_with_cursor.callback(
-                                event_record.event_log_entry,
-                                str(EventLogCursor.from_storage_id(event_record.storage_id)),
-                            )
+            event_watcher = self._event_watcher_ref()
+            if event_watcher is None:
+                break
+            try:
+                event_watcher.poll()
+            except Exception:
+                logging.exception("Exception while polling for new events.")
+            finally:
+                del event_watcher
@@ -39,6 +39,10 @@
 
 MIN_ASSET_ROWS = 25
 
+# Maximum number of rows written per multi-row insert statement in `store_events`. Kept well
+# below the bound variable limits of the supported SQL backends (e.g. 999 for older sqlite builds).
+STORE_EVENTS_BATCH_SIZE = 100
+
 
 class SqlEventLogStorage(EventLogStorage):
     """Base class for SQL backed event log storages.
@@ -78,7 +82,20 @@ def prepare_insert_event(self, event):
         the `dagster-postgres` implementation which overrides the generic SQL implementation of
         `store_event`.
         """
+        # https://stackoverflow.com/a/54386260/324449
+        return SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
+            **self._get_event_insert_values(event)
+        )
+
+    def prepare_insert_events(self, events):
+        """Helper method for preparing a single multi-row SQL insertion statement for a batch of
+        events. See `prepare_insert_event`.
+        """
+        return SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
+            [self._get_event_insert_values(event) for event in events]
+        )
 
+    def _get_event_insert_values(self, event):
         dagster_event_type = None
         asset_key_str = None
         partition = None
@@ -93,8 +110,7 @@ def prepare_insert_event(self, event):
             if event.dagster_event.partition:
                 partition = event.dagster_event.partition
 
-        # https://stackoverflow.com/a/54386260/324449
-        return SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
+        return dict(
             run_id=event.run_id,
             event=serialize_dagster_namedtuple(event),
             dagster_event_type=dagster_event_type,
@@ -215,17 +231,28 @@ def store_event(self, event):
         with self.run_connection(run_id) as conn:
             conn.execute(insert_event_statement)
 
-        if (
-            event.is_dagster_event
-            and (
-                event.dagster_event.is_step_materialization
-                or event.dagster_event.is_asset_observation
-                or event.dagster_event.is_asset_materialization_planned
-            )
-            and event.dagster_event.asset_key
-        ):
+        if is_asset_index_event(event):
             self.store_asset_event(event)
 
+    def store_events(self, events):
+        """Store a batch of events corresponding to one or more pipeline runs, using multi-row
+        inserts. Events are grouped by run, and each group is written in chunks of at most
+        `STORE_EVENTS_BATCH_SIZE` rows per statement.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.list_param(events, "events", of_type=EventLogEntry)
+
+        for run_id, run_events in group_events_by_run_id(events).items():
+            with self.run_connection(run_id) as conn:
+                for chunk in chunk_events(run_events, STORE_EVENTS_BATCH_SIZE):
+                    conn.execute(self.prepare_insert_events(chunk))
+
+        for event in events:
+            if is_asset_index_event(event):
+                self.store_asset_event(event)
+
     def get_records_for_run(
         self,
         run_id,
@@ -315,6 +342,65 @@ def get_records_for_run(
             has_more=bool(limit and len(results) == limit),
         )
 
+    def get_records_for_runs(self, run_cursors: Mapping[str, int]) -> Sequence[EventLogRecord]:
+        """Get the new records for several runs at once, for use by event log watchers that
+        multiplex many run subscriptions.
+
+        Args:
+            run_cursors (Mapping[str, int]): For each run id, the storage id after which records
+                should be returned.
+
+        Returns:
+            Sequence[EventLogRecord]: The matching records, ordered by storage id within each run.
+        """
+        check.dict_param(run_cursors, "run_cursors", key_type=str, value_type=int)
+        if not run_cursors:
+            return []
+
+        if self.is_run_sharded:
+            # each run lives in its own shard, so there is no single query spanning runs
+            records = []
+            for run_id, storage_id in run_cursors.items():
+                records.extend(
+                    self.get_records_for_run(
+                        run_id, cursor=EventLogCursor.from_storage_id(storage_id).to_string()
+                    ).records
+                )
+            return records
+
+        query = (
+            db.select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+            .where(
+                db.or_(
+                    *[
+                        db.and_(
+                            SqlEventLogStorageTable.c.run_id == run_id,
+                            SqlEventLogStorageTable.c.id > storage_id,
+                        )
+                        for run_id, storage_id in run_cursors.items()
+                    ]
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        records = []
+        for record_id, json_str in results:
+            try:
+                records.append(
+                    EventLogRecord(
+                        storage_id=record_id,
+                        event_log_entry=deserialize_as(json_str, EventLogEntry),
+                    )
+                )
+            except (seven.JSONDecodeError, DeserializationError):
+                logging.warning("Could not parse event record id `%s`.", record_id)
+
+        return records
+
     def get_stats_for_run(self, run_id):
         check.str_param(run_id, "run_id")
 
@@ -1278,3 +1364,31 @@ def _get_from_row(row, column):
     if not row.has_key(column):
         return None
     return row[column]
+
+
+def is_asset_index_event(event: EventLogEntry) -> bool:
+    return bool(
+        event.is_dagster_event
+        and (
+            event.dagster_event.is_step_materialization
+            or event.dagster_event.is_asset_observation
+            or event.dagster_event.is_asset_materialization_planned
+        )
+        and event.dagster_event.asset_key
+    )
+
+
+def group_events_by_run_id(
+    events: Sequence[EventLogEntry],
+) -> Mapping[str, Sequence[EventLogEntry]]:
+    grouped: Dict[str, List[EventLogEntry]] = OrderedDict()
+    for event in events:
+        grouped.setdefault(event.run_id, []).append(event)
+    return grouped
+
+
+def chunk_events(
+    events: Sequence[EventLogEntry], chunk_size: int
+) -> Iterable[Sequence[EventLogEntry]]:
+    for i in range(0, len(events), chunk_size):
+        yield events[i : i + chunk_size]
@@ -37,7 +37,14 @@
 from dagster._utils import mkdir_p
 
 from ..schema import SqlEventLogStorageMetadata, SqlEventLogStorageTable
-from ..sql_event_log import RunShardedEventsCursor, SqlEventLogStorage
+from ..sql_event_log import (
+    STORE_EVENTS_BATCH_SIZE,
+    RunShardedEventsCursor,
+    SqlEventLogStorage,
+    chunk_events,
+    group_events_by_run_id,
+    is_asset_index_event,
+)
 
 INDEX_SHARD_NAME = "index"
 
@@ -226,24 +233,56 @@ def store_event(self, event):
             conn.execute(insert_event_statement)
 
         if event.is_dagster_event and event.dagster_event.asset_key:
-            check.invariant(
-                event.dagster_event_type == DagsterEventType.ASSET_MATERIALIZATION
-                or event.dagster_event_type == DagsterEventType.ASSET_OBSERVATION
-                or event.dagster_event_type == DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
-                "Can only store asset materializations, materialization_planned, and observations in index database",
-            )
+            self._check_index_event(event)
 
             # mirror the event in the cross-run index database
             with self.index_connection() as conn:
                 conn.execute(insert_event_statement)
 
-            if (
-                event.dagster_event.is_step_materialization
-                or event.dagster_event.is_asset_observation
-                or event.dagster_event.is_asset_materialization_planned
-            ):
+            if is_asset_index_event(event):
+                self.store_asset_event(event)
+
+    def store_events(self, events):
+        """
+        Overridden method to write each run's events to its shard with multi-row inserts, and to
+        replicate the batch's asset events in the central assets.db sqlite shard.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.list_param(events, "events", of_type=EventLogEntry)
+
+        for run_id, run_events in group_events_by_run_id(events).items():
+            with self.run_connection(run_id) as conn:
+                for chunk in chunk_events(run_events, STORE_EVENTS_BATCH_SIZE):
+                    conn.execute(self.prepare_insert_events(chunk))
+
+        asset_events = [
+            event for event in events if event.is_dagster_event and event.dagster_event.asset_key
+        ]
+        if not asset_events:
+            return
+
+        for event in asset_events:
+            self._check_index_event(event)
+
+        # mirror the asset events in the cross-run index database
+        with self.index_connection() as conn:
+            for chunk in chunk_events(asset_events, STORE_EVENTS_BATCH_SIZE):
+                conn.execute(self.prepare_insert_events(chunk))
+
+        for event in asset_events:
+            if is_asset_index_event(event):
                 self.store_asset_event(event)
 
+    def _check_index_event(self, event):
+        check.invariant(
+            event.dagster_event_type == DagsterEventType.ASSET_MATERIALIZATION
+            or event.dagster_event_type == DagsterEventType.ASSET_OBSERVATION
+            or event.dagster_event_type == DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
+            "Can only store asset materializations, materialization_planned, and observations in index database",
+        )
+
     def get_event_records(
         self,
         event_records_filter: EventRecordsFilter,
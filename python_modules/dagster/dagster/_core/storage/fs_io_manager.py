@@ -4,7 +4,7 @@
 
 import dagster._check as check
 from dagster._annotations import experimental
-from dagster._config import Field, StringSource
+from dagster._config import BoolSource, Field, StringSource
 from dagster._core.definitions.events import AssetKey, AssetMaterialization
 from dagster._core.definitions.metadata import MetadataEntry, MetadataValue
 from dagster._core.errors import DagsterInvariantViolationError
@@ -16,7 +16,19 @@
 
 
 @io_manager(
-    config_schema={"base_dir": Field(StringSource, is_required=False)},
+    config_schema={
+        "base_dir": Field(StringSource, is_required=False),
+        "release_outputs": Field(
+            BoolSource,
+            is_required=False,
+            default_value=False,
+            description=(
+                "Whether to delete the files for op outputs once every downstream op that loads "
+                "them has completed. Only applies to in-process execution. Asset outputs are "
+                "never deleted."
+            ),
+        ),
+    },
     description="Built-in filesystem IO manager that stores and retrieves values using pickling.",
 )
 def fs_io_manager(init_context):
@@ -31,6 +43,11 @@ def fs_io_manager(init_context):
       points to, if that environment variable is specified. Otherwise...
     * A temporary directory.
 
+    When the "release_outputs" configuration value is set, the files for op outputs are deleted once
+    all of the downstream ops that load them have completed, rather than being kept after the run.
+    This keeps disk usage bounded for large fan-out jobs, but means that the run cannot be
+    re-executed from the deleted outputs.
+
     Assigns each op output to a unique filepath containing run ID, step key, and output name.
     Assigns each asset to a single filesystem path, at "<base_dir>/<asset_key>". If the asset key
     has multiple components, the final component is used as the name of the file, and the preceding
@@ -120,7 +137,9 @@ def job():
         "base_dir", init_context.instance.storage_directory()
     )
 
-    return PickledObjectFilesystemIOManager(base_dir=base_dir)
+    return PickledObjectFilesystemIOManager(
+        base_dir=base_dir, release_outputs=init_context.resource_config["release_outputs"]
+    )
 
 
 class PickledObjectFilesystemIOManager(MemoizableIOManager):
@@ -129,10 +148,13 @@ class PickledObjectFilesystemIOManager(MemoizableIOManager):
     Args:
         base_dir (Optional[str]): base directory where all the step outputs which use this object
             manager will be stored in.
+        release_outputs (Optional[bool]): whether to delete the files for op outputs once they are
+            released. Defaults to False.
     """
 
-    def __init__(self, base_dir=None):
+    def __init__(self, base_dir=None, release_outputs=False):
         self.base_dir = check.opt_str_param(base_dir, "base_dir")
+        self.release_outputs = check.bool_param(release_outputs, "release_outputs")
         self.write_mode = "wb"
         self.read_mode = "rb"
 
@@ -210,6 +232,15 @@ def load_input(self, context):
         with open(filepath, self.read_mode) as read_obj:
             return pickle.load(read_obj)
 
+    def release_output(self, context):
+        """Delete the file for an op output that will not be loaded again."""
+        if not self.release_outputs or context.has_asset_key:
+            return
+
+        filepath = self._get_path(context)
+        if os.path.exists(filepath):
+            os.remove(filepath)
+
 
 class CustomPathPickledObjectFilesystemIOManager(IOManager):
     """Built-in filesystem IO managerthat stores and retrieves values using pickling and
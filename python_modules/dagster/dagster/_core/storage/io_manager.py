@@ -187,6 +187,18 @@ def get_input_asset_partitions(self, context: "InputContext") -> Set[str]:
         upstream_output_context = check.not_none(context.upstream_output)
         return self.get_output_asset_partitions(upstream_output_context)
 
+    def release_output(self, context: "OutputContext") -> None:
+        """User-defined method that is called once every downstream step that loads an output
+        handled by this IOManager has completed, so that any memory or storage held for the output
+        can be freed before the run finishes. By default, outputs are kept.
+
+        Outputs are only released during in-process execution, and are not released if a
+        downstream step fails, so that they remain available for re-execution.
+
+        Args:
+            context (OutputContext): The context of the step output that produced the object.
+        """
+
 
 @overload
 def io_manager(config_schema: IOManagerFunction) -> IOManagerDefinition:
@@ -36,6 +36,7 @@
     from dagster._core.snap.execution_plan_snapshot import ExecutionPlanSnapshot
     from dagster._core.snap.pipeline_snapshot import PipelineSnapshot
     from dagster._core.storage.pipeline_run import (
+        InstigatorRunKey,
         JobBucket,
         PipelineRun,
         PipelineRunStatsSnapshot,
@@ -159,6 +160,9 @@ def from_config_value(inst_data, config_value):
     def add_run(self, pipeline_run: "PipelineRun") -> "PipelineRun":
         return self._storage.run_storage.add_run(pipeline_run)
 
+    def add_runs(self, pipeline_runs: Sequence["PipelineRun"]) -> Sequence["PipelineRun"]:
+        return self._storage.run_storage.add_runs(pipeline_runs)
+
     def handle_run_event(self, run_id: str, event: "DagsterEvent"):
         return self._storage.run_storage.handle_run_event(run_id, event)
 
@@ -294,6 +298,14 @@ def add_backfill(self, partition_backfill: "PartitionBackfill"):
     def update_backfill(self, partition_backfill: "PartitionBackfill"):
         return self._storage.run_storage.update_backfill(partition_backfill)
 
+    def supports_instigator_run_keys(self) -> bool:
+        return self._storage.run_storage.supports_instigator_run_keys()
+
+    def get_instigator_run_keys(
+        self, selector_id: str, run_keys: Sequence[str]
+    ) -> Mapping[str, "InstigatorRunKey"]:
+        return self._storage.run_storage.get_instigator_run_keys(selector_id, run_keys)
+
 
 class LegacyEventLogStorage(EventLogStorage, ConfigurableClass):
     def __init__(self, storage, inst_data=None):
@@ -533,6 +545,19 @@ def purge_ticks(
             origin_id, selector_id, before, tick_statuses
         )
 
+    def update_ticks(self, ticks: Sequence["InstigatorTick"]):
+        return self._storage.schedule_storage.update_ticks(ticks)
+
+    def purge_ticks_before(
+        self,
+        before: float,
+        instigator_type: Optional["InstigatorType"] = None,
+        tick_statuses: Optional[List["TickStatus"]] = None,
+    ):
+        return self._storage.schedule_storage.purge_ticks_before(
+            before, instigator_type, tick_statuses
+        )
+
     def upgrade(self):
         return self._storage.schedule_storage.upgrade()
 
@@ -1,15 +1,16 @@
 import hashlib
 import os
 import sys
+import threading
 from collections import defaultdict
 from contextlib import contextmanager
 
-from watchdog.events import PatternMatchingEventHandler
+from watchdog.events import FileSystemEventHandler
 from watchdog.observers.polling import PollingObserver
 
 from dagster import Field, Float, StringSource
 from dagster import _check as check
-from dagster._core.execution.compute_logs import mirror_stream_to_file
+from dagster._core.execution.compute_logs import tee_stream_to_file
 from dagster._core.storage.pipeline_run import PipelineRun
 from dagster._serdes import ConfigurableClass, ConfigurableClassData
 from dagster._utils import ensure_dir, touch_file
@@ -20,6 +21,7 @@
     ComputeLogFileData,
     ComputeLogManager,
     ComputeLogSubscription,
+    read_log_updates,
 )
 
 DEFAULT_WATCHDOG_POLLING_TIMEOUT = 2.5
@@ -48,8 +50,8 @@ def _watch_logs(self, pipeline_run, step_key=None):
         key = self.get_key(pipeline_run, step_key)
         outpath = self.get_local_path(pipeline_run.run_id, key, ComputeIOType.STDOUT)
         errpath = self.get_local_path(pipeline_run.run_id, key, ComputeIOType.STDERR)
-        with mirror_stream_to_file(sys.stdout, outpath):
-            with mirror_stream_to_file(sys.stderr, errpath):
+        with tee_stream_to_file(sys.stdout, outpath):
+            with tee_stream_to_file(sys.stderr, errpath):
                 yield
 
     @property
@@ -143,11 +145,25 @@ def dispose(self):
 
 
 class LocalComputeLogSubscriptionManager:
+    """Shared hub that pushes appended log data to all of the compute log subscriptions of a
+    manager.
+
+    A single polling filesystem observer is shared across subscriptions, with one watch per run
+    directory, so that logs written by other hosts to a shared directory are picked up. When a log
+    file changes, the appended bytes are read once for each distinct cursor and pushed to every
+    subscription at that cursor, rather than having each subscription reread the file.
+    """
+
     def __init__(self, manager):
         self._manager = manager
         self._subscriptions = defaultdict(list)
         self._watchers = {}
+        self._update_paths = {}
+        self._complete_paths = {}
+        self._directory_watches = {}
+        self._directory_watch_keys = defaultdict(set)
         self._observer = None
+        self._lock = threading.RLock()
 
     def _watch_key(self, run_id, key):
         return "{}:{}".format(run_id, key)
@@ -157,60 +173,123 @@ def add_subscription(self, subscription):
         if self._manager.is_watch_completed(subscription.run_id, subscription.key):
             subscription.fetch()
             subscription.complete()
-        else:
+            return
+
+        with self._lock:
             watch_key = self._watch_key(subscription.run_id, subscription.key)
             self._subscriptions[watch_key].append(subscription)
             self.watch(subscription.run_id, subscription.key)
 
+        # the step may have completed before the watch was scheduled, in which case no creation
+        # event will be observed for the completion artifact
+        if self._manager.is_watch_completed(subscription.run_id, subscription.key):
+            self.notify_subscriptions(subscription.run_id, subscription.key)
+            self.remove_all_subscriptions(subscription.run_id, subscription.key)
+
     def remove_subscription(self, subscription):
         check.inst_param(subscription, "subscription", ComputeLogSubscription)
         watch_key = self._watch_key(subscription.run_id, subscription.key)
-        if subscription in self._subscriptions[watch_key]:
+        with self._lock:
+            if subscription not in self._subscriptions[watch_key]:
+                return
             self._subscriptions[watch_key].remove(subscription)
-            subscription.complete()
+        subscription.complete()
 
     def remove_all_subscriptions(self, run_id, step_key):
         watch_key = self._watch_key(run_id, step_key)
-        for subscription in self._subscriptions.pop(watch_key, []):
+        with self._lock:
+            subscriptions = self._subscriptions.pop(watch_key, [])
+        for subscription in subscriptions:
             subscription.complete()
 
     def watch(self, run_id, step_key):
         watch_key = self._watch_key(run_id, step_key)
-        if watch_key in self._watchers:
-            return
-
-        update_paths = [
-            self._manager.get_local_path(run_id, step_key, ComputeIOType.STDOUT),
-            self._manager.get_local_path(run_id, step_key, ComputeIOType.STDERR),
-        ]
-        complete_paths = [self._manager.complete_artifact_path(run_id, step_key)]
-        directory = os.path.dirname(
-            self._manager.get_local_path(run_id, step_key, ComputeIOType.STDERR)
-        )
-
-        if not self._observer:
-            self._observer = PollingObserver(self._manager.polling_timeout)
-            self._observer.start()
-
-        ensure_dir(directory)
-
-        self._watchers[watch_key] = self._observer.schedule(
-            LocalComputeLogFilesystemEventHandler(
-                self, run_id, step_key, update_paths, complete_paths
-            ),
-            str(directory),
-        )
-
-    def notify_subscriptions(self, run_id, step_key):
+        with self._lock:
+            if watch_key in self._watchers:
+                return
+
+            directory = str(
+                os.path.dirname(
+                    self._manager.get_local_path(run_id, step_key, ComputeIOType.STDERR)
+                )
+            )
+            update_paths = {
+                self._manager.get_local_path(run_id, step_key, io_type): io_type
+                for io_type in [ComputeIOType.STDOUT, ComputeIOType.STDERR]
+            }
+            complete_path = self._manager.complete_artifact_path(run_id, step_key)
+
+            for path, io_type in update_paths.items():
+                self._update_paths[path] = (run_id, step_key, io_type)
+            self._complete_paths[complete_path] = (run_id, step_key)
+            self._watchers[watch_key] = (directory, list(update_paths.keys()), complete_path)
+            self._directory_watch_keys[directory].add(watch_key)
+
+            if directory in self._directory_watches:
+                return
+
+            if not self._observer:
+                self._observer = PollingObserver(self._manager.polling_timeout)
+                self._observer.start()
+
+            ensure_dir(directory)
+            self._directory_watches[directory] = self._observer.schedule(
+                LocalComputeLogFilesystemEventHandler(self), directory
+            )
+
+    def notify_subscriptions(self, run_id, step_key, io_type=None):
         watch_key = self._watch_key(run_id, step_key)
-        for subscription in self._subscriptions[watch_key]:
-            subscription.fetch()
-
-    def unwatch(self, run_id, step_key, handler):
+        with self._lock:
+            subscriptions = [
+                subscription
+                for subscription in self._subscriptions.get(watch_key, [])
+                # subscriptions without an observer fetch from their own cursor once subscribed
+                if subscription.observer and (io_type is None or subscription.io_type == io_type)
+            ]
+
+        subscriptions_by_cursor = defaultdict(list)
+        for subscription in subscriptions:
+            subscriptions_by_cursor[(subscription.io_type, subscription.cursor)].append(
+                subscription
+            )
+
+        for (cursor_io_type, cursor), cursor_subscriptions in subscriptions_by_cursor.items():
+            for update in read_log_updates(self._manager, run_id, step_key, cursor_io_type, cursor):
+                for subscription in cursor_subscriptions:
+                    if subscription.observer:
+                        subscription.observer.on_next(update)
+                        subscription.cursor = update.cursor
+
+    def on_path_modified(self, path):
+        with self._lock:
+            target = self._update_paths.get(path)
+        if target:
+            run_id, step_key, io_type = target
+            self.notify_subscriptions(run_id, step_key, io_type)
+
+    def on_path_created(self, path):
+        with self._lock:
+            target = self._complete_paths.get(path)
+        if target:
+            run_id, step_key = target
+            self.remove_all_subscriptions(run_id, step_key)
+            self.unwatch(run_id, step_key)
+
+    def unwatch(self, run_id, step_key):
         watch_key = self._watch_key(run_id, step_key)
-        if watch_key in self._watchers:
-            self._observer.remove_handler_for_watch(handler, self._watchers[watch_key])
-        del self._watchers[watch_key]
+        with self._lock:
+            if watch_key not in self._watchers:
+                return
+
+            directory, update_paths, complete_path = self._watchers.pop(watch_key)
+            for path in update_paths:
+                self._update_paths.pop(path, None)
+            self._complete_paths.pop(complete_path, None)
+
+            self._directory_watch_keys[directory].discard(watch_key)
+            if not self._directory_watch_keys[directory]:
+                del self._directory_watch_keys[directory]
+                self._observer.unschedule(self._directory_watches.pop(directory))
 
     def dispose(self):
         if self._observer:
@@ -218,21 +297,15 @@ def dispose(self):
             self._observer.join(15)
 
 
-class LocalComputeLogFilesystemEventHandler(PatternMatchingEventHandler):
-    def __init__(self, manager, run_id, key, update_paths, complete_paths):
+class LocalComputeLogFilesystemEventHandler(FileSystemEventHandler):
+    def __init__(self, manager):
         self.manager = manager
-        self.run_id = run_id
-        self.key = key
-        self.update_paths = update_paths
-        self.complete_paths = complete_paths
-        patterns = update_paths + complete_paths
-        super(LocalComputeLogFilesystemEventHandler, self).__init__(patterns=patterns)
+        super(LocalComputeLogFilesystemEventHandler, self).__init__()
 
     def on_created(self, event):
-        if event.src_path in self.complete_paths:
-            self.manager.remove_all_subscriptions(self.run_id, self.key)
-            self.manager.unwatch(self.run_id, self.key, self)
+        if not event.is_directory:
+            self.manager.on_path_created(event.src_path)
 
     def on_modified(self, event):
-        if event.src_path in self.update_paths:
-            self.manager.notify_subscriptions(self.run_id, self.key)
+        if not event.is_directory:
+            self.manager.on_path_modified(event.src_path)
@@ -1,9 +1,19 @@
+import dagster._check as check
 from dagster._core.storage.io_manager import IOManager, io_manager
 
 
 class InMemoryIOManager(IOManager):
-    def __init__(self):
+    """IO manager that stores and retrieves values in memory.
+
+    Args:
+        release_outputs (Optional[bool]): whether to drop the values of op outputs once every
+            downstream op that loads them has completed. Defaults to False. Asset values are never
+            dropped.
+    """
+
+    def __init__(self, release_outputs=False):
         self.values = {}
+        self.release_outputs = check.bool_param(release_outputs, "release_outputs")
 
     def handle_output(self, context, obj):
         keys = tuple(context.get_identifier())
@@ -13,9 +23,28 @@ def load_input(self, context):
         keys = tuple(context.get_identifier())
         return self.values[keys]
 
+    def release_output(self, context):
+        # asset values are kept, like the stored assets of other IO managers
+        if not self.release_outputs or context.has_asset_key:
+            return
+
+        keys = tuple(context.get_identifier())
+        self.values.pop(keys, None)
+
 
 @io_manager(description="Built-in IO manager that stores and retrieves values in memory.")
 def mem_io_manager(_):
     """Built-in IO manager that stores and retrieves values in memory."""
 
     return InMemoryIOManager()
+
+
+@io_manager(description="Built-in IO manager that stores and retrieves values in memory.")
+def in_process_mem_io_manager(_):
+    """The IO manager that execute_in_process uses in place of the default IO manager.
+
+    Every step of an in-process execution runs in the same process, so the values of op outputs are
+    dropped once every downstream op that loads them has completed.
+    """
+
+    return InMemoryIOManager(release_outputs=True)
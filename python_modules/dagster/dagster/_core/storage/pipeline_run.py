@@ -11,6 +11,7 @@
     Mapping,
     NamedTuple,
     Optional,
+    Tuple,
     Type,
     Union,
 )
@@ -31,6 +32,7 @@
     unpack_inner_value,
     whitelist_for_serdes,
 )
+from dagster._serdes.utils import create_snapshot_id
 
 from .tags import (
     BACKFILL_ID_TAG,
@@ -38,6 +40,8 @@
     PARTITION_SET_TAG,
     REPOSITORY_LABEL_TAG,
     RESUME_RETRY_TAG,
+    RUN_KEY_TAG,
+    SCHEDULED_EXECUTION_TIME_TAG,
     SCHEDULE_NAME_TAG,
     SENSOR_NAME_TAG,
 )
@@ -751,6 +755,66 @@ def __new__(
         )
 
 
+class InstigatorRunKey(
+    NamedTuple(
+        "_InstigatorRunKey",
+        [
+            ("run_key", str),
+            ("run_id", str),
+            ("status", DagsterRunStatus),
+        ],
+    )
+):
+    """A run that a sensor or schedule launched for a run key, as recorded in the run key index."""
+
+    def __new__(cls, run_key: str, run_id: str, status: DagsterRunStatus):
+        return super(InstigatorRunKey, cls).__new__(
+            cls,
+            run_key=check.str_param(run_key, "run_key"),
+            run_id=check.str_param(run_id, "run_id"),
+            status=check.inst_param(status, "status", DagsterRunStatus),
+        )
+
+
+def schedule_run_key(scheduled_execution_time: str, run_key: Optional[str] = None) -> str:
+    """Schedule runs are deduplicated by their scheduled execution time, along with the run key of
+    their run request if it has one."""
+    check.str_param(scheduled_execution_time, "scheduled_execution_time")
+    check.opt_str_param(run_key, "run_key")
+    return f"{scheduled_execution_time}|{run_key}" if run_key else scheduled_execution_time
+
+
+def get_instigator_run_key(run: PipelineRun) -> Optional[Tuple[str, str]]:
+    """The selector id of the sensor or schedule that launched a run, and the key that it
+    deduplicates the run by, or None if the run wasn't launched by a sensor or schedule."""
+    from dagster._core.host_representation.selector import InstigatorSelector
+
+    check.inst_param(run, "run", PipelineRun)
+    if not run.external_pipeline_origin:
+        return None
+
+    if run.tags.get(SENSOR_NAME_TAG) and run.tags.get(RUN_KEY_TAG):
+        instigator_name = run.tags[SENSOR_NAME_TAG]
+        run_key = run.tags[RUN_KEY_TAG]
+    elif run.tags.get(SCHEDULE_NAME_TAG) and run.tags.get(SCHEDULED_EXECUTION_TIME_TAG):
+        instigator_name = run.tags[SCHEDULE_NAME_TAG]
+        run_key = schedule_run_key(
+            run.tags[SCHEDULED_EXECUTION_TIME_TAG], run.tags.get(RUN_KEY_TAG)
+        )
+    else:
+        return None
+
+    repository_origin = run.external_pipeline_origin.external_repository_origin
+    selector_id = create_snapshot_id(
+        InstigatorSelector(
+            repository_origin.repository_location_origin.location_name,
+            repository_origin.repository_name,
+            instigator_name,
+        )
+    )
+    return selector_id, run_key
+
+
 ###################################################################################################
 # GRAVEYARD
 #
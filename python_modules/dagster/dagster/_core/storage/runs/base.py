@@ -1,11 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple, Union
 
 from dagster._core.events import DagsterEvent
 from dagster._core.execution.backfill import BulkActionStatus, PartitionBackfill
 from dagster._core.instance import MayHaveInstanceWeakref
 from dagster._core.snap import ExecutionPlanSnapshot, PipelineSnapshot
 from dagster._core.storage.pipeline_run import (
+    InstigatorRunKey,
     JobBucket,
     PipelineRun,
     RunPartitionData,
@@ -13,6 +15,7 @@
     RunsFilter,
     TagBucket,
 )
+from dagster._core.storage.tags import PRIORITY_TAG, get_run_priority
 from dagster._daemon.types import DaemonHeartbeat
 
 
@@ -39,6 +42,20 @@ def add_run(self, pipeline_run: PipelineRun) -> PipelineRun:
             pipeline_run (PipelineRun): The run to add.
         """
 
+    def add_runs(self, pipeline_runs: Sequence[PipelineRun]) -> Sequence[PipelineRun]:
+        """Add many runs to storage at once. Storages that can write the runs with fewer queries
+        than one ``add_run`` call per run should override this.
+
+        The runs are not guaranteed to be added atomically: if adding them fails part way, some of
+        the runs may have been stored.
+
+        Raises the same errors as ``add_run``.
+
+        Args:
+            pipeline_runs (Sequence[PipelineRun]): The runs to add.
+        """
+        return [self.add_run(pipeline_run) for pipeline_run in pipeline_runs]
+
     @abstractmethod
     def handle_run_event(self, run_id: str, event: DagsterEvent):
         """Update run storage in accordance to a pipeline run related DagsterEvent
@@ -179,6 +196,48 @@ def get_run_tags(self) -> List[Tuple[str, Set[str]]]:
             List[Tuple[str, Set[str]]]
         """
 
+    def get_run_tag_counts(
+        self, filters: RunsFilter, tag_keys: Sequence[str]
+    ) -> Mapping[Tuple[str, str], int]:
+        """Count the runs that match the given filters by tag, for each of the given tag keys.
+
+        Args:
+            filters (RunsFilter): the filter by which to filter runs.
+            tag_keys (Sequence[str]): the tag keys to count runs by.
+
+        Returns:
+            Mapping[Tuple[str, str], int]: The number of matching runs with each (key, value) tag,
+                for each value of the given tag keys.
+        """
+        counts: Dict[Tuple[str, str], int] = defaultdict(int)
+        for run in self.get_runs(filters=filters):
+            for key in tag_keys:
+                if key in run.tags:
+                    counts[(key, run.tags[key])] += 1
+        return counts
+
+    def get_runs_by_priority(
+        self, filters: RunsFilter, limit: Optional[int] = None, offset: int = 0
+    ) -> List[PipelineRun]:
+        """Return the runs that match the given filters, ordered from highest to lowest priority
+        (see PRIORITY_TAG), and in the order in which they were created within the same priority.
+
+        Args:
+            filters (RunsFilter): the filter by which to filter runs.
+            limit (Optional[int]): Number of results to get. Defaults to infinite.
+            offset (int): Number of runs to skip, for paginating through the ordered runs.
+
+        Returns:
+            List[PipelineRun]
+        """
+        # get_runs returns the most recently created runs first, and sorted is stable
+        runs = sorted(
+            reversed(self.get_runs(filters=filters)),
+            key=lambda run: get_run_priority(run.tags.get(PRIORITY_TAG)),
+            reverse=True,
+        )
+        return runs[offset : offset + limit] if limit is not None else runs[offset:]
+
     @abstractmethod
     def add_run_tags(self, run_id: str, new_tags: Dict[str, str]):
         """Add additional tags for a pipeline run.
@@ -398,3 +457,22 @@ def kvs_get(self, keys: Set[str]) -> Dict[str, str]:
     @abstractmethod
     def kvs_set(self, pairs: Dict[str, str]) -> None:
         """Set the value for a given key in the current deployment."""
+
+    # Instigator run keys
+    #
+    # Indexes the runs launched by sensors and schedules by the key that they are deduplicated by,
+    # so that the daemons can check which run requests already have runs without loading them.
+
+    def supports_instigator_run_keys(self) -> bool:
+        return False
+
+    def get_instigator_run_keys(
+        self, selector_id: str, run_keys: Sequence[str]
+    ) -> Mapping[str, InstigatorRunKey]:
+        """Get the runs launched by the sensor or schedule with the given selector id for each of
+        the given run keys, keyed by run key. If more than one run was launched for a run key, the
+        first one is returned.
+
+        Schedule runs are keyed by ``schedule_run_key``.
+        """
+        raise NotImplementedError()
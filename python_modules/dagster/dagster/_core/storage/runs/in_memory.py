@@ -1,5 +1,17 @@
 from collections import OrderedDict, defaultdict
-from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union, cast
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 import dagster._check as check
 from dagster._core.errors import (
@@ -20,12 +32,14 @@
 from dagster._utils import EPOCH, frozendict, merge_dicts
 
 from ..pipeline_run import (
+    InstigatorRunKey,
     JobBucket,
     PipelineRun,
     RunPartitionData,
     RunRecord,
     RunsFilter,
     TagBucket,
+    get_instigator_run_key,
 )
 from .base import RunStorage
 
@@ -403,6 +417,25 @@ def update_backfill(self, partition_backfill: PartitionBackfill):
     def supports_kvs(self):
         return False
 
+    def supports_instigator_run_keys(self) -> bool:
+        return True
+
+    def get_instigator_run_keys(
+        self, selector_id: str, run_keys: Sequence[str]
+    ) -> Mapping[str, InstigatorRunKey]:
+        check.str_param(selector_id, "selector_id")
+        run_keys = set(check.sequence_param(run_keys, "run_keys", of_type=str))
+
+        instigator_run_keys: Dict[str, InstigatorRunKey] = {}
+        for run in self._runs.values():
+            instigator_run_key = get_instigator_run_key(run)
+            if not instigator_run_key or instigator_run_key[0] != selector_id:
+                continue
+            run_key = instigator_run_key[1]
+            if run_key in run_keys and run_key not in instigator_run_keys:
+                instigator_run_keys[run_key] = InstigatorRunKey(run_key, run.run_id, run.status)
+        return instigator_run_keys
+
     def kvs_get(self, keys: Set[str]) -> Dict[str, str]:
         raise NotImplementedError()
 
@@ -8,21 +8,29 @@
 
 from ...execution.backfill import PartitionBackfill
 from ...execution.bulk_actions import BulkActionType
-from ..pipeline_run import PipelineRun, PipelineRunStatus
+from ..pipeline_run import DagsterRunStatus, PipelineRun, PipelineRunStatus, get_instigator_run_key
 from ..runs.base import RunStorage
-from ..runs.schema import BulkActionsTable, RunTagsTable, RunsTable
-from ..tags import PARTITION_NAME_TAG, PARTITION_SET_TAG, REPOSITORY_LABEL_TAG
+from ..runs.schema import BulkActionsTable, InstigatorRunKeysTable, RunTagsTable, RunsTable
+from ..tags import (
+    PARTITION_NAME_TAG,
+    PARTITION_SET_TAG,
+    REPOSITORY_LABEL_TAG,
+    SCHEDULE_NAME_TAG,
+    SENSOR_NAME_TAG,
+)
 
 RUN_PARTITIONS = "run_partitions"
 RUN_START_END = "run_start_end_overwritten"  # was run_start_end, but renamed to overwrite bad timestamps written
 RUN_REPO_LABEL_TAGS = "run_repo_label_tags"
 BULK_ACTION_TYPES = "bulk_action_types"
+INSTIGATOR_RUN_KEYS = "instigator_run_keys"
 
 # for `dagster instance migrate`, paired with schema changes
 REQUIRED_DATA_MIGRATIONS = {
     RUN_PARTITIONS: lambda: migrate_run_partition,
     RUN_REPO_LABEL_TAGS: lambda: migrate_run_repo_tags,
     BULK_ACTION_TYPES: lambda: migrate_bulk_actions,
+    INSTIGATOR_RUN_KEYS: lambda: migrate_instigator_run_keys,
 }
 # for `dagster instance reindex`, optionally run for better read performance
 OPTIONAL_DATA_MIGRATIONS = {
@@ -253,3 +261,72 @@ def migrate_bulk_actions(run_storage: RunStorage, print_fn=None):
                     .where(BulkActionsTable.c.id == storage_id)
                 )
                 cursor = storage_id
+
+
+def migrate_instigator_run_keys(run_storage: RunStorage, print_fn=None):
+    """
+    Utility method that indexes the runs launched by sensors and schedules by the key that they
+    are deduplicated by.
+    """
+    from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
+
+    if not isinstance(run_storage, SqlRunStorage):
+        return
+
+    if print_fn:
+        print_fn("Querying run storage.")
+
+    subquery = (
+        db.select([RunTagsTable.c.run_id.label("tags_run_id")])
+        .where(RunTagsTable.c.key.in_([SENSOR_NAME_TAG, SCHEDULE_NAME_TAG]))
+        .alias("tag_subquery")
+    )
+    base_query = (
+        db.select([RunsTable.c.run_body, RunsTable.c.status, RunsTable.c.id])
+        .select_from(
+            RunsTable.join(subquery, RunsTable.c.run_id == subquery.c.tags_run_id).join(
+                InstigatorRunKeysTable,
+                RunsTable.c.run_id == InstigatorRunKeysTable.c.run_id,
+                isouter=True,
+            )
+        )
+        .where(InstigatorRunKeysTable.c.run_id.is_(None))
+        .order_by(db.asc(RunsTable.c.id))
+        .limit(CHUNK_SIZE)
+    )
+
+    cursor = None
+    has_more = True
+    while has_more:
+        if cursor:
+            query = base_query.where(RunsTable.c.id > cursor)
+        else:
+            query = base_query
+
+        with run_storage.connect() as conn:
+            result_proxy = conn.execute(query)
+            rows = result_proxy.fetchall()
+            result_proxy.close()
+
+            has_more = len(rows) >= CHUNK_SIZE
+            for row in rows:
+                run = deserialize_as(row[0], PipelineRun).with_status(DagsterRunStatus(row[1]))
+                cursor = row[2]
+                write_instigator_run_key(conn, run)
+
+
+def write_instigator_run_key(conn, run: PipelineRun):
+    instigator_run_key = get_instigator_run_key(run)
+    if not instigator_run_key:
+        # not launched by a sensor or schedule
+        return
+
+    selector_id, run_key = instigator_run_key
+    conn.execute(
+        InstigatorRunKeysTable.insert().values(  # pylint: disable=no-value-for-parameter
+            selector_id=selector_id,
+            run_key=run_key,
+            run_id=run.run_id,
+            status=run.status.value,
+        )
+    )
@@ -103,6 +103,19 @@
     db.Column("value", db.Text),
 )
 
+# The runs launched by sensors and schedules, by the key they are deduplicated by
+InstigatorRunKeysTable = db.Table(
+    "instigator_run_keys",
+    RunStorageSqlMetadata,
+    db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+    db.Column("selector_id", db.String(255), nullable=False),
+    db.Column("run_key", db.Text, nullable=False),
+    db.Column("run_id", None, db.ForeignKey("runs.run_id", ondelete="CASCADE"), nullable=False),
+    db.Column("status", db.String(63), nullable=False),
+    db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
+    db.Column("update_timestamp", db.DateTime, server_default=get_current_timestamp()),
+)
+
 db.Index("idx_run_tags", RunTagsTable.c.key, RunTagsTable.c.value, mysql_length=64)
 db.Index("idx_run_partitions", RunsTable.c.partition_set, RunsTable.c.partition, mysql_length=64)
 db.Index("idx_bulk_actions", BulkActionsTable.c.key, mysql_length=32)
@@ -122,3 +135,10 @@
     },
 )
 db.Index("idx_kvs_keys_unique", KeyValueStoreTable.c.key, unique=True, mysql_length=64)
+db.Index(
+    "idx_instigator_run_keys",
+    InstigatorRunKeysTable.c.selector_id,
+    InstigatorRunKeysTable.c.run_key,
+    mysql_length={"selector_id": 64, "run_key": 64},
+)
+db.Index("idx_instigator_run_keys_run_id", InstigatorRunKeysTable.c.run_id, mysql_length=64)
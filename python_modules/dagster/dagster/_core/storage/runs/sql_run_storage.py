@@ -5,7 +5,7 @@
 from collections import defaultdict
 from datetime import datetime
 from enum import Enum
-from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple, Union
 
 import pendulum
 import sqlalchemy as db
@@ -30,8 +30,10 @@
 from dagster._core.storage.tags import (
     PARTITION_NAME_TAG,
     PARTITION_SET_TAG,
+    PRIORITY_TAG,
     REPOSITORY_LABEL_TAG,
     ROOT_RUN_ID_TAG,
+    get_run_priority,
 )
 from dagster._daemon.types import DaemonHeartbeat
 from dagster._serdes import (
@@ -44,19 +46,28 @@
 
 from ..pipeline_run import (
     DagsterRunStatus,
+    InstigatorRunKey,
     JobBucket,
     PipelineRun,
     RunPartitionData,
     RunRecord,
     RunsFilter,
     TagBucket,
+    get_instigator_run_key,
 )
 from .base import RunStorage
-from .migration import OPTIONAL_DATA_MIGRATIONS, REQUIRED_DATA_MIGRATIONS, RUN_PARTITIONS
+from .migration import (
+    INSTIGATOR_RUN_KEYS,
+    OPTIONAL_DATA_MIGRATIONS,
+    REQUIRED_DATA_MIGRATIONS,
+    RUN_PARTITIONS,
+    write_instigator_run_key,
+)
 from .schema import (
     BulkActionsTable,
     DaemonHeartbeatsTable,
     InstanceInfo,
+    InstigatorRunKeysTable,
     KeyValueStoreTable,
     RunTagsTable,
     RunsTable,
@@ -73,6 +84,10 @@ class SnapshotType(Enum):
 class SqlRunStorage(RunStorage):  # pylint: disable=no-init
     """Base class for SQL based run storages"""
 
+    # the schema is checked for the instigator run keys table on every write of a run, so the
+    # result is cached until the schema is upgraded or downgraded
+    _instigator_run_keys_table_exists: Optional[bool] = None
+
     @abstractmethod
     def connect(self):
         """Context manager yielding a sqlalchemy.engine.Connection."""
@@ -101,46 +116,70 @@ def fetchone(self, query):
 
     def add_run(self, pipeline_run: PipelineRun) -> PipelineRun:
         check.inst_param(pipeline_run, "pipeline_run", PipelineRun)
+        return self.add_runs([pipeline_run])[0]
+
+    def add_runs(self, pipeline_runs: Sequence[PipelineRun]) -> Sequence[PipelineRun]:
+        check.sequence_param(pipeline_runs, "pipeline_runs", of_type=PipelineRun)
+        if not pipeline_runs:
+            return []
 
-        if pipeline_run.pipeline_snapshot_id and not self.has_pipeline_snapshot(
+        for snapshot_id in {
             pipeline_run.pipeline_snapshot_id
-        ):
-            raise DagsterSnapshotDoesNotExist(
-                "Snapshot {ss_id} does not exist in run storage".format(
-                    ss_id=pipeline_run.pipeline_snapshot_id
+            for pipeline_run in pipeline_runs
+            if pipeline_run.pipeline_snapshot_id
+        }:
+            if not self.has_pipeline_snapshot(snapshot_id):
+                raise DagsterSnapshotDoesNotExist(
+                    "Snapshot {ss_id} does not exist in run storage".format(ss_id=snapshot_id)
+                )
+
+        runs_to_insert = []
+        tags_to_insert = []
+        for pipeline_run in pipeline_runs:
+            has_tags = pipeline_run.tags and len(pipeline_run.tags) > 0
+            runs_to_insert.append(
+                dict(
+                    run_id=pipeline_run.run_id,
+                    pipeline_name=pipeline_run.pipeline_name,
+                    status=pipeline_run.status.value,
+                    run_body=serialize_dagster_namedtuple(pipeline_run),
+                    snapshot_id=pipeline_run.pipeline_snapshot_id,
+                    partition=pipeline_run.tags.get(PARTITION_NAME_TAG) if has_tags else None,
+                    partition_set=pipeline_run.tags.get(PARTITION_SET_TAG) if has_tags else None,
                 )
             )
+            tags_to_insert.extend(
+                dict(run_id=pipeline_run.run_id, key=k, value=v)
+                for k, v in pipeline_run.tags_for_storage().items()
+            )
+        runs_to_index = [
+            pipeline_run
+            for pipeline_run in pipeline_runs
+            if self._should_index_run_key(pipeline_run)
+        ]
 
-        has_tags = pipeline_run.tags and len(pipeline_run.tags) > 0
-        partition = pipeline_run.tags.get(PARTITION_NAME_TAG) if has_tags else None
-        partition_set = pipeline_run.tags.get(PARTITION_SET_TAG) if has_tags else None
-
-        runs_insert = RunsTable.insert().values(  # pylint: disable=no-value-for-parameter
-            run_id=pipeline_run.run_id,
-            pipeline_name=pipeline_run.pipeline_name,
-            status=pipeline_run.status.value,
-            run_body=serialize_dagster_namedtuple(pipeline_run),
-            snapshot_id=pipeline_run.pipeline_snapshot_id,
-            partition=partition,
-            partition_set=partition_set,
-        )
         with self.connect() as conn:
-            try:
-                conn.execute(runs_insert)
-            except db.exc.IntegrityError as exc:
-                raise DagsterRunAlreadyExists from exc
+            # storages that connect in autocommit mode, like postgres and mysql, commit each insert
+            # on its own, so this only makes the inserts atomic on storages like sqlite
+            with conn.begin():
+                try:
+                    conn.execute(
+                        RunsTable.insert(),  # pylint: disable=no-value-for-parameter
+                        runs_to_insert,
+                    )
+                except db.exc.IntegrityError as exc:
+                    raise DagsterRunAlreadyExists from exc
 
-            tags_to_insert = pipeline_run.tags_for_storage()
-            if tags_to_insert:
-                conn.execute(
-                    RunTagsTable.insert(),  # pylint: disable=no-value-for-parameter
-                    [
-                        dict(run_id=pipeline_run.run_id, key=k, value=v)
-                        for k, v in tags_to_insert.items()
-                    ],
-                )
+                if tags_to_insert:
+                    conn.execute(
+                        RunTagsTable.insert(),  # pylint: disable=no-value-for-parameter
+                        tags_to_insert,
+                    )
 
-        return pipeline_run
+                for pipeline_run in runs_to_index:
+                    write_instigator_run_key(conn, pipeline_run)
+
+        return pipeline_runs
 
     def handle_run_event(self, run_id: str, event: DagsterEvent):
         check.str_param(run_id, "run_id")
@@ -157,6 +196,7 @@ def handle_run_event(self, run_id: str, event: DagsterEvent):
         new_pipeline_status = EVENT_TYPE_TO_PIPELINE_RUN_STATUS[event.event_type]
 
         run_stats_cols_in_index = self.has_run_stats_index_cols()
+        index_run_key = self._should_index_run_key(run)
 
         kwargs = {}
 
@@ -187,6 +227,13 @@ def handle_run_event(self, run_id: str, event: DagsterEvent):
                 )
             )
 
+            if index_run_key:
+                conn.execute(
+                    InstigatorRunKeysTable.update()  # pylint: disable=no-value-for-parameter
+                    .where(InstigatorRunKeysTable.c.run_id == run_id)
+                    .values(status=new_pipeline_status.value, update_timestamp=now)
+                )
+
     def _row_to_run(self, row) -> PipelineRun:
         run = deserialize_as(row["run_body"], PipelineRun)
         status = DagsterRunStatus(row["status"])
@@ -461,6 +508,85 @@ def get_run_tags(self) -> List[Tuple[str, Set[str]]]:
             result[r[0]].add(r[1])
         return sorted(list([(k, v) for k, v in result.items()]), key=lambda x: x[0])
 
+    def get_run_tag_counts(
+        self, filters: RunsFilter, tag_keys: Sequence[str]
+    ) -> Mapping[Tuple[str, str], int]:
+        check.inst_param(filters, "filters", RunsFilter)
+        check.sequence_param(tag_keys, "tag_keys", of_type=str)
+
+        if not tag_keys:
+            return {}
+
+        run_ids_query = self._add_filters_to_query(
+            db.select([RunsTable.c.run_id]).select_from(RunsTable), filters
+        )
+        query = (
+            db.select([RunTagsTable.c.key, RunTagsTable.c.value, db.func.count()])
+            .where(
+                db.and_(
+                    RunTagsTable.c.key.in_(tag_keys),
+                    RunTagsTable.c.run_id.in_(run_ids_query),
+                )
+            )
+            .group_by(RunTagsTable.c.key, RunTagsTable.c.value)
+        )
+        rows = self.fetchall(query)
+        return {(row[0], row[1]): row[2] for row in rows}
+
+    def get_runs_by_priority(
+        self, filters: RunsFilter, limit: Optional[int] = None, offset: int = 0
+    ) -> List[PipelineRun]:
+        check.inst_param(filters, "filters", RunsFilter)
+        check.opt_int_param(limit, "limit")
+        check.int_param(offset, "offset")
+
+        # priority tag values are arbitrary strings, so the distinct values are mapped to integer
+        # priorities here, and the query orders the runs by the mapped priority
+        run_ids_query = self._add_filters_to_query(
+            db.select([RunsTable.c.run_id]).select_from(RunsTable), filters
+        )
+        priority_values_query = (
+            db.select([RunTagsTable.c.value])
+            .where(
+                db.and_(
+                    RunTagsTable.c.key == PRIORITY_TAG,
+                    RunTagsTable.c.run_id.in_(run_ids_query),
+                )
+            )
+            .distinct()
+        )
+        priorities_by_value = {
+            row[0]: get_run_priority(row[0]) for row in self.fetchall(priority_values_query)
+        }
+        priority_tags = RunTagsTable.alias("priority_tags")
+        priority_whens = [
+            (priority_tags.c.value == value, priority)
+            for value, priority in priorities_by_value.items()
+            if priority != 0
+        ]
+
+        query = db.select([RunsTable.c.run_body, RunsTable.c.status]).select_from(
+            RunsTable.outerjoin(
+                priority_tags,
+                db.and_(
+                    priority_tags.c.run_id == RunsTable.c.run_id,
+                    priority_tags.c.key == PRIORITY_TAG,
+                ),
+            )
+        )
+        query = self._add_filters_to_query(query, filters)
+        if priority_whens:
+            query = query.order_by(db.desc(db.case(priority_whens, else_=0)))
+        query = query.order_by(db.asc(RunsTable.c.id))
+
+        if limit is not None:
+            query = query.limit(limit)
+        if offset:
+            query = query.offset(offset)
+
+        rows = self.fetchall(query)
+        return self._rows_to_runs(rows)
+
     def add_run_tags(self, run_id: str, new_tags: Dict[str, str]):
         check.str_param(run_id, "run_id")
         check.dict_param(new_tags, "new_tags", key_type=str, value_type=str)
@@ -935,6 +1061,17 @@ def has_bulk_actions_selector_cols(self):
             ]
             return "selector_id" in column_names
 
+    def has_instigator_run_keys_table(self) -> bool:
+        if self._instigator_run_keys_table_exists is None:
+            with self.connect() as conn:
+                self._instigator_run_keys_table_exists = (
+                    InstigatorRunKeysTable.name in db.inspect(conn).get_table_names()
+                )
+        return self._instigator_run_keys_table_exists
+
+    def _clear_schema_cache(self):
+        self._instigator_run_keys_table_exists = None
+
     # Daemon heartbeats
 
     def add_daemon_heartbeat(self, daemon_heartbeat: DaemonHeartbeat):
@@ -980,6 +1117,12 @@ def wipe(self):
             conn.execute(DaemonHeartbeatsTable.delete())  # pylint: disable=no-value-for-parameter
             conn.execute(BulkActionsTable.delete())  # pylint: disable=no-value-for-parameter
 
+        if self.has_instigator_run_keys_table():
+            with self.connect() as conn:
+                conn.execute(
+                    InstigatorRunKeysTable.delete()  # pylint: disable=no-value-for-parameter
+                )
+
     def wipe_daemon_heartbeats(self):
         with self.connect() as conn:
             # https://stackoverflow.com/a/54386260/324449
@@ -1073,9 +1216,50 @@ def kvs_set(self, pairs: Dict[str, str]) -> None:
                     .values(value=db.sql.case(pairs, value=KeyValueStoreTable.c.key))
                 )
 
+    # Instigator run keys
+
+    def _should_index_run_key(self, run: PipelineRun) -> bool:
+        # only checks for the table when the run was launched by a sensor or schedule
+        return bool(get_instigator_run_key(run)) and self.has_instigator_run_keys_table()
+
+    def supports_instigator_run_keys(self) -> bool:
+        return self.has_instigator_run_keys_table() and self.has_built_index(INSTIGATOR_RUN_KEYS)
+
+    def get_instigator_run_keys(
+        self, selector_id: str, run_keys: Sequence[str]
+    ) -> Mapping[str, InstigatorRunKey]:
+        check.str_param(selector_id, "selector_id")
+        check.sequence_param(run_keys, "run_keys", of_type=str)
+
+        if not run_keys:
+            return {}
+
+        query = (
+            db.select(
+                [
+                    InstigatorRunKeysTable.c.run_key,
+                    InstigatorRunKeysTable.c.run_id,
+                    InstigatorRunKeysTable.c.status,
+                ]
+            )
+            .where(InstigatorRunKeysTable.c.selector_id == selector_id)
+            .where(InstigatorRunKeysTable.c.run_key.in_(run_keys))
+            .order_by(db.asc(InstigatorRunKeysTable.c.id))
+        )
+
+        instigator_run_keys: Dict[str, InstigatorRunKey] = {}
+        for row in self.fetchall(query):
+            run_key = row[0]
+            if run_key not in instigator_run_keys:
+                instigator_run_keys[run_key] = InstigatorRunKey(
+                    run_key=run_key, run_id=row[1], status=DagsterRunStatus(row[2])
+                )
+        return instigator_run_keys
+
     # Migrating run history
     def replace_job_origin(self, run: PipelineRun, job_origin: ExternalPipelineOrigin):
         new_label = job_origin.external_repository_origin.get_label()
+        has_instigator_run_keys_table = self.has_instigator_run_keys_table()
         with self.connect() as conn:
             conn.execute(
                 RunsTable.update()  # pylint: disable=no-value-for-parameter
@@ -1090,6 +1274,14 @@ def replace_job_origin(self, run: PipelineRun, job_origin: ExternalPipelineOrigi
                 .where(RunTagsTable.c.key == REPOSITORY_LABEL_TAG)
                 .values(value=new_label)
             )
+            if has_instigator_run_keys_table:
+                # the selector id of the sensor or schedule that launched the run has changed
+                conn.execute(
+                    db.delete(InstigatorRunKeysTable).where(
+                        InstigatorRunKeysTable.c.run_id == run.run_id
+                    )
+                )
+                write_instigator_run_key(conn, run.with_job_origin(job_origin))
 
 
 GET_PIPELINE_SNAPSHOT_QUERY_ID = "get-pipeline-snapshot"
@@ -19,7 +19,13 @@
 from dagster._serdes import ConfigurableClass, ConfigurableClassData
 from dagster._utils import mkdir_p
 
-from ..schema import InstanceInfo, RunStorageSqlMetadata, RunTagsTable, RunsTable
+from ..schema import (
+    InstanceInfo,
+    InstigatorRunKeysTable,
+    RunStorageSqlMetadata,
+    RunTagsTable,
+    RunsTable,
+)
 from ..sql_run_storage import SqlRunStorage
 
 MINIMUM_SQLITE_BUCKET_VERSION = [3, 25, 0]
@@ -108,11 +114,13 @@ def _alembic_upgrade(self, rev="head"):
         alembic_config = get_alembic_config(__file__)
         with self.connect() as conn:
             run_alembic_upgrade(alembic_config, conn, rev=rev)
+        self._clear_schema_cache()
 
     def _alembic_downgrade(self, rev="head"):
         alembic_config = get_alembic_config(__file__)
         with self.connect() as conn:
             run_alembic_downgrade(alembic_config, conn, rev=rev)
+        self._clear_schema_cache()
 
     @property
     def supports_bucket_queries(self):
@@ -156,8 +164,15 @@ def delete_run(self, run_id):
         check.str_param(run_id, "run_id")
         remove_tags = db.delete(RunTagsTable).where(RunTagsTable.c.run_id == run_id)
         remove_run = db.delete(RunsTable).where(RunsTable.c.run_id == run_id)
+        has_instigator_run_keys_table = self.has_instigator_run_keys_table()
         with self.connect() as conn:
             conn.execute(remove_tags)
+            if has_instigator_run_keys_table:
+                conn.execute(
+                    db.delete(InstigatorRunKeysTable).where(
+                        InstigatorRunKeysTable.c.run_id == run_id
+                    )
+                )
             conn.execute(remove_run)
 
     def alembic_version(self):
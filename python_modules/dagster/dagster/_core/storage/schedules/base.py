@@ -129,6 +129,32 @@ def purge_ticks(
             tick_statuses (Optional[List[TickStatus]]): The tick statuses to wipe
         """
 
+    def update_ticks(self, ticks: Sequence[InstigatorTick]):
+        """Update many ticks already in storage at once.
+
+        Args:
+            ticks (Sequence[InstigatorTick]): The ticks to update
+        """
+        for tick in ticks:
+            self.update_tick(tick)
+
+    def purge_ticks_before(
+        self,
+        before: float,
+        instigator_type: Optional[InstigatorType] = None,
+        tick_statuses: Optional[List[TickStatus]] = None,
+    ):
+        """Wipe the ticks of all instigators for certain statuses before a timestamp.
+
+        Args:
+            before (float): All ticks before this timestamp will get purged
+            instigator_type (Optional[InstigatorType]): Only purge the ticks of this type of
+                instigator
+            tick_statuses (Optional[List[TickStatus]]): The tick statuses to wipe
+        """
+        for state in self.all_instigator_state(instigator_type=instigator_type):
+            self.purge_ticks(state.instigator_origin_id, state.selector_id, before, tick_statuses)
+
     @abc.abstractmethod
     def upgrade(self):
         """Perform any needed migrations"""
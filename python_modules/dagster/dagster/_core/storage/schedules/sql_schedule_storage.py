@@ -27,6 +27,9 @@
 )
 from .schema import InstigatorsTable, JobTable, JobTickTable, SecondaryIndexMigrationTable
 
+# The number of ticks deleted by each statement when purging ticks in bulk
+TICK_PURGE_BATCH_SIZE = 1000
+
 
 class SqlScheduleStorage(ScheduleStorage):
     """Base class for SQL backed schedule storage"""
@@ -372,6 +375,46 @@ def update_tick(self, tick):
 
         return tick
 
+    def update_ticks(self, ticks):
+        check.sequence_param(ticks, "ticks", of_type=InstigatorTick)
+        if not ticks:
+            return
+
+        values = {
+            "status": db.bindparam("b_status"),
+            "type": db.bindparam("b_type"),
+            "timestamp": db.bindparam("b_timestamp"),
+            "tick_body": db.bindparam("b_tick_body"),
+        }
+        has_instigators_table = self.has_instigators_table()
+        if has_instigators_table:
+            # like update_tick, keep the selector id of ticks that are updated without one
+            values["selector_id"] = db.func.coalesce(
+                db.bindparam("b_selector_id"), JobTickTable.c.selector_id
+            )
+
+        update = (
+            JobTickTable.update()  # pylint: disable=no-value-for-parameter
+            .where(JobTickTable.c.id == db.bindparam("b_id"))
+            .values(**values)
+        )
+        params = []
+        for tick in ticks:
+            tick_params = {
+                "b_id": tick.tick_id,
+                "b_status": tick.status.value,
+                "b_type": tick.instigator_type.value,
+                "b_timestamp": utc_datetime_from_timestamp(tick.timestamp),
+                "b_tick_body": serialize_dagster_namedtuple(tick.tick_data),
+            }
+            if has_instigators_table:
+                tick_params["b_selector_id"] = tick.selector_id
+            params.append(tick_params)
+
+        with self.connect() as conn:
+            with conn.begin():
+                conn.execute(update, params)
+
     def purge_ticks(self, origin_id, selector_id, before, tick_statuses=None):
         check.str_param(origin_id, "origin_id")
         check.float_param(before, "before")
@@ -403,6 +446,45 @@ def purge_ticks(self, origin_id, selector_id, before, tick_statuses=None):
         with self.connect() as conn:
             conn.execute(query)
 
+    def purge_ticks_before(self, before, instigator_type=None, tick_statuses=None):
+        check.float_param(before, "before")
+        check.opt_inst_param(instigator_type, "instigator_type", InstigatorType)
+        check.opt_list_param(tick_statuses, "tick_statuses", of_type=TickStatus)
+
+        query = db.select([JobTickTable.c.id]).where(
+            JobTickTable.c.timestamp < utc_datetime_from_timestamp(before)
+        )
+        if instigator_type:
+            query = query.where(JobTickTable.c.type == instigator_type.value)
+        if tick_statuses:
+            query = query.where(
+                JobTickTable.c.status.in_([tick_status.value for tick_status in tick_statuses])
+            )
+
+        # delete the ticks in batches, walking the ids in order, so that each delete only holds
+        # its locks briefly and no batch scans the ticks that earlier batches have kept
+        last_id = 0
+        while True:
+            with self.connect() as conn:
+                tick_ids = [
+                    row[0]
+                    for row in conn.execute(
+                        query.where(JobTickTable.c.id > last_id)
+                        .order_by(JobTickTable.c.id.asc())
+                        .limit(TICK_PURGE_BATCH_SIZE)
+                    ).fetchall()
+                ]
+                if tick_ids:
+                    conn.execute(
+                        JobTickTable.delete().where(  # pylint: disable=no-value-for-parameter
+                            JobTickTable.c.id.in_(tick_ids)
+                        )
+                    )
+
+            if len(tick_ids) < TICK_PURGE_BATCH_SIZE:
+                return
+            last_id = tick_ids[-1]
+
     def wipe(self):
         """Clears the schedule storage."""
         with self.connect() as conn:
@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Optional
 
 import dagster._check as check
 
@@ -17,6 +18,12 @@
 
 PARTITION_SET_TAG = "{prefix}partition_set".format(prefix=SYSTEM_TAG_PREFIX)
 
+ASSET_PARTITION_RANGE_START_TAG = "{prefix}asset_partition_range_start".format(
+    prefix=SYSTEM_TAG_PREFIX
+)
+
+ASSET_PARTITION_RANGE_END_TAG = "{prefix}asset_partition_range_end".format(prefix=SYSTEM_TAG_PREFIX)
+
 PARENT_RUN_ID_TAG = "{prefix}parent_run_id".format(prefix=SYSTEM_TAG_PREFIX)
 
 ROOT_RUN_ID_TAG = "{prefix}root_run_id".format(prefix=SYSTEM_TAG_PREFIX)
@@ -69,6 +76,16 @@ def get_tag_type(tag):
         return TagType.USER_PROVIDED
 
 
+def get_run_priority(priority_tag_value: Optional[str]) -> int:
+    """The priority of a run with the given PRIORITY_TAG value. Runs without a valid integer
+    priority tag have priority 0.
+    """
+    try:
+        return int(priority_tag_value) if priority_tag_value is not None else 0
+    except ValueError:
+        return 0
+
+
 def check_reserved_tags(tags):
     check.opt_dict_param(tags, "tags", key_type=str, value_type=str)
 
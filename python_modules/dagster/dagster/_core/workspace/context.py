@@ -15,6 +15,7 @@
 from dagster._core.execution.plan.state import KnownExecutionState
 from dagster._core.host_representation import (
     ExternalExecutionPlan,
+    ExternalJobDataCache,
     ExternalPartitionSet,
     ExternalPipeline,
     GrpcServerRepositoryLocation,
@@ -425,6 +426,9 @@ def __init__(
         self._state_subscribers: List[LocationStateSubscriber] = []
         self.add_state_subscriber(self._location_state_subscriber)
 
+        # job snapshots fetched for each location, carried across reloads of the location
+        self._external_job_data_caches: Dict[str, ExternalJobDataCache] = {}
+
         if grpc_server_registry:
             self._grpc_server_registry: GrpcServerRegistry = check.inst_param(
                 grpc_server_registry, "grpc_server_registry", GrpcServerRegistry
@@ -476,10 +480,28 @@ def _load_workspace(self):
                 self._start_watch_thread(origin)
             self._location_entry_dict[origin.location_name] = self._load_location(origin)
 
+        self._external_job_data_caches = {
+            location_name: job_data_cache
+            for location_name, job_data_cache in self._external_job_data_caches.items()
+            if location_name in self._location_entry_dict
+        }
+
+    def _get_external_job_data_cache(self, location_name: str) -> Optional[ExternalJobDataCache]:
+        if not self._instance.code_server_defer_job_snapshots:
+            return None
+        if location_name not in self._external_job_data_caches:
+            self._external_job_data_caches[location_name] = ExternalJobDataCache()
+        return self._external_job_data_caches[location_name]
+
     def _create_location_from_origin(
         self, origin: RepositoryLocationOrigin
     ) -> Optional[RepositoryLocation]:
         if not self._grpc_server_registry.supports_origin(origin):
+            if isinstance(origin, GrpcServerRepositoryLocationOrigin):
+                return GrpcServerRepositoryLocation(
+                    origin,
+                    external_job_data_cache=self._get_external_job_data_cache(origin.location_name),
+                )
             return origin.create_location()
         else:
             endpoint = (
@@ -497,6 +519,7 @@ def _create_location_from_origin(
                 heartbeat=True,
                 watch_server=False,
                 grpc_server_registry=self._grpc_server_registry,
+                external_job_data_cache=self._get_external_job_data_cache(origin.location_name),
             )
 
     @property
@@ -557,6 +580,10 @@ def _load_location(self, origin):
         error = None
         try:
             location = self._create_location_from_origin(origin)
+            job_data_cache = self._external_job_data_caches.get(location_name)
+            if job_data_cache is not None and isinstance(location, GrpcServerRepositoryLocation):
+                # drop the snapshots of jobs that changed or no longer exist
+                job_data_cache.retain(location.external_job_refs)
         except Exception:
             error = serializable_error_info_from_exc_info(sys.exc_info())
             warnings.warn(
@@ -3,14 +3,20 @@
 import sys
 import time
 
+import dagster._check as check
 from dagster._core.errors import DagsterBackfillFailedError
+from dagster._core.execution.asset_backfill import (
+    AssetBackfillRun,
+    plan_asset_backfill,
+    submit_asset_backfill_runs,
+)
 from dagster._core.execution.backfill import (
     BulkActionStatus,
     PartitionBackfill,
     submit_backfill_runs,
 )
 from dagster._core.instance import DagsterInstance
-from dagster._core.storage.pipeline_run import PipelineRun, RunsFilter
+from dagster._core.storage.pipeline_run import PipelineRun, PipelineRunStatus, RunsFilter
 from dagster._core.storage.tags import PARTITION_NAME_TAG
 from dagster._core.workspace.context import IWorkspaceProcessContext
 from dagster._utils.error import serializable_error_info_from_exc_info
@@ -55,6 +61,12 @@ def execute_backfill_iteration(
         # refetch, in case the backfill was updated in the meantime
         backfill_job = instance.get_backfill(backfill_id)
 
+        if backfill_job.is_asset_backfill:
+            yield from _execute_asset_backfill_iteration(
+                instance, workspace, logger, backfill_job, debug_crash_flags
+            )
+            continue
+
         if not backfill_job.last_submitted_partition_name:
             logger.info(f"Starting backfill for {backfill_id}")
         else:
@@ -62,23 +74,13 @@ def execute_backfill_iteration(
                 f"Resuming backfill for {backfill_id} from {backfill_job.last_submitted_partition_name}"
             )
 
-        origin = (
-            backfill_job.partition_set_origin.external_repository_origin.repository_location_origin
-        )
-
         try:
-            repo_location = workspace.get_repository_location(origin.location_name)
-            repo_name = backfill_job.partition_set_origin.external_repository_origin.repository_name
+            repo_location, external_repo = _get_backfill_repository(workspace, backfill_job)
             partition_set_name = backfill_job.partition_set_origin.partition_set_name
-            if not repo_location.has_repository(repo_name):
-                raise DagsterBackfillFailedError(
-                    f"Could not find repository {repo_name} in location {repo_location.name} to "
-                    f"run backfill {backfill_id}."
-                )
-            external_repo = repo_location.get_repository(repo_name)
             if not external_repo.has_external_partition_set(partition_set_name):
                 raise DagsterBackfillFailedError(
-                    f"Could not find partition set {partition_set_name} in repository {repo_name}. "
+                    f"Could not find partition set {partition_set_name} in repository "
+                    f"{external_repo.name}. "
                 )
 
             has_more = True
@@ -86,19 +88,30 @@ def execute_backfill_iteration(
                 if backfill_job.status != BulkActionStatus.REQUESTED:
                     break
 
-                chunk, checkpoint, has_more = _get_partitions_chunk(
+                chunk, unsubmitted_runs, checkpoint, has_more = _get_partitions_chunk(
                     instance, logger, backfill_job, CHECKPOINT_COUNT
                 )
                 _check_for_debug_crash(debug_crash_flags, "BEFORE_SUBMIT")
 
+                for run in unsubmitted_runs:
+                    instance.submit_run(run.run_id, workspace)
+                    yield
+                    # before submitting, refetch the backfill job to check for status changes
+                    backfill_job = instance.get_backfill(backfill_job.backfill_id)
+                    if backfill_job.status != BulkActionStatus.REQUESTED:
+                        return
+
                 if chunk:
-                    for _run_id in submit_backfill_runs(
+                    submitted_run_ids = submit_backfill_runs(
                         instance, workspace, repo_location, backfill_job, chunk
-                    ):
+                    )
+                    for _run_id in submitted_run_ids:
                         yield
                         # before submitting, refetch the backfill job to check for status changes
                         backfill_job = instance.get_backfill(backfill_job.backfill_id)
                         if backfill_job.status != BulkActionStatus.REQUESTED:
+                            # deletes the runs that were created but not submitted
+                            submitted_run_ids.close()
                             return
 
                 _check_for_debug_crash(debug_crash_flags, "AFTER_SUBMIT")
@@ -124,6 +137,102 @@ def execute_backfill_iteration(
             yield error_info
 
 
+def _get_backfill_repository(workspace, backfill_job: PartitionBackfill):
+    repository_origin = backfill_job.external_repository_origin
+    repo_location = workspace.get_repository_location(
+        repository_origin.repository_location_origin.location_name
+    )
+    repo_name = repository_origin.repository_name
+    if not repo_location.has_repository(repo_name):
+        raise DagsterBackfillFailedError(
+            f"Could not find repository {repo_name} in location {repo_location.name} to "
+            f"run backfill {backfill_job.backfill_id}."
+        )
+    return repo_location, repo_location.get_repository(repo_name)
+
+
+def _execute_asset_backfill_iteration(
+    instance: DagsterInstance,
+    workspace,
+    logger: logging.Logger,
+    backfill_job: PartitionBackfill,
+    debug_crash_flags,
+):
+    """Launches the next group of runs of an asset backfill, once the runs of the groups before it
+    have succeeded. The backfill is completed once the runs of its last group are launched, and
+    fails if any of the runs of an earlier group don't succeed."""
+    backfill_id = backfill_job.backfill_id
+    try:
+        repo_location, external_repo = _get_backfill_repository(workspace, backfill_job)
+        planned_runs_by_group = plan_asset_backfill(
+            external_repo,
+            check.not_none(backfill_job.asset_selection),
+            check.not_none(backfill_job.partition_key_range),
+            backfill_job.max_partitions_per_run,
+        )
+
+        # for idempotence, match the planned runs to the runs already launched by the backfill
+        backfill_runs = {}
+        for run in instance.get_runs(RunsFilter.for_backfill(backfill_id)):
+            backfill_runs.setdefault(AssetBackfillRun.key_for_run(run), run)
+
+        for group_index, planned_runs in enumerate(planned_runs_by_group):
+            is_last_group = group_index == len(planned_runs_by_group) - 1
+            to_submit = [
+                planned_run for planned_run in planned_runs if planned_run.key not in backfill_runs
+            ]
+            if to_submit:
+                # refetch, in case the backfill was canceled while waiting on the previous group
+                backfill_job = instance.get_backfill(backfill_id)
+                if backfill_job.status != BulkActionStatus.REQUESTED:
+                    return
+
+                logger.info(
+                    f"Launching {len(to_submit)} runs for group {group_index + 1} of "
+                    f"{len(planned_runs_by_group)} of backfill {backfill_id}"
+                )
+                _check_for_debug_crash(debug_crash_flags, "BEFORE_SUBMIT")
+                for _run_id in submit_asset_backfill_runs(
+                    instance, workspace, repo_location, external_repo, backfill_job, to_submit
+                ):
+                    yield
+                _check_for_debug_crash(debug_crash_flags, "AFTER_SUBMIT")
+
+                if not is_last_group:
+                    return
+
+            if is_last_group:
+                logger.info(
+                    f"Backfill completed for {backfill_id} for "
+                    f"{len(backfill_job.partition_names)} partitions"
+                )
+                instance.update_backfill(backfill_job.with_status(BulkActionStatus.COMPLETED))
+                yield
+                return
+
+            group_runs = [backfill_runs[planned_run.key] for planned_run in planned_runs]
+            unsuccessful_runs = [
+                run
+                for run in group_runs
+                if run.is_finished and run.status != PipelineRunStatus.SUCCESS
+            ]
+            if unsuccessful_runs:
+                raise DagsterBackfillFailedError(
+                    f"Run {unsuccessful_runs[0].run_id} of backfill {backfill_id} did not "
+                    "succeed, so the assets downstream of it were not backfilled."
+                )
+            if not all(run.is_finished for run in group_runs):
+                # wait for the runs of this group before launching the next one
+                return
+    except Exception:
+        error_info = serializable_error_info_from_exc_info(sys.exc_info())
+        instance.update_backfill(
+            backfill_job.with_status(BulkActionStatus.FAILED).with_error(error_info)
+        )
+        logger.error(f"Backfill failed for {backfill_id}: {error_info.to_string()}")
+        yield error_info
+
+
 def _get_partitions_chunk(
     instance: DagsterInstance,
     logger: logging.Logger,
@@ -163,4 +272,18 @@ def _get_partitions_chunk(
         for partition_name in partitions_chunk
         if partition_name not in completed_partitions
     ]
-    return to_submit, next_checkpoint, has_more
+
+    # runs that were created but never submitted, e.g. because the daemon was interrupted while
+    # submitting the chunk's runs
+    unsubmitted_runs = [
+        run
+        for run in backfill_runs
+        if run.status == PipelineRunStatus.NOT_STARTED
+        and run.tags.get(PARTITION_NAME_TAG) in partitions_chunk
+    ]
+    if unsubmitted_runs:
+        logger.info(
+            f"Found {len(unsubmitted_runs)} unsubmitted runs for backfill "
+            f"{backfill_job.backfill_id}, submitting"
+        )
+    return to_submit, unsubmitted_runs, next_checkpoint, has_more
@@ -20,6 +20,7 @@
     MonitoringDaemon,
     SchedulerDaemon,
     SensorDaemon,
+    TickCompactionDaemon,
 )
 from dagster._daemon.run_coordinator.queued_run_coordinator_daemon import QueuedRunCoordinatorDaemon
 from dagster._daemon.types import DaemonHeartbeat, DaemonStatus
@@ -304,6 +305,8 @@ def create_daemon_of_type(daemon_type, instance):
         return MonitoringDaemon(interval_seconds=instance.run_monitoring_poll_interval_seconds)
     elif daemon_type == EventLogConsumerDaemon.daemon_type():
         return EventLogConsumerDaemon()
+    elif daemon_type == TickCompactionDaemon.daemon_type():
+        return TickCompactionDaemon(interval_seconds=instance.tick_compaction_interval_seconds)
     else:
         raise Exception(f"Unexpected daemon type {daemon_type}")
 
@@ -18,6 +18,7 @@
 from dagster._daemon.backfill import execute_backfill_iteration
 from dagster._daemon.monitoring import execute_monitoring_iteration
 from dagster._daemon.sensor import execute_sensor_iteration_loop
+from dagster._daemon.tick_compaction import execute_tick_compaction_iteration
 from dagster._daemon.types import DaemonHeartbeat
 from dagster._scheduler.scheduler import execute_scheduler_iteration_loop
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
@@ -276,3 +277,15 @@ def run_iteration(
         workspace_process_context: IWorkspaceProcessContext,
     ) -> TDaemonGenerator:
         yield from execute_monitoring_iteration(workspace_process_context, self._logger)
+
+
+class TickCompactionDaemon(IntervalDaemon):
+    @classmethod
+    def daemon_type(cls):
+        return "TICK_COMPACTION"
+
+    def run_iteration(
+        self,
+        workspace_process_context: IWorkspaceProcessContext,
+    ) -> TDaemonGenerator:
+        yield from execute_tick_compaction_iteration(workspace_process_context, self._logger)
@@ -1,6 +1,6 @@
 import sys
 from collections import defaultdict
-from typing import Dict
+from typing import Dict, List, Mapping, Tuple
 
 from dagster import DagsterEvent, DagsterEventType
 from dagster import _check as check
@@ -12,20 +12,30 @@
     PipelineRunStatus,
     RunsFilter,
 )
-from dagster._core.storage.tags import PRIORITY_TAG
 from dagster._core.workspace.context import IWorkspaceProcessContext
 from dagster._daemon.daemon import IntervalDaemon
 from dagster._utils.error import serializable_error_info_from_exc_info
 
+# maximum number of queued runs fetched from the run storage at once
+QUEUED_RUNS_PAGE_SIZE = 100
+
+
+def _get_tag_concurrency_limit_keys(tag_concurrency_limits) -> List[str]:
+    return list({tag_limit["key"] for tag_limit in tag_concurrency_limits or []})
+
 
 class _TagConcurrencyLimitsCounter:
     """
     Helper object that keeps track of when the tag concurrency limits are met
     """
 
-    def __init__(self, tag_concurrency_limits, in_progress_runs):
+    def __init__(
+        self,
+        tag_concurrency_limits,
+        in_progress_tag_counts: Mapping[Tuple[str, str], int],
+    ):
         check.opt_list_param(tag_concurrency_limits, "tag_concurrency_limits", of_type=dict)
-        check.list_param(in_progress_runs, "in_progress_runs", of_type=PipelineRun)
+        check.mapping_param(in_progress_tag_counts, "in_progress_tag_counts")
 
         self._key_limits: Dict[str, int] = {}
         self._key_value_limits: Dict[(str, str), int] = {}
@@ -47,9 +57,9 @@ def __init__(self, tag_concurrency_limits, in_progress_runs):
         self._key_value_counts: Dict[(str, str), int] = defaultdict(lambda: 0)
         self._unique_value_counts: Dict[(str, str), int] = defaultdict(lambda: 0)
 
-        # initialize counters based on current in progress runs
-        for run in in_progress_runs:
-            self.update_counters_with_launched_run(run)
+        # initialize counters based on the tags of the current in progress runs
+        for (key, value), count in in_progress_tag_counts.items():
+            self._increment_counters(key, value, count)
 
     def is_run_blocked(self, run):
         """
@@ -79,15 +89,18 @@ def update_counters_with_launched_run(self, run):
         Add a new in progress run to the counters
         """
         for key, value in run.tags.items():
-            if key in self._key_limits:
-                self._key_counts[key] += 1
+            self._increment_counters(key, value, 1)
 
-            tag_tuple = (key, value)
-            if tag_tuple in self._key_value_limits:
-                self._key_value_counts[tag_tuple] += 1
+    def _increment_counters(self, key, value, count):
+        if key in self._key_limits:
+            self._key_counts[key] += count
+
+        tag_tuple = (key, value)
+        if tag_tuple in self._key_value_limits:
+            self._key_value_counts[tag_tuple] += count
 
-            if key in self._unique_value_limits:
-                self._unique_value_counts[tag_tuple] += 1
+        if key in self._unique_value_limits:
+            self._unique_value_counts[tag_tuple] += count
 
 
 class QueuedRunCoordinatorDaemon(IntervalDaemon):
@@ -113,94 +126,94 @@ def run_iteration(
         max_concurrent_runs = run_queue_config.max_concurrent_runs
         tag_concurrency_limits = run_queue_config.tag_concurrency_limits
 
-        in_progress_runs = self._get_in_progress_runs(instance)
+        in_progress_runs_filter = RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES)
+        num_in_progress_runs = instance.get_runs_count(in_progress_runs_filter)
 
         max_concurrent_runs_enabled = max_concurrent_runs != -1  # setting to -1 disables the limit
         if max_concurrent_runs_enabled:
-            max_runs_to_launch = max_concurrent_runs - len(in_progress_runs)
+            max_runs_to_launch = max_concurrent_runs - num_in_progress_runs
 
             # Possibly under 0 if runs were launched without queuing
             if max_runs_to_launch <= 0:
                 self._logger.info(
                     "{} runs are currently in progress. Maximum is {}, won't launch more.".format(
-                        len(in_progress_runs), max_concurrent_runs
+                        num_in_progress_runs, max_concurrent_runs
                     )
                 )
                 return
 
-        queued_runs = self._get_queued_runs(instance)
-
-        if not queued_runs:
-            self._logger.debug("Poll returned no queued runs.")
-        else:
-            self._logger.info("Retrieved %d queued runs, checking limits.", len(queued_runs))
+        # only the tags that have concurrency limits are counted, in the run storage
+        tag_concurrency_limits_counter = _TagConcurrencyLimitsCounter(
+            tag_concurrency_limits,
+            instance.get_run_tag_counts(
+                in_progress_runs_filter, _get_tag_concurrency_limit_keys(tag_concurrency_limits)
+            ),
+        )
 
-        # place in order
-        sorted_runs = self._priority_sort(queued_runs)
+        # queued runs are fetched in priority order a page at a time, so that only the runs that
+        # are considered for launching are loaded
+        page_size = (
+            min(max_runs_to_launch, QUEUED_RUNS_PAGE_SIZE)
+            if max_concurrent_runs_enabled
+            else QUEUED_RUNS_PAGE_SIZE
+        )
+        queued_runs_filter = RunsFilter(statuses=[PipelineRunStatus.QUEUED])
+        # runs that are dequeued (or fail to dequeue) leave the queue, so only the runs that are
+        # blocked by tag limits need to be skipped to reach the next page
+        num_blocked_runs = 0
 
         # launch until blocked by limit rules
         num_dequeued_runs = 0
-        tag_concurrency_limits_counter = _TagConcurrencyLimitsCounter(
-            tag_concurrency_limits, in_progress_runs
-        )
+        while not max_concurrent_runs_enabled or num_dequeued_runs < max_runs_to_launch:
+            queued_runs = instance.get_runs_by_priority(
+                queued_runs_filter, limit=page_size, offset=num_blocked_runs
+            )
 
-        for run in sorted_runs:
-            if max_concurrent_runs_enabled and num_dequeued_runs >= max_runs_to_launch:
+            if not queued_runs:
+                if num_blocked_runs == 0 and num_dequeued_runs == 0:
+                    self._logger.debug("Poll returned no queued runs.")
                 break
 
-            if tag_concurrency_limits_counter.is_run_blocked(run):
-                continue
+            self._logger.info("Retrieved %d queued runs, checking limits.", len(queued_runs))
 
-            error_info = None
+            for run in queued_runs:
+                if max_concurrent_runs_enabled and num_dequeued_runs >= max_runs_to_launch:
+                    break
 
-            try:
-                self._dequeue_run(instance, run, workspace_process_context)
-            except Exception:
-                error_info = serializable_error_info_from_exc_info(sys.exc_info())
+                if tag_concurrency_limits_counter.is_run_blocked(run):
+                    num_blocked_runs += 1
+                    continue
 
-                message = (
-                    f"Caught an error for run {run.run_id} while removing it from the queue."
-                    " Marking the run as failed and dropping it from the queue"
-                )
-                message_with_full_error = f"{message}: {error_info.to_string()}"
+                error_info = None
 
-                self._logger.error(message_with_full_error)
-                instance.report_run_failed(run, message_with_full_error)
+                try:
+                    self._dequeue_run(instance, run, workspace_process_context)
+                except Exception:
+                    error_info = serializable_error_info_from_exc_info(sys.exc_info())
 
-                # modify the original error, so that the extra message appears in heartbeats
-                error_info = error_info._replace(message=f"{message}: {error_info.message}")
+                    message = (
+                        f"Caught an error for run {run.run_id} while removing it from the queue."
+                        " Marking the run as failed and dropping it from the queue"
+                    )
+                    message_with_full_error = f"{message}: {error_info.to_string()}"
 
-            else:
-                tag_concurrency_limits_counter.update_counters_with_launched_run(run)
-                num_dequeued_runs += 1
+                    self._logger.error(message_with_full_error)
+                    instance.report_run_failed(run, message_with_full_error)
 
-            yield error_info
+                    # modify the original error, so that the extra message appears in heartbeats
+                    error_info = error_info._replace(message=f"{message}: {error_info.message}")
 
-        if num_dequeued_runs > 0:
-            self._logger.info("Launched %d runs.", num_dequeued_runs)
+                else:
+                    tag_concurrency_limits_counter.update_counters_with_launched_run(run)
+                    num_dequeued_runs += 1
 
-    def _get_queued_runs(self, instance):
-        queued_runs_filter = RunsFilter(statuses=[PipelineRunStatus.QUEUED])
+                yield error_info
+
+            if len(queued_runs) < page_size:
+                break
 
-        # Reversed for fifo ordering
-        # Note: should add a maximum fetch limit https://github.com/dagster-io/dagster/issues/3339
-        runs = instance.get_runs(filters=queued_runs_filter)[::-1]
-        return runs
-
-    def _get_in_progress_runs(self, instance):
-        # Note: should add a maximum fetch limit https://github.com/dagster-io/dagster/issues/3339
-        return instance.get_runs(filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES))
-
-    def _priority_sort(self, runs):
-        def get_priority(run):
-            priority_tag_value = run.tags.get(PRIORITY_TAG, "0")
-            try:
-                return int(priority_tag_value)
-            except ValueError:
-                return 0
-
-        # sorted is stable, so fifo is maintained
-        return sorted(runs, key=get_priority, reverse=True)
+        if num_dequeued_runs > 0:
+            self._logger.info("Launched %d runs.", num_dequeued_runs)
 
     def _dequeue_run(
         self,
@@ -1,13 +1,27 @@
 import datetime
 import logging
+import multiprocessing
 import os
 import sys
 import threading
 import time
 from collections import defaultdict
-from concurrent.futures import Future, ThreadPoolExecutor
-from contextlib import ExitStack
-from typing import Dict, Generator, List, NamedTuple, Optional, Sequence, Union
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import ExitStack, nullcontext
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import pendulum
 
@@ -20,22 +34,42 @@
 from dagster._core.host_representation import PipelineSelector
 from dagster._core.host_representation.external import ExternalPipeline, ExternalSensor
 from dagster._core.host_representation.external_data import ExternalTargetData
-from dagster._core.host_representation.repository_location import RepositoryLocation
-from dagster._core.instance import DagsterInstance
+from dagster._core.host_representation.grpc_server_registry import (
+    GrpcServerEndpoint,
+    GrpcServerRegistry,
+)
+from dagster._core.host_representation.origin import (
+    ManagedGrpcPythonEnvRepositoryLocationOrigin,
+    RepositoryLocationOrigin,
+)
+from dagster._core.host_representation.repository_location import (
+    GrpcServerRepositoryLocation,
+    RepositoryLocation,
+)
+from dagster._core.host_representation.selector import InstigatorSelector
+from dagster._core.instance import DagsterInstance, InstanceRef
 from dagster._core.scheduler.instigation import (
     InstigatorState,
     InstigatorStatus,
     InstigatorTick,
+    LatencyHistogram,
     SensorInstigatorData,
     TickData,
     TickStatus,
 )
-from dagster._core.storage.pipeline_run import PipelineRun, PipelineRunStatus, RunsFilter
+from dagster._core.storage.pipeline_run import (
+    InstigatorRunKey,
+    PipelineRun,
+    PipelineRunStatus,
+    RunsFilter,
+)
 from dagster._core.storage.tags import RUN_KEY_TAG, SENSOR_NAME_TAG
 from dagster._core.telemetry import SENSOR_RUN_CREATED, hash_name, log_action
-from dagster._core.workspace.context import IWorkspaceProcessContext
+from dagster._core.workspace.context import IWorkspaceProcessContext, WorkspaceProcessContext
+from dagster._core.workspace.load_target import WorkspaceLoadTarget
 from dagster._utils import merge_dicts
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
+from dagster._utils.log import configure_loggers
 
 MIN_INTERVAL_LOOP_TIME = 5
 
@@ -53,27 +87,75 @@ class SkippedSensorRun(
         "SkippedSensorRun",
         [
             ("run_key", Optional[str]),
-            ("existing_run", PipelineRun),
+            ("existing_run_id", str),
         ],
     )
 ):
     """Placeholder for runs that are skipped during the run_key idempotence check"""
 
 
+class SensorEvaluationLatencies:
+    """The latency histograms of the sensor evaluations made by this process, keyed by the selector
+    id of the sensor."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, LatencyHistogram] = {}
+
+    def record(self, selector_id: str, seconds: float) -> LatencyHistogram:
+        with self._lock:
+            histogram = self._histograms.get(selector_id, LatencyHistogram()).with_latency(seconds)
+            self._histograms[selector_id] = histogram
+            return histogram
+
+
+_sensor_evaluation_latencies = SensorEvaluationLatencies()
+
+
+class SkippedTickBatch:
+    """The coalesced skipped ticks of sensors, which are written to storage together at the end of
+    each iteration of the sensor daemon, rather than one at a time."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ticks: Dict[str, InstigatorTick] = {}
+
+    def add(self, selector_id: str, tick: InstigatorTick):
+        with self._lock:
+            self._ticks[selector_id] = tick
+
+    def get(self, selector_id: str) -> Optional[InstigatorTick]:
+        """The tick of the sensor that is waiting to be written, if any."""
+        with self._lock:
+            return self._ticks.get(selector_id)
+
+    def flush(self, instance: DagsterInstance):
+        with self._lock:
+            ticks = list(self._ticks.values())
+            self._ticks = {}
+        if ticks:
+            instance.update_ticks(ticks)
+
+
 class SensorLaunchContext:
     def __init__(
         self,
         external_sensor: ExternalSensor,
-        tick: InstigatorTick,
+        tick: Union[InstigatorTick, TickData],
         instance: DagsterInstance,
         logger: logging.Logger,
         tick_retention_settings,
         sensor_state_lock: threading.Lock,
+        previous_tick: Optional[InstigatorTick] = None,
+        skipped_tick_batch: Optional[SkippedTickBatch] = None,
     ):
         self._external_sensor = external_sensor
         self._instance = instance
         self._logger = logger
+        # the data of a tick that hasn't been written to storage yet, if skipped ticks are coalesced
         self._tick = tick
+        self._previous_tick = previous_tick
+        self._skipped_tick_batch = skipped_tick_batch
         self._sensor_state_lock = sensor_state_lock
         self._should_update_cursor_on_failure = False
         self._purge_settings = defaultdict(set)
@@ -122,11 +204,40 @@ def update_state(self, status, **kwargs):
     def add_run_info(self, run_id=None, run_key=None):
         self._tick = self._tick.with_run_info(run_id, run_key)
 
+    def record_evaluation_latency(self, seconds: float):
+        self._tick = self._tick.with_evaluation_latency_histogram(
+            _sensor_evaluation_latencies.record(self._external_sensor.selector_id, seconds)
+        )
+
     def set_should_update_cursor_on_failure(self, should_update_cursor_on_failure: bool):
         self._should_update_cursor_on_failure = should_update_cursor_on_failure
 
+    def _write_coalesced_tick(self, tick_data: TickData) -> InstigatorTick:
+        previous_tick = self._previous_tick
+        if not (
+            tick_data.status == TickStatus.SKIPPED
+            and previous_tick
+            and previous_tick.status == TickStatus.SKIPPED
+            and previous_tick.skip_reason == tick_data.skip_reason
+        ):
+            return self._instance.create_tick(tick_data)
+
+        # fold the tick into the previous skipped tick, rather than adding a tick to storage
+        tick = InstigatorTick(
+            previous_tick.tick_id,
+            tick_data.with_skipped_tick_count((previous_tick.skipped_tick_count or 1) + 1),
+        )
+        if self._skipped_tick_batch:
+            self._skipped_tick_batch.add(self._external_sensor.selector_id, tick)
+        else:
+            self._instance.update_tick(tick)
+        return tick
+
     def _write(self):
-        self._instance.update_tick(self._tick)
+        if isinstance(self._tick, TickData):
+            self._tick = self._write_coalesced_tick(self._tick)
+        else:
+            self._instance.update_tick(self._tick)
 
         if self._tick.status not in FINISHED_TICK_STATES:
             return
@@ -205,6 +316,117 @@ def _check_for_debug_crash(debug_crash_flags, key):
 
 VERBOSE_LOGS_INTERVAL = 60
 
+# The repository locations of the daemon's workspace that sensor worker processes load, with the
+# endpoint of the gRPC server that the daemon started for each location, if any
+SensorWorkerLocations = Tuple[Tuple[RepositoryLocationOrigin, Optional[GrpcServerEndpoint]], ...]
+
+
+class LocationEvaluationLimiter:
+    """Limits the number of sensor evaluations that can be in flight against each repository
+    location at once, handing out one semaphore per location name.
+
+    Args:
+        max_concurrent_evaluations (int): The maximum number of concurrent evaluations per location.
+        semaphore_factory (Callable[[int], Any]): Creates the semaphore for a location. Semaphores
+            that are shared with worker processes need to be created by a multiprocessing manager.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_evaluations: int,
+        semaphore_factory: Callable[[int], Any] = threading.BoundedSemaphore,
+    ):
+        self._max_concurrent_evaluations = check.int_param(
+            max_concurrent_evaluations, "max_concurrent_evaluations"
+        )
+        check.invariant(
+            max_concurrent_evaluations > 0,
+            "max_concurrent_evaluations_per_location must be a positive integer",
+        )
+        self._semaphore_factory = check.callable_param(semaphore_factory, "semaphore_factory")
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, Any] = {}
+
+    def get_semaphore(self, location_name: str):
+        with self._lock:
+            if location_name not in self._semaphores:
+                self._semaphores[location_name] = self._semaphore_factory(
+                    self._max_concurrent_evaluations
+                )
+            return self._semaphores[location_name]
+
+
+class SensorProcessPool:
+    """Evaluates sensors in worker processes, so that slow or CPU-bound sensor evaluations don't
+    contend for the daemon's GIL.
+
+    Sensors are sharded across the workers by their selector id, so that every tick of a sensor is
+    evaluated by the same worker. Each worker is a single-process pool, which is replaced if its
+    process dies.
+
+    Args:
+        instance_ref (InstanceRef): The instance that the workers evaluate sensors against.
+        num_workers (int): The number of worker processes.
+        max_concurrent_evaluations_per_location (Optional[int]): If set, the maximum number of
+            sensor evaluations that can be in flight against each repository location at once,
+            across all workers.
+    """
+
+    def __init__(
+        self,
+        instance_ref: InstanceRef,
+        num_workers: int,
+        max_concurrent_evaluations_per_location: Optional[int] = None,
+    ):
+        self._instance_ref = check.inst_param(instance_ref, "instance_ref", InstanceRef)
+        check.invariant(num_workers > 0, "num_workers must be a positive integer")
+        self._mp_context = multiprocessing.get_context("spawn")
+        self._executors: List[Optional[ProcessPoolExecutor]] = [None] * num_workers
+        self._manager = None
+        self.location_limiter = None
+        if max_concurrent_evaluations_per_location:
+            self._manager = self._mp_context.Manager()
+            self.location_limiter = LocationEvaluationLimiter(
+                max_concurrent_evaluations_per_location,
+                semaphore_factory=self._manager.BoundedSemaphore,
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.shutdown()
+
+    def _get_executor(self, shard: int) -> ProcessPoolExecutor:
+        executor = self._executors[shard]
+        if not executor:
+            executor = ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=self._mp_context,
+                initializer=_initialize_sensor_worker,
+                initargs=(self._instance_ref,),
+            )
+            self._executors[shard] = executor
+        return executor
+
+    def submit(self, selector_id: str, fn, *args) -> Future:
+        shard = int(selector_id, 16) % len(self._executors)
+        try:
+            return self._get_executor(shard).submit(fn, *args)
+        except BrokenProcessPool:
+            check.not_none(self._executors[shard]).shutdown(wait=False)
+            self._executors[shard] = None
+            return self._get_executor(shard).submit(fn, *args)
+
+    def shutdown(self):
+        for executor in self._executors:
+            if executor:
+                executor.shutdown(wait=True)
+        self._executors = [None] * len(self._executors)
+        if self._manager:
+            self._manager.shutdown()
+            self._manager = None
+
 
 def execute_sensor_iteration_loop(
     workspace_process_context: IWorkspaceProcessContext,
@@ -222,15 +444,32 @@ def execute_sensor_iteration_loop(
     sensor_tick_futures: Dict[str, Future] = {}
     with ExitStack() as stack:
         settings = workspace_process_context.instance.get_settings("sensors")
-        if settings.get("use_threads"):
+        skipped_tick_batch = None
+        if settings.get("coalesce_skipped_ticks"):
+            skipped_tick_batch = SkippedTickBatch()
+            stack.callback(skipped_tick_batch.flush, workspace_process_context.instance)
+        max_concurrent_evaluations = settings.get("max_concurrent_evaluations_per_location")
+        threadpool_executor = None
+        process_pool = None
+        location_limiter = None
+        if settings.get("use_processes"):
+            process_pool = stack.enter_context(
+                SensorProcessPool(
+                    workspace_process_context.instance.get_ref(),
+                    num_workers=settings.get("num_workers") or os.cpu_count() or 1,
+                    max_concurrent_evaluations_per_location=max_concurrent_evaluations,
+                )
+            )
+            location_limiter = process_pool.location_limiter
+        elif settings.get("use_threads"):
             threadpool_executor = stack.enter_context(
                 ThreadPoolExecutor(
                     max_workers=settings.get("num_workers"),
                     thread_name_prefix="sensor_daemon_worker",
                 )
             )
-        else:
-            threadpool_executor = None
+            if max_concurrent_evaluations:
+                location_limiter = LocationEvaluationLimiter(max_concurrent_evaluations)
 
         last_verbose_time = None
         while True:
@@ -250,7 +489,12 @@ def execute_sensor_iteration_loop(
                 sensor_tick_futures=sensor_tick_futures,
                 sensor_state_lock=sensor_state_lock,
                 log_verbose_checks=verbose_logs_iteration,
+                process_pool=process_pool,
+                location_limiter=location_limiter,
+                skipped_tick_batch=skipped_tick_batch,
             )
+            if skipped_tick_batch:
+                skipped_tick_batch.flush(workspace_process_context.instance)
             end_time = pendulum.now("UTC").timestamp()
 
             if verbose_logs_iteration:
@@ -270,6 +514,9 @@ def execute_sensor_iteration(
     sensor_state_lock: Optional[threading.Lock] = None,
     log_verbose_checks: bool = True,
     debug_crash_flags=None,
+    process_pool: Optional[SensorProcessPool] = None,
+    location_limiter: Optional[LocationEvaluationLimiter] = None,
+    skipped_tick_batch: Optional[SkippedTickBatch] = None,
 ):
 
     instance = workspace_process_context.instance
@@ -289,7 +536,12 @@ def execute_sensor_iteration(
         for sensor_state in instance.all_instigator_state(instigator_type=InstigatorType.SENSOR)
     }
 
-    tick_retention_settings = instance.get_tick_retention_settings(InstigatorType.SENSOR)
+    # with tick compaction, old ticks are purged in bulk by the tick compaction daemon instead
+    tick_retention_settings = (
+        {}
+        if instance.tick_compaction_enabled
+        else instance.get_tick_retention_settings(InstigatorType.SENSOR)
+    )
 
     sensors: Dict[str, ExternalSensor] = {}
     for location_entry in workspace_snapshot.values():
@@ -352,8 +604,14 @@ def execute_sensor_iteration(
         yield
         return
 
+    worker_locations = _get_sensor_worker_locations(workspace_snapshot) if process_pool else None
+
     for external_sensor in sensors.values():
         sensor_name = external_sensor.name
+        location_name = external_sensor.handle.location_name
+        location_semaphore = (
+            location_limiter.get_semaphore(location_name) if location_limiter else None
+        )
         sensor_debug_crash_flags = debug_crash_flags.get(sensor_name) if debug_crash_flags else None
         sensor_state = all_sensor_states.get(external_sensor.selector_id)
         if not sensor_state:
@@ -368,7 +626,35 @@ def execute_sensor_iteration(
         elif _is_under_min_interval(sensor_state, external_sensor):
             continue
 
-        if threadpool_executor:
+        if process_pool:
+            if sensor_tick_futures is None:
+                check.failed("sensor_tick_futures dict must be passed with process_pool")
+
+            # only allow one tick per sensor to be in flight
+            if (
+                external_sensor.selector_id in sensor_tick_futures
+                and not sensor_tick_futures[external_sensor.selector_id].done()
+            ):
+                continue
+
+            future = process_pool.submit(
+                external_sensor.selector_id,
+                _process_tick_in_worker,
+                worker_locations,
+                InstigatorSelector(
+                    location_name,
+                    external_sensor.handle.repository_name,
+                    sensor_name,
+                ),
+                sensor_state,
+                sensor_debug_crash_flags,
+                tick_retention_settings,
+                location_semaphore,
+            )
+            sensor_tick_futures[external_sensor.selector_id] = future
+            yield
+
+        elif threadpool_executor:
             if sensor_tick_futures is None:
                 check.failed("sensor_tick_futures dict must be passed with threadpool_executor")
 
@@ -388,6 +674,8 @@ def execute_sensor_iteration(
                 sensor_state_lock,
                 sensor_debug_crash_flags,
                 tick_retention_settings,
+                location_semaphore,
+                skipped_tick_batch,
             )
             sensor_tick_futures[external_sensor.selector_id] = future
             yield
@@ -403,7 +691,29 @@ def execute_sensor_iteration(
                 sensor_state_lock,
                 sensor_debug_crash_flags,
                 tick_retention_settings,
+                location_semaphore,
+                skipped_tick_batch,
+            )
+
+
+def _get_sensor_worker_locations(workspace_snapshot) -> SensorWorkerLocations:
+    worker_locations = []
+    for location_entry in workspace_snapshot.values():
+        origin = location_entry.origin
+        repo_location = location_entry.repository_location
+        endpoint = None
+        if isinstance(origin, ManagedGrpcPythonEnvRepositoryLocationOrigin) and isinstance(
+            repo_location, GrpcServerRepositoryLocation
+        ):
+            # point the workers at the server that the daemon already started for the location
+            endpoint = GrpcServerEndpoint(
+                server_id=check.not_none(repo_location.server_id),
+                host=repo_location.host,
+                port=repo_location.port,
+                socket=repo_location.socket,
             )
+        worker_locations.append((origin, endpoint))
+    return tuple(worker_locations)
 
 
 def _process_tick(
@@ -414,6 +724,8 @@ def _process_tick(
     sensor_state_lock: threading.Lock,
     sensor_debug_crash_flags,
     tick_retention_settings,
+    location_semaphore=None,
+    skipped_tick_batch: Optional[SkippedTickBatch] = None,
 ):
     # evaluate the tick immediately, but from within a thread.  The main thread should be able to
     # heartbeat to keep the daemon alive
@@ -426,6 +738,127 @@ def _process_tick(
             sensor_state_lock,
             sensor_debug_crash_flags,
             tick_retention_settings,
+            location_semaphore,
+            skipped_tick_batch,
+        )
+    )
+
+
+class _SensorWorkerLoadTarget(WorkspaceLoadTarget):
+    def __init__(self, origins: Sequence[RepositoryLocationOrigin]):
+        self._origins = list(origins)
+
+    def create_origins(self) -> List[RepositoryLocationOrigin]:
+        return self._origins
+
+
+class _SensorWorkerGrpcServerRegistry(GrpcServerRegistry):
+    """Serves the endpoints of the gRPC servers that the sensor daemon started for its workspace,
+    so that sensor workers connect to them rather than starting servers of their own."""
+
+    def __init__(self, endpoints: Mapping[str, GrpcServerEndpoint]):
+        self._endpoints = dict(endpoints)
+
+    def supports_origin(self, repository_location_origin: RepositoryLocationOrigin) -> bool:
+        return repository_location_origin.location_name in self._endpoints
+
+    def get_grpc_endpoint(
+        self, repository_location_origin: RepositoryLocationOrigin
+    ) -> GrpcServerEndpoint:
+        return self._endpoints[repository_location_origin.location_name]
+
+    def reload_grpc_endpoint(
+        self, repository_location_origin: RepositoryLocationOrigin
+    ) -> GrpcServerEndpoint:
+        return self.get_grpc_endpoint(repository_location_origin)
+
+    @property
+    def supports_reload(self) -> bool:
+        return False
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        pass
+
+
+class _SensorWorker:
+    """The state of a sensor worker process, which reloads its workspace whenever the locations of
+    the daemon's workspace change."""
+
+    def __init__(self, instance: DagsterInstance):
+        self.instance = instance
+        self.logger = logging.getLogger("dagster.daemon.SensorDaemon")
+        self.sensor_state_lock = threading.Lock()
+        self._worker_locations: Optional[SensorWorkerLocations] = None
+        self._workspace_process_context: Optional[WorkspaceProcessContext] = None
+
+    def get_workspace_process_context(
+        self, worker_locations: SensorWorkerLocations
+    ) -> WorkspaceProcessContext:
+        if self._workspace_process_context and worker_locations == self._worker_locations:
+            return self._workspace_process_context
+
+        if self._workspace_process_context:
+            self._workspace_process_context.__exit__(None, None, None)
+
+        self._workspace_process_context = WorkspaceProcessContext(
+            self.instance,
+            _SensorWorkerLoadTarget([origin for origin, _endpoint in worker_locations]),
+            grpc_server_registry=_SensorWorkerGrpcServerRegistry(
+                {
+                    origin.location_name: endpoint
+                    for origin, endpoint in worker_locations
+                    if endpoint
+                }
+            ),
+        )
+        self._worker_locations = worker_locations
+        return self._workspace_process_context
+
+
+_sensor_worker: Optional[_SensorWorker] = None
+
+
+def _initialize_sensor_worker(instance_ref: InstanceRef):
+    global _sensor_worker  # pylint: disable=global-statement
+
+    configure_loggers()
+    _sensor_worker = _SensorWorker(DagsterInstance.from_ref(instance_ref))
+
+
+def _process_tick_in_worker(
+    worker_locations: SensorWorkerLocations,
+    sensor_selector: InstigatorSelector,
+    sensor_state: InstigatorState,
+    sensor_debug_crash_flags,
+    tick_retention_settings,
+    location_semaphore,
+):
+    worker = check.not_none(_sensor_worker, "Sensor worker process was not initialized")
+    try:
+        workspace_process_context = worker.get_workspace_process_context(worker_locations)
+        external_sensor = (
+            workspace_process_context.create_request_context()
+            .get_repository_location(sensor_selector.location_name)
+            .get_repository(sensor_selector.repository_name)
+            .get_external_sensor(sensor_selector.name)
+        )
+    except Exception:
+        error_info = serializable_error_info_from_exc_info(sys.exc_info())
+        worker.logger.error(
+            f"Sensor worker could not load sensor {sensor_selector.name} : {error_info.to_string()}"
+        )
+        return
+
+    list(
+        _process_tick_generator(
+            workspace_process_context,
+            worker.logger,
+            external_sensor,
+            sensor_state,
+            worker.sensor_state_lock,
+            sensor_debug_crash_flags,
+            tick_retention_settings,
+            location_semaphore,
         )
     )
 
@@ -438,6 +871,8 @@ def _process_tick_generator(
     sensor_state_lock: threading.Lock,
     sensor_debug_crash_flags,
     tick_retention_settings,
+    location_semaphore=None,
+    skipped_tick_batch: Optional[SkippedTickBatch] = None,
 ):
     instance = workspace_process_context.instance
     error_info = None
@@ -456,21 +891,46 @@ def _process_tick_generator(
             _mark_sensor_state_for_tick(instance, external_sensor, sensor_state, now)
 
     try:
-        tick = instance.create_tick(
-            TickData(
-                instigator_origin_id=sensor_state.instigator_origin_id,
-                instigator_name=sensor_state.instigator_name,
-                instigator_type=InstigatorType.SENSOR,
-                status=TickStatus.STARTED,
-                timestamp=now.timestamp(),
-                selector_id=external_sensor.selector_id,
-            )
+        tick_data = TickData(
+            instigator_origin_id=sensor_state.instigator_origin_id,
+            instigator_name=sensor_state.instigator_name,
+            instigator_type=InstigatorType.SENSOR,
+            status=TickStatus.STARTED,
+            timestamp=now.timestamp(),
+            selector_id=external_sensor.selector_id,
         )
+        tick: Union[InstigatorTick, TickData]
+        previous_tick = None
+        if instance.get_settings("sensors").get("coalesce_skipped_ticks"):
+            # the tick is only written once it has finished, so that a skipped tick following
+            # another skipped tick can be folded into it
+            tick = tick_data
+            previous_tick = (
+                skipped_tick_batch.get(external_sensor.selector_id) if skipped_tick_batch else None
+            ) or next(
+                iter(
+                    instance.get_ticks(
+                        external_sensor.get_external_origin_id(),
+                        external_sensor.selector_id,
+                        limit=1,
+                    )
+                ),
+                None,
+            )
+        else:
+            tick = instance.create_tick(tick_data)
 
         _check_for_debug_crash(sensor_debug_crash_flags, "TICK_CREATED")
 
         with SensorLaunchContext(
-            external_sensor, tick, instance, logger, tick_retention_settings, sensor_state_lock
+            external_sensor,
+            tick,
+            instance,
+            logger,
+            tick_retention_settings,
+            sensor_state_lock,
+            previous_tick=previous_tick,
+            skipped_tick_batch=skipped_tick_batch,
         ) as tick_context:
             _check_for_debug_crash(sensor_debug_crash_flags, "TICK_HELD")
             yield from _evaluate_sensor(
@@ -479,6 +939,7 @@ def _process_tick_generator(
                 external_sensor,
                 sensor_state,
                 sensor_debug_crash_flags,
+                location_semaphore,
             )
 
     except Exception:
@@ -525,6 +986,7 @@ def _evaluate_sensor(
     external_sensor: ExternalSensor,
     state: InstigatorState,
     sensor_debug_crash_flags=None,
+    location_semaphore=None,
 ):
     instance = workspace_process_context.instance
     context.logger.info(f"Checking for new runs for sensor: {external_sensor.name}")
@@ -537,14 +999,18 @@ def _evaluate_sensor(
 
     instigator_data = _sensor_instigator_data(state)
 
-    sensor_runtime_data = repo_location.get_external_sensor_execution_data(
-        instance,
-        repository_handle,
-        external_sensor.name,
-        instigator_data.last_tick_timestamp if instigator_data else None,
-        instigator_data.last_run_key if instigator_data else None,
-        instigator_data.cursor if instigator_data else None,
-    )
+    # the semaphore caps the evaluations in flight against the location, across all sensors
+    with location_semaphore if location_semaphore else nullcontext():
+        evaluation_start = time.perf_counter()
+        sensor_runtime_data = repo_location.get_external_sensor_execution_data(
+            instance,
+            repository_handle,
+            external_sensor.name,
+            instigator_data.last_tick_timestamp if instigator_data else None,
+            instigator_data.last_run_key if instigator_data else None,
+            instigator_data.cursor if instigator_data else None,
+        )
+        context.record_evaluation_latency(time.perf_counter() - evaluation_start)
 
     yield
 
@@ -701,12 +1167,18 @@ def _fetch_existing_runs(
     instance: DagsterInstance,
     external_sensor: ExternalSensor,
     run_requests: Sequence[RunRequest],
-):
+) -> Dict[str, InstigatorRunKey]:
     run_keys = [run_request.run_key for run_request in run_requests if run_request.run_key]
 
     if not run_keys:
         return {}
 
+    if instance.run_storage.supports_instigator_run_keys():
+        # look up the runs in the run key index, without loading them
+        return dict(
+            instance.run_storage.get_instigator_run_keys(external_sensor.selector_id, run_keys)
+        )
+
     # fetch runs from the DB with only the run key tag
     # note: while possible to filter more at DB level with tags - it is avoided here due to observed perf problems
     runs_with_run_keys = instance.get_runs(filters=RunsFilter(tags={RUN_KEY_TAG: run_keys}))
@@ -732,7 +1204,7 @@ def _fetch_existing_runs(
     for run in valid_runs:
         tags = run.tags or {}
         run_key = tags.get(RUN_KEY_TAG)
-        existing_runs[run_key] = run
+        existing_runs[run_key] = InstigatorRunKey(run_key, run.run_id, run.status)
 
     return existing_runs
 
@@ -745,7 +1217,7 @@ def _get_or_create_sensor_run(
     external_pipeline: ExternalPipeline,
     run_request: RunRequest,
     target_data: ExternalTargetData,
-    existing_runs_by_key: Dict[str, PipelineRun],
+    existing_runs_by_key: Dict[str, InstigatorRunKey],
 ):
 
     if not run_request.run_key:
@@ -753,14 +1225,18 @@ def _get_or_create_sensor_run(
             instance, repo_location, external_sensor, external_pipeline, run_request, target_data
         )
 
-    run = existing_runs_by_key.get(run_request.run_key)
+    existing_run = existing_runs_by_key.get(run_request.run_key)
 
-    if run:
-        if run.status != PipelineRunStatus.NOT_STARTED:
+    if existing_run:
+        if existing_run.status != PipelineRunStatus.NOT_STARTED:
             # A run already exists and was launched for this run key, but the daemon must have
             # crashed before the tick could be updated
-            return SkippedSensorRun(run_key=run_request.run_key, existing_run=run)
-        else:
+            return SkippedSensorRun(
+                run_key=run_request.run_key, existing_run_id=existing_run.run_id
+            )
+
+        run = instance.get_run_by_id(existing_run.run_id)
+        if run:
             context.logger.info(
                 f"Run {run.run_id} already created with the run key "
                 f"`{run_request.run_key}` for {external_sensor.name}"
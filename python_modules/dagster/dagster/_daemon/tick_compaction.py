@@ -0,0 +1,37 @@
+import logging
+from collections import defaultdict
+from typing import Dict, List
+
+import pendulum
+
+from dagster._core.definitions.run_request import InstigatorType
+from dagster._core.scheduler.instigation import TickStatus
+from dagster._core.workspace.context import IWorkspaceProcessContext
+
+
+def execute_tick_compaction_iteration(
+    workspace_process_context: IWorkspaceProcessContext,
+    logger: logging.Logger,
+):
+    """Purges the ticks of all schedules and sensors that are past their retention period, with a
+    bulk delete for each retention period rather than one per instigator."""
+    instance = workspace_process_context.instance
+    now = pendulum.now("UTC")
+
+    for instigator_type in [InstigatorType.SCHEDULE, InstigatorType.SENSOR]:
+        statuses_by_day_offset: Dict[int, List[TickStatus]] = defaultdict(list)
+        for status, day_offset in instance.get_tick_retention_settings(instigator_type).items():
+            if day_offset > 0:
+                statuses_by_day_offset[day_offset].append(status)
+
+        for day_offset, statuses in sorted(statuses_by_day_offset.items()):
+            instance.purge_ticks_before(
+                before=now.subtract(days=day_offset).timestamp(),
+                instigator_type=instigator_type,
+                tick_statuses=statuses,
+            )
+            logger.info(
+                f"Purged {instigator_type.value.lower()} ticks with statuses "
+                f"{', '.join(status.value for status in statuses)} older than {day_offset} days"
+            )
+            yield
@@ -7,7 +7,7 @@
 from collections import defaultdict
 from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import ExitStack
-from typing import Dict, List, Optional, cast
+from typing import Dict, List, Optional, Sequence, cast
 
 import pendulum
 
@@ -30,7 +30,13 @@
     TickStatus,
 )
 from dagster._core.scheduler.scheduler import DEFAULT_MAX_CATCHUP_RUNS, DagsterSchedulerError
-from dagster._core.storage.pipeline_run import PipelineRun, PipelineRunStatus, RunsFilter
+from dagster._core.storage.pipeline_run import (
+    InstigatorRunKey,
+    PipelineRun,
+    PipelineRunStatus,
+    RunsFilter,
+    schedule_run_key,
+)
 from dagster._core.storage.tags import RUN_KEY_TAG, SCHEDULED_EXECUTION_TIME_TAG
 from dagster._core.telemetry import SCHEDULED_RUN_CREATED, hash_name, log_action
 from dagster._core.workspace.context import IWorkspaceProcessContext
@@ -178,7 +184,12 @@ def launch_scheduled_runs(
         for schedule_state in instance.all_instigator_state(instigator_type=InstigatorType.SCHEDULE)
     }
 
-    tick_retention_settings = instance.get_tick_retention_settings(InstigatorType.SCHEDULE)
+    # with tick compaction, old ticks are purged in bulk by the tick compaction daemon instead
+    tick_retention_settings = (
+        {}
+        if instance.tick_compaction_enabled
+        else instance.get_tick_retention_settings(InstigatorType.SCHEDULE)
+    )
 
     schedules: Dict[str, ExternalSchedule] = {}
     error_locations = set()
@@ -588,24 +599,32 @@ def _schedule_runs_at_time(
         )
         return
 
+    existing_runs_by_key = _fetch_existing_runs(
+        instance, external_schedule, schedule_time, schedule_execution_data.run_requests
+    )
+
     for run_request in schedule_execution_data.run_requests:
-        run = _get_existing_run_for_request(instance, external_schedule, schedule_time, run_request)
-        if run:
-            if run.status != PipelineRunStatus.NOT_STARTED:
+        existing_run = existing_runs_by_key.get(run_request.run_key)
+        run = None
+        if existing_run:
+            if existing_run.status != PipelineRunStatus.NOT_STARTED:
                 # A run already exists and was launched for this time period,
                 # but the scheduler must have crashed or errored before the tick could be put
                 # into a SUCCESS state
 
                 logger.info(
-                    f"Run {run.run_id} already completed for this execution of {external_schedule.name}"
+                    f"Run {existing_run.run_id} already completed for this execution of {external_schedule.name}"
                 )
-                tick_context.add_run_info(run_id=run.run_id, run_key=run_request.run_key)
+                tick_context.add_run_info(run_id=existing_run.run_id, run_key=run_request.run_key)
                 yield None
                 continue
-            else:
-                logger.info(
-                    f"Run {run.run_id} already created for this execution of {external_schedule.name}"
-                )
+
+            run = instance.get_run_by_id(existing_run.run_id)
+
+        if run:
+            logger.info(
+                f"Run {run.run_id} already created for this execution of {external_schedule.name}"
+            )
         else:
             run = _create_scheduler_run(
                 instance,
@@ -638,11 +657,47 @@ def _schedule_runs_at_time(
     tick_context.update_state(TickStatus.SUCCESS)
 
 
+def _fetch_existing_runs(
+    instance: DagsterInstance,
+    external_schedule: ExternalSchedule,
+    schedule_time,
+    run_requests: Sequence[RunRequest],
+) -> Dict[Optional[str], InstigatorRunKey]:
+    """The runs that already exist for the run requests of a scheduled execution, keyed by the run
+    key of their run request."""
+    scheduled_execution_time = to_timezone(schedule_time, "UTC").isoformat()
+    request_run_keys = {
+        schedule_run_key(scheduled_execution_time, run_request.run_key): run_request.run_key
+        for run_request in run_requests
+    }
+
+    if instance.run_storage.supports_instigator_run_keys():
+        # look up the runs in the run key index, without loading them
+        existing_runs = instance.run_storage.get_instigator_run_keys(
+            external_schedule.selector_id, list(request_run_keys.keys())
+        )
+        return {
+            request_run_keys[run_key]: existing_run
+            for run_key, existing_run in existing_runs.items()
+        }
+
+    existing_runs_by_key = {}
+    for run_key, request_run_key in request_run_keys.items():
+        run = _get_existing_run_for_request(
+            instance, external_schedule, schedule_time, request_run_key
+        )
+        if run:
+            existing_runs_by_key[request_run_key] = InstigatorRunKey(
+                run_key, run.run_id, run.status
+            )
+    return existing_runs_by_key
+
+
 def _get_existing_run_for_request(
     instance: DagsterInstance,
     external_schedule: ExternalSchedule,
     schedule_time,
-    run_request: RunRequest,
+    run_key: Optional[str],
 ):
     tags = merge_dicts(
         PipelineRun.tags_for_schedule(external_schedule),
@@ -650,8 +705,8 @@ def _get_existing_run_for_request(
             SCHEDULED_EXECUTION_TIME_TAG: to_timezone(schedule_time, "UTC").isoformat(),
         },
     )
-    if run_request.run_key:
-        tags[RUN_KEY_TAG] = run_request.run_key
+    if run_key:
+        tags[RUN_KEY_TAG] = run_key
     runs_filter = RunsFilter(tags=tags)
     existing_runs = instance.get_runs(runs_filter)
 
@@ -10,6 +10,7 @@
     register_serdes_tuple_fallbacks,
     serialize_dagster_namedtuple,
     serialize_value,
+    serialize_value_compact,
     unpack_inner_value,
     unpack_value,
     whitelist_for_serdes,
@@ -54,6 +54,8 @@ class WhitelistMap(NamedTuple):
     enums: Dict[str, EnumEntry]
     serialized_names: Dict[str, str]
     deserialized_names: Dict[str, str]
+    # per-class field layouts used by the compact format, populated lazily
+    compact_schemas: Dict[Type[Any], "CompactTupleSchema"]
 
     def register_tuple(
         self,
@@ -71,6 +73,7 @@ def register_tuple(
             args_for_class: the inspect.signature paramaters for __new__
         """
         self.tuples[name] = (nt, serializer or DefaultNamedTupleSerializer, args_for_class)
+        self.compact_schemas.clear()
 
     def has_tuple_entry(self, name: str) -> bool:
         return name in self.tuples
@@ -94,6 +97,7 @@ def get_enum_entry(self, name: str) -> EnumEntry:
 
     def register_serialized_name(self, name: str, serialized_name: str):
         self.serialized_names[name] = serialized_name
+        self.compact_schemas.clear()
 
     def has_serialized_name(self, name: str) -> bool:
         return name in self.serialized_names
@@ -112,7 +116,9 @@ def get_deserialized_name(self, name: str) -> str:
 
     @staticmethod
     def create():
-        return WhitelistMap(tuples={}, enums={}, serialized_names={}, deserialized_names={})
+        return WhitelistMap(
+            tuples={}, enums={}, serialized_names={}, deserialized_names={}, compact_schemas={}
+        )
 
 
 _WHITELIST_MAP = WhitelistMap.create()
@@ -282,6 +288,18 @@ def skip_when_empty(cls) -> Set[str]:
         # change the serialized namedtuple.
         return set()
 
+    @classmethod
+    def supports_compact(cls) -> bool:
+        # The compact format stores the namedtuple fields positionally and rebuilds the value with
+        # value_from_unpacked, bypassing the storage dict methods. Serializers that override those
+        # methods are packed with them instead, unless they override this method to opt in.
+        return (
+            cls.value_to_storage_dict.__func__  # type: ignore[attr-defined]
+            is DefaultNamedTupleSerializer.value_to_storage_dict.__func__  # type: ignore[attr-defined]
+            and cls.value_from_storage_dict.__func__  # type: ignore[attr-defined]
+            is DefaultNamedTupleSerializer.value_from_storage_dict.__func__  # type: ignore[attr-defined]
+        )
+
     @classmethod
     def value_from_storage_dict(
         cls,
@@ -464,16 +482,18 @@ def opt_deserialize_as(json_str: Optional[str], cls: Type[T]) -> Optional[T]:
 
 def _deserialize_json(json_str: str, whitelist_map: WhitelistMap):
     value = seven.json.loads(json_str)
+    if _is_compact_payload(value):
+        return _unpack_compact_payload(value, whitelist_map)
     return unpack_inner_value(value, whitelist_map=whitelist_map, descent_path=_root(value))
 
 
 def deserialize_value(val: str, whitelist_map: WhitelistMap = _WHITELIST_MAP) -> Any:
-    """Deserialize a json encoded string in to its original value"""
-    return unpack_inner_value(
-        seven.json.loads(check.str_param(val, "val")),
-        whitelist_map=whitelist_map,
-        descent_path="",
-    )
+    """Deserialize a json encoded string in to its original value. Strings produced by either
+    serialize_value or serialize_value_compact are accepted."""
+    value = seven.json.loads(check.str_param(val, "val"))
+    if _is_compact_payload(value):
+        return _unpack_compact_payload(value, whitelist_map)
+    return unpack_inner_value(value, whitelist_map=whitelist_map, descent_path="")
 
 
 def unpack_value(val: Any) -> Any:
@@ -546,6 +566,231 @@ def unpack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str)
     return val
 
 
+###################################################################################################
+# Compact format
+###################################################################################################
+
+# The compact format is an alternative encoding for the same whitelisted values, meant for large
+# payloads (repository snapshots, event log entries) where the time spent building and parsing a
+# dict with a "__class__" key per namedtuple dominates. It is still a json document, so it can be
+# stored and transported anywhere the default format is, and it is parsed by the C json decoder:
+#
+#   {"__compact__": 1, "tuples": [[storage name, [field, ...]], ...], "enums": [...], "value": ...}
+#
+# Every class and enum name appears once in the tables. Within "value", json objects are always
+# dicts and json arrays are tagged with a leading integer: one of the _COMPACT_* codes below, or
+# _COMPACT_TUPLE_OFFSET + the index of a namedtuple class in "tuples" followed by the field values
+# in the order of its field list. Deserializing goes through the whitelist, so values written
+# by a different version of a class load the same way they do in the default format.
+
+COMPACT_FORMAT_VERSION = 1
+
+_COMPACT_LIST = 0
+_COMPACT_SET = 1
+_COMPACT_FROZENSET = 2
+_COMPACT_ENUM = 3
+_COMPACT_PACKED = 4
+_COMPACT_TUPLE_OFFSET = 8
+
+# exact types, so that subclasses like str enums take the slower checks below
+_COMPACT_SCALAR_TYPES = frozenset([str, int, float, bool, type(None)])
+
+
+class CompactTupleSchema(NamedTuple):
+    storage_name: str
+    fields: Tuple[str, ...]
+    # False when the class has a custom serializer that must produce its storage dict
+    positional: bool
+
+
+def _get_compact_tuple_schema(
+    klass: Type[Any], whitelist_map: WhitelistMap, descent_path: str
+) -> CompactTupleSchema:
+    schema = whitelist_map.compact_schemas.get(klass)
+    if schema is None:
+        klass_name = klass.__name__
+        if not whitelist_map.has_tuple_entry(klass_name):
+            raise SerializationError(
+                f"Can only serialize whitelisted namedtuples, received {klass_name}.{_path_msg(descent_path)}",
+            )
+        _, serializer, _ = whitelist_map.get_tuple_entry(klass_name)
+        schema = CompactTupleSchema(
+            storage_name=(
+                whitelist_map.get_serialized_name(klass_name)
+                if whitelist_map.has_serialized_name(klass_name)
+                else klass_name
+            ),
+            fields=tuple(klass._fields),
+            positional=(
+                issubclass(serializer, DefaultNamedTupleSerializer)
+                and serializer.supports_compact()
+            ),
+        )
+        whitelist_map.compact_schemas[klass] = schema
+    return schema
+
+
+def serialize_value_compact(val: Any, whitelist_map: WhitelistMap = _WHITELIST_MAP) -> str:
+    """Serialize a value to a string in the compact format. The result can be loaded with
+    deserialize_value, deserialize_as or deserialize_json_to_dagster_namedtuple, but not by
+    versions of Dagster that predate the compact format.
+    """
+    tuple_index: Dict[Type[Any], int] = {}
+    tuple_table: List[List[Any]] = []
+    enum_index: Dict[str, int] = {}
+    enum_table: List[str] = []
+
+    def _pack(inner: Any) -> Any:
+        if inner.__class__ in _COMPACT_SCALAR_TYPES:
+            return inner
+        if isinstance(inner, list):
+            return [_COMPACT_LIST, *[_pack(item) for item in inner]]
+        if isinstance(inner, tuple):
+            klass = inner.__class__
+            code = tuple_index.get(klass)
+            if code is None:
+                schema = _get_compact_tuple_schema(klass, whitelist_map, "")
+                if not schema.positional:
+                    return _pack_with_serializer(inner)
+                code = _COMPACT_TUPLE_OFFSET + len(tuple_table)
+                tuple_index[klass] = code
+                tuple_table.append([schema.storage_name, list(schema.fields)])
+            return [code, *[_pack(item) for item in inner]]
+        if isinstance(inner, dict):
+            return {key: _pack(value) for key, value in inner.items()}
+        if isinstance(inner, Enum):
+            klass_name = inner.__class__.__name__
+            if not whitelist_map.has_enum_entry(klass_name):
+                raise SerializationError(
+                    f"Can only serialize whitelisted Enums, received {klass_name}."
+                )
+            _, enum_serializer = whitelist_map.get_enum_entry(klass_name)
+            storage_str = enum_serializer.value_to_storage_str(inner, whitelist_map, "")
+            index = enum_index.get(storage_str)
+            if index is None:
+                index = len(enum_table)
+                enum_index[storage_str] = index
+                enum_table.append(storage_str)
+            return [_COMPACT_ENUM, index]
+        if isinstance(inner, set):
+            return [_COMPACT_SET, *[_pack(item) for item in sorted(list(inner), key=str)]]
+        if isinstance(inner, frozenset):
+            return [_COMPACT_FROZENSET, *[_pack(item) for item in sorted(list(inner), key=str)]]
+        return inner
+
+    def _pack_with_serializer(inner: tuple) -> Any:
+        _, serializer, _ = whitelist_map.get_tuple_entry(inner.__class__.__name__)
+        return [
+            _COMPACT_PACKED,
+            serializer.value_to_storage_dict(cast(NamedTuple, inner), whitelist_map, _root(inner)),
+        ]
+
+    try:
+        packed = _pack(val)
+    except SerializationError:
+        # rerun with the default packing, which tracks the descent path for the error message
+        pack_inner_value(val, whitelist_map, _root(val))
+        raise
+
+    return seven.json.dumps(
+        {
+            "__compact__": COMPACT_FORMAT_VERSION,
+            "tuples": tuple_table,
+            "enums": enum_table,
+            "value": packed,
+        }
+    )
+
+
+def _is_compact_payload(value: Any) -> bool:
+    return isinstance(value, dict) and "__compact__" in value
+
+
+def _unpack_compact_payload(payload: Dict[str, Any], whitelist_map: WhitelistMap) -> Any:
+    version = payload["__compact__"]
+    if version != COMPACT_FORMAT_VERSION:
+        raise DeserializationError(
+            f"Attempted to deserialize compact format version {version}, only version "
+            f"{COMPACT_FORMAT_VERSION} is supported. This error can occur due to version skew, "
+            "verify processes are running expected versions."
+        )
+
+    # resolve each class once: (class, serializer, field names to keep) or None for classes
+    # that have been mapped to None to gracefully load removed types
+    tuple_entries: List[
+        Optional[Tuple[Type[Any], Type[NamedTupleSerializer], List[bool], List[str]]]
+    ] = []
+    for storage_name, fields in payload["tuples"]:
+        lookup_name = (
+            whitelist_map.get_deserialized_name(storage_name)
+            if whitelist_map.has_deserialized_name(storage_name)
+            else storage_name
+        )
+        if not whitelist_map.has_tuple_entry(lookup_name):
+            name_str = (
+                f'"{storage_name}"'
+                if storage_name == lookup_name
+                else f'"{storage_name}" (mapped to: "{lookup_name}")'
+            )
+            raise DeserializationError(
+                f"Attempted to deserialize class {name_str} which is not in the whitelist. "
+                "This error can occur due to version skew, verify processes are running "
+                "expected versions."
+            )
+        klass, serializer, args_for_class = whitelist_map.get_tuple_entry(lookup_name)
+        if klass is None:
+            tuple_entries.append(None)
+        else:
+            tuple_entries.append(
+                (klass, serializer, [field in args_for_class for field in fields], fields)
+            )
+
+    enum_values = []
+    for storage_str in payload["enums"]:
+        name, member = storage_str.split(".")
+        if not whitelist_map.has_enum_entry(name):
+            raise DeserializationError(
+                f"Attempted to deserialize enum {name} which was not in the whitelist.\n"
+                "This error can occur due to version skew, verify processes are running "
+                "expected versions."
+            )
+        enum_class, enum_serializer = whitelist_map.get_enum_entry(name)
+        enum_values.append(enum_serializer.value_from_storage_str(member, enum_class))
+
+    def _unpack(inner: Any) -> Any:
+        if isinstance(inner, list):
+            code = inner[0]
+            if code >= _COMPACT_TUPLE_OFFSET:
+                entry = tuple_entries[code - _COMPACT_TUPLE_OFFSET]
+                if entry is None:
+                    return None
+                klass, serializer, keep, fields = entry
+                return serializer.value_from_unpacked(
+                    {
+                        field: _unpack(item)
+                        for field, item, should_keep in zip(fields, inner[1:], keep)
+                        if should_keep
+                    },
+                    klass,
+                )
+            if code == _COMPACT_LIST:
+                return [_unpack(item) for item in inner[1:]]
+            if code == _COMPACT_ENUM:
+                return enum_values[inner[1]]
+            if code == _COMPACT_SET:
+                return set(_unpack(item) for item in inner[1:])
+            if code == _COMPACT_FROZENSET:
+                return frozenset(_unpack(item) for item in inner[1:])
+            if code == _COMPACT_PACKED:
+                return unpack_inner_value(inner[1], whitelist_map, "")
+            raise DeserializationError(f"Unexpected compact format code {code}.")
+        if isinstance(inner, dict):
+            return {key: _unpack(value) for key, value in inner.items()}
+        return inner
+
+    return _unpack(payload["value"])
+
+
 ###################################################################################################
 # Back compat
 ###################################################################################################
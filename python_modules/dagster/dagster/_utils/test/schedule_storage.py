@@ -590,6 +590,64 @@ def test_purge_ticks(self, storage):
         ticks = storage.get_ticks("my_sensor", "my_sensor")
         assert len(ticks) == 2
 
+    def test_update_ticks(self, storage):
+        assert storage
+
+        current_time = time.time()
+        tick_one = storage.create_tick(self.build_sensor_tick(current_time, name="sensor_one"))
+        tick_two = storage.create_tick(self.build_sensor_tick(current_time, name="sensor_two"))
+
+        storage.update_ticks(
+            [
+                tick_one.with_status(TickStatus.SKIPPED).with_reason("no new files"),
+                tick_two.with_status(TickStatus.SUCCESS).with_run_info(run_id="fake_run_id"),
+            ]
+        )
+
+        [tick_one] = storage.get_ticks("sensor_one", "sensor_one")
+        assert tick_one.status == TickStatus.SKIPPED
+        assert tick_one.skip_reason == "no new files"
+
+        [tick_two] = storage.get_ticks("sensor_two", "sensor_two")
+        assert tick_two.status == TickStatus.SUCCESS
+        assert tick_two.run_ids == ["fake_run_id"]
+
+    def test_purge_ticks_before(self, storage):
+        assert storage
+
+        if not self.can_purge():
+            pytest.skip("Storage cannot purge")
+
+        now = pendulum.now()
+        five_minutes_ago = now.subtract(minutes=5).timestamp()
+        one_minute_ago = now.subtract(minutes=1).timestamp()
+        for name in ["sensor_one", "sensor_two"]:
+            storage.create_tick(
+                self.build_sensor_tick(five_minutes_ago, TickStatus.SKIPPED, name=name)
+            )
+            storage.create_tick(
+                self.build_sensor_tick(
+                    five_minutes_ago, TickStatus.SUCCESS, run_id="fake_run_id", name=name
+                )
+            )
+            storage.create_tick(
+                self.build_sensor_tick(one_minute_ago, TickStatus.SKIPPED, name=name)
+            )
+        storage.create_tick(self.build_schedule_tick(five_minutes_ago, TickStatus.SKIPPED))
+
+        storage.purge_ticks_before(
+            now.subtract(minutes=2).timestamp(),
+            instigator_type=InstigatorType.SENSOR,
+            tick_statuses=[TickStatus.SKIPPED],
+        )
+
+        for name in ["sensor_one", "sensor_two"]:
+            ticks = storage.get_ticks(name, name)
+            assert [tick.status for tick in ticks] == [TickStatus.SKIPPED, TickStatus.SUCCESS]
+            assert ticks[0].timestamp == one_minute_ago
+
+        assert len(storage.get_ticks("my_schedule", "my_schedule")) == 1
+
     def test_ticks_filtered(self, storage):
         storage.create_tick(self.build_sensor_tick(time.time(), status=TickStatus.STARTED))
         storage.create_tick(self.build_sensor_tick(time.time(), status=TickStatus.SUCCESS))
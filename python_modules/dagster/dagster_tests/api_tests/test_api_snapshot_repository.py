@@ -1,10 +1,14 @@
 import sys
 from contextlib import contextmanager
+from unittest import mock
 
 import pytest
 
 from dagster import repository
-from dagster._api.snapshot_repository import sync_get_streaming_external_repositories_data_grpc
+from dagster._api.snapshot_repository import (
+    sync_get_external_job_data_grpc,
+    sync_get_streaming_external_repositories_data_grpc,
+)
 from dagster._core.errors import DagsterUserCodeProcessError
 from dagster._core.host_representation import (
     ExternalRepositoryData,
@@ -19,7 +23,7 @@
 from dagster._legacy import lambda_solid, pipeline
 from dagster._serdes.serdes import deserialize_as
 
-from .utils import get_bar_repo_repository_location
+from .utils import get_bar_repo_repository_location, get_bar_workspace
 
 
 def test_streaming_external_repositories_api_grpc(instance):
@@ -161,3 +165,34 @@ def _ref_to_data(ref):
         job = repo.get_all_external_jobs()[0]
         _ = job.pipeline_snapshot
         assert _state.get("cnt", 0) == 1
+
+
+def test_workspace_reuses_job_snapshots_across_reloads():
+    with instance_for_test(
+        overrides={"code_servers": {"defer_job_snapshots": True}}
+    ) as instance, mock.patch(
+        "dagster._core.host_representation.repository_location.sync_get_external_job_data_grpc",
+        wraps=sync_get_external_job_data_grpc,
+    ) as fetch_job_data:
+        with get_bar_workspace(instance) as workspace:
+            process_context = workspace.process_context
+            location = workspace.get_repository_location("bar_repo_location")
+            repo = location.get_repository("bar_repo")
+            assert repo.external_repository_data.external_pipeline_datas is None
+
+            pipeline_snapshot = repo.get_full_external_job("foo").pipeline_snapshot
+            assert fetch_job_data.call_count == 1
+
+            process_context.reload_repository_location("bar_repo_location")
+            reloaded_location = process_context.create_request_context().get_repository_location(
+                "bar_repo_location"
+            )
+            assert reloaded_location is not location
+
+            # the job is unchanged, so its snapshot is served from the cache
+            reloaded_repo = reloaded_location.get_repository("bar_repo")
+            assert reloaded_repo.get_full_external_job("foo").pipeline_snapshot == pipeline_snapshot
+            assert fetch_job_data.call_count == 1
+
+            reloaded_repo.get_full_external_job("bar").pipeline_snapshot
+            assert fetch_job_data.call_count == 2
@@ -4,6 +4,7 @@
 
 from snapshottest import Snapshot
 
+
 snapshots = Snapshot()
 
 snapshots['test_basic_solids_config 1'] = {
@@ -28,6 +29,8 @@
                     'enabled': {
                     }
                 },
+                'reuse_processes': True,
+                'reuse_resources': True,
                 'start_method': {
                     'forkserver': {
                         'preload_modules': [
@@ -86,6 +89,8 @@
                     'enabled': {
                     }
                 },
+                'reuse_processes': True,
+                'reuse_resources': True,
                 'start_method': {
                     'forkserver': {
                         'preload_modules': [
@@ -144,6 +149,8 @@
                     'enabled': {
                     }
                 },
+                'reuse_processes': True,
+                'reuse_resources': True,
                 'start_method': {
                     'forkserver': {
                         'preload_modules': [
@@ -7,6 +7,7 @@
     AssetMaterialization,
     AssetOut,
     DagsterInvalidDefinitionError,
+    DagsterInvariantViolationError,
     DailyPartitionsDefinition,
     HourlyPartitionsDefinition,
     IOManager,
@@ -16,6 +17,7 @@
     StaticPartitionsDefinition,
     daily_partitioned_config,
     define_asset_job,
+    in_process_executor,
     materialize,
 )
 from dagster._core.definitions import asset, build_assets_job, multi_asset
@@ -26,6 +28,11 @@
 from dagster._core.definitions.events import AssetKey
 from dagster._core.definitions.partition_key_range import PartitionKeyRange
 from dagster._core.definitions.time_window_partitions import TimeWindow
+from dagster._core.storage.tags import (
+    ASSET_PARTITION_RANGE_END_TAG,
+    ASSET_PARTITION_RANGE_START_TAG,
+)
+from dagster._legacy import execute_pipeline
 
 
 @pytest.fixture(autouse=True)
@@ -88,6 +95,7 @@ def my_asset(context):
         "my_job",
         assets=[my_asset],
         resource_defs={"io_manager": IOManagerDefinition.hardcoded_io_manager(MyIOManager())},
+        executor_def=in_process_executor,
     )
     result = my_job.execute_in_process(partition_key="b")
     assert result.asset_materializations_for_node("my_asset") == [
@@ -194,6 +202,7 @@ def my_asset():
         "my_job",
         assets=[my_asset],
         resource_defs={"io_manager": IOManagerDefinition.hardcoded_io_manager(MyIOManager())},
+        executor_def=in_process_executor,
     )
     my_job.execute_in_process(partition_key="2021-06-06")
 
@@ -233,6 +242,134 @@ def downstream_asset(upstream_asset):
     ).success
 
 
+def test_partition_range_single_run():
+    partitions_def = DailyPartitionsDefinition(start_date="2021-05-05")
+    handled_windows = []
+    loaded_windows = []
+
+    class MyIOManager(IOManager):
+        def handle_output(self, context, _obj):
+            handled_windows.append(context.asset_partitions_time_window)
+            assert context.asset_partition_key_range == PartitionKeyRange(
+                "2021-06-06", "2021-06-08"
+            )
+
+        def load_input(self, context):
+            loaded_windows.append(context.asset_partitions_time_window)
+
+    @asset(partitions_def=partitions_def)
+    def upstream_asset():
+        pass
+
+    @asset(partitions_def=partitions_def)
+    def downstream_asset(upstream_asset):
+        assert upstream_asset is None
+
+    my_job = build_assets_job(
+        "my_job",
+        assets=[upstream_asset, downstream_asset],
+        resource_defs={"io_manager": IOManagerDefinition.hardcoded_io_manager(MyIOManager())},
+        executor_def=in_process_executor,
+    )
+    result = execute_pipeline(
+        my_job,
+        tags={
+            ASSET_PARTITION_RANGE_START_TAG: "2021-06-06",
+            ASSET_PARTITION_RANGE_END_TAG: "2021-06-08",
+        },
+    )
+    assert result.success
+
+    # each output is handled once, for the time window spanning the whole range
+    range_window = TimeWindow(pendulum.parse("2021-06-06"), pendulum.parse("2021-06-09"))
+    assert handled_windows == [range_window, range_window]
+    assert loaded_windows == [range_window]
+
+    materializations = [
+        (event.asset_key, event.event_specific_data.materialization.partition)
+        for event in result.event_list
+        if event.is_step_materialization
+    ]
+    assert sorted(materializations) == [
+        (AssetKey(asset_name), partition)
+        for asset_name in ["downstream_asset", "upstream_asset"]
+        for partition in ["2021-06-06", "2021-06-07", "2021-06-08"]
+    ]
+
+
+def test_partition_range_single_run_partition_key():
+    class MyIOManager(IOManager):
+        def handle_output(self, context, obj):
+            pass
+
+        def load_input(self, context):
+            pass
+
+    @asset(partitions_def=DailyPartitionsDefinition(start_date="2021-05-05"))
+    def my_asset(context):
+        with pytest.raises(
+            DagsterInvariantViolationError,
+            match="targets the range of partitions from 2021-06-06 to 2021-06-08",
+        ):
+            context.partition_key  # pylint: disable=pointless-statement
+
+    my_job = build_assets_job(
+        "my_job",
+        assets=[my_asset],
+        resource_defs={"io_manager": IOManagerDefinition.hardcoded_io_manager(MyIOManager())},
+        executor_def=in_process_executor,
+    )
+    assert execute_pipeline(
+        my_job,
+        tags={
+            ASSET_PARTITION_RANGE_START_TAG: "2021-06-06",
+            ASSET_PARTITION_RANGE_END_TAG: "2021-06-08",
+        },
+    ).success
+
+
+@pytest.mark.parametrize(
+    "tags,error_match",
+    [
+        (
+            {ASSET_PARTITION_RANGE_START_TAG: "2021-06-06"},
+            "only the dagster/asset_partition_range_start tag is set",
+        ),
+        (
+            {ASSET_PARTITION_RANGE_END_TAG: "2021-06-08"},
+            "only the dagster/asset_partition_range_end tag is set",
+        ),
+        (
+            {
+                ASSET_PARTITION_RANGE_START_TAG: "2021-06-08",
+                ASSET_PARTITION_RANGE_END_TAG: "2021-06-06",
+            },
+            "Invalid range of partitions from 2021-06-08 to 2021-06-06",
+        ),
+    ],
+)
+def test_partition_range_single_run_invalid_tags(tags, error_match):
+    class MyIOManager(IOManager):
+        def handle_output(self, context, obj):
+            pass
+
+        def load_input(self, context):
+            pass
+
+    @asset(partitions_def=DailyPartitionsDefinition(start_date="2021-05-05"))
+    def my_asset():
+        pass
+
+    my_job = build_assets_job(
+        "my_job",
+        assets=[my_asset],
+        resource_defs={"io_manager": IOManagerDefinition.hardcoded_io_manager(MyIOManager())},
+        executor_def=in_process_executor,
+    )
+    with pytest.raises(DagsterInvariantViolationError, match=error_match):
+        execute_pipeline(my_job, tags=tags)
+
+
 def test_cross_job_different_partitions():
     @asset(partitions_def=HourlyPartitionsDefinition(start_date="2021-05-05-00:00"))
     def hourly_asset():
@@ -362,6 +499,7 @@ def my_asset():
         "my_job",
         assets=[my_asset],
         resource_defs={"io_manager": IOManagerDefinition.hardcoded_io_manager(MyIOManager())},
+        executor_def=in_process_executor,
     )
     result = my_job.execute_in_process(partition_key="b")
     assert result.asset_materializations_for_node("my_asset") == [
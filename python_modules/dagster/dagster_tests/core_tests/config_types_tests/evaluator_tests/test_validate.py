@@ -5,8 +5,10 @@
     EvaluationStackMapKeyEntry,
     EvaluationStackMapValueEntry,
     EvaluationStackPathEntry,
+    config_schema_snapshot_from_config_type,
     resolve_to_config_type,
     validate_config,
+    validate_config_from_snap,
 )
 
 
@@ -662,3 +664,56 @@ def test_list_of_scalar_or_dict():
     assert not validate_config(int_or_dict_list, [2, {"wrong_key": "kjdfd"}]).success
     assert not validate_config(int_or_dict_list, [2, {"a_string": 2343}]).success
     assert not validate_config(int_or_dict_list, ["kjdfkd", {"a_string": "kjdfd"}]).success
+
+
+def test_validate_config_matches_snapshot_validation():
+    config_type = resolve_to_config_type(
+        {
+            "shape": Shape({"required": int, "aliased": Field(str, is_required=False)}),
+            "aliases": Field(
+                Shape({"name": Field(str, is_required=False)}, field_aliases={"name": "alias"}),
+                is_required=False,
+            ),
+            "permissive": Field(
+                Permissive({"known": Field(int, is_required=False)}), default_value={}
+            ),
+            "selector": Field(
+                Selector({"a": Field(int), "b": {"c": Field(str, default_value="c")}})
+            ),
+            "noneable": Field(Noneable([int]), is_required=False),
+            "map": Field({str: float}, is_required=False),
+            "union": Field(
+                ScalarUnion(scalar_type=int, non_scalar_schema=Shape({"a": int})), is_required=False
+            ),
+        }
+    )
+    config_schema_snapshot = config_schema_snapshot_from_config_type(config_type)
+
+    values = [
+        {"shape": {"required": 1}, "selector": {"a": 1}},
+        {"shape": {"required": 1, "aliased": "x"}, "selector": {"b": None}},
+        {"shape": {"required": 1}, "selector": {"b": {}}, "aliases": {"alias": "x"}},
+        {"shape": {"required": 1}, "selector": {"a": 1}, "permissive": {"known": 1, "other": 2}},
+        {"shape": {"required": 1}, "selector": {"a": 1}, "noneable": None, "map": {"x": 1.5}},
+        {"shape": {"required": 1}, "selector": {"a": 1}, "noneable": [1, 2], "union": {"a": 1}},
+        {"shape": {"required": 1}, "selector": {"a": 1}, "union": 1},
+        # invalid
+        {"shape": {}, "selector": {"a": 1}},
+        {"shape": {"required": "1"}, "selector": {"a": 1}},
+        {"shape": {"required": 1}, "selector": {"a": 1, "b": {}}},
+        {"shape": {"required": 1}, "selector": {}},
+        {"shape": {"required": 1}, "selector": {"a": 1}, "permissive": {"known": "1"}},
+        {"shape": {"required": 1}, "selector": {"a": 1}, "noneable": [None]},
+        {"shape": {"required": 1}, "selector": {"a": 1}, "map": {1: 1.5}},
+        {"shape": {"required": 1}, "selector": {"a": 1}, "union": "1"},
+        {"shape": {"required": 1}, "selector": {"a": 1}, "extra": 1},
+        None,
+    ]
+    for value in values:
+        result = validate_config(config_type, value)
+        expected = validate_config_from_snap(config_schema_snapshot, config_type.key, value)
+        assert result.success == expected.success
+        assert result.value == expected.value
+        assert [error.message for error in result.errors] == [
+            error.message for error in expected.errors
+        ]
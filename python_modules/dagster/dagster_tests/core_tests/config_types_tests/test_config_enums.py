@@ -9,9 +9,10 @@
     EnumValue,
     Field,
     Int,
+    Shape,
 )
 from dagster._config import Enum as ConfigEnum
-from dagster._config.validate import validate_config
+from dagster._config.validate import process_config, validate_config
 from dagster._legacy import PipelineDefinition, execute_pipeline, pipeline, solid
 
 
@@ -218,3 +219,18 @@ def test_native_enum_classmethod_creates_all_values():
     dagster_enum = Enum.from_python_enum(NativeEnum)
     for enum_value in NativeEnum:
         assert enum_value is dagster_enum.post_process(enum_value.name)
+
+
+def test_enums_with_same_name_in_same_shape():
+    class FirstEnum(PythonEnum):
+        VALUE = 1
+
+    class SecondEnum(PythonEnum):
+        VALUE = 2
+
+    # shapes are interned by key, which only depends on the name of the enum type
+    first_shape = Shape({"enum": Enum.from_python_enum(FirstEnum)})
+    assert process_config(first_shape, {"enum": "VALUE"}).value == {"enum": FirstEnum.VALUE}
+
+    second_shape = Shape({"enum": Enum("FirstEnum", [EnumValue("VALUE", SecondEnum.VALUE)])})
+    assert process_config(second_shape, {"enum": "VALUE"}).value == {"enum": SecondEnum.VALUE}
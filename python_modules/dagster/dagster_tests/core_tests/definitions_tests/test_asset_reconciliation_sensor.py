@@ -0,0 +1,184 @@
+import json
+from unittest import mock
+
+import pytest
+
+from dagster import (
+    AssetKey,
+    AssetSelection,
+    DagsterInstance,
+    DagsterRunStatus,
+    asset,
+    build_asset_reconciliation_sensor,
+    build_multi_asset_sensor_context,
+    materialize,
+    repository,
+)
+from dagster._core.definitions.asset_reconciliation_sensor import _LatestMaterializationCache
+from dagster._core.events import AssetMaterializationPlannedData, DagsterEvent, DagsterEventType
+from dagster._core.test_utils import create_run_for_test, instance_for_test
+
+
+def _fan_out_assets(num_children):
+    @asset
+    def root():
+        return 1
+
+    def _make_child(i):
+        @asset(name=f"child_{i}", non_argument_deps={"root"})
+        def _child():
+            return 1
+
+        return _child
+
+    return [root] + [_make_child(i) for i in range(num_children)]
+
+
+def _repository_def(assets, sensor):
+    @repository
+    def repo():
+        return [assets, sensor]
+
+    return repo
+
+
+def _evaluate_tick(sensor, repository_def, instance, cursor):
+    # the daemon rebuilds the instance from its ref on every tick
+    context = build_multi_asset_sensor_context(
+        repository_def=repository_def,
+        asset_selection=AssetSelection.all(),
+        instance=DagsterInstance.from_ref(instance.get_ref()),
+        cursor=cursor,
+    )
+    return sensor.evaluate_tick(context)
+
+
+def _count_materialization_queries(fn, event_type=DagsterEventType.ASSET_MATERIALIZATION):
+    original = DagsterInstance.get_event_records
+    filters = []
+
+    def _get_event_records(self, event_records_filter, *args, **kwargs):
+        if event_records_filter.event_type == event_type:
+            filters.append(event_records_filter)
+        return original(self, event_records_filter, *args, **kwargs)
+
+    with mock.patch.object(DagsterInstance, "get_event_records", _get_event_records):
+        result = fn()
+    return result, filters
+
+
+def test_reconciliation_sensor_reuses_materialization_cache():
+    assets = _fan_out_assets(2)
+    sensor = build_asset_reconciliation_sensor(AssetSelection.all(), name="reconciliation_sensor")
+    repository_def = _repository_def(assets, sensor)
+
+    with instance_for_test() as instance:
+        materialize(assets[:1], instance=instance)
+
+        first_tick, first_filters = _count_materialization_queries(
+            lambda: _evaluate_tick(sensor, repository_def, instance, None)
+        )
+        assert len(first_tick.run_requests) == 1
+        assert set(first_tick.run_requests[0].asset_selection) == {
+            AssetKey("child_0"),
+            AssetKey("child_1"),
+        }
+        assert any(f.asset_key == AssetKey("root") for f in first_filters)
+
+        # nothing new has been materialized, so the cached records are reused without refetching
+        # the latest materialization of each parent
+        second_tick, second_filters = _count_materialization_queries(
+            lambda: _evaluate_tick(sensor, repository_def, instance, first_tick.cursor)
+        )
+        assert not second_tick.run_requests
+        assert all(f.asset_key is None for f in second_filters)
+
+        # new materializations are picked up from the global cursor of the cached records
+        materialize(assets[:1], instance=instance)
+        third_tick, third_filters = _count_materialization_queries(
+            lambda: _evaluate_tick(sensor, repository_def, instance, first_tick.cursor)
+        )
+        assert len(third_tick.run_requests) == 1
+        assert all(f.asset_key is None for f in third_filters)
+
+        child_key = str(AssetKey("child_0"))
+        assert (
+            json.loads(third_tick.cursor)[child_key][1]
+            > json.loads(first_tick.cursor)[child_key][1]
+        )
+
+
+@pytest.mark.parametrize("num_children", [10, 200])
+def test_reconciliation_sensor_tick_queries_independent_of_graph_size(num_children):
+    assets = _fan_out_assets(num_children)
+    sensor = build_asset_reconciliation_sensor(AssetSelection.all(), name="reconciliation_sensor")
+    repository_def = _repository_def(assets, sensor)
+
+    with instance_for_test() as instance:
+        materialize(assets[:1], instance=instance)
+        first_tick = _evaluate_tick(sensor, repository_def, instance, None)
+
+        materialize(assets[:1], instance=instance)
+        _, filters = _count_materialization_queries(
+            lambda: _evaluate_tick(sensor, repository_def, instance, first_tick.cursor)
+        )
+        # a single query for the records written since the last tick, which also reads the record
+        # at the cursor of the previous tick to check that the event log hasn't been wiped
+        assert len(filters) == 1
+
+        # without runs in progress, no planned materializations are read
+        _, planned_filters = _count_materialization_queries(
+            lambda: _evaluate_tick(sensor, repository_def, instance, first_tick.cursor),
+            DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
+        )
+        assert not planned_filters
+
+
+def test_reconciliation_sensor_waits_for_in_progress_runs():
+    assets = _fan_out_assets(1)
+    sensor = build_asset_reconciliation_sensor(AssetSelection.all(), name="reconciliation_sensor")
+    repository_def = _repository_def(assets, sensor)
+
+    with instance_for_test() as instance:
+        materialize(assets[:1], instance=instance)
+
+        # the parent is being materialized again by a run in progress
+        run = create_run_for_test(
+            instance, pipeline_name="upstream_job", status=DagsterRunStatus.STARTED
+        )
+        instance.report_dagster_event(
+            DagsterEvent(
+                event_type_value=DagsterEventType.ASSET_MATERIALIZATION_PLANNED.value,
+                pipeline_name="upstream_job",
+                event_specific_data=AssetMaterializationPlannedData(AssetKey("root")),
+            ),
+            run.run_id,
+        )
+        assert not _evaluate_tick(sensor, repository_def, instance, None).run_requests
+
+        instance.report_run_failed(run)
+        tick = _evaluate_tick(sensor, repository_def, instance, None)
+        assert len(tick.run_requests) == 1
+        assert tick.run_requests[0].asset_selection == [AssetKey("child_0")]
+
+
+def test_latest_materialization_cache_detects_wiped_event_log():
+    @asset
+    def wiped():
+        return 1
+
+    @asset
+    def other():
+        return 1
+
+    with instance_for_test() as instance:
+        cache = _LatestMaterializationCache()
+        materialize([wiped], instance=instance)
+        assert AssetKey("wiped") in cache.get_latest_records(instance, {AssetKey("wiped")})
+
+        instance.wipe()
+        # the storage ids written after the wipe overtake the cursor of the cache
+        for _ in range(3):
+            materialize([other], instance=instance)
+
+        assert AssetKey("wiped") not in cache.get_latest_records(instance, {AssetKey("wiped")})
@@ -1,5 +1,6 @@
 from datetime import datetime
 from typing import cast
+from unittest import mock
 
 import pendulum
 import pytest
@@ -16,6 +17,7 @@
     monthly_partitioned_config,
     weekly_partitioned_config,
 )
+from dagster._core.definitions.partition import Partition
 from dagster._core.definitions.time_window_partitions import ScheduleType, TimeWindow
 from dagster._utils.partitions import DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE
 
@@ -347,3 +349,135 @@ def test_start_not_aligned():
         time_window("2021-05-05T07:00:00", "2021-05-06T07:00:00"),
         time_window("2021-05-06T07:00:00", "2021-05-07T07:00:00"),
     ]
+
+
+@pytest.mark.parametrize(
+    "cron_schedule, timezone",
+    [
+        ("0 * * * *", "US/Central"),
+        ("0 * * * *", "Asia/Kolkata"),
+        ("30 2 * * *", "US/Central"),
+        ("30 1 * * *", "America/New_York"),
+        ("15 3 * * 0", "Europe/Berlin"),
+        ("0 2 12 * *", "US/Central"),
+        ("0 0 31 * *", "UTC"),
+        ("*/20 * * * *", "US/Central"),
+        ("0 0 * * 1-5", "UTC"),
+    ],
+)
+def test_partitions_match_schedule_iteration(cron_schedule, timezone):
+    partitions_def = TimeWindowPartitionsDefinition(
+        start="2020-02-01-00:07",
+        fmt=DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE,
+        cron_schedule=cron_schedule,
+        timezone=timezone,
+        end_offset=1,
+    )
+    current_time = pendulum.datetime(2020, 12, 1, tz=timezone)
+
+    expected_time_windows = []
+    for window in partitions_def._iterate_time_windows(  # pylint: disable=protected-access
+        partitions_def.start
+    ):
+        expected_time_windows.append(window)
+        if window.end > current_time:
+            break
+
+    partitions = partitions_def.get_partitions(current_time)
+    assert [partition.value for partition in partitions] == expected_time_windows
+    assert [partition.name for partition in partitions] == [
+        window.start.strftime(DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE)
+        for window in expected_time_windows
+    ]
+    assert partitions_def.get_partition_keys(current_time) == [
+        partition.name for partition in partitions
+    ]
+    assert partitions_def.get_first_partition_key(current_time) == partitions[0].name
+    assert partitions_def.get_last_partition_key(current_time) == partitions[-1].name
+
+    for partition in partitions[::50]:
+        assert partitions_def.time_window_for_partition_key(partition.name) == partition.value
+
+
+def _get_partitions_by_iterating(partitions_def, current_time):
+    current_timestamp = current_time.timestamp()
+    partitions_past_current_time = 0
+    partitions = []
+    for window in partitions_def._iterate_time_windows(  # pylint: disable=protected-access
+        partitions_def.start
+    ):
+        if (
+            window.end.timestamp() <= current_timestamp
+            or partitions_past_current_time < partitions_def.end_offset
+        ):
+            partitions.append(window)
+            if window.end.timestamp() > current_timestamp:
+                partitions_past_current_time += 1
+        else:
+            break
+
+    if partitions_def.end_offset < 0:
+        partitions = partitions[: partitions_def.end_offset]
+
+    return partitions
+
+
+@pytest.mark.parametrize("timezone", ["UTC", "US/Central", "Europe/Berlin", "Asia/Kolkata"])
+@pytest.mark.parametrize(
+    "cron_schedule",
+    ["15 * * * *", "30 2 * * *", "0 0 * * 3", "45 23 5 * *", "*/20 * * * *"],
+)
+@pytest.mark.parametrize("end_offset", [-2, 0, 2])
+def test_get_partitions_matches_iterating_windows(timezone, cron_schedule, end_offset):
+    partitions_def = TimeWindowPartitionsDefinition(
+        start="2020-10-01-00:00",
+        fmt=DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE,
+        cron_schedule=cron_schedule,
+        timezone=timezone,
+        end_offset=end_offset,
+    )
+    current_time = pendulum.datetime(2021, 3, 28, 12, 30, tz=timezone)
+    expected = _get_partitions_by_iterating(partitions_def, current_time)
+
+    partitions = partitions_def.get_partitions(current_time)
+    assert len(partitions) == len(expected)
+    assert [partition.value for partition in partitions] == expected
+    assert partitions[0].value == expected[0]
+    assert partitions[-1].value == expected[-1]
+    assert [partition.value for partition in partitions[-5:]] == expected[-5:]
+    assert [partition.value for partition in partitions[10:40:7]] == expected[10:40:7]
+    assert partitions == [
+        Partition(value=window, name=window.start.strftime(DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE))
+        for window in expected
+    ]
+    with pytest.raises(IndexError):
+        partitions[len(expected)]  # pylint: disable=pointless-statement
+
+
+def test_get_partitions_is_lazy():
+    partitions_def = HourlyPartitionsDefinition(start_date="2000-01-01-00:00")
+    current_time = pendulum.datetime(2022, 1, 1, tz="UTC")
+
+    last_window = time_window("2021-12-31T23:00:00", "2022-01-01T00:00:00")
+
+    partitions = partitions_def.get_partitions(current_time)
+    with mock.patch.object(TimeWindow, "__new__", wraps=TimeWindow.__new__) as new_time_window:
+        assert partitions[-1].value == last_window
+        assert len(partitions[-24:]) == 24
+    # only the accessed partitions are created
+    assert new_time_window.call_count == 25
+
+
+def test_get_partition_keys_in_range_is_clamped_to_current_partitions():
+    partitions_def = HourlyPartitionsDefinition(start_date="2021-05-05-01:00")
+    current_time = datetime.strptime("2021-05-05-05:30", DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE)
+
+    with pendulum.test(pendulum.instance(current_time, tz="UTC")):
+        assert partitions_def.get_partition_keys_in_range(
+            PartitionKeyRange("2021-05-05-00:00", "2021-05-05-09:00")
+        ) == [
+            "2021-05-05-01:00",
+            "2021-05-05-02:00",
+            "2021-05-05-03:00",
+            "2021-05-05-04:00",
+        ]
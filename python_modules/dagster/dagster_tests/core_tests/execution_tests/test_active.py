@@ -148,3 +148,140 @@ def test_recover_in_between_steps():
                 step_key="bar_op",
             )
         )
+
+
+def define_fan_out_job():
+    @op
+    def emit():
+        return 1
+
+    @op
+    def left(num):
+        return num
+
+    @op
+    def right(num):
+        return num
+
+    @job
+    def fan_out_job():
+        emit_output = emit()
+        left(emit_output)
+        right(emit_output)
+
+    return fan_out_job
+
+
+def _output_event(job_name, step_key):
+    return DagsterEvent(
+        DagsterEventType.STEP_OUTPUT.value,
+        pipeline_name=job_name,
+        event_specific_data=StepOutputData(
+            StepOutputHandle(step_key=step_key, output_name="result")
+        ),
+        step_key=step_key,
+    )
+
+
+def _success_event(job_name, step_key):
+    return DagsterEvent(
+        DagsterEventType.STEP_SUCCESS.value,
+        pipeline_name=job_name,
+        event_specific_data=StepSuccessData(duration_ms=10.0),
+        step_key=step_key,
+    )
+
+
+def test_release_outputs_after_last_consumer():
+    fan_out_job = define_fan_out_job()
+
+    with create_execution_plan(fan_out_job).start(RetryMode.DISABLED) as active_execution:
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["emit"]
+        active_execution.handle_event(_output_event(fan_out_job.name, "emit"))
+        active_execution.handle_event(_success_event(fan_out_job.name, "emit"))
+        assert active_execution.get_outputs_to_release() == []
+
+        assert {step.key for step in active_execution.get_steps_to_execute()} == {"left", "right"}
+        active_execution.handle_event(_output_event(fan_out_job.name, "left"))
+        active_execution.handle_event(_success_event(fan_out_job.name, "left"))
+        assert active_execution.get_outputs_to_release() == []
+
+        active_execution.handle_event(_output_event(fan_out_job.name, "right"))
+        active_execution.handle_event(_success_event(fan_out_job.name, "right"))
+        assert active_execution.get_outputs_to_release() == [
+            StepOutputHandle(step_key="emit", output_name="result")
+        ]
+        assert active_execution.get_outputs_to_release() == []
+
+
+def test_retain_outputs_of_failed_consumer():
+    fan_out_job = define_fan_out_job()
+
+    with create_execution_plan(fan_out_job).start(RetryMode.DISABLED) as active_execution:
+        active_execution.get_steps_to_execute()
+        active_execution.handle_event(_output_event(fan_out_job.name, "emit"))
+        active_execution.handle_event(_success_event(fan_out_job.name, "emit"))
+
+        active_execution.get_steps_to_execute()
+        active_execution.mark_failed("left")
+        active_execution.handle_event(_output_event(fan_out_job.name, "right"))
+        active_execution.handle_event(_success_event(fan_out_job.name, "right"))
+        assert active_execution.get_outputs_to_release() == []
+
+
+def define_fan_in_job():
+    @op
+    def left():
+        return 1
+
+    @op
+    def right():
+        return 1
+
+    @op
+    def total(left_num, right_num):
+        return left_num + right_num
+
+    @job
+    def fan_in_job():
+        total(left(), right())
+
+    return fan_in_job
+
+
+def test_executable_once_all_deps_complete():
+    fan_in_job = define_fan_in_job()
+
+    with create_execution_plan(fan_in_job).start(RetryMode.DISABLED) as active_execution:
+        assert [step.key for step in active_execution.get_steps_to_execute()] == [
+            "left",
+            "right",
+        ]
+
+        active_execution.handle_event(_output_event(fan_in_job.name, "left"))
+        active_execution.handle_event(_success_event(fan_in_job.name, "left"))
+        assert active_execution.get_steps_to_execute() == []
+
+        active_execution.handle_event(_output_event(fan_in_job.name, "right"))
+        active_execution.handle_event(_success_event(fan_in_job.name, "right"))
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["total"]
+
+        active_execution.handle_event(_output_event(fan_in_job.name, "total"))
+        active_execution.handle_event(_success_event(fan_in_job.name, "total"))
+        assert active_execution.is_complete
+
+
+def test_abandon_as_soon_as_dep_fails():
+    fan_in_job = define_fan_in_job()
+
+    with create_execution_plan(fan_in_job).start(RetryMode.DISABLED) as active_execution:
+        active_execution.get_steps_to_execute()
+        active_execution.mark_failed("left")
+
+        # total is abandoned while right is still in flight
+        assert [step.key for step in active_execution.get_steps_to_abandon()] == ["total"]
+        active_execution.mark_abandoned("total")
+
+        active_execution.handle_event(_output_event(fan_in_job.name, "right"))
+        active_execution.handle_event(_success_event(fan_in_job.name, "right"))
+        assert active_execution.is_complete
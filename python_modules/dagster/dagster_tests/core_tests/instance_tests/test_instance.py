@@ -1,10 +1,12 @@
 import re
 
+import mock
 import pytest
 import yaml
 from dagster_tests.api_tests.utils import get_bar_workspace
 
 from dagster import _check as check
+from dagster import job, op
 from dagster._check import CheckError
 from dagster._config import Field
 from dagster._core.errors import (
@@ -234,11 +236,15 @@ def test_grpc_default_settings():
             instance.code_server_process_startup_timeout
             == DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT
         )
+        assert not instance.code_server_defer_job_snapshots
 
 
 def test_grpc_override_settings():
-    with instance_for_test(overrides={"code_servers": {"local_startup_timeout": 60}}) as instance:
+    with instance_for_test(
+        overrides={"code_servers": {"local_startup_timeout": 60, "defer_job_snapshots": True}}
+    ) as instance:
         assert instance.code_server_process_startup_timeout == 60
+        assert instance.code_server_defer_job_snapshots
 
 
 def test_run_monitoring(capsys):  # pylint: disable=unused-argument
@@ -291,6 +297,53 @@ def test_run_monitoring(capsys):  # pylint: disable=unused-argument
             pass
 
 
+def test_event_log_buffer():
+    @op
+    def chatty_op(context):
+        for i in range(25):
+            context.log.info(f"log {i}")
+
+    @job
+    def chatty_job():
+        chatty_op()
+
+    with instance_for_test() as instance:
+        result = chatty_job.execute_in_process(instance=instance)
+        unbuffered_logs = [
+            event.message
+            for event in instance.all_logs(result.run_id)
+            if not event.is_dagster_event
+        ]
+
+    with instance_for_test(
+        overrides={"event_log_buffer": {"enabled": True, "max_buffered_events": 10}}
+    ) as instance:
+        assert instance.event_log_buffer_enabled
+        assert instance.event_log_buffer_max_buffered_events == 10
+
+        with mock.patch.object(
+            instance, "handle_new_events", wraps=instance.handle_new_events
+        ) as handle_new_events:
+            result = chatty_job.execute_in_process(instance=instance)
+
+        assert result.success
+        assert handle_new_events.call_count < 25
+        assert max(len(call.args[0]) for call in handle_new_events.call_args_list) == 10
+
+        buffered_logs = [
+            event.message
+            for event in instance.all_logs(result.run_id)
+            if not event.is_dagster_event
+        ]
+        assert len(buffered_logs) == len(unbuffered_logs)
+        assert [log.split(" - ")[-1] for log in buffered_logs] == [
+            log.split(" - ")[-1] for log in unbuffered_logs
+        ]
+
+        # the run is marked complete as soon as the run success event is emitted
+        assert instance.get_run_by_id(result.run_id).is_finished
+
+
 def test_cancellation_thread():
     with instance_for_test(
         overrides={
@@ -21,7 +21,7 @@
     },
     "step_output_versions": []
   },
-  "pipeline_snapshot_id": "4e770878de7d4f59d0c4841924046e1310918f5b",
+  "pipeline_snapshot_id": "f91f963a2b1c41f2b867e8f7765df1b074eb80d4",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "solid_one",
@@ -155,7 +155,7 @@
     },
     "step_output_versions": []
   },
-  "pipeline_snapshot_id": "8ed9ed25f01be4b6c27ffe6d5619edbf54f7e859",
+  "pipeline_snapshot_id": "80aed4d2d5b74fbbd09f967b0c0aa0f6cda2bd2a",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "noop_solid"
@@ -218,7 +218,7 @@
     },
     "step_output_versions": []
   },
-  "pipeline_snapshot_id": "9fe072eddd35c49d2899a4d605ae231e268086db",
+  "pipeline_snapshot_id": "def60a4a3f8f5e451cd06d3ba3896addbbe7107d",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "noop_solid"
@@ -295,7 +295,7 @@
     },
     "step_output_versions": []
   },
-  "pipeline_snapshot_id": "7ff012b7ed8b0a5aeb1a53929bbd30108fe77873",
+  "pipeline_snapshot_id": "73a892a681d56e6b4426f73b4297d9b0da773e04",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "comp_1.return_one",
@@ -16,7 +16,7 @@
 from dagster._core.test_utils import in_process_test_workspace, instance_for_test
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster._legacy import ModeDefinition, PresetDefinition, daily_schedule, pipeline, solid
-from dagster._serdes import serialize_pp
+from dagster._serdes import deserialize_value, serialize_pp, serialize_value_compact
 
 
 @solid
@@ -97,6 +97,15 @@ def repo():
     snapshot.assert_match(serialize_pp(external_repo_data))
 
 
+def test_external_repository_data_compact_round_trip():
+    @repository
+    def repo():
+        return [a_pipeline, a_schedule, a_job]
+
+    external_repo_data = external_repository_data_from_def(repo)
+    assert deserialize_value(serialize_value_compact(external_repo_data)) == external_repo_data
+
+
 def test_external_pipeline_data(snapshot):
     snapshot.assert_match(serialize_pp(external_pipeline_data_from_def(a_pipeline)))
 
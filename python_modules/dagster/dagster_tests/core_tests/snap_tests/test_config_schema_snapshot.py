@@ -1,5 +1,13 @@
 from dagster import Array, Enum, EnumValue, Field, Noneable, ScalarUnion, Selector, Shape, resource
-from dagster._config import ConfigTypeKind, Map, resolve_to_config_type
+from dagster._config import (
+    ConfigTypeKind,
+    Map,
+    config_schema_snapshot_from_config_type,
+    iterate_config_types,
+    process_config,
+    resolve_to_config_type,
+    validate_config,
+)
 from dagster._core.snap import (
     ConfigEnumValueSnap,
     build_config_schema_snapshot,
@@ -410,3 +418,25 @@ def test_historical_config_type_snap(snapshot):
     old_snap = deserialize_json_to_dagster_namedtuple(old_snap_json)
 
     snapshot.assert_match(serialize_pp(old_snap))
+
+
+def test_config_schema_snapshot_cached():
+    nested_type = Shape({"inner": Field(int, default_value=1)})
+    config_type = resolve_to_config_type(
+        {"first": nested_type, "second": nested_type, "items": [nested_type]}
+    )
+
+    snapshot = config_schema_snapshot_from_config_type(config_type)
+    assert config_schema_snapshot_from_config_type(config_type) is snapshot
+    assert snapshot.get_config_snap(nested_type.key) is snap_from_config_type(nested_type)
+    assert set(snapshot.all_config_snaps_by_key.keys()) == {
+        ct.key for ct in iterate_config_types(config_type)
+    }
+
+    assert validate_config(config_type, {"first": {"inner": 2}, "items": []}).success
+    assert not validate_config(config_type, {"first": {"inner": "2"}, "items": []}).success
+    assert process_config(config_type, {"items": [{}]}).value == {
+        "first": {"inner": 1},
+        "second": {"inner": 1},
+        "items": [{"inner": 1}],
+    }
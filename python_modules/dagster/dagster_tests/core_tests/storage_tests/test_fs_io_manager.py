@@ -82,6 +82,20 @@ def test_fs_io_manager():
             assert pickle.load(read_obj) == 1
 
 
+def test_fs_io_manager_release_outputs():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        io_manager = fs_io_manager.configured({"base_dir": tmpdir_path, "release_outputs": True})
+        pipeline_def = define_pipeline(io_manager)
+
+        result = execute_pipeline(pipeline_def)
+        assert result.success
+
+        # solid_a's output is deleted once solid_b has loaded it, but solid_b's output has no
+        # downstream ops and is kept
+        assert not os.path.exists(os.path.join(tmpdir_path, result.run_id, "solid_a", "result"))
+        assert os.path.isfile(os.path.join(tmpdir_path, result.run_id, "solid_b", "result"))
+
+
 def test_fs_io_manager_base_dir():
     with tempfile.TemporaryDirectory() as tmpdir_path:
         instance = DagsterInstance.ephemeral(tempdir=tmpdir_path)
@@ -19,10 +19,12 @@
     MetadataEntry,
     Nothing,
     Out,
+    asset,
     build_input_context,
     build_output_context,
     graph,
     job,
+    materialize,
     op,
     resource,
 )
@@ -516,6 +518,139 @@ def test_mem_io_manager_execution():
     assert mem_io_manager_instance.load_input(input_context) == 1
 
 
+def test_release_output():
+    released = []
+
+    class ReleasingIOManager(InMemoryIOManager):
+        def release_output(self, context):
+            released.append(context.step_key)
+            super().release_output(context)
+
+    io_manager_instance = ReleasingIOManager(release_outputs=True)
+
+    @op
+    def emit():
+        return 1
+
+    @op
+    def add_one(num):
+        return num + 1
+
+    @op
+    def total(left, right):
+        return left + right
+
+    @job(
+        resource_defs={"io_manager": IOManagerDefinition.hardcoded_io_manager(io_manager_instance)}
+    )
+    def fan_out_job():
+        num = emit()
+        total(add_one.alias("left")(num), add_one.alias("right")(num))
+
+    result = fan_out_job.execute_in_process()
+    assert result.success
+    assert result.output_for_node("total") == 4
+    assert sorted(released) == ["emit", "left", "right"]
+    assert list(io_manager_instance.values.keys()) == [(result.run_id, "total", "result")]
+
+
+def test_mem_io_manager_keeps_outputs_by_default():
+    io_manager_instance = InMemoryIOManager()
+
+    @op
+    def emit():
+        return 1
+
+    @op
+    def add_one(num):
+        return num + 1
+
+    @job(
+        resource_defs={"io_manager": IOManagerDefinition.hardcoded_io_manager(io_manager_instance)}
+    )
+    def chained_job():
+        add_one(emit())
+
+    result = chained_job.execute_in_process()
+    assert result.success
+    assert sorted(io_manager_instance.values.values()) == [1, 2]
+
+
+def test_execute_in_process_releases_default_io_manager_outputs():
+    released = []
+
+    def _release_output(self, context):
+        released.append((context.step_key, self.release_outputs))
+
+    @op
+    def emit():
+        return 1
+
+    @op
+    def add_one(num):
+        return num + 1
+
+    @job
+    def chained_job():
+        add_one(emit())
+
+    with mock.patch.object(InMemoryIOManager, "release_output", _release_output):
+        assert chained_job.execute_in_process().success
+
+    assert released == [("emit", True)]
+
+
+def test_release_output_keeps_assets():
+    io_manager_instance = InMemoryIOManager(release_outputs=True)
+
+    @asset
+    def upstream():
+        return 1
+
+    @asset
+    def downstream(upstream):
+        return upstream + 1
+
+    result = materialize(
+        [upstream, downstream],
+        resources={"io_manager": IOManagerDefinition.hardcoded_io_manager(io_manager_instance)},
+    )
+    assert result.success
+    assert sorted(io_manager_instance.values.values()) == [1, 2]
+
+
+def test_release_output_retained_on_failure():
+    released = []
+
+    class ReleasingIOManager(InMemoryIOManager):
+        def release_output(self, context):
+            released.append(context.step_key)
+
+    @op
+    def emit():
+        return 1
+
+    @op
+    def passes(num):
+        return num
+
+    @op
+    def fails(_num):
+        raise Exception("boom")
+
+    @job(
+        resource_defs={"io_manager": IOManagerDefinition.hardcoded_io_manager(ReleasingIOManager())}
+    )
+    def failing_job():
+        num = emit()
+        passes(num)
+        fails(num)
+
+    result = failing_job.execute_in_process(raise_on_error=False)
+    assert not result.success
+    assert released == []
+
+
 def test_io_manager_resources_on_context():
     @resource
     def foo_resource(_):
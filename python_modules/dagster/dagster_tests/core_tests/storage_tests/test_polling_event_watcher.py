@@ -1,4 +1,5 @@
 import tempfile
+import threading
 import time
 from contextlib import contextmanager
 from typing import Callable, Union
@@ -129,3 +130,82 @@ def watch_two(event, _cursor):
 
         assert [int(evt.message) for evt in watched_1] == [2, 3, 4]
         assert [int(evt.message) for evt in watched_2] == [4, 5]
+
+
+def test_watch_multiple_runs_with_shared_thread():
+    with create_sqlite_run_event_logstorage() as storage:
+        run_ids = ["foo", "bar", "baz"]
+        watched = {run_id: [] for run_id in run_ids}
+
+        def _watch_fn(run_id):
+            def _watch(event, _cursor):
+                watched[run_id].append(event)
+
+            return _watch
+
+        watch_fns = {run_id: _watch_fn(run_id) for run_id in run_ids}
+        threads_before = set(threading.enumerate())
+        for run_id in run_ids:
+            storage.watch(run_id, None, watch_fns[run_id])
+
+        # all of the watched runs are served by one polling thread
+        watcher_threads = list(set(threading.enumerate()) - threads_before)
+        assert len(watcher_threads) == 1
+
+        for count in range(3):
+            for run_id in run_ids:
+                storage.store_event(create_event(count, run_id=run_id))
+
+        attempts = 10
+        while any(len(events) < 3 for events in watched.values()) and attempts > 0:
+            time.sleep(0.1)
+            attempts -= 1
+
+        for run_id in run_ids:
+            assert [int(evt.message) for evt in watched[run_id]] == [0, 1, 2]
+            assert all(evt.run_id == run_id for evt in watched[run_id])
+            storage.end_watch(run_id, watch_fns[run_id])
+
+        storage.dispose()
+        for thread in watcher_threads:
+            thread.join(timeout=5)
+            assert not thread.is_alive()
+
+
+def test_watch_from_earlier_cursor():
+    with create_sqlite_run_event_logstorage() as storage:
+        watched_1 = []
+        watched_2 = []
+
+        def watch_one(event, _cursor):
+            watched_1.append(event)
+
+        def watch_two(event, _cursor):
+            watched_2.append(event)
+
+        storage.watch(RUN_ID, None, watch_one)
+        for count in range(1, 4):
+            storage.store_event(create_event(count))
+
+        attempts = 10
+        while len(watched_1) < 3 and attempts > 0:
+            time.sleep(0.1)
+            attempts -= 1
+        assert [int(evt.message) for evt in watched_1] == [1, 2, 3]
+
+        # the second subscriber starts from a cursor behind the events already fetched for the run
+        storage.watch(RUN_ID, str(EventLogCursor.from_storage_id(1)), watch_two)
+        storage.store_event(create_event(4))
+
+        attempts = 10
+        while (len(watched_1) < 4 or len(watched_2) < 3) and attempts > 0:
+            time.sleep(0.1)
+            attempts -= 1
+
+        # wait for another poll to check that no event is delivered twice
+        time.sleep(0.3)
+        storage.end_watch(RUN_ID, watch_one)
+        storage.end_watch(RUN_ID, watch_two)
+
+        assert [int(evt.message) for evt in watched_1] == [1, 2, 3, 4]
+        assert [int(evt.message) for evt in watched_2] == [2, 3, 4]
@@ -400,6 +400,95 @@ def test_event_log_storage_store_events_and_wipe(self, test_run_id, storage):
             storage.wipe()
             assert len(storage.get_logs_for_run(test_run_id)) == 0
 
+    def test_event_log_storage_store_events_batch(self, instance, storage):
+        runs = ["foo", "bar"]
+        if instance:
+            for run in runs:
+                create_run_for_test(instance, run_id=run)
+
+        asset_key = AssetKey(["batch_asset"])
+        events = []
+        for i in range(3):
+            for run_id in runs:
+                events.append(
+                    EventLogEntry(
+                        error_info=None,
+                        level="debug",
+                        user_message=f"message {i}",
+                        run_id=run_id,
+                        timestamp=time.time(),
+                    )
+                )
+        events.append(
+            EventLogEntry(
+                error_info=None,
+                level="debug",
+                user_message="",
+                run_id="foo",
+                timestamp=time.time(),
+                step_key="materialize_one",
+                pipeline_name="nonce",
+                dagster_event=DagsterEvent(
+                    DagsterEventType.ASSET_MATERIALIZATION.value,
+                    "nonce",
+                    event_specific_data=StepMaterializationData(
+                        AssetMaterialization(asset_key=asset_key)
+                    ),
+                ),
+            )
+        )
+
+        storage.store_events(events)
+
+        foo_logs = storage.get_logs_for_run("foo")
+        assert [log.user_message for log in foo_logs[:3]] == [
+            "message 0",
+            "message 1",
+            "message 2",
+        ]
+        assert len(foo_logs) == 4
+        assert foo_logs[3].dagster_event.asset_key == asset_key
+
+        bar_logs = storage.get_logs_for_run("bar")
+        assert [log.user_message for log in bar_logs] == ["message 0", "message 1", "message 2"]
+
+        assert storage.has_asset_key(asset_key)
+        latest_events = storage.get_latest_materialization_events([asset_key])
+        assert latest_events[asset_key].run_id == "foo"
+
+    def test_get_records_for_runs(self, instance, storage):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("This test is for SQL-backed Event Log behavior")
+
+        runs = ["foo", "bar", "baz"]
+        if instance:
+            for run in runs:
+                create_run_for_test(instance, run_id=run)
+
+        for i in range(3):
+            for run_id in runs:
+                storage.store_event(
+                    EventLogEntry(
+                        error_info=None,
+                        level="debug",
+                        user_message=str(i),
+                        run_id=run_id,
+                        timestamp=time.time(),
+                    )
+                )
+
+        foo_records = storage.get_records_for_run("foo").records
+        records = storage.get_records_for_runs({"foo": foo_records[0].storage_id, "bar": -1})
+
+        records_by_run = {}
+        for record in records:
+            records_by_run.setdefault(record.event_log_entry.run_id, []).append(record)
+
+        assert set(records_by_run.keys()) == {"foo", "bar"}
+        assert [r.event_log_entry.user_message for r in records_by_run["foo"]] == ["1", "2"]
+        assert [r.event_log_entry.user_message for r in records_by_run["bar"]] == ["0", "1", "2"]
+        assert storage.get_records_for_runs({}) == []
+
     def test_event_log_storage_store_with_multiple_runs(self, instance, storage):
         runs = ["foo", "bar", "baz"]
         if instance:
@@ -16,6 +16,7 @@
 from dagster._core.execution.backfill import BulkActionStatus, PartitionBackfill
 from dagster._core.host_representation import (
     ExternalRepositoryOrigin,
+    InstigatorSelector,
     ManagedGrpcPythonEnvRepositoryLocationOrigin,
 )
 from dagster._core.instance import DagsterInstance, InstanceType
@@ -26,10 +27,12 @@
 from dagster._core.storage.noop_compute_log_manager import NoOpComputeLogManager
 from dagster._core.storage.pipeline_run import (
     DagsterRun,
+    InstigatorRunKey,
     JobBucket,
     PipelineRunStatus,
     RunsFilter,
     TagBucket,
+    schedule_run_key,
 )
 from dagster._core.storage.root import LocalArtifactStorage
 from dagster._core.storage.runs.migration import REQUIRED_DATA_MIGRATIONS
@@ -38,14 +41,19 @@
     PARENT_RUN_ID_TAG,
     PARTITION_NAME_TAG,
     PARTITION_SET_TAG,
+    PRIORITY_TAG,
     REPOSITORY_LABEL_TAG,
     ROOT_RUN_ID_TAG,
+    RUN_KEY_TAG,
+    SCHEDULED_EXECUTION_TIME_TAG,
+    SCHEDULE_NAME_TAG,
+    SENSOR_NAME_TAG,
 )
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster._core.utils import make_new_run_id
 from dagster._daemon.daemon import SensorDaemon
 from dagster._daemon.types import DaemonHeartbeat
-from dagster._serdes import serialize_pp
+from dagster._serdes import create_snapshot_id, serialize_pp
 from dagster._seven.compat.pendulum import create_pendulum_time, to_timezone
 
 win_py36 = _seven.IS_WINDOWS and sys.version_info[0] == 3 and sys.version_info[1] == 6
@@ -146,6 +154,34 @@ def test_basic_storage(self, storage):
         assert fetched_run.run_id == run_id
         assert fetched_run.pipeline_name == "some_pipeline"
 
+    def test_add_runs(self, storage):
+        assert storage
+        one = make_new_run_id()
+        two = make_new_run_id()
+        added = storage.add_runs(
+            [
+                TestRunStorage.build_run(run_id=one, pipeline_name="foo", tags={"tag": "one"}),
+                TestRunStorage.build_run(run_id=two, pipeline_name="bar", tags={"tag": "two"}),
+            ]
+        )
+        assert [run.run_id for run in added] == [one, two]
+        assert {run.run_id for run in storage.get_runs()} == {one, two}
+        assert storage.get_run_by_id(two).pipeline_name == "bar"
+        assert [run.run_id for run in storage.get_runs(RunsFilter(tags={"tag": "one"}))] == [one]
+
+        three = make_new_run_id()
+        with pytest.raises(DagsterRunAlreadyExists):
+            storage.add_runs(
+                [
+                    TestRunStorage.build_run(run_id=three, pipeline_name="foo"),
+                    TestRunStorage.build_run(run_id=one, pipeline_name="foo"),
+                ]
+            )
+        if isinstance(storage, SqlRunStorage):
+            # sql storages add the runs in a single transaction, so none of them were added
+            assert not storage.has_run(three)
+            assert storage.get_runs_count() == 2
+
     def test_clear(self, storage):
         if not self.can_delete_runs():
             pytest.skip("storage cannot delete")
@@ -508,6 +544,89 @@ def test_fetch_count_by_tag(self, storage):
 
         assert storage.get_run_tags() == [("mytag", {"hello", "goodbye"}), ("mytag2", {"world"})]
 
+    def test_fetch_run_tag_counts(self, storage):
+        assert storage
+        for tags, status in [
+            ({"mytag": "hello", "mytag2": "world"}, PipelineRunStatus.STARTED),
+            ({"mytag": "goodbye", "mytag2": "world"}, PipelineRunStatus.STARTED),
+            ({"mytag": "hello"}, PipelineRunStatus.STARTED),
+            ({"mytag": "hello"}, PipelineRunStatus.SUCCESS),
+            ({"othertag": "hello"}, PipelineRunStatus.STARTED),
+        ]:
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=make_new_run_id(),
+                    pipeline_name="some_pipeline",
+                    tags=tags,
+                    status=status,
+                )
+            )
+
+        started_filter = RunsFilter(statuses=[PipelineRunStatus.STARTED])
+        assert dict(storage.get_run_tag_counts(started_filter, ["mytag", "mytag2"])) == {
+            ("mytag", "hello"): 2,
+            ("mytag", "goodbye"): 1,
+            ("mytag2", "world"): 2,
+        }
+        assert dict(storage.get_run_tag_counts(RunsFilter(), ["mytag"])) == {
+            ("mytag", "hello"): 3,
+            ("mytag", "goodbye"): 1,
+        }
+        assert not storage.get_run_tag_counts(started_filter, [])
+
+    def test_fetch_by_priority(self, storage):
+        assert storage
+        run_ids_by_priority = [
+            ("no_priority", None),
+            ("high_priority", "5"),
+            ("malformed_priority", "foobar"),
+            ("low_priority", "-1"),
+            ("high_priority_2", "5"),
+            ("zero_priority", "0"),
+        ]
+        run_ids = {}
+        for name, priority in run_ids_by_priority:
+            run_ids[name] = make_new_run_id()
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=run_ids[name],
+                    pipeline_name="some_pipeline",
+                    tags={PRIORITY_TAG: priority} if priority is not None else None,
+                    status=PipelineRunStatus.NOT_STARTED,
+                )
+            )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=make_new_run_id(),
+                pipeline_name="some_pipeline",
+                tags={PRIORITY_TAG: "10"},
+                status=PipelineRunStatus.STARTED,
+            )
+        )
+
+        not_started_filter = RunsFilter(statuses=[PipelineRunStatus.NOT_STARTED])
+        expected_order = [
+            run_ids[name]
+            for name in [
+                "high_priority",
+                "high_priority_2",
+                "no_priority",
+                "malformed_priority",
+                "zero_priority",
+                "low_priority",
+            ]
+        ]
+        assert [
+            run.run_id for run in storage.get_runs_by_priority(not_started_filter)
+        ] == expected_order
+        assert [
+            run.run_id for run in storage.get_runs_by_priority(not_started_filter, limit=2)
+        ] == expected_order[:2]
+        assert [
+            run.run_id
+            for run in storage.get_runs_by_priority(not_started_filter, limit=3, offset=2)
+        ] == expected_order[2:5]
+
     def test_fetch_by_tags(self, storage):
         assert storage
         one = make_new_run_id()
@@ -1548,3 +1667,76 @@ def test_migrate_repo(self, storage):
         )
         assert len(two_runs) == 1
         assert two_runs[0].run_id == one
+
+    def test_instigator_run_keys(self, storage):
+        if not storage.supports_instigator_run_keys():
+            pytest.skip("storage cannot index instigator run keys")
+
+        job_name = "some_job"
+        origin = self.fake_job_origin(job_name)
+        location_name = origin.external_repository_origin.repository_location_origin.location_name
+        sensor_selector_id = create_snapshot_id(
+            InstigatorSelector(location_name, "fake_repo_name", "my_sensor")
+        )
+        schedule_selector_id = create_snapshot_id(
+            InstigatorSelector(location_name, "fake_repo_name", "my_schedule")
+        )
+
+        def _add_run(tags, external_pipeline_origin=origin):
+            run_id = make_new_run_id()
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=run_id,
+                    pipeline_name=job_name,
+                    tags=tags,
+                    external_pipeline_origin=external_pipeline_origin,
+                )
+            )
+            return run_id
+
+        one = _add_run({SENSOR_NAME_TAG: "my_sensor", RUN_KEY_TAG: "one"})
+        # the first run launched for a run key is returned
+        _add_run({SENSOR_NAME_TAG: "my_sensor", RUN_KEY_TAG: "one"})
+        two = _add_run({SENSOR_NAME_TAG: "my_sensor", RUN_KEY_TAG: "two"})
+        _add_run({SENSOR_NAME_TAG: "other_sensor", RUN_KEY_TAG: "three"})
+        _add_run(
+            {SENSOR_NAME_TAG: "my_sensor", RUN_KEY_TAG: "four"},
+            self.fake_job_origin(job_name, "other_repo"),
+        )
+        _add_run({SENSOR_NAME_TAG: "my_sensor"})
+        scheduled_execution_time = "2022-01-01T00:00:00+00:00"
+        scheduled = _add_run(
+            {
+                SCHEDULE_NAME_TAG: "my_schedule",
+                SCHEDULED_EXECUTION_TIME_TAG: scheduled_execution_time,
+            }
+        )
+
+        assert storage.get_instigator_run_keys(
+            sensor_selector_id, ["one", "two", "three", "four", "five"]
+        ) == {
+            "one": InstigatorRunKey("one", one, PipelineRunStatus.NOT_STARTED),
+            "two": InstigatorRunKey("two", two, PipelineRunStatus.NOT_STARTED),
+        }
+        assert storage.get_instigator_run_keys(sensor_selector_id, []) == {}
+
+        storage.handle_run_event(
+            two,
+            DagsterEvent(
+                message="a message",
+                event_type_value=DagsterEventType.PIPELINE_START.value,
+                pipeline_name=job_name,
+            ),
+        )
+        assert storage.get_instigator_run_keys(sensor_selector_id, ["two"]) == {
+            "two": InstigatorRunKey("two", two, PipelineRunStatus.STARTED),
+        }
+
+        run_key = schedule_run_key(scheduled_execution_time)
+        assert storage.get_instigator_run_keys(
+            schedule_selector_id, [run_key, schedule_run_key(scheduled_execution_time, "one")]
+        ) == {run_key: InstigatorRunKey(run_key, scheduled, PipelineRunStatus.NOT_STARTED)}
+
+        if self.can_delete_runs():
+            storage.delete_run(two)
+            assert storage.get_instigator_run_keys(sensor_selector_id, ["two"]) == {}
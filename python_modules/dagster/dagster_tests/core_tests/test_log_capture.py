@@ -1,3 +1,4 @@
+import os
 import sys
 
 import pytest
@@ -5,6 +6,7 @@
 from dagster._core.execution.compute_logs import (
     mirror_stream_to_file,
     should_disable_io_stream_redirect,
+    tee_stream_to_file,
 )
 from dagster._utils.test import get_temp_file_name
 
@@ -19,3 +21,22 @@ def test_capture():
 
         with open(capture_filepath, "r", encoding="utf8") as capture_stream:
             assert "HELLO" in capture_stream.read()
+
+
+@pytest.mark.skipif(
+    should_disable_io_stream_redirect(), reason="compute logs disabled for win / py3.6+"
+)
+def test_tee_capture():
+    with get_temp_file_name() as outer_filepath, get_temp_file_name() as inner_filepath:
+        with tee_stream_to_file(sys.stdout, outer_filepath):
+            print("OUTER")  # pylint: disable=print-call
+            with tee_stream_to_file(sys.stdout, inner_filepath):
+                print("INNER")  # pylint: disable=print-call
+                sys.stdout.flush()
+                os.write(sys.stdout.fileno(), b"FROM FD\n")
+
+        with open(outer_filepath, "r", encoding="utf8") as capture_stream:
+            assert capture_stream.read().split() == ["OUTER", "INNER", "FROM", "FD"]
+
+        with open(inner_filepath, "r", encoding="utf8") as capture_stream:
+            assert capture_stream.read().split() == ["INNER", "FROM", "FD"]
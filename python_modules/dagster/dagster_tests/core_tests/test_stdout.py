@@ -199,6 +199,59 @@ def test_compute_log_manager_subscription_updates():
         assert last_chunk.cursor > 0
 
 
+@pytest.mark.skipif(
+    should_disable_io_stream_redirect(), reason="compute logs disabled for win / py3.6+"
+)
+def test_compute_log_manager_shared_subscription_updates():
+    from dagster._core.storage.local_compute_log_manager import LocalComputeLogManager
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        compute_log_manager = LocalComputeLogManager(temp_dir, polling_timeout=0.5)
+        run_id = "fake_run_id"
+        stdout_path = compute_log_manager.get_local_path(run_id, "spew", ComputeIOType.STDOUT)
+        other_path = compute_log_manager.get_local_path(run_id, "other", ComputeIOType.STDOUT)
+        ensure_dir(os.path.dirname(stdout_path))
+        touch_file(stdout_path)
+        touch_file(other_path)
+
+        first = []
+        second = []
+        other = []
+        compute_log_manager.observable(run_id, "spew", ComputeIOType.STDOUT).subscribe(first.append)
+        compute_log_manager.observable(run_id, "spew", ComputeIOType.STDOUT).subscribe(
+            second.append
+        )
+        compute_log_manager.observable(run_id, "other", ComputeIOType.STDOUT).subscribe(
+            other.append
+        )
+
+        with open(stdout_path, "a+", encoding="utf8") as f:
+            print(HELLO_SOLID, file=f)  # pylint:disable=print-call
+        time.sleep(1)
+
+        with open(stdout_path, "a+", encoding="utf8") as f:
+            print(HELLO_SOLID, file=f)  # pylint:disable=print-call
+        time.sleep(1)
+
+        # only the appended bytes are pushed, to both subscribers of the step
+        for messages in [first, second]:
+            assert len(messages) == 3
+            assert [message.data.strip() for message in messages[1:]] == [HELLO_SOLID] * 2
+            assert messages[1].cursor < messages[2].cursor
+
+        # subscribers to other steps in the same run are not notified
+        assert len(other) == 1
+
+        touch_file(compute_log_manager.complete_artifact_path(run_id, "spew"))
+        time.sleep(1)
+        with open(stdout_path, "a+", encoding="utf8") as f:
+            print(HELLO_SOLID, file=f)  # pylint:disable=print-call
+        time.sleep(1)
+        assert len(first) == 3
+
+        compute_log_manager.dispose()
+
+
 def gen_solid_name(length):
     return "".join(random.choice(string.ascii_lowercase) for x in range(length))
 
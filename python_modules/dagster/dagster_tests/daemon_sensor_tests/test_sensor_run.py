@@ -45,7 +45,12 @@
 from dagster._core.execution.api import execute_pipeline
 from dagster._core.host_representation import ExternalInstigatorOrigin, ExternalRepositoryOrigin
 from dagster._core.instance import DagsterInstance
-from dagster._core.scheduler.instigation import InstigatorState, InstigatorStatus, TickStatus
+from dagster._core.scheduler.instigation import (
+    InstigatorState,
+    InstigatorStatus,
+    LatencyHistogram,
+    TickStatus,
+)
 from dagster._core.storage.event_log.base import EventRecordsFilter
 from dagster._core.test_utils import (
     SingleThreadPoolExecutor,
@@ -54,7 +59,12 @@
     wait_for_futures,
 )
 from dagster._daemon import get_default_daemon_logger
-from dagster._daemon.sensor import execute_sensor_iteration, execute_sensor_iteration_loop
+from dagster._daemon.sensor import (
+    SensorProcessPool,
+    SkippedTickBatch,
+    execute_sensor_iteration,
+    execute_sensor_iteration_loop,
+)
 from dagster._legacy import pipeline, solid
 from dagster._seven.compat.pendulum import create_pendulum_time, to_timezone
 
@@ -2629,3 +2639,112 @@ def test_repository_namespacing(executor):
                 external_sensor.get_external_origin_id(), external_sensor.selector_id
             )
             assert len(ticks) == 2
+
+
+def test_latency_histogram():
+    histogram = LatencyHistogram(bucket_bounds=[1, 10])
+    assert histogram.bucket_counts == [0, 0, 0]
+    assert histogram.mean_seconds is None
+
+    histogram = histogram.with_latency(0.5).with_latency(1).with_latency(2).with_latency(20)
+    assert histogram.bucket_counts == [2, 1, 1]
+    assert histogram.count == 4
+    assert histogram.mean_seconds == 23.5 / 4
+
+
+def test_sensor_process_pool(instance, workspace_context, external_repo):
+    external_sensor = external_repo.get_external_sensor("always_on_sensor")
+    instance.add_instigator_state(
+        InstigatorState(
+            external_sensor.get_external_origin(),
+            InstigatorType.SENSOR,
+            InstigatorStatus.RUNNING,
+        )
+    )
+
+    with SensorProcessPool(
+        instance.get_ref(), num_workers=2, max_concurrent_evaluations_per_location=1
+    ) as process_pool:
+        futures = {}
+        list(
+            execute_sensor_iteration(
+                workspace_context,
+                get_default_daemon_logger("SensorDaemon"),
+                sensor_tick_futures=futures,
+                process_pool=process_pool,
+                location_limiter=process_pool.location_limiter,
+            )
+        )
+        assert external_sensor.selector_id in futures
+        wait_for_futures(futures, timeout=75)
+
+    assert instance.get_runs_count() == 1
+    validate_run_started(instance.get_runs()[0])
+
+    ticks = instance.get_ticks(
+        external_sensor.get_external_origin_id(), external_sensor.selector_id
+    )
+    assert len(ticks) == 1
+    assert ticks[0].status == TickStatus.SUCCESS
+    assert ticks[0].evaluation_latency_histogram.count == 1
+
+
+@pytest.mark.parametrize("threaded", [False, True])
+def test_sensor_coalesce_skipped_ticks(workspace_context, external_repo, threaded):
+    freeze_datetime = to_timezone(
+        create_pendulum_time(year=2019, month=2, day=27, hour=23, minute=59, second=58, tz="UTC"),
+        "US/Central",
+    )
+    with instance_for_test(
+        overrides={
+            "sensors": {"coalesce_skipped_ticks": True},
+            "run_launcher": {"module": "dagster._core.test_utils", "class": "MockedRunLauncher"},
+        },
+    ) as instance:
+        coalesce_ws_ctx = workspace_context.copy_for_test_instance(instance)
+        external_sensor = external_repo.get_external_sensor("simple_sensor")
+        instance.add_instigator_state(
+            InstigatorState(
+                external_sensor.get_external_origin(),
+                InstigatorType.SENSOR,
+                InstigatorStatus.RUNNING,
+            )
+        )
+        skipped_tick_batch = SkippedTickBatch()
+        executor = SingleThreadPoolExecutor() if threaded else None
+
+        def _evaluate_and_flush():
+            futures = {}
+            list(
+                execute_sensor_iteration(
+                    coalesce_ws_ctx,
+                    get_default_daemon_logger("SensorDaemon"),
+                    threadpool_executor=executor,
+                    sensor_tick_futures=futures,
+                    skipped_tick_batch=skipped_tick_batch,
+                )
+            )
+            # ticks evaluated in threads are only added to the batch once their futures finish, so
+            # the batch is flushed after waiting for them, as at the end of a daemon iteration
+            wait_for_futures(futures, timeout=75)
+            skipped_tick_batch.flush(instance)
+            return instance.get_ticks(
+                external_sensor.get_external_origin_id(), external_sensor.selector_id
+            )
+
+        # the sensor skips while its last tick was at an even second, and each skip after the first
+        # is folded into it
+        for i, seconds in enumerate([0, 30, 31]):
+            freeze_datetime = freeze_datetime.add(seconds=seconds)
+            with pendulum.test(freeze_datetime):
+                ticks = _evaluate_and_flush()
+                assert len(ticks) == 1
+                validate_tick(ticks[0], external_sensor, freeze_datetime, TickStatus.SKIPPED)
+                assert (ticks[0].skipped_tick_count or 1) == i + 1
+
+        freeze_datetime = freeze_datetime.add(seconds=30)
+        with pendulum.test(freeze_datetime):
+            ticks = _evaluate_and_flush()
+            assert len(ticks) == 2
+            validate_tick(ticks[0], external_sensor, freeze_datetime, TickStatus.SUCCESS)
+            assert ticks[1].skipped_tick_count == 3
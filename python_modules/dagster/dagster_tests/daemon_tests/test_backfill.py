@@ -3,6 +3,7 @@
 import string
 import sys
 import time
+from unittest import mock
 
 import pendulum
 import pytest
@@ -24,14 +25,32 @@
     repository,
 )
 from dagster._core.definitions import Partition, PartitionSetDefinition, StaticPartitionsDefinition
+from dagster._core.definitions.partition_key_range import PartitionKeyRange
 from dagster._core.execution.api import execute_pipeline
+from dagster._core.execution.asset_backfill import (
+    AssetBackfillRun,
+    build_asset_backfill,
+    plan_asset_backfill,
+)
 from dagster._core.execution.backfill import BulkActionStatus, PartitionBackfill
 from dagster._core.host_representation import (
     ExternalRepositoryOrigin,
     InProcessRepositoryLocationOrigin,
 )
+from dagster._core.host_representation.external_data import (
+    ExternalAssetDependency,
+    ExternalAssetNode,
+    ExternalStaticPartitionsDefinitionData,
+)
+from dagster._core.instance import DagsterInstance
 from dagster._core.storage.pipeline_run import PipelineRunStatus, RunsFilter
-from dagster._core.storage.tags import BACKFILL_ID_TAG, PARTITION_NAME_TAG, PARTITION_SET_TAG
+from dagster._core.storage.tags import (
+    ASSET_PARTITION_RANGE_END_TAG,
+    ASSET_PARTITION_RANGE_START_TAG,
+    BACKFILL_ID_TAG,
+    PARTITION_NAME_TAG,
+    PARTITION_SET_TAG,
+)
 from dagster._core.test_utils import step_did_not_run, step_failed, step_succeeded
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster._daemon import get_default_daemon_logger
@@ -324,6 +343,45 @@ def test_simple_backfill(instance, workspace_context, external_repo):
     assert three.tags[PARTITION_NAME_TAG] == "three"
 
 
+def test_backfill_reuses_execution_plan(instance, workspace_context, external_repo):
+    external_partition_set = external_repo.get_external_partition_set("simple_partition_set")
+    instance.add_backfill(
+        PartitionBackfill(
+            backfill_id="simple",
+            partition_set_origin=external_partition_set.get_external_origin(),
+            status=BulkActionStatus.REQUESTED,
+            partition_names=["one", "two", "three"],
+            from_failure=False,
+            reexecution_steps=None,
+            tags=None,
+            backfill_timestamp=pendulum.now().timestamp(),
+        )
+    )
+
+    location_class = type(
+        workspace_context.create_request_context().get_repository_location(
+            external_repo.handle.location_name
+        )
+    )
+    with mock.patch.object(
+        location_class,
+        "get_external_execution_plan",
+        autospec=True,
+        side_effect=location_class.get_external_execution_plan,
+    ) as get_external_execution_plan:
+        list(
+            execute_backfill_iteration(
+                workspace_context, get_default_daemon_logger("BackfillDaemon")
+            )
+        )
+
+    # the partitions all have the same run config, so they share a single execution plan
+    assert get_external_execution_plan.call_count == 1
+    runs = instance.get_runs()
+    assert len(runs) == 3
+    assert len({run.execution_plan_snapshot_id for run in runs}) == 1
+
+
 def test_canceled_backfill(instance, workspace_context, external_repo):
     external_partition_set = external_repo.get_external_partition_set("simple_partition_set")
     instance.add_backfill(
@@ -354,6 +412,79 @@ def test_canceled_backfill(instance, workspace_context, external_repo):
     assert instance.get_runs_count() == 1
 
 
+def test_canceled_backfill_deletes_unsubmitted_runs(instance, workspace_context, external_repo):
+    external_partition_set = external_repo.get_external_partition_set("simple_partition_set")
+    instance.add_backfill(
+        PartitionBackfill(
+            backfill_id="simple",
+            partition_set_origin=external_partition_set.get_external_origin(),
+            status=BulkActionStatus.REQUESTED,
+            partition_names=["one", "two", "three"],
+            from_failure=False,
+            reexecution_steps=None,
+            tags=None,
+            backfill_timestamp=pendulum.now().timestamp(),
+        )
+    )
+
+    iterator = execute_backfill_iteration(
+        workspace_context, get_default_daemon_logger("BackfillDaemon")
+    )
+    # the run of the first partition is created on its own, and the next two together
+    while instance.get_runs_count() < 3:
+        next(iterator)
+    backfill = instance.get_backfill("simple")
+    instance.update_backfill(backfill.with_status(BulkActionStatus.CANCELED))
+    list(iterator)
+
+    # the run that was created for the last partition was never submitted
+    assert instance.get_runs_count() == 2
+    assert sorted(run.tags[PARTITION_NAME_TAG] for run in instance.get_runs()) == ["one", "two"]
+
+
+def test_backfill_resumes_unsubmitted_runs(instance, workspace_context, external_repo):
+    external_partition_set = external_repo.get_external_partition_set("simple_partition_set")
+    instance.add_backfill(
+        PartitionBackfill(
+            backfill_id="simple",
+            partition_set_origin=external_partition_set.get_external_origin(),
+            status=BulkActionStatus.REQUESTED,
+            partition_names=["one", "two", "three"],
+            from_failure=False,
+            reexecution_steps=None,
+            tags=None,
+            backfill_timestamp=pendulum.now().timestamp(),
+        )
+    )
+
+    submit_run = DagsterInstance.submit_run
+
+    def _interrupt_second_submit(self, run_id, workspace):
+        if self.get_runs_count(RunsFilter(statuses=[PipelineRunStatus.SUCCESS])) == 1:
+            raise KeyboardInterrupt()
+        return submit_run(self, run_id, workspace)
+
+    # the daemon is interrupted after creating the runs of the last two partitions, before
+    # submitting them
+    with mock.patch.object(
+        DagsterInstance, "submit_run", autospec=True, side_effect=_interrupt_second_submit
+    ):
+        with pytest.raises(KeyboardInterrupt):
+            list(
+                execute_backfill_iteration(
+                    workspace_context, get_default_daemon_logger("BackfillDaemon")
+                )
+            )
+    assert instance.get_runs_count() == 3
+    assert instance.get_runs_count(RunsFilter(statuses=[PipelineRunStatus.NOT_STARTED])) == 2
+
+    list(execute_backfill_iteration(workspace_context, get_default_daemon_logger("BackfillDaemon")))
+    assert instance.get_backfill("simple").status == BulkActionStatus.COMPLETED
+    runs = instance.get_runs()
+    assert sorted(run.tags[PARTITION_NAME_TAG] for run in runs) == ["one", "three", "two"]
+    assert all(run.status == PipelineRunStatus.SUCCESS for run in runs)
+
+
 def test_failure_backfill(instance, workspace_context, external_repo):
     output_file = _failure_flag_file()
     external_partition_set = external_repo.get_external_partition_set(
@@ -704,3 +835,148 @@ def test_backfill_from_failure_for_subselection(instance, workspace_context, ext
     assert run.solid_selection
     assert len(run.solids_to_execute) == 2
     assert len(run.solid_selection) == 2
+
+
+def test_asset_backfill(instance, workspace_context, external_repo):
+    asset_selection = [AssetKey("foo"), AssetKey("a1"), AssetKey("bar")]
+    instance.add_backfill(
+        build_asset_backfill(
+            backfill_id="asset_backfill",
+            external_repo=external_repo,
+            asset_selection=asset_selection,
+            partition_key_range=PartitionKeyRange("x", "z"),
+            backfill_timestamp=pendulum.now().timestamp(),
+        )
+    )
+    assert instance.get_runs_count() == 0
+
+    list(execute_backfill_iteration(workspace_context, get_default_daemon_logger("BackfillDaemon")))
+    wait_for_all_runs_to_finish(instance, timeout=30)
+
+    assert instance.get_runs_count() == 3
+    runs = list(reversed(instance.get_runs()))
+    for partition_key, run in zip(["x", "y", "z"], runs):
+        assert run.pipeline_name == "__ASSET_JOB_0"
+        assert run.asset_selection == frozenset(asset_selection)
+        assert run.tags[BACKFILL_ID_TAG] == "asset_backfill"
+        assert run.tags[PARTITION_NAME_TAG] == partition_key
+        assert run.status == PipelineRunStatus.SUCCESS
+    for asset_key in asset_selection:
+        assert len(instance.run_ids_for_asset_key(asset_key)) == 3
+    assert len(instance.run_ids_for_asset_key(AssetKey("a2"))) == 0
+
+    backfill = instance.get_backfill("asset_backfill")
+    assert backfill.status == BulkActionStatus.COMPLETED
+    assert backfill.partition_names == ["x", "y", "z"]
+
+
+def test_asset_backfill_partition_ranges(instance, workspace_context, external_repo):
+    instance.add_backfill(
+        build_asset_backfill(
+            backfill_id="asset_backfill_ranges",
+            external_repo=external_repo,
+            asset_selection=[AssetKey("foo")],
+            partition_key_range=PartitionKeyRange("x", "z"),
+            backfill_timestamp=pendulum.now().timestamp(),
+            max_partitions_per_run=2,
+        )
+    )
+
+    list(execute_backfill_iteration(workspace_context, get_default_daemon_logger("BackfillDaemon")))
+
+    assert instance.get_runs_count() == 2
+    range_run, single_run = reversed(instance.get_runs())
+    assert range_run.tags[ASSET_PARTITION_RANGE_START_TAG] == "x"
+    assert range_run.tags[ASSET_PARTITION_RANGE_END_TAG] == "y"
+    assert PARTITION_NAME_TAG not in range_run.tags
+    assert single_run.tags[PARTITION_NAME_TAG] == "z"
+    assert instance.get_backfill("asset_backfill_ranges").status == BulkActionStatus.COMPLETED
+
+
+def test_plan_asset_backfill_orders_jobs():
+    partitions_def_data = ExternalStaticPartitionsDefinitionData(["x", "y", "z"])
+
+    def _asset_node(name, job_name, upstream=()):
+        return ExternalAssetNode(
+            asset_key=AssetKey(name),
+            dependencies=[ExternalAssetDependency(AssetKey(key)) for key in upstream],
+            depended_by=[],
+            job_names=[job_name],
+            partitions_def_data=partitions_def_data,
+        )
+
+    # upstream -> midstream -> unselected -> downstream, with midstream in a different job
+    external_repo = mock.MagicMock()
+    external_repo.get_external_asset_nodes.return_value = [
+        _asset_node("upstream", "first_job"),
+        _asset_node("midstream", "second_job", ["upstream"]),
+        _asset_node("unselected", "first_job", ["midstream"]),
+        _asset_node("downstream", "first_job", ["unselected"]),
+        _asset_node("sibling", "first_job", ["upstream"]),
+    ]
+
+    planned_runs = plan_asset_backfill(
+        external_repo,
+        [AssetKey(name) for name in ["upstream", "midstream", "downstream", "sibling"]],
+        PartitionKeyRange("x", "z"),
+        max_partitions_per_run=2,
+    )
+    assert [
+        [(run.job_name, run.asset_keys, run.partition_key_range) for run in group_runs]
+        for group_runs in planned_runs
+    ] == [
+        [
+            ("first_job", {AssetKey("upstream"), AssetKey("sibling")}, PartitionKeyRange("x", "y")),
+            ("first_job", {AssetKey("upstream"), AssetKey("sibling")}, PartitionKeyRange("z", "z")),
+        ],
+        [
+            ("second_job", {AssetKey("midstream")}, PartitionKeyRange("x", "y")),
+            ("second_job", {AssetKey("midstream")}, PartitionKeyRange("z", "z")),
+        ],
+        [
+            ("first_job", {AssetKey("downstream")}, PartitionKeyRange("x", "y")),
+            ("first_job", {AssetKey("downstream")}, PartitionKeyRange("z", "z")),
+        ],
+    ]
+
+
+def test_asset_backfill_waits_for_upstream_groups(instance, workspace_context, external_repo):
+    instance.add_backfill(
+        build_asset_backfill(
+            backfill_id="asset_backfill_groups",
+            external_repo=external_repo,
+            asset_selection=[AssetKey("foo"), AssetKey("a1")],
+            partition_key_range=PartitionKeyRange("x", "x"),
+            backfill_timestamp=pendulum.now().timestamp(),
+        )
+    )
+    partition_key_range = PartitionKeyRange("x", "x")
+    planned_runs = [
+        [AssetBackfillRun("__ASSET_JOB_0", {AssetKey("foo")}, partition_key_range)],
+        [AssetBackfillRun("__ASSET_JOB_0", {AssetKey("a1")}, partition_key_range)],
+    ]
+
+    with mock.patch("dagster._daemon.backfill.plan_asset_backfill", return_value=planned_runs):
+        list(
+            execute_backfill_iteration(
+                workspace_context, get_default_daemon_logger("BackfillDaemon")
+            )
+        )
+        wait_for_all_runs_to_finish(instance, timeout=30)
+
+        # the second group is only launched once the run of the first group has succeeded
+        assert instance.get_runs_count() == 1
+        assert instance.get_runs()[0].asset_selection == {AssetKey("foo")}
+        assert instance.get_backfill("asset_backfill_groups").status == BulkActionStatus.REQUESTED
+
+        list(
+            execute_backfill_iteration(
+                workspace_context, get_default_daemon_logger("BackfillDaemon")
+            )
+        )
+        wait_for_all_runs_to_finish(instance, timeout=30)
+
+    assert instance.get_runs_count() == 2
+    assert instance.get_runs()[0].asset_selection == {AssetKey("a1")}
+    assert all(run.status == PipelineRunStatus.SUCCESS for run in instance.get_runs())
+    assert instance.get_backfill("asset_backfill_groups").status == BulkActionStatus.COMPLETED
@@ -635,3 +635,42 @@ def test_key_limit_with_extra_tags(workspace_context, daemon, pipeline_handle):
 
         list(daemon.run_iteration(bounded_ctx))
         assert get_run_ids(instance.run_launcher.queue()) == ["run-1"]
+
+
+def test_tag_limits_across_pages(workspace_context, pipeline_handle, daemon, monkeypatch):
+    monkeypatch.setattr(
+        "dagster._daemon.run_coordinator.queued_run_coordinator_daemon.QUEUED_RUNS_PAGE_SIZE", 2
+    )
+    with instance_for_queued_run_coordinator(
+        max_concurrent_runs=10,
+        tag_concurrency_limits=[{"key": "database", "value": "tiny", "limit": 1}],
+    ) as instance:
+        bounded_ctx = workspace_context.copy_for_test_instance(instance)
+
+        create_run(
+            instance,
+            pipeline_handle,
+            run_id="tiny-in-progress",
+            status=PipelineRunStatus.STARTED,
+            tags={"database": "tiny"},
+        )
+        for i in range(3):
+            create_run(
+                instance,
+                pipeline_handle,
+                run_id=f"tiny-{i}",
+                status=PipelineRunStatus.QUEUED,
+                tags={"database": "tiny", PRIORITY_TAG: "1"},
+            )
+        for i in range(3):
+            create_run(
+                instance,
+                pipeline_handle,
+                run_id=f"large-{i}",
+                status=PipelineRunStatus.QUEUED,
+                tags={"database": "large"},
+            )
+
+        list(daemon.run_iteration(bounded_ctx))
+
+        assert get_run_ids(instance.run_launcher.queue()) == ["large-0", "large-1", "large-2"]
@@ -0,0 +1,70 @@
+import pendulum
+
+from dagster._core.definitions.run_request import InstigatorType
+from dagster._core.scheduler.instigation import TickData, TickStatus
+from dagster._core.test_utils import create_test_daemon_workspace_context, instance_for_test
+from dagster._core.workspace.load_target import EmptyWorkspaceTarget
+from dagster._daemon import get_default_daemon_logger
+from dagster._daemon.controller import daemon_controller_from_instance
+from dagster._daemon.daemon import TickCompactionDaemon
+from dagster._daemon.tick_compaction import execute_tick_compaction_iteration
+from dagster._utils.error import SerializableErrorInfo
+
+
+def _create_tick(instance, name, status, timestamp):
+    return instance.create_tick(
+        TickData(
+            instigator_origin_id=name,
+            instigator_name=name,
+            instigator_type=InstigatorType.SENSOR,
+            status=status,
+            timestamp=timestamp,
+            error=(
+                SerializableErrorInfo(message="Error", stack=[], cls_name="TestError")
+                if status == TickStatus.FAILURE
+                else None
+            ),
+            selector_id=name,
+        )
+    )
+
+
+def test_tick_compaction_instance():
+    with instance_for_test(overrides={"retention": {"compaction": {"enabled": True}}}) as instance:
+        assert instance.tick_compaction_enabled
+        with daemon_controller_from_instance(
+            instance,
+            workspace_load_target=EmptyWorkspaceTarget(),
+        ) as controller:
+            assert any(isinstance(daemon, TickCompactionDaemon) for daemon in controller.daemons)
+
+
+def test_tick_compaction_iteration():
+    with instance_for_test(
+        overrides={
+            "retention": {
+                "sensor": {"purge_after_days": {"skipped": 7, "failure": 14}},
+                "compaction": {"enabled": True},
+            }
+        }
+    ) as instance:
+        now = pendulum.now("UTC")
+        ten_days_ago = now.subtract(days=10).timestamp()
+        for name in ["sensor_one", "sensor_two"]:
+            _create_tick(instance, name, TickStatus.SKIPPED, ten_days_ago)
+            _create_tick(instance, name, TickStatus.FAILURE, ten_days_ago)
+            _create_tick(instance, name, TickStatus.SKIPPED, now.timestamp())
+
+        with create_test_daemon_workspace_context(
+            EmptyWorkspaceTarget(), instance
+        ) as workspace_context:
+            list(
+                execute_tick_compaction_iteration(
+                    workspace_context, get_default_daemon_logger("TickCompactionDaemon")
+                )
+            )
+
+        for name in ["sensor_one", "sensor_two"]:
+            ticks = instance.get_ticks(name, name)
+            assert [tick.status for tick in ticks] == [TickStatus.SKIPPED, TickStatus.FAILURE]
+            assert ticks[0].timestamp == now.timestamp()
@@ -16,6 +16,7 @@
 from dagster._core.errors import DagsterExecutionStepNotFoundError
 from dagster._core.execution.api import create_execution_plan
 from dagster._core.execution.plan.state import KnownExecutionState
+from dagster._core.system_config.objects import ResolvedRunConfig
 from dagster._core.test_utils import instance_for_test
 from dagster._utils import merge_dicts
 
@@ -248,6 +249,40 @@ def test_tags():
         assert plan.get_step_by_key(f"{multiply_by_two.name}[{mapping_key}]").tags == {"third": "3"}
 
 
+def test_plan_with_known_state():
+    known_state = KnownExecutionState(
+        {},
+        {
+            emit.name: {"result": ["0", "1", "2"]},
+            dynamic_echo.name: {"result": ["0", "2"]},
+        },
+    )
+    full_plan = create_execution_plan(fan_repeat, known_state=known_state)
+    resolved_run_config = ResolvedRunConfig.build(fan_repeat)
+
+    # subsetting the plan built without known state, once its steps are resolved with the known
+    # state, gives the same plan for each step as building it with the known state
+    plan_without_known_state = create_execution_plan(fan_repeat)
+    for step_key in full_plan.executable_map:
+        plan = create_execution_plan(
+            fan_repeat, step_keys_to_execute=[step_key], known_state=known_state
+        )
+        subset_plan = plan_without_known_state.with_known_state(known_state).build_subset_plan(
+            [step_key], fan_repeat, resolved_run_config
+        )
+        assert subset_plan.step_keys_to_execute == plan.step_keys_to_execute == [step_key]
+        assert subset_plan.executable_map == plan.executable_map
+        assert subset_plan.resolvable_map == plan.resolvable_map
+        assert set(subset_plan.step_dict) == set(plan.step_dict)
+        assert subset_plan.known_state == known_state
+        assert subset_plan.artifacts_persisted == plan.artifacts_persisted
+
+    # the plan it was built from is unchanged
+    assert set(plan_without_known_state.step_dict) == set(
+        create_execution_plan(fan_repeat).step_dict
+    )
+
+
 def test_full_reexecute():
     with instance_for_test() as instance:
         result_1 = execute_job(
@@ -11,6 +11,7 @@
     ChildProcessEvent,
     ChildProcessStartEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorkerPool,
     execute_child_process_command,
 )
 from dagster._utils import segfault
@@ -103,6 +104,40 @@ def test_child_process_segfault():
     assert exc.value.exit_code == -11
 
 
+def _worker_results(worker, command):
+    return [
+        event
+        for event in worker.execute_command(command)
+        if event and not isinstance(event, ChildProcessEvent)
+    ]
+
+
+def test_worker_pool_reuses_workers():
+    with ChildProcessWorkerPool(multiprocessing, max_workers=1) as pool:
+        worker = pool.acquire()
+        assert _worker_results(worker, DoubleAStringChildProcessCommand("aa")) == ["aaaa"]
+        pool.release(worker)
+
+        reused_worker = pool.acquire()
+        assert reused_worker is worker
+        assert _worker_results(reused_worker, DoubleAStringChildProcessCommand("bb")) == ["bbbb"]
+        pool.release(reused_worker)
+
+
+def test_worker_pool_replaces_interrupted_workers():
+    with ChildProcessWorkerPool(multiprocessing, max_workers=1) as pool:
+        worker = pool.acquire()
+        assert _worker_results(worker, DoubleAStringChildProcessCommand("aa")) == ["aaaa"]
+        worker.term_event.set()
+        pool.release(worker)
+
+        new_worker = pool.acquire()
+        assert new_worker is not worker
+        assert not new_worker.term_event.is_set()
+        assert _worker_results(new_worker, DoubleAStringChildProcessCommand("bb")) == ["bbbb"]
+        pool.release(new_worker)
+
+
 @pytest.mark.skip("too long")
 def test_long_running_command():
     list(execute_child_process_command(multiprocessing, LongRunningCommand()))
@@ -12,8 +12,10 @@
     Nothing,
     Output,
     String,
+    fs_io_manager,
     multiprocess_executor,
     reconstructable,
+    resource,
 )
 from dagster._core.errors import DagsterUnmetExecutorRequirementsError
 from dagster._core.instance import DagsterInstance
@@ -21,6 +23,7 @@
 from dagster._core.test_utils import default_mode_def_for_test, instance_for_test
 from dagster._legacy import (
     InputDefinition,
+    ModeDefinition,
     OutputDefinition,
     PresetDefinition,
     execute_pipeline,
@@ -113,6 +116,133 @@ def test_forkserver_preload():
         assert result.result_for_solid("adder").output_value() == 11
 
 
+@pytest.mark.parametrize(
+    "start_method",
+    [
+        "spawn",
+        pytest.param(
+            "forkserver",
+            marks=pytest.mark.skipif(os.name == "nt", reason="No forkserver on windows"),
+        ),
+    ],
+)
+def test_reuse_processes(start_method):
+    with instance_for_test() as instance:
+        pipe = reconstructable(define_diamond_pipeline)
+        result = execute_pipeline(
+            pipe,
+            run_config={
+                "execution": {
+                    "multiprocess": {
+                        "config": {
+                            "start_method": {start_method: {}},
+                            "max_concurrent": 1,
+                            "reuse_processes": True,
+                        }
+                    }
+                },
+            },
+            instance=instance,
+        )
+        assert result.success
+        assert result.result_for_solid("adder").output_value() == 11
+
+        # with a single worker, every step executes in the same process
+        step_worker_pids = {
+            entry.value.text
+            for event in result.event_list
+            if event.event_type_value == "STEP_WORKER_STARTED"
+            for entry in event.event_specific_data.metadata_entries
+            if entry.label == "pid"
+        }
+        assert len(step_worker_pids) == 1
+        assert step_worker_pids != {str(os.getpid())}
+
+
+@resource(config_schema=str)
+def tracked_resource(init_context):
+    # records its initializations and teardowns in the file at the path in its config
+    with open(init_context.resource_config, "a", encoding="utf8") as f:
+        f.write(f"init {os.getpid()}\n")
+    try:
+        yield
+    finally:
+        with open(init_context.resource_config, "a", encoding="utf8") as f:
+            f.write(f"teardown {os.getpid()}\n")
+
+
+def define_tracked_resource_pipeline():
+    @solid(required_resource_keys={"tracked"})
+    def first(_):
+        return 1
+
+    @solid(required_resource_keys={"tracked"})
+    def second(_, num):
+        return num + 1
+
+    @solid(required_resource_keys={"tracked"})
+    def third(_, num):
+        return num + 1
+
+    @pipeline(
+        mode_defs=[
+            ModeDefinition(resource_defs={"tracked": tracked_resource, "io_manager": fs_io_manager})
+        ]
+    )
+    def tracked_resource_pipeline():
+        third(second(first()))
+
+    return tracked_resource_pipeline
+
+
+@pytest.mark.parametrize("reuse_resources", [True, False])
+def test_reuse_resources(reuse_resources):
+    with instance_for_test() as instance, safe_tempfile_path() as path:
+        result = execute_pipeline(
+            reconstructable(define_tracked_resource_pipeline),
+            run_config={
+                "resources": {"tracked": {"config": path}},
+                "execution": {
+                    "multiprocess": {
+                        "config": {
+                            "max_concurrent": 1,
+                            "reuse_processes": True,
+                            "reuse_resources": reuse_resources,
+                        }
+                    }
+                },
+            },
+            instance=instance,
+        )
+        assert result.success
+
+        with open(path, encoding="utf8") as f:
+            lines = f.read().splitlines()
+
+        # every step executes in the same worker process, which keeps the resources it initialized
+        # for the first step when they are reused, and tears them down when it exits
+        assert len({line.split()[1] for line in lines}) == 1
+        events = [line.split()[0] for line in lines]
+        if reuse_resources:
+            assert events == ["init", "teardown"]
+        else:
+            assert events == ["init", "teardown"] * 3
+
+        assert result.result_for_solid("third").output_value() == 3
+
+
+def test_reuse_resources_requires_reuse_processes():
+    with instance_for_test() as instance:
+        with pytest.raises(
+            DagsterUnmetExecutorRequirementsError, match="reuse_resources requires reuse_processes"
+        ):
+            execute_pipeline(
+                reconstructable(define_diamond_pipeline),
+                run_config={"execution": {"multiprocess": {"config": {"reuse_resources": True}}}},
+                instance=instance,
+            )
+
+
 def define_diamond_pipeline():
     @lambda_solid
     def return_two():
@@ -474,6 +604,23 @@ def test_crash_multiprocessing():
         # )
 
 
+@pytest.mark.skipif(os.name == "nt", reason="Different crash output on Windows: See issue #2791")
+def test_crash_multiprocessing_reuse_processes():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(sys_exit_pipeline),
+            run_config={
+                "execution": {"multiprocess": {"config": {"reuse_processes": True}}},
+            },
+            instance=instance,
+            raise_on_error=False,
+        )
+        assert not result.success
+        failure_data = result.result_for_solid("sys_exit").failure_data
+        assert failure_data
+        assert failure_data.error.cls_name == "ChildProcessCrashException"
+
+
 # segfault test
 @solid
 def segfault_solid(context):
@@ -531,6 +678,12 @@ def get_dynamic_op_failure_job():
     return get_dynamic_job_op_failure(multiprocess_executor)[0]
 
 
+def get_dynamic_resource_init_failure_job_reuse_processes():
+    return get_dynamic_job_resource_init_failure(
+        multiprocess_executor.configured({"max_concurrent": 1, "reuse_processes": True})
+    )[0]
+
+
 # Tests identical retry behavior when a job fails because of resource
 # initialization of a dynamic step, and failure during op runtime of a
 # dynamic step.
@@ -545,6 +698,10 @@ def get_dynamic_op_failure_job():
             get_dynamic_op_failure_job,
             get_dynamic_job_op_failure(multiprocess_executor)[1],
         ),
+        (
+            get_dynamic_resource_init_failure_job_reuse_processes,
+            get_dynamic_job_resource_init_failure(multiprocess_executor)[1],
+        ),
     ],
 )
 def test_dynamic_failure_retry(job_fn, config_fn):
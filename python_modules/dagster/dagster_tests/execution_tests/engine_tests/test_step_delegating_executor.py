@@ -44,10 +44,12 @@ class TestStepHandler(StepHandler):
     # are left alive when the test ends. Non-test step handlers should not keep their own state in memory.
     processes = []  # type: ignore
     launch_step_count = 0  # type: ignore
+    launch_batch_sizes = []  # type: ignore
     saw_baz_op = False
     check_step_health_count = 0  # type: ignore
     terminate_step_count = 0  # type: ignore
     verify_step_count = 0  # type: ignore
+    dispose_count = 0  # type: ignore
 
     @property
     def name(self):
@@ -67,6 +69,10 @@ def launch_step(self, step_handler_context):
         )
         return iter(())
 
+    def launch_steps(self, step_handler_contexts):
+        TestStepHandler.launch_batch_sizes.append(len(step_handler_contexts))
+        return super().launch_steps(step_handler_contexts)
+
     def check_step_health(self, step_handler_context) -> CheckStepHealthResult:
         TestStepHandler.check_step_health_count += 1
         return CheckStepHealthResult.healthy()
@@ -75,13 +81,18 @@ def terminate_step(self, step_handler_context):
         TestStepHandler.terminate_step_count += 1
         raise NotImplementedError()
 
+    def dispose(self):
+        TestStepHandler.dispose_count += 1
+
     @classmethod
     def reset(cls):
         cls.processes = []
         cls.launch_step_count = 0
+        cls.launch_batch_sizes = []
         cls.check_step_health_count = 0
         cls.terminate_step_count = 0
         cls.verify_step_count = 0
+        cls.dispose_count = 0
 
     @classmethod
     def wait_for_processes(cls):
@@ -137,6 +148,7 @@ def test_execute():
     assert result.success
     assert TestStepHandler.saw_baz_op
     assert TestStepHandler.verify_step_count == 0
+    assert TestStepHandler.dispose_count == 1
 
 
 def test_skip_execute():
@@ -258,6 +270,22 @@ def test_max_concurrent():
             active_step = None
 
 
+def test_launch_parallelism():
+    TestStepHandler.reset()
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(three_op_job),
+            instance=instance,
+            run_config={"execution": {"config": {"launch_parallelism": 2}}},
+        )
+        TestStepHandler.wait_for_processes()
+    assert result.success
+    assert TestStepHandler.launch_step_count == 3
+
+    # the three ready steps are launched together, split across two launch threads
+    assert sorted(TestStepHandler.launch_batch_sizes) == [1, 2]
+
+
 @executor(
     name="test_step_delegating_executor_verify_step",
     requirements=multiple_process_executor_requirements(),
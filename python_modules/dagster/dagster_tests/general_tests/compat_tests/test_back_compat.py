@@ -20,13 +20,20 @@
 from dagster._core.events import DagsterEvent
 from dagster._core.events.log import EventLogEntry
 from dagster._core.execution.backfill import BulkActionStatus, PartitionBackfill
+from dagster._core.host_representation import ExternalRepositoryOrigin, InstigatorSelector
+from dagster._core.host_representation.origin import RegisteredRepositoryLocationOrigin
 from dagster._core.instance import DagsterInstance, InstanceRef
 from dagster._core.scheduler.instigation import InstigatorState, InstigatorTick
 from dagster._core.storage.event_log.migration import migrate_event_log_data
 from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
 from dagster._core.storage.migration.utils import upgrading_instance
-from dagster._core.storage.pipeline_run import DagsterRun, DagsterRunStatus, RunsFilter
-from dagster._core.storage.tags import REPOSITORY_LABEL_TAG
+from dagster._core.storage.pipeline_run import (
+    DagsterRun,
+    DagsterRunStatus,
+    InstigatorRunKey,
+    RunsFilter,
+)
+from dagster._core.storage.tags import REPOSITORY_LABEL_TAG, RUN_KEY_TAG, SENSOR_NAME_TAG
 from dagster._legacy import execute_pipeline, pipeline, solid
 from dagster._serdes import DefaultNamedTupleSerializer, create_snapshot_id
 from dagster._serdes.serdes import (
@@ -1015,3 +1022,50 @@ def test_add_kvs_table():
 
             assert not "kvs" in get_sqlite3_tables(db_path)
             assert get_sqlite3_indexes(db_path, "kvs") == []
+
+
+def test_add_instigator_run_keys_table():
+    src_dir = file_relative_path(__file__, "snapshot_0_14_16_bulk_actions_columns/sqlite")
+
+    with copy_directory(src_dir) as test_dir:
+        db_path = os.path.join(test_dir, "history", "runs.db")
+
+        with DagsterInstance.from_ref(InstanceRef.from_dir(test_dir)) as instance:
+            assert "instigator_run_keys" not in get_sqlite3_tables(db_path)
+            assert not instance.run_storage.supports_instigator_run_keys()
+
+            # launched by a sensor before the table existed
+            origin = ExternalRepositoryOrigin(
+                RegisteredRepositoryLocationOrigin("my_location"), "my_repo"
+            ).get_pipeline_origin("my_job")
+            run = instance.add_run(
+                DagsterRun(
+                    pipeline_name="my_job",
+                    tags={SENSOR_NAME_TAG: "my_sensor", RUN_KEY_TAG: "my_run_key"},
+                    external_pipeline_origin=origin,
+                )
+            )
+
+            instance.upgrade()
+
+            assert "instigator_run_keys" in get_sqlite3_tables(db_path)
+            assert sorted(get_sqlite3_indexes(db_path, "instigator_run_keys")) == [
+                "idx_instigator_run_keys",
+                "idx_instigator_run_keys_run_id",
+            ]
+            assert instance.run_storage.supports_instigator_run_keys()
+
+            selector_id = create_snapshot_id(
+                InstigatorSelector("my_location", "my_repo", "my_sensor")
+            )
+            assert instance.run_storage.get_instigator_run_keys(selector_id, ["my_run_key"]) == {
+                "my_run_key": InstigatorRunKey(
+                    "my_run_key", run.run_id, DagsterRunStatus.NOT_STARTED
+                )
+            }
+
+            instance._run_storage._alembic_downgrade(rev="a00dd8d936a1")
+
+            assert "instigator_run_keys" not in get_sqlite3_tables(db_path)
+            assert not instance.run_storage.supports_instigator_run_keys()
+            assert sorted(get_sqlite3_indexes(db_path, "instigator_run_keys")) == []
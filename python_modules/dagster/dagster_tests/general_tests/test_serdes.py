@@ -23,6 +23,7 @@
     register_serdes_enum_fallbacks,
     register_serdes_tuple_fallbacks,
     serialize_value,
+    serialize_value_compact,
     unpack_inner_value,
 )
 from dagster._serdes.utils import hash_str
@@ -718,3 +719,94 @@ class Thing(NamedTuple):  # pylint: disable=unused-variable
 
     assert wmap.get_serialized_name("Thing") == "SerializedThing"
     assert wmap.get_deserialized_name("SerializedThing") == "Thing"
+
+
+def test_compact_round_trip():
+    test_map = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Color(Enum):
+        RED = 1
+        BLUE = 2
+
+    @_whitelist_for_serdes(whitelist_map=test_map, storage_name="SerializedLeaf")
+    class Leaf(NamedTuple):
+        name: str
+        color: Color
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Node(NamedTuple):
+        leaves: list
+        tags: dict
+        keys: frozenset
+        parent: object
+
+    root = Node([Leaf("a", Color.RED)], {"x": Leaf("b", Color.BLUE)}, frozenset(["k"]), None)
+    value = {"nodes": [Node([], {}, frozenset(), root), {1, 2}], "count": 3, "ratio": 0.5}
+
+    serialized = serialize_value_compact(value, whitelist_map=test_map)
+    packed = _seven.json.loads(serialized)
+    assert [storage_name for storage_name, _ in packed["tuples"]] == ["Node", "SerializedLeaf"]
+    assert packed["enums"] == ["Color.RED", "Color.BLUE"]
+
+    assert deserialize_value(serialized, whitelist_map=test_map) == value
+    assert _deserialize_json(serialized, whitelist_map=test_map) == value
+
+
+def test_compact_backward_compat():
+    test_map = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Quux(namedtuple("_Quux", "foo bar baz")):
+        def __new__(cls, foo, bar, baz):
+            return super(Quux, cls).__new__(cls, foo, bar, baz)  # pylint: disable=bad-super-call
+
+    serialized = serialize_value_compact([Quux("zip", "zow", "whoopie")], whitelist_map=test_map)
+
+    # pylint: disable=function-redefined
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Quux(namedtuple("_Quux", "foo bar")):  # pylint: disable=bad-super-call
+        def __new__(cls, foo, bar):
+            return super(Quux, cls).__new__(cls, foo, bar)
+
+    assert deserialize_value(serialized, whitelist_map=test_map) == [Quux("zip", "zow")]
+
+    register_serdes_tuple_fallbacks({"Quux": None}, whitelist_map=test_map)
+    assert deserialize_value(serialized, whitelist_map=test_map) == [None]
+
+    with pytest.raises(DeserializationError, match="not in the whitelist"):
+        deserialize_value(serialized, whitelist_map=WhitelistMap.create())
+
+
+def test_compact_custom_serializer():
+    test_map = WhitelistMap.create()
+
+    class CustomSerializer(DefaultNamedTupleSerializer):
+        @classmethod
+        def value_to_storage_dict(cls, value, whitelist_map, descent_path):
+            storage_dict = super().value_to_storage_dict(value, whitelist_map, descent_path)
+            storage_dict["legacy"] = True
+            return storage_dict
+
+    @_whitelist_for_serdes(whitelist_map=test_map, serializer=CustomSerializer)
+    class Custom(NamedTuple):
+        name: str
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Wrapper(NamedTuple):
+        inner: Custom
+
+    value = Wrapper(Custom("foo"))
+    serialized = serialize_value_compact(value, whitelist_map=test_map)
+    packed = _seven.json.loads(serialized)
+    # the custom serializer still produces the storage dict for its class
+    assert packed["value"][1][1]["legacy"] is True
+    assert deserialize_value(serialized, whitelist_map=test_map) == value
+
+
+def test_compact_descent_path():
+    class Foo(NamedTuple):
+        bar: int
+
+    with pytest.raises(SerializationError, match=re.escape("Descent path: <root:dict>.a.b[2].c")):
+        serialize_value_compact({"a": {"b": [{}, {}, {"c": Foo(1)}]}})
@@ -1,4 +1,7 @@
+import logging
 import os
+import threading
+import time
 from contextlib import contextmanager
 
 import boto3
@@ -8,6 +11,7 @@
 from dagster import Field, StringSource
 from dagster import _check as check
 from dagster._core.storage.compute_log_manager import (
+    MAX_BYTES_CHUNK_READ,
     MAX_BYTES_FILE_READ,
     ComputeIOType,
     ComputeLogFileData,
@@ -18,7 +22,12 @@
     LocalComputeLogManager,
 )
 from dagster._serdes import ConfigurableClass, ConfigurableClassData
-from dagster._utils import ensure_dir, ensure_file
+from dagster._utils import ensure_file
+
+# how often the segment uploader checks the local log files for new bytes
+SEGMENT_UPLOAD_POLL_INTERVAL = 1
+
+log = logging.getLogger(__name__)
 
 
 class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
@@ -41,6 +50,7 @@ class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
             verify_cert_path: "/path/to/cert/bundle.pem"
             endpoint_url: "http://alternate-s3-host.io"
             skip_empty_files: true
+            upload_interval: 30
 
     Args:
         bucket (str): The name of the s3 bucket to which to log.
@@ -53,6 +63,11 @@ class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
             `verify` set to False.
         endpoint_url (Optional[str]): Override for the S3 endpoint url.
         skip_empty_files: (Optional[bool]): Skip upload of empty log files.
+        upload_interval: (Optional[int]): Interval in seconds at which to upload partial logs while
+            a step is executing. If not set, logs are only uploaded once the step completes.
+        upload_segment_size: (Optional[int]): When ``upload_interval`` is set, upload partial logs
+            as soon as this many new bytes have been written, and split larger uploads into
+            segments of at most this many bytes. Default: 4 MB.
         inst_data (Optional[ConfigurableClassData]): Serializable representation of the compute
             log manager when newed up from config.
     """
@@ -68,6 +83,8 @@ def __init__(
         verify_cert_path=None,
         endpoint_url=None,
         skip_empty_files=False,
+        upload_interval=None,
+        upload_segment_size=MAX_BYTES_CHUNK_READ,
     ):
         _verify = False if not verify else verify_cert_path
         self._s3_session = boto3.resource(
@@ -83,6 +100,8 @@ def __init__(
         self.local_manager = LocalComputeLogManager(local_dir)
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self._skip_empty_files = check.bool_param(skip_empty_files, "skip_empty_files")
+        self._upload_interval = check.opt_int_param(upload_interval, "upload_interval")
+        self._upload_segment_size = check.int_param(upload_segment_size, "upload_segment_size")
 
     @contextmanager
     def _watch_logs(self, pipeline_run, step_key=None):
@@ -90,7 +109,19 @@ def _watch_logs(self, pipeline_run, step_key=None):
         with self.local_manager._watch_logs(  # pylint: disable=protected-access
             pipeline_run, step_key
         ):
-            yield
+            if self._upload_interval is None:
+                yield
+                return
+
+            key = self.local_manager.get_key(pipeline_run, step_key)
+            uploader = S3ComputeLogSegmentUploader(
+                self, pipeline_run.run_id, key, self._upload_interval, self._upload_segment_size
+            )
+            uploader.start()
+            try:
+                yield
+            finally:
+                uploader.stop()
 
     @property
     def inst_data(self):
@@ -107,6 +138,10 @@ def config_type(cls):
             "verify_cert_path": Field(StringSource, is_required=False),
             "endpoint_url": Field(StringSource, is_required=False),
             "skip_empty_files": Field(bool, is_required=False, default_value=False),
+            "upload_interval": Field(int, is_required=False),
+            "upload_segment_size": Field(
+                int, is_required=False, default_value=MAX_BYTES_CHUNK_READ
+            ),
         }
 
     @staticmethod
@@ -124,6 +159,10 @@ def on_watch_finish(self, pipeline_run, step_key):
         key = self.local_manager.get_key(pipeline_run, step_key)
         self._upload_from_local(pipeline_run.run_id, key, ComputeIOType.STDOUT)
         self._upload_from_local(pipeline_run.run_id, key, ComputeIOType.STDERR)
+        if self._upload_interval is not None:
+            # the complete logs supersede any segments uploaded during execution
+            self._delete_segments(pipeline_run.run_id, key, ComputeIOType.STDOUT)
+            self._delete_segments(pipeline_run.run_id, key, ComputeIOType.STDERR)
 
     def is_watch_completed(self, run_id, key):
         return self.local_manager.is_watch_completed(run_id, key)
@@ -140,10 +179,39 @@ def download_url(self, run_id, key, io_type):
         return url
 
     def read_logs_file(self, run_id, key, io_type, cursor=0, max_bytes=MAX_BYTES_FILE_READ):
-        if self._should_download(run_id, key, io_type):
-            self._download_to_local(run_id, key, io_type)
-        data = self.local_manager.read_logs_file(run_id, key, io_type, cursor, max_bytes)
-        return self._from_local_file_data(run_id, key, io_type, data)
+        local_path = self.get_local_path(run_id, key, io_type)
+        if os.path.exists(local_path):
+            data = self.local_manager.read_logs_file(run_id, key, io_type, cursor, max_bytes)
+            return self._from_local_file_data(run_id, key, io_type, data)
+
+        # read only the requested byte range from s3, from the complete logs if they have been
+        # uploaded or else from the segments uploaded so far
+        bucket_key = self._bucket_key(run_id, key, io_type)
+        try:
+            size = self._s3_session.head_object(Bucket=self._s3_bucket, Key=bucket_key)[
+                "ContentLength"
+            ]
+            ranges = [(bucket_key, 0, size)]
+            path = "s3://{}/{}".format(self._s3_bucket, bucket_key)
+        except ClientError:
+            ranges = self._get_segments(run_id, key, io_type)
+            size = ranges[-1][2] if ranges else 0
+            path = local_path
+
+        if not ranges:
+            return ComputeLogFileData(path=path, data=None, cursor=0, size=0, download_url=None)
+
+        data = self._read_ranges(ranges, cursor, min(cursor + max_bytes, size))
+        if cursor + len(data) < size:
+            data = _trim_partial_utf8(data)
+
+        return ComputeLogFileData(
+            path=path,
+            data=data.decode("utf-8"),
+            cursor=cursor + len(data),
+            size=size,
+            download_url=self.download_url(run_id, key, io_type),
+        )
 
     def on_subscribe(self, subscription):
         self.local_manager.on_subscribe(subscription)
@@ -151,20 +219,6 @@ def on_subscribe(self, subscription):
     def on_unsubscribe(self, subscription):
         self.local_manager.on_unsubscribe(subscription)
 
-    def _should_download(self, run_id, key, io_type):
-        local_path = self.get_local_path(run_id, key, io_type)
-        if os.path.exists(local_path):
-            return False
-
-        try:  # https://stackoverflow.com/a/38376288/14656695
-            self._s3_session.head_object(
-                Bucket=self._s3_bucket, Key=self._bucket_key(run_id, key, io_type)
-            )
-        except ClientError:
-            return False
-
-        return True
-
     def _from_local_file_data(self, run_id, key, io_type, local_file_data):
         is_complete = self.is_watch_completed(run_id, key)
         path = (
@@ -191,13 +245,62 @@ def _upload_from_local(self, run_id, key, io_type):
         with open(path, "rb") as data:
             self._s3_session.upload_fileobj(data, self._s3_bucket, key)
 
-    def _download_to_local(self, run_id, key, io_type):
-        path = self.get_local_path(run_id, key, io_type)
-        ensure_dir(os.path.dirname(path))
-        with open(path, "wb") as fileobj:
-            self._s3_session.download_fileobj(
-                self._s3_bucket, self._bucket_key(run_id, key, io_type), fileobj
+    def _read_ranges(self, ranges, start, end):
+        chunks = []
+        for bucket_key, range_start, range_end in ranges:
+            if range_end <= start or range_start >= end or range_start == range_end:
+                continue
+            byte_range = "bytes={}-{}".format(
+                max(start, range_start) - range_start, min(end, range_end) - range_start - 1
             )
+            response = self._s3_session.get_object(
+                Bucket=self._s3_bucket, Key=bucket_key, Range=byte_range
+            )
+            chunks.append(response["Body"].read())
+        return b"".join(chunks)
+
+    def upload_segment(self, run_id, key, io_type, offset, data):
+        """Upload the bytes of a log file starting at ``offset`` as a separate segment object, so
+        that partial logs are visible while the step is still executing."""
+        self._s3_session.put_object(
+            Bucket=self._s3_bucket,
+            Key="{}{:020d}".format(self._segment_prefix(run_id, key, io_type), offset),
+            Body=data,
+        )
+
+    def _list_segments(self, run_id, key, io_type):
+        # segment keys end with their zero-padded starting offset, so listing them in key order
+        # serves as the index of the uploaded byte ranges
+        segments = []
+        prefix = self._segment_prefix(run_id, key, io_type)
+        paginator = self._s3_session.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self._s3_bucket, Prefix=prefix):
+            for obj in page.get("Contents", []):
+                offset = int(obj["Key"][len(prefix) :])
+                segments.append((obj["Key"], offset, offset + obj["Size"]))
+        return sorted(segments, key=lambda segment: segment[1])
+
+    def _get_segments(self, run_id, key, io_type):
+        # only return the contiguous segments, in case a later segment landed first
+        contiguous = []
+        for segment in self._list_segments(run_id, key, io_type):
+            if segment[1] != (contiguous[-1][2] if contiguous else 0):
+                break
+            contiguous.append(segment)
+        return contiguous
+
+    def _delete_segments(self, run_id, key, io_type):
+        segment_keys = [
+            {"Key": bucket_key} for bucket_key, _, _ in self._list_segments(run_id, key, io_type)
+        ]
+        # delete_objects accepts at most 1000 keys per request
+        for i in range(0, len(segment_keys), 1000):
+            self._s3_session.delete_objects(
+                Bucket=self._s3_bucket, Delete={"Objects": segment_keys[i : i + 1000]}
+            )
+
+    def _segment_prefix(self, run_id, key, io_type):
+        return "{}.segments/".format(self._bucket_key(run_id, key, io_type))
 
     def _bucket_key(self, run_id, key, io_type):
         check.inst_param(io_type, "io_type", ComputeIOType)
@@ -213,3 +316,108 @@ def _bucket_key(self, run_id, key, io_type):
 
     def dispose(self):
         self.local_manager.dispose()
+
+
+class S3ComputeLogSegmentUploader:
+    """Uploads the bytes appended to the local stdout/stderr files of a step as S3 segments,
+    every ``upload_interval`` seconds or as soon as ``segment_size`` new bytes are available."""
+
+    def __init__(self, manager, run_id, key, upload_interval, segment_size):
+        self._manager = manager
+        self._run_id = run_id
+        self._key = key
+        self._upload_interval = upload_interval
+        self._segment_size = segment_size
+        self._offsets = {io_type: 0 for io_type in [ComputeIOType.STDOUT, ComputeIOType.STDERR]}
+        self._last_upload_time = time.time()
+        self._shutdown_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._run, name="s3-compute-log-uploader", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        # the complete logs are uploaded once the step finishes, so there is no final segment
+        self._shutdown_event.set()
+        if self._thread:
+            self._thread.join()
+
+    def _run(self):
+        # clear out any segments left behind by a previous attempt which did not complete, on the
+        # uploader thread so that the step does not wait on s3 before it starts executing
+        try:
+            self.delete_stale_segments()
+        except Exception:  # pylint: disable=broad-except
+            log.exception(
+                "Failed to delete stale compute log segments for step %s of run %s",
+                self._key,
+                self._run_id,
+            )
+
+        while not self._shutdown_event.wait(
+            min(SEGMENT_UPLOAD_POLL_INTERVAL, self._upload_interval)
+        ):
+            try:
+                self.upload_new_segments()
+            except Exception:  # pylint: disable=broad-except
+                # partial uploads are best effort, the complete logs are uploaded on finish
+                log.exception(
+                    "Failed to upload compute log segments for step %s of run %s",
+                    self._key,
+                    self._run_id,
+                )
+
+    def delete_stale_segments(self):
+        for io_type in self._offsets:
+            self._manager._delete_segments(  # pylint: disable=protected-access
+                self._run_id, self._key, io_type
+            )
+
+    def upload_new_segments(self):
+        pending = {io_type: self._pending_bytes(io_type) for io_type in self._offsets}
+        interval_elapsed = time.time() - self._last_upload_time >= self._upload_interval
+        if not interval_elapsed:
+            if all(num_bytes < self._segment_size for num_bytes in pending.values()):
+                return
+
+        for io_type, num_bytes in pending.items():
+            if num_bytes:
+                self._upload(io_type, num_bytes)
+        self._last_upload_time = time.time()
+
+    def _pending_bytes(self, io_type):
+        path = self._manager.get_local_path(self._run_id, self._key, io_type)
+        if not os.path.exists(path):
+            return 0
+        return max(os.path.getsize(path) - self._offsets[io_type], 0)
+
+    def _upload(self, io_type, num_bytes):
+        path = self._manager.get_local_path(self._run_id, self._key, io_type)
+        with open(path, "rb") as f:
+            f.seek(self._offsets[io_type])
+            while num_bytes > 0:
+                data = f.read(min(num_bytes, self._segment_size))
+                if not data:
+                    break
+                self._manager.upload_segment(
+                    self._run_id, self._key, io_type, self._offsets[io_type], data
+                )
+                self._offsets[io_type] += len(data)
+                num_bytes -= len(data)
+
+
+def _trim_partial_utf8(data):
+    # drop a utf-8 sequence split by the end of a byte range, it is returned by the next read
+    for i in range(1, min(4, len(data)) + 1):
+        byte = data[-i]
+        if byte & 0xC0 == 0x80:
+            # continuation byte, keep looking for the lead byte
+            continue
+        if byte & 0x80 == 0:
+            return data
+        expected_length = 2 if byte & 0xE0 == 0xC0 else 3 if byte & 0xF0 == 0xE0 else 4
+        return data if expected_length == i else data[:-i]
+    return data
@@ -1,5 +1,8 @@
 import io
 import pickle
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Sequence, Union
 
 from dagster import (
@@ -14,6 +17,18 @@
 from dagster import io_manager
 from dagster._utils import PICKLE_PROTOCOL
 
+# pickle protocol 5 (python 3.8+) allows large buffers to be serialized out-of-band
+STREAMING_PICKLE_PROTOCOL = min(pickle.HIGHEST_PROTOCOL, 5)
+
+# trails objects written in streaming mode, pickles themselves always end with the STOP opcode
+STREAMING_FORMAT_MAGIC = b"DGSTRPK5"
+STREAMING_FORMAT_FOOTER = struct.Struct("<QQ")
+
+# s3 requires all parts of a multipart upload except the last to be at least 5 MB
+MIN_PART_SIZE = 5 * 1024 * 1024
+DEFAULT_PART_SIZE = 64 * 1024 * 1024
+DEFAULT_MAX_CONCURRENCY = 8
+
 
 class PickledObjectS3IOManager(MemoizableIOManager):
     def __init__(
@@ -21,10 +36,20 @@ def __init__(
         s3_bucket,
         s3_session,
         s3_prefix=None,
+        streaming=False,
+        part_size=DEFAULT_PART_SIZE,
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
     ):
         self.bucket = check.str_param(s3_bucket, "s3_bucket")
         self.s3_prefix = check.opt_str_param(s3_prefix, "s3_prefix")
         self.s3 = s3_session
+        self.streaming = check.bool_param(streaming, "streaming")
+        self.part_size = check.int_param(part_size, "part_size")
+        check.param_invariant(
+            self.part_size >= MIN_PART_SIZE, "part_size", "must be at least 5 MB (5242880 bytes)"
+        )
+        self.max_concurrency = check.int_param(max_concurrency, "max_concurrency")
+        check.param_invariant(self.max_concurrency > 0, "max_concurrency")
         self.s3.list_objects(Bucket=self.bucket, Prefix=self.s3_prefix, MaxKeys=1)
 
     def _get_path(self, context: Union[InputContext, OutputContext]) -> str:
@@ -71,9 +96,12 @@ def load_input(self, context):
 
         key = self._get_path(context)
         context.log.debug(f"Loading S3 object from: {self._uri_for_key(key)}")
-        obj = pickle.loads(self.s3.get_object(Bucket=self.bucket, Key=key)["Body"].read())
+        if self.streaming:
+            data = self._download_in_parts(key)
+        else:
+            data = self.s3.get_object(Bucket=self.bucket, Key=key)["Body"].read()
 
-        return obj
+        return _loads(data)
 
     def handle_output(self, context, obj):
         if context.dagster_type.typing_type == type(None):
@@ -92,16 +120,212 @@ def handle_output(self, context, obj):
             context.log.warning(f"Removing existing S3 key: {key}")
             self._rm_object(key)
 
-        pickled_obj = pickle.dumps(obj, PICKLE_PROTOCOL)
-        pickled_obj_bytes = io.BytesIO(pickled_obj)
-        self.s3.upload_fileobj(pickled_obj_bytes, self.bucket, key)
+        if self.streaming:
+            with _MultipartUploadWriter(
+                self.s3, self.bucket, key, self.part_size, self.max_concurrency
+            ) as writer:
+                _dump_streaming(obj, writer)
+        else:
+            pickled_obj = pickle.dumps(obj, PICKLE_PROTOCOL)
+            pickled_obj_bytes = io.BytesIO(pickled_obj)
+            self.s3.upload_fileobj(pickled_obj_bytes, self.bucket, key)
         context.add_output_metadata({"uri": MetadataValue.path(path)})
 
+    def _download_in_parts(self, key):
+        size = self.s3.head_object(Bucket=self.bucket, Key=key)["ContentLength"]
+        data = bytearray(size)
+        view = memoryview(data)
+
+        def _download_part(start):
+            end = min(start + self.part_size, size)
+            body = self.s3.get_object(
+                Bucket=self.bucket, Key=key, Range=f"bytes={start}-{end - 1}"
+            )["Body"]
+            offset = start
+            for chunk in body.iter_chunks():
+                view[offset : offset + len(chunk)] = chunk
+                offset += len(chunk)
+            check.invariant(offset == end, f"Incomplete read of S3 object {key}")
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="s3_io_manager_download"
+        ) as executor:
+            # consume the results to surface any download errors
+            list(executor.map(_download_part, range(0, size, self.part_size)))
+
+        return data
+
+
+def _dump_streaming(obj, writer):
+    """Pickle `obj` into `writer`, with any out-of-band buffers written after the pickle stream and
+    a footer describing the lengths of each section."""
+    buffers = []
+    if STREAMING_PICKLE_PROTOCOL >= 5:
+        pickle.dump(obj, writer, STREAMING_PICKLE_PROTOCOL, buffer_callback=buffers.append)
+    else:
+        pickle.dump(obj, writer, STREAMING_PICKLE_PROTOCOL)
+    pickle_length = writer.tell()
+
+    buffer_lengths = []
+    for buffer in buffers:
+        raw = buffer.raw()
+        writer.write(raw)
+        buffer_lengths.append(raw.nbytes)
+
+    writer.write(struct.pack(f"<{len(buffer_lengths)}Q", *buffer_lengths))
+    writer.write(STREAMING_FORMAT_FOOTER.pack(pickle_length, len(buffer_lengths)))
+    writer.write(STREAMING_FORMAT_MAGIC)
+
+
+def _loads(data):
+    if not data.endswith(STREAMING_FORMAT_MAGIC):
+        return pickle.loads(data)
+
+    # unpickle the out-of-band buffers in place, without copying them out of the downloaded data
+    view = memoryview(data)
+    footer_end = len(data) - len(STREAMING_FORMAT_MAGIC)
+    footer_start = footer_end - STREAMING_FORMAT_FOOTER.size
+    pickle_length, num_buffers = STREAMING_FORMAT_FOOTER.unpack(view[footer_start:footer_end])
+    lengths_start = footer_start - 8 * num_buffers
+    buffer_lengths = struct.unpack(f"<{num_buffers}Q", view[lengths_start:footer_start])
+
+    if not num_buffers:
+        return pickle.loads(view[:pickle_length])
+
+    buffers = []
+    offset = pickle_length
+    for length in buffer_lengths:
+        buffers.append(view[offset : offset + length])
+        offset += length
+
+    return pickle.loads(view[:pickle_length], buffers=buffers)
+
+
+class _MultipartUploadWriter:
+    """Write-only file-like object which uploads what is written to it as the parts of an S3
+    multipart upload, with at most `max_concurrency` parts in flight at a time.
+
+    Objects smaller than a single part are uploaded with a single `put_object` call.
+    """
+
+    def __init__(self, s3, bucket, key, part_size, max_concurrency):
+        self._s3 = s3
+        self._bucket = bucket
+        self._key = key
+        self._part_size = part_size
+        self._buffer = bytearray()
+        self._position = 0
+        self._upload_id = None
+        self._futures = []
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="s3_io_manager_upload"
+        )
+        # bounds the memory held by parts which have not been uploaded yet
+        self._in_flight = threading.BoundedSemaphore(max_concurrency)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if exc_type is None:
+                self._complete()
+            elif self._upload_id:
+                self._wait_for_parts(raise_errors=False)
+                self._s3.abort_multipart_upload(
+                    Bucket=self._bucket, Key=self._key, UploadId=self._upload_id
+                )
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def writable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def write(self, data):
+        view = memoryview(data).cast("B")
+        num_bytes = view.nbytes
+        self._position += num_bytes
+        while view.nbytes:
+            if not self._buffer and view.nbytes >= self._part_size:
+                # avoid copying whole parts through the buffer
+                self._submit_part(bytes(view[: self._part_size]))
+                view = view[self._part_size :]
+                continue
+
+            remaining = self._part_size - len(self._buffer)
+            self._buffer += view[:remaining]
+            view = view[remaining:]
+            if len(self._buffer) == self._part_size:
+                self._submit_part(bytes(self._buffer))
+                self._buffer = bytearray()
+        return num_bytes
+
+    def _submit_part(self, body):
+        if not self._upload_id:
+            self._upload_id = self._s3.create_multipart_upload(Bucket=self._bucket, Key=self._key)[
+                "UploadId"
+            ]
+
+        part_number = len(self._futures) + 1
+        self._in_flight.acquire()
+        future = self._executor.submit(self._upload_part, part_number, body)
+        future.add_done_callback(lambda _: self._in_flight.release())
+        self._futures.append(future)
+
+    def _upload_part(self, part_number, body):
+        response = self._s3.upload_part(
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=body,
+        )
+        return {"ETag": response["ETag"], "PartNumber": part_number}
+
+    def _wait_for_parts(self, raise_errors=True):
+        parts = []
+        for future in self._futures:
+            if raise_errors:
+                parts.append(future.result())
+            elif not future.exception():
+                parts.append(future.result())
+        return parts
+
+    def _complete(self):
+        if not self._upload_id:
+            self._s3.put_object(Bucket=self._bucket, Key=self._key, Body=bytes(self._buffer))
+            return
+
+        if self._buffer:
+            self._submit_part(bytes(self._buffer))
+            self._buffer = bytearray()
+        try:
+            parts = self._wait_for_parts()
+        except Exception:
+            self._wait_for_parts(raise_errors=False)
+            self._s3.abort_multipart_upload(
+                Bucket=self._bucket, Key=self._key, UploadId=self._upload_id
+            )
+            raise
+
+        self._s3.complete_multipart_upload(
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=self._upload_id,
+            MultipartUpload={"Parts": parts},
+        )
+
 
 @io_manager(
     config_schema={
         "s3_bucket": Field(StringSource),
         "s3_prefix": Field(StringSource, is_required=False, default_value="dagster"),
+        "streaming": Field(bool, is_required=False, default_value=False),
+        "part_size": Field(int, is_required=False, default_value=DEFAULT_PART_SIZE),
+        "max_concurrency": Field(int, is_required=False, default_value=DEFAULT_MAX_CONCURRENCY),
     },
     required_resource_keys={"s3"},
 )
@@ -138,9 +362,23 @@ def my_job():
                 config:
                     s3_bucket: my-cool-bucket
                     s3_prefix: good/prefix-for-files-
+
+    Large outputs can be written and read in streaming mode, by setting ``streaming: true``. Objects
+    are then pickled directly into a multipart upload, with buffers such as numpy arrays serialized
+    out-of-band (pickle protocol 5) instead of being copied into the pickle, and loaded by
+    downloading byte ranges in parallel. Parts of ``part_size`` bytes (default 64 MB, at least 5 MB)
+    are transferred by up to ``max_concurrency`` threads (default 8). Objects written in streaming
+    mode can be loaded with or without streaming mode enabled.
     """
     s3_session = init_context.resources.s3
     s3_bucket = init_context.resource_config["s3_bucket"]
     s3_prefix = init_context.resource_config.get("s3_prefix")  # s3_prefix is optional
-    pickled_io_manager = PickledObjectS3IOManager(s3_bucket, s3_session, s3_prefix=s3_prefix)
+    pickled_io_manager = PickledObjectS3IOManager(
+        s3_bucket,
+        s3_session,
+        s3_prefix=s3_prefix,
+        streaming=init_context.resource_config["streaming"],
+        part_size=init_context.resource_config["part_size"],
+        max_concurrency=init_context.resource_config["max_concurrency"],
+    )
     return pickled_io_manager
@@ -1,10 +1,16 @@
+import logging
 import os
 import sys
 import tempfile
+import threading
+import time
+from unittest import mock
 
 import pytest
 from botocore.exceptions import ClientError
+from botocore.stub import Stubber
 from dagster_aws.s3 import S3ComputeLogManager
+from dagster_aws.s3.compute_log_manager import S3ComputeLogSegmentUploader
 
 from dagster import DagsterEventType, job, op
 from dagster._core.instance import DagsterInstance, InstanceRef, InstanceType
@@ -15,6 +21,7 @@
 from dagster._core.storage.root import LocalArtifactStorage
 from dagster._core.storage.runs import SqliteRunStorage
 from dagster._core.test_utils import environ
+from dagster._utils import ensure_dir
 
 HELLO_WORLD = "Hello World"
 SEPARATOR = os.linesep if (os.name == "nt" and sys.version_info < (3,)) else "\n"
@@ -170,3 +177,173 @@ def test_blank_compute_logs(mock_s3_bucket):
 
         assert not stdout.data
         assert not stderr.data
+
+
+def test_compute_log_manager_upload_segments(mock_s3_bucket):
+    @op
+    def slow(context):
+        context.log.info("slow")
+        print(HELLO_WORLD)  # pylint: disable=print-call
+        sys.stdout.flush()
+        time.sleep(3)
+
+        # the partial logs are visible while the step is executing
+        segments = list(
+            mock_s3_bucket.objects.filter(
+                Prefix=f"my_prefix/storage/{context.run_id}/compute_logs/slow.out.segments/"
+            )
+        )
+        assert len(segments) == 1
+        assert segments[0].get()["Body"].read().decode("utf-8") == HELLO_WORLD + SEPARATOR
+
+    @job
+    def simple():
+        slow()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with environ({"DAGSTER_HOME": temp_dir}):
+            manager = S3ComputeLogManager(
+                bucket=mock_s3_bucket.name,
+                prefix="my_prefix",
+                local_dir=temp_dir,
+                upload_interval=1,
+            )
+            instance = DagsterInstance(
+                instance_type=InstanceType.PERSISTENT,
+                local_artifact_storage=LocalArtifactStorage(temp_dir),
+                run_storage=SqliteRunStorage.from_local(temp_dir),
+                event_storage=SqliteEventLogStorage(temp_dir),
+                compute_log_manager=manager,
+                run_coordinator=DefaultRunCoordinator(),
+                run_launcher=DefaultRunLauncher(),
+                ref=InstanceRef.from_dir(temp_dir),
+            )
+            result = simple.execute_in_process(instance=instance)
+            assert result.success
+
+            # segments are cleaned up once the complete logs are uploaded
+            assert not list(
+                mock_s3_bucket.objects.filter(
+                    Prefix=f"my_prefix/storage/{result.run_id}/compute_logs/slow.out.segments/"
+                )
+            )
+            stdout_s3 = mock_s3_bucket.Object(
+                key=f"my_prefix/storage/{result.run_id}/compute_logs/slow.out"
+            )
+            assert stdout_s3.get()["Body"].read().decode("utf-8") == HELLO_WORLD + SEPARATOR
+
+
+def test_compute_log_manager_read_segments(mock_s3_bucket):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = S3ComputeLogManager(
+            bucket=mock_s3_bucket.name,
+            prefix="my_prefix",
+            local_dir=temp_dir,
+            upload_interval=60,
+            upload_segment_size=4,
+        )
+        run_id = "my_run_id"
+        step_key = "my_step_key"
+        local_path = manager.get_local_path(run_id, step_key, ComputeIOType.STDOUT)
+        ensure_dir(os.path.dirname(local_path))
+        with open(local_path, "w", encoding="utf8") as f:
+            f.write("abcdefghij")
+
+        uploader = S3ComputeLogSegmentUploader(manager, run_id, step_key, 60, 4)
+        uploader.upload_new_segments()
+        segments = list(
+            mock_s3_bucket.objects.filter(
+                Prefix=f"my_prefix/storage/{run_id}/compute_logs/{step_key}.out.segments/"
+            )
+        )
+        assert len(segments) == 3
+
+        # simulate reading from another host, where the local logs are not available
+        os.unlink(local_path)
+
+        stdout = manager.read_logs_file(run_id, step_key, ComputeIOType.STDOUT)
+        assert stdout.data == "abcdefghij"
+        assert stdout.cursor == 10
+        assert stdout.size == 10
+
+        # only the requested byte range is read, across segment boundaries
+        stdout = manager.read_logs_file(run_id, step_key, ComputeIOType.STDOUT, 3, max_bytes=4)
+        assert stdout.data == "defg"
+        assert stdout.cursor == 7
+
+        # reads of the complete logs are also range reads
+        mock_s3_bucket.put_object(
+            Key=f"my_prefix/storage/{run_id}/compute_logs/{step_key}.out", Body=b"0123456789"
+        )
+        stdout = manager.read_logs_file(run_id, step_key, ComputeIOType.STDOUT, 8, max_bytes=4)
+        assert stdout.data == "89"
+        assert stdout.cursor == 10
+        assert (
+            stdout.path
+            == f"s3://{mock_s3_bucket.name}/my_prefix/storage/{run_id}/compute_logs/{step_key}.out"
+        )
+
+
+def test_segment_uploader_deletes_stale_segments_off_the_step_thread(mock_s3_bucket):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = S3ComputeLogManager(
+            bucket=mock_s3_bucket.name, prefix="my_prefix", local_dir=temp_dir, upload_interval=60
+        )
+        run_id = "my_run_id"
+        step_key = "my_step_key"
+        stale_prefix = f"my_prefix/storage/{run_id}/compute_logs/{step_key}.out.segments/"
+        mock_s3_bucket.put_object(Key=f"{stale_prefix}{0:020d}", Body=b"stale")
+
+        delete_threads = []
+        delete_segments = manager._delete_segments  # pylint: disable=protected-access
+
+        def _delete_segments(*args):
+            delete_threads.append(threading.current_thread())
+            delete_segments(*args)
+
+        uploader = S3ComputeLogSegmentUploader(manager, run_id, step_key, 60, 4)
+        with mock.patch.object(manager, "_delete_segments", _delete_segments):
+            uploader.start()
+            uploader.stop()
+
+        assert len(delete_threads) == 2
+        assert threading.current_thread() not in delete_threads
+        assert not list(mock_s3_bucket.objects.filter(Prefix=stale_prefix))
+
+
+def test_segment_uploader_logs_upload_errors(mock_s3_bucket, caplog):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = S3ComputeLogManager(
+            bucket=mock_s3_bucket.name, prefix="my_prefix", local_dir=temp_dir, upload_interval=1
+        )
+        run_id = "my_run_id"
+        step_key = "my_step_key"
+        local_path = manager.get_local_path(run_id, step_key, ComputeIOType.STDOUT)
+        ensure_dir(os.path.dirname(local_path))
+        with open(local_path, "w", encoding="utf8") as f:
+            f.write("abcdefghij")
+
+        uploader = S3ComputeLogSegmentUploader(manager, run_id, step_key, 1, 4)
+        with Stubber(manager._s3_session) as stubber:  # pylint: disable=protected-access
+            # no stale segments to delete, then the segment upload is denied
+            stubber.add_response("list_objects_v2", {"KeyCount": 0})
+            stubber.add_response("list_objects_v2", {"KeyCount": 0})
+            stubber.add_client_error("put_object", service_error_code="AccessDenied")
+
+            with caplog.at_level(logging.ERROR):
+                uploader.start()
+                start_time = time.time()
+                while not any(
+                    "Failed to upload compute log segments" in record.getMessage()
+                    for record in caplog.records
+                ):
+                    assert time.time() - start_time < 10
+                    time.sleep(0.1)
+                uploader.stop()
+
+        error_records = [
+            record
+            for record in caplog.records
+            if "Failed to upload compute log segments" in record.getMessage()
+        ]
+        assert "AccessDenied" in str(error_records[0].exc_info[1])
@@ -1,4 +1,4 @@
-from dagster_aws.s3.io_manager import s3_pickle_io_manager
+from dagster_aws.s3.io_manager import PickledObjectS3IOManager, s3_pickle_io_manager
 from dagster_aws.s3.utils import construct_s3_client
 
 from dagster import (
@@ -11,6 +11,8 @@
     StaticPartitionsDefinition,
     VersionStrategy,
     asset,
+    build_input_context,
+    build_output_context,
     graph,
     job,
     materialize,
@@ -20,6 +22,7 @@
 )
 from dagster._core.definitions.assets import AssetsDefinition
 from dagster._core.test_utils import instance_for_test
+from dagster._core.types.dagster_type import resolve_dagster_type
 from dagster._legacy import build_assets_job
 
 
@@ -213,3 +216,65 @@ def asset2() -> None:
 
     for event in handled_output_events:
         assert len(event.event_specific_data.metadata_entries) == 0
+
+
+def define_large_output_job(streaming):
+    @op
+    def return_large():
+        # larger than two parts, so that it is written in a multipart upload
+        return {"data": bytearray(b"x" * (11 * 1024 * 1024)), "name": "large"}
+
+    @op
+    def check_large(large):
+        assert large["name"] == "large"
+        assert len(large["data"]) == 11 * 1024 * 1024
+        return len(large["data"])
+
+    @job(
+        resource_defs={
+            "io_manager": s3_pickle_io_manager.configured(
+                {"s3_bucket": "test-bucket", "streaming": streaming, "part_size": 5 * 1024 * 1024}
+            ),
+            "s3": s3_test_resource,
+        }
+    )
+    def large_output_job():
+        check_large(return_large())
+
+    return large_output_job
+
+
+def test_s3_pickle_io_manager_streaming(mock_s3_bucket):
+    result = define_large_output_job(streaming=True).execute_in_process()
+    assert result.success
+    assert result.output_for_node("check_large") == 11 * 1024 * 1024
+
+    large_object = mock_s3_bucket.Object(
+        "/".join(["dagster", "storage", result.run_id, "return_large", "result"])
+    )
+    assert large_object.content_length > 11 * 1024 * 1024
+    assert not list(mock_s3_bucket.multipart_uploads.all())
+
+
+def test_s3_pickle_io_manager_streaming_load_without_streaming(mock_s3_bucket):
+    s3_client = construct_s3_client(max_attempts=5)
+    streaming_io_manager = PickledObjectS3IOManager(
+        mock_s3_bucket.name, s3_client, s3_prefix="dagster", streaming=True
+    )
+    io_manager = PickledObjectS3IOManager(mock_s3_bucket.name, s3_client, s3_prefix="dagster")
+
+    dict_type = resolve_dagster_type(dict)
+    output_context = build_output_context(
+        run_id="my_run_id", step_key="my_step", name="result", dagster_type=dict_type
+    )
+    value = {"data": bytearray(b"abc" * 1000), "name": "small"}
+    streaming_io_manager.handle_output(output_context, value)
+
+    # objects written in streaming mode can be loaded whether or not streaming is enabled
+    input_context = build_input_context(upstream_output=output_context, dagster_type=dict_type)
+    assert streaming_io_manager.load_input(input_context) == value
+    assert io_manager.load_input(input_context) == value
+
+    # and objects written without streaming can be loaded in streaming mode
+    io_manager.handle_output(output_context, value)
+    assert streaming_io_manager.load_input(input_context) == value
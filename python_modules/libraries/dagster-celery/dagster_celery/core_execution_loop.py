@@ -5,11 +5,10 @@
 
 import dagster._check as check
 from dagster._core.errors import DagsterSubprocessError
-from dagster._core.events import DagsterEvent, EngineEventData
+from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster._core.execution.context.system import PlanOrchestrationContext
 from dagster._core.execution.plan.plan import ExecutionPlan
 from dagster._core.storage.tags import PRIORITY_TAG
-from dagster._serdes import deserialize_json_to_dagster_namedtuple
 from dagster._utils.error import serializable_error_info_from_exc_info
 
 from .defaults import task_default_priority, task_default_queue
@@ -21,16 +20,54 @@
 )
 
 TICK_SECONDS = 1
+MAX_TICK_SECONDS = 5
 DELEGATE_MARKER = "celery_queue_wait"
 
-
-def core_celery_execution_loop(pipeline_context, execution_plan, step_execution_fn):
-
+# Events after which the celery task for a step does no further work
+STEP_TASK_TERMINAL_EVENTS = {
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_UP_FOR_RETRY,
+    DagsterEventType.RESOURCE_INIT_FAILURE,
+}
+
+# The step events that celery tasks write to the event log, read back by the execution loop. Engine
+# events are excluded since the loop emits its own engine events for in-flight steps.
+STEP_TASK_EVENT_TYPES = {
+    event_type for event_type in DagsterEventType if event_type != DagsterEventType.ENGINE_EVENT
+}
+
+
+def core_celery_execution_loop(
+    pipeline_context,
+    execution_plan,
+    step_execution_fn,
+    poll_interval=TICK_SECONDS,
+    max_poll_interval=MAX_TICK_SECONDS,
+):
+    """Submits a celery task for each step as it becomes ready to execute, and tracks the steps
+    through the events that the tasks write to the run's event log.
+
+    Tasks write their events to the instance directly, so rather than waiting for each task's
+    result to be delivered by the result backend, the loop reads new events with a cursor into the
+    event log. Task results are only checked to detect tasks that errored or were revoked before the
+    step they were executing completed.
+
+    When nothing happens in an iteration, the interval between polls of the event log doubles, up to
+    ``max_poll_interval`` seconds, and it drops back to ``poll_interval`` seconds as soon as there
+    are new events or steps to submit.
+    """
     check.inst_param(pipeline_context, "pipeline_context", PlanOrchestrationContext)
     check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
     check.callable_param(step_execution_fn, "step_execution_fn")
+    poll_interval = check.numeric_param(poll_interval, "poll_interval")
+    max_poll_interval = max(
+        check.numeric_param(max_poll_interval, "max_poll_interval"), poll_interval
+    )
 
     executor = pipeline_context.executor
+    instance = pipeline_context.instance
+    run_id = pipeline_context.run_id
 
     # If there are no step keys to execute, then any io managers will not be used.
     if len(execution_plan.step_keys_to_execute) > 0:
@@ -47,13 +84,11 @@ def core_celery_execution_loop(pipeline_context, execution_plan, step_execution_
         -1 * int(step.tags.get(DAGSTER_CELERY_STEP_PRIORITY_TAG, task_default_priority))
         + -1 * _get_run_priority(pipeline_context)
     )
-    priority_for_key = lambda step_key: (
-        priority_for_step(execution_plan.get_step_by_key(step_key))
-    )
     _warn_on_priority_misuse(pipeline_context, execution_plan)
 
     step_results = {}  # Dict[ExecutionStep, celery.AsyncResult]
     step_errors = {}
+    event_cursor = None
 
     with execution_plan.start(
         retry_mode=pipeline_context.executor.retries,
@@ -61,8 +96,11 @@ def core_celery_execution_loop(pipeline_context, execution_plan, step_execution_
     ) as active_execution:
 
         stopping = False
+        tick_seconds = poll_interval
 
         while (not active_execution.is_complete and not stopping) or step_results:
+            has_progress = False
+
             if active_execution.check_for_interrupts():
                 yield DagsterEvent.engine_event(
                     pipeline_context,
@@ -71,92 +109,115 @@ def core_celery_execution_loop(pipeline_context, execution_plan, step_execution_
                 )
                 stopping = True
                 active_execution.mark_interrupted()
-                for result in step_results.values():
-                    result.revoke()
-            results_to_pop = []
-            for step_key, result in sorted(
-                step_results.items(), key=lambda x: priority_for_key(x[0])
-            ):
-                if result.ready():
-                    try:
-                        step_events = result.get()
-                    except TaskRevokedError:
-                        step_events = []
-                        step = active_execution.get_step_by_key(step_key)
-                        yield DagsterEvent.engine_event(
-                            pipeline_context.for_step(step),
-                            'celery task for running step "{step_key}" was revoked.'.format(
-                                step_key=step_key,
-                            ),
-                            EngineEventData(marker_end=DELEGATE_MARKER),
-                        )
-                    except Exception:
-                        # We will want to do more to handle the exception here.. maybe subclass Task
-                        # Certainly yield an engine or pipeline event
-                        step_events = []
-                        step_errors[step_key] = serializable_error_info_from_exc_info(
-                            sys.exc_info()
-                        )
-                    for step_event in step_events:
-                        event = deserialize_json_to_dagster_namedtuple(step_event)
-                        yield event
-                        active_execution.handle_event(event)
+                if step_results:
+                    # a single broadcast revokes every in-flight task
+                    app.control.revoke([result.id for result in step_results.values()])
+
+            # Tasks write all of their events before finishing, so any task that's ready now has
+            # all of its events in the event log by the time it is read below
+            finished_step_keys = [
+                step_key for step_key, result in step_results.items() if result.ready()
+            ]
+
+            connection = instance.get_records_for_run(
+                run_id, cursor=event_cursor, of_type=STEP_TASK_EVENT_TYPES
+            )
+            event_cursor = connection.cursor
+            for record in connection.records:
+                event = check.not_none(record.event_log_entry.dagster_event)
+                if event.step_key not in step_results:
+                    # events for steps that aren't executing in a task, e.g. skipped steps,
+                    # are emitted by the active execution itself
+                    continue
+
+                has_progress = True
+                yield event
+                active_execution.handle_event(event)
 
-                    results_to_pop.append(step_key)
+                if event.event_type in STEP_TASK_TERMINAL_EVENTS:
+                    del step_results[event.step_key]
+                    active_execution.verify_complete(pipeline_context, event.step_key)
 
-            for step_key in results_to_pop:
-                if step_key in step_results:
-                    del step_results[step_key]
-                    active_execution.verify_complete(pipeline_context, step_key)
+            for step_key in finished_step_keys:
+                if step_key not in step_results:
+                    continue
 
-            # process skips from failures or uncovered inputs
-            for event in active_execution.plan_events_iterator(pipeline_context):
-                yield event
-
-            # don't add any new steps if we are stopping
-            if stopping or step_errors:
-                continue
-
-            # This is a slight refinement. If we have n workers idle and schedule m > n steps for
-            # execution, the first n steps will be picked up by the idle workers in the order in
-            # which they are scheduled (and the following m-n steps will be executed in priority
-            # order, provided that it takes longer to execute a step than to schedule it). The test
-            # case has m >> n to exhibit this behavior in the absence of this sort step.
-            for step in active_execution.get_steps_to_execute():
+                # the task finished without the step completing, so it errored or was revoked
+                has_progress = True
+                result = step_results.pop(step_key)
                 try:
-                    queue = step.tags.get(DAGSTER_CELERY_QUEUE_TAG, task_default_queue)
+                    result.get()
+                except TaskRevokedError:
+                    step = active_execution.get_step_by_key(step_key)
                     yield DagsterEvent.engine_event(
                         pipeline_context.for_step(step),
-                        'Submitting celery task for step "{step_key}" to queue "{queue}".'.format(
-                            step_key=step.key, queue=queue
+                        'celery task for running step "{step_key}" was revoked.'.format(
+                            step_key=step_key,
                         ),
-                        EngineEventData(marker_start=DELEGATE_MARKER),
+                        EngineEventData(marker_end=DELEGATE_MARKER),
                     )
+                except Exception:
+                    # We will want to do more to handle the exception here.. maybe subclass Task
+                    # Certainly yield an engine or pipeline event
+                    step_errors[step_key] = serializable_error_info_from_exc_info(sys.exc_info())
 
-                    # Get the Celery priority for this step
-                    priority = _get_step_priority(pipeline_context, step)
-
-                    # Submit the Celery tasks
-                    step_results[step.key] = step_execution_fn(
-                        app,
-                        pipeline_context,
-                        step,
-                        queue,
-                        priority,
-                        active_execution.get_known_state(),
-                    )
+                active_execution.verify_complete(pipeline_context, step_key)
 
-                except Exception:
-                    yield DagsterEvent.engine_event(
-                        pipeline_context,
-                        "Encountered error during celery task submission.",
-                        event_specific_data=EngineEventData.engine_error(
-                            serializable_error_info_from_exc_info(sys.exc_info()),
-                        ),
-                    )
-                    raise
+            # process skips from failures or uncovered inputs
+            for event in active_execution.plan_events_iterator(pipeline_context):
+                has_progress = True
+                yield event
+
+            # don't add any new steps if we are stopping
+            if not (stopping or step_errors):
+                # This is a slight refinement. If we have n workers idle and schedule m > n steps
+                # for execution, the first n steps will be picked up by the idle workers in the
+                # order in which they are scheduled (and the following m-n steps will be executed
+                # in priority order, provided that it takes longer to execute a step than to
+                # schedule it). The test case has m >> n to exhibit this behavior in the absence of
+                # this sort step.
+                for step in active_execution.get_steps_to_execute():
+                    has_progress = True
+                    try:
+                        queue = step.tags.get(DAGSTER_CELERY_QUEUE_TAG, task_default_queue)
+                        yield DagsterEvent.engine_event(
+                            pipeline_context.for_step(step),
+                            'Submitting celery task for step "{step_key}" to queue "{queue}".'.format(
+                                step_key=step.key, queue=queue
+                            ),
+                            EngineEventData(marker_start=DELEGATE_MARKER),
+                        )
 
-            time.sleep(TICK_SECONDS)
+                        # Get the Celery priority for this step
+                        priority = _get_step_priority(pipeline_context, step)
+
+                        # Submit the Celery tasks
+                        step_results[step.key] = step_execution_fn(
+                            app,
+                            pipeline_context,
+                            step,
+                            queue,
+                            priority,
+                            active_execution.get_known_state(),
+                        )
+
+                    except Exception:
+                        yield DagsterEvent.engine_event(
+                            pipeline_context,
+                            "Encountered error during celery task submission.",
+                            event_specific_data=EngineEventData.engine_error(
+                                serializable_error_info_from_exc_info(sys.exc_info()),
+                            ),
+                        )
+                        raise
+
+            # back off while waiting on long-running steps, so that idle runs poll the event log
+            # less often
+            tick_seconds = (
+                poll_interval if has_progress else min(tick_seconds * 2, max_poll_interval)
+            )
+            if (not active_execution.is_complete and not stopping) or step_results:
+                time.sleep(tick_seconds)
 
         if step_errors:
             raise DagsterSubprocessError(
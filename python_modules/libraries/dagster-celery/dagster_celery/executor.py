@@ -1,11 +1,13 @@
-from dagster import Executor, Field, Noneable, Permissive, StringSource
+from dagster import Executor, Field, Float, Noneable, Permissive, StringSource
 from dagster import _check as check
 from dagster import executor, multiple_process_executor_requirements
 from dagster._core.execution.retries import RetryMode, get_retries_config
 from dagster._grpc.types import ExecuteStepArgs
 from dagster._serdes import pack_value
+from dagster._utils import merge_dicts
 
 from .config import DEFAULT_CONFIG, dict_wrapper
+from .core_execution_loop import MAX_TICK_SECONDS, TICK_SECONDS
 from .defaults import broker_url, result_backend
 
 CELERY_CONFIG = {
@@ -38,7 +40,25 @@
 
 @executor(
     name="celery",
-    config_schema=CELERY_CONFIG,
+    config_schema=merge_dicts(
+        CELERY_CONFIG,
+        {
+            "poll_interval_seconds": Field(
+                Float,
+                is_required=False,
+                default_value=float(TICK_SECONDS),
+                description="How often the executor checks the run's event log for progress of "
+                "its steps while steps are completing.",
+            ),
+            "max_poll_interval_seconds": Field(
+                Float,
+                is_required=False,
+                default_value=float(MAX_TICK_SECONDS),
+                description="While no steps complete, the interval between checks of the event log "
+                "doubles, up to this many seconds.",
+            ),
+        },
+    ),
     requirements=multiple_process_executor_requirements(),
 )
 def celery_executor(init_context):
@@ -82,6 +102,12 @@ def celery_enabled_job():
             config_source: # Dict[str, Any]: Any additional parameters to pass to the
                 #...       # Celery workers. This dict will be passed as the `config_source`
                 #...       # argument of celery.Celery().
+            poll_interval_seconds: 1.0 # Optional[float]: How often to check for step progress
+            max_poll_interval_seconds: 5.0 # Optional[float]: Longest interval between checks
+
+    Celery workers write step events directly to the run's event log, from which the executor
+    follows the progress of each step, so task results only carry errors back through the result
+    backend.
 
     Note that the YAML you provide here must align with the configuration with which the Celery
     workers on which you hope to run were started. If, for example, you point the executor at a
@@ -95,6 +121,8 @@ def celery_enabled_job():
         config_source=init_context.executor_config.get("config_source"),
         include=init_context.executor_config.get("include"),
         retries=RetryMode.from_config(init_context.executor_config["retries"]),
+        poll_interval_seconds=init_context.executor_config["poll_interval_seconds"],
+        max_poll_interval_seconds=init_context.executor_config["max_poll_interval_seconds"],
     )
 
 
@@ -130,6 +158,8 @@ def __init__(
         backend=None,
         include=None,
         config_source=None,
+        poll_interval_seconds=None,
+        max_poll_interval_seconds=None,
     ):
         self.broker = check.opt_str_param(broker, "broker", default=broker_url)
         self.backend = check.opt_str_param(backend, "backend", default=result_backend)
@@ -138,6 +168,12 @@ def __init__(
             dict(DEFAULT_CONFIG, **check.opt_dict_param(config_source, "config_source"))
         )
         self._retries = check.inst_param(retries, "retries", RetryMode)
+        self.poll_interval_seconds = check.opt_numeric_param(
+            poll_interval_seconds, "poll_interval_seconds", default=TICK_SECONDS
+        )
+        self.max_poll_interval_seconds = check.opt_numeric_param(
+            max_poll_interval_seconds, "max_poll_interval_seconds", default=MAX_TICK_SECONDS
+        )
 
     @property
     def retries(self):
@@ -147,7 +183,11 @@ def execute(self, plan_context, execution_plan):
         from .core_execution_loop import core_celery_execution_loop
 
         return core_celery_execution_loop(
-            plan_context, execution_plan, step_execution_fn=_submit_task
+            plan_context,
+            execution_plan,
+            step_execution_fn=_submit_task,
+            poll_interval=self.poll_interval_seconds,
+            max_poll_interval=self.max_poll_interval_seconds,
         )
 
     @staticmethod
@@ -4,7 +4,7 @@
 from dagster._core.events import EngineEventData
 from dagster._core.execution.api import create_execution_plan, execute_plan_iterator
 from dagster._grpc.types import ExecuteStepArgs
-from dagster._serdes import serialize_dagster_namedtuple, unpack_value
+from dagster._serdes import unpack_value
 
 from .core_execution_loop import DELEGATE_MARKER
 from .executor import CeleryExecutor
@@ -43,7 +43,7 @@ def _execute_plan(self, execute_step_args_packed, executable_dict):
             known_state=execute_step_args.known_state,
         )
 
-        engine_event = instance.report_engine_event(
+        instance.report_engine_event(
             "Executing steps {} in celery worker".format(step_keys_str),
             pipeline_run,
             EngineEventData(
@@ -57,8 +57,9 @@ def _execute_plan(self, execute_step_args_packed, executable_dict):
             step_key=execution_plan.step_handle_for_single_step_plans().to_key(),
         )
 
-        events = [engine_event]
-        for step_event in execute_plan_iterator(
+        # The events are written to the run's event log as the steps execute, which is where the
+        # execution loop reads them from, so they aren't returned through the result backend
+        for _ in execute_plan_iterator(
             execution_plan=execution_plan,
             pipeline=pipeline,
             pipeline_run=pipeline_run,
@@ -66,9 +67,6 @@ def _execute_plan(self, execute_step_args_packed, executable_dict):
             retry_mode=retry_mode,
             run_config=pipeline_run.run_config,
         ):
-            events.append(step_event)
-
-        serialized_events = [serialize_dagster_namedtuple(event) for event in events]
-        return serialized_events
+            pass
 
     return _execute_plan
@@ -2,6 +2,7 @@
 # pylint: disable=unused-argument
 
 import os
+import tempfile
 from threading import Thread
 from unittest import mock
 
@@ -200,6 +201,30 @@ def test_execute_eagerly_serial_on_celery():
         assert len(events_of_type(result, "STEP_SUCCESS")) == 2
 
 
+def test_execute_eagerly_with_poll_intervals_on_celery():
+    with tempfile.TemporaryDirectory() as tempdir:
+        run_config = {
+            "resources": {"io_manager": {"config": {"base_dir": tempdir}}},
+            "execution": {
+                "celery": {
+                    "config": {
+                        "config_source": {"task_always_eager": True},
+                        "poll_interval_seconds": 0.1,
+                        "max_poll_interval_seconds": 0.5,
+                    }
+                }
+            },
+        }
+        with execute_pipeline_on_celery(
+            "test_serial_pipeline", run_config=run_config, tempdir=tempdir
+        ) as result:
+            assert result.success
+            assert result.result_for_solid("add_one").output_value() == 2
+            # each step event is read from the event log exactly once
+            assert len(result.step_event_list) == 10
+            assert len(events_of_type(result, "STEP_SUCCESS")) == 2
+
+
 def test_execute_eagerly_diamond_pipeline_on_celery():
     with execute_eagerly_on_celery("test_diamond_pipeline") as result:
         assert result.result_for_solid("emit_values").output_values == {
@@ -2,6 +2,7 @@
 
 from .data_frame import DataFrame
 from .executor import dask_executor
+from .io_manager import dask_in_memory_io_manager
 from .resources import dask_resource
 from .version import __version__
 
@@ -10,4 +11,5 @@
 __all__ = [
     "DataFrame",
     "dask_executor",
+    "dask_in_memory_io_manager",
 ]
@@ -1,3 +1,5 @@
+from typing import Any, Dict, List, NamedTuple
+
 import dask
 import dask.distributed
 
@@ -14,6 +16,8 @@
 from dagster._core.instance import DagsterInstance
 from dagster._utils import frozentags, iterate_with_context
 
+from .io_manager import OutputKey, dask_worker_outputs
+
 # Dask resource requirements are specified under this key
 DASK_RESOURCE_REQUIREMENTS_KEY = "dagster-dask/resource_requirements"
 
@@ -101,11 +105,22 @@ def dask_executor(init_context):
         def dask_enabled_job():
             pass
 
+    The whole execution plan is submitted to Dask at once, and each step starts as soon as the steps
+    it depends on have finished. To pass outputs between steps in memory, worker-to-worker, instead
+    of through storage, use the :py:func:`dask_in_memory_io_manager`.
     """
     ((cluster_type, cluster_configuration),) = init_context.executor_config["cluster"].items()
     return DaskExecutor(cluster_type, cluster_configuration)
 
 
+class DaskStepResult(NamedTuple):
+    """The result of executing a step on a Dask worker: the step's events, and any outputs that
+    were stored in memory by the ``dask_in_memory_io_manager``."""
+
+    events: List[DagsterEvent]
+    outputs: Dict[OutputKey, Any]
+
+
 def query_on_dask_worker(
     dependencies,
     recon_pipeline,
@@ -115,10 +130,14 @@ def query_on_dask_worker(
     mode,
     instance_ref,
     known_state,
-):  # pylint: disable=unused-argument
+):
     """Note that we need to pass "dependencies" to ensure Dask sequences futures during task
-    scheduling, even though we do not use this argument within the function.
+    scheduling. Dask resolves them to the results of the upstream steps, which carry the in-memory
+    outputs that this step's inputs may be loaded from.
     """
+    upstream_outputs = {}
+    for dependency in dependencies:
+        upstream_outputs.update(dependency.outputs)
 
     with DagsterInstance.from_ref(instance_ref) as instance:
         subset_pipeline = recon_pipeline.subset_for_execution_from_existing_pipeline(
@@ -133,9 +152,19 @@ def query_on_dask_worker(
             known_state=known_state,
         )
 
-        return execute_plan(
-            execution_plan, subset_pipeline, instance, pipeline_run, run_config=run_config
-        )
+        with dask_worker_outputs(upstream_outputs) as outputs:
+            events = execute_plan(
+                execution_plan, subset_pipeline, instance, pipeline_run, run_config=run_config
+            )
+
+        # identifiers are (run_id, step_key, output_name[, mapping_key])
+        step_outputs = {key: value for key, value in outputs.items() if key[1] in step_keys}
+
+        return DaskStepResult(events=events, outputs=step_outputs)
+
+
+def get_step_events(step_result: DaskStepResult) -> List[DagsterEvent]:
+    return step_result.events
 
 
 def get_dask_resource_requirements(tags):
@@ -228,13 +257,14 @@ def execute(self, plan_context, execution_plan):
             )
 
         with dask.distributed.Client(cluster) as client:
-            execution_futures = []
             execution_futures_dict = {}
+            event_futures = []
 
+            # The whole plan is submitted up front, with each step depending on the futures of its
+            # upstream steps, so Dask can start each step as soon as its own inputs are ready and
+            # place it on a worker that already holds them.
             for step_level in step_levels:
                 for step in step_level:
-                    # We ensure correctness in sequencing by letting Dask schedule futures and
-                    # awaiting dependencies within each step.
                     dependencies = []
                     for step_input in step.step_inputs:
                         for key in step_input.dependency_keys:
@@ -262,13 +292,17 @@ def execute(self, plan_context, execution_plan):
                         key=dask_task_name,
                         resources=get_dask_resource_requirements(step.tags),
                     )
-
-                    execution_futures.append(future)
                     execution_futures_dict[step.key] = future
 
-            # This tells Dask to awaits the step executions and retrieve their results to the
+                    # Only the events are sent back to the client - in-memory outputs stay on the
+                    # workers, and are only transferred to the workers of downstream steps
+                    event_futures.append(
+                        client.submit(get_step_events, future, key=f"{dask_task_name}.events")
+                    )
+
+            # This tells Dask to awaits the step executions and retrieve their events to the
             # master
-            futures = dask.distributed.as_completed(execution_futures, with_results=True)
+            futures = dask.distributed.as_completed(event_futures, with_results=True)
 
             # Allow interrupts while waiting for the results from Dask
             for future, result in iterate_with_context(raise_execution_interrupts, futures):
@@ -0,0 +1,89 @@
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
+
+from dagster import IOManager
+from dagster import _check as check
+from dagster import io_manager
+from dagster._core.errors import DagsterInvariantViolationError
+
+OutputKey = Tuple[str, ...]
+
+# The outputs available to the step that is currently executing on this thread of a Dask worker
+_worker_outputs = threading.local()
+
+
+@contextmanager
+def dask_worker_outputs(
+    upstream_outputs: Mapping[OutputKey, Any]
+) -> Iterator[Dict[OutputKey, Any]]:
+    """Makes the in-memory outputs of upstream steps available to the
+    ``dask_in_memory_io_manager`` while a step executes on a Dask worker, and yields the dict that
+    the step's own outputs are stored in.
+    """
+    outputs = dict(upstream_outputs)
+    _worker_outputs.values = outputs
+    try:
+        yield outputs
+    finally:
+        _worker_outputs.values = None
+
+
+def _get_worker_outputs() -> Optional[Dict[OutputKey, Any]]:
+    return getattr(_worker_outputs, "values", None)
+
+
+class DaskInMemoryIOManager(IOManager):
+    def __init__(self):
+        self.values: Dict[OutputKey, Any] = {}
+
+    def _get_values(self) -> Dict[OutputKey, Any]:
+        worker_outputs = _get_worker_outputs()
+        return self.values if worker_outputs is None else worker_outputs
+
+    def handle_output(self, context, obj):
+        keys = tuple(context.get_identifier())
+        self._get_values()[keys] = obj
+
+    def load_input(self, context):
+        keys = tuple(check.not_none(context.upstream_output).get_identifier())
+        values = self._get_values()
+        if keys not in values:
+            raise DagsterInvariantViolationError(
+                f"No in-memory value for output {keys}. The dask_in_memory_io_manager can only pass "
+                "outputs between steps executed by the dask_executor in the same run."
+            )
+        return values[keys]
+
+
+@io_manager(
+    description=(
+        "IO manager that keeps outputs in the memory of the Dask worker that produced them, from "
+        "which Dask transfers them directly to the workers of downstream steps."
+    )
+)
+def dask_in_memory_io_manager(_):
+    """IO manager that passes outputs between steps in memory when executing with the
+    :py:func:`dask_executor`.
+
+    Outputs stay in the memory of the Dask worker that produced them, and are sent by Dask
+    worker-to-worker to the steps that consume them, rather than being written to and read back from
+    storage. Dask schedules steps on the workers that already hold their inputs where it can.
+
+    Outputs only live as long as the run's Dask futures, so they can't be loaded once the run has
+    finished, and a step can't be re-executed on its own without also re-executing its upstream
+    steps.
+
+    Example:
+        .. code-block:: python
+
+            from dagster_dask import dask_executor, dask_in_memory_io_manager
+
+            @job(
+                executor_def=dask_executor,
+                resource_defs={"io_manager": dask_in_memory_io_manager},
+            )
+            def my_job():
+                ...
+    """
+    return DaskInMemoryIOManager()
@@ -5,7 +5,7 @@
 
 import dagster_pandas as dagster_pd
 import pytest
-from dagster_dask import DataFrame, dask_executor
+from dagster_dask import DataFrame, dask_executor, dask_in_memory_io_manager
 from dask.distributed import Scheduler, Worker
 
 from dagster import (
@@ -337,3 +337,42 @@ def test_dask_executor_job():
         )
         assert result.success
         assert result.output_for_solid("the_op") == 5
+
+
+@op
+def in_memory_value():
+    return {"value": 5}
+
+
+@op
+def add_one_in_memory(upstream):
+    return upstream["value"] + 1
+
+
+@op
+def check_fan_in(first, second):
+    assert first == 6
+    assert second == 6
+
+
+@job(executor_def=dask_executor, resource_defs={"io_manager": dask_in_memory_io_manager})
+def in_memory_job():
+    upstream = in_memory_value()
+    check_fan_in(
+        add_one_in_memory.alias("first")(upstream), add_one_in_memory.alias("second")(upstream)
+    )
+
+
+def test_dask_executor_in_memory_io_manager():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(in_memory_job),
+            instance=instance,
+            run_config={"execution": {"config": {"cluster": {"local": {"timeout": 30}}}}},
+        )
+        assert result.success
+        assert {
+            event.step_key
+            for event in result.step_event_list
+            if event.event_type == DagsterEventType.STEP_SUCCESS
+        } == {"in_memory_value", "first", "second", "check_fan_in"}
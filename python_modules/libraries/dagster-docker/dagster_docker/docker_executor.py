@@ -1,10 +1,10 @@
-from typing import Iterator, Optional, cast
+from typing import Iterator, Optional, Sequence, cast
 
 import docker
 from dagster_docker.utils import DOCKER_CONFIG_SCHEMA, validate_docker_config, validate_docker_image
 
 import dagster._check as check
-from dagster import executor
+from dagster import Field, IntSource, executor
 from dagster._annotations import experimental
 from dagster._core.definitions.executor_definition import multiple_process_executor_requirements
 from dagster._core.events import DagsterEvent, EngineEventData, MetadataEntry
@@ -32,6 +32,12 @@
         DOCKER_CONFIG_SCHEMA,
         {
             "retries": get_retries_config(),
+            "launch_parallelism": Field(
+                IntSource,
+                is_required=False,
+                description="The number of threads used to create step containers when several "
+                "steps become ready to execute at once. Defaults to 1.",
+            ),
         },
     ),
     requirements=multiple_process_executor_requirements(),
@@ -58,6 +64,10 @@ def docker_executor(init_context: InitExecutorContext) -> Executor:
             network: ...
             networks: ...
             container_kwargs: ...
+            launch_parallelism: ...
+
+    `launch_parallelism` sets how many threads create step containers at once when many steps
+    become ready at the same time. By default containers are created one at a time.
 
     If you're using the DockerRunLauncher, configuration set on the containers created by the run
     launcher will also be set on the containers that are created for each step.
@@ -87,6 +97,7 @@ def docker_executor(init_context: InitExecutorContext) -> Executor:
     return StepDelegatingExecutor(
         DockerStepHandler(image, container_context),
         retries=check.not_none(RetryMode.from_config(retries)),
+        launch_parallelism=check.opt_int_elem(config, "launch_parallelism"),
     )
 
 
@@ -186,13 +197,36 @@ def _create_step_container(self, client, container_context, step_image, execute_
         )
 
     def launch_step(self, step_handler_context: StepHandlerContext) -> Iterator[DagsterEvent]:
-        container_context = self._get_docker_container_context(step_handler_context)
+        yield from self.launch_steps([step_handler_context])
+
+    def launch_steps(
+        self, step_handler_contexts: Sequence[StepHandlerContext]
+    ) -> Iterator[DagsterEvent]:
+        if not step_handler_contexts:
+            return
+
+        # The container context, client, and image are the same for every step in the run, so the
+        # registry login and image validation only happen once for the whole batch
+        first_context = step_handler_contexts[0]
+        container_context = self._get_docker_container_context(first_context)
 
         client = self._get_client(container_context)
 
-        step_image = self._get_image(step_handler_context)
+        step_image = self._get_image(first_context)
         validate_docker_image(step_image)
 
+        for step_handler_context in step_handler_contexts:
+            yield from self._launch_step_container(
+                step_handler_context, client, container_context, step_image
+            )
+
+    def _launch_step_container(
+        self,
+        step_handler_context: StepHandlerContext,
+        client,
+        container_context: DockerContainerContext,
+        step_image: str,
+    ) -> Iterator[DagsterEvent]:
         try:
             step_container = self._create_step_container(
                 client, container_context, step_image, step_handler_context.execute_step_args
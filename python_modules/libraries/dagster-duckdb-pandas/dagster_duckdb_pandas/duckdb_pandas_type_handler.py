@@ -56,6 +56,10 @@ def handle_output(
 
     def load_input(self, context: InputContext, conn: duckdb.DuckDBPyConnection) -> pd.DataFrame:
         """Loads the input as a Pandas DataFrame."""
+        check.invariant(
+            not context.has_asset_partitions,
+            "DuckDBPandasTypeHandler can't load partitioned inputs",
+        )
         return conn.execute(
             f"SELECT * FROM {self._table_path(context, cast(OutputContext, context.upstream_output))}"
         ).fetchdf()
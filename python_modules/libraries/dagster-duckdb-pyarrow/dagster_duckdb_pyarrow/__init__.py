@@ -0,0 +1 @@
+from .duckdb_pyarrow_type_handler import DuckDBPyArrowTypeHandler as DuckDBPyArrowTypeHandler
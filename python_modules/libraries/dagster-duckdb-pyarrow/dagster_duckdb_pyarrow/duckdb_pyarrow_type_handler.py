@@ -0,0 +1,155 @@
+from pathlib import Path
+from typing import Optional, Sequence, Union, cast
+
+import duckdb
+import pyarrow as pa
+from dagster_duckdb import DbTypeHandler
+
+from dagster import InputContext, OutputContext
+from dagster import _check as check
+
+DUCKDB_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# name under which outputs are registered with the connection while they are being written
+_ARROW_VIEW_NAME = "__dagster_arrow_output"
+_ARROW_SCHEMA_VIEW_NAME = "__dagster_arrow_output_schema"
+
+ArrowData = Union[pa.Table, pa.RecordBatch, pa.RecordBatchReader]
+
+
+class DuckDBPyArrowTypeHandler(DbTypeHandler[ArrowData]):
+    """Stores and loads PyArrow Tables in DuckDB.
+
+    Outputs are registered with DuckDB as Arrow views, so DuckDB scans the Arrow buffers directly
+    instead of going through an intermediate file, and are stored as DuckDB tables. Outputs may be
+    ``pyarrow.Table``, ``pyarrow.RecordBatch``, or ``pyarrow.RecordBatchReader`` objects - a
+    ``RecordBatchReader`` is consumed batch by batch, so it never needs to fit in memory.
+
+    Inputs annotated as ``pyarrow.Table`` are loaded as a single table. Inputs annotated as
+    ``pyarrow.RecordBatchReader`` are loaded as batches of at most ``batch_size`` rows.
+
+    Loads only select the columns listed in the ``columns`` input metadata, if provided. Partitioned
+    assets are stored in a single table: the upstream output must set ``partition_expr`` metadata to
+    a SQL expression over the partition's timestamp column, which is used to replace the rows of a
+    materialized partition and to filter the rows that are loaded for a downstream partition.
+
+    To use this type handler, pass it to ``build_duckdb_io_manager``
+
+    Example:
+        .. code-block:: python
+
+            from dagster_duckdb import build_duckdb_io_manager
+            from dagster_duckdb_pyarrow import DuckDBPyArrowTypeHandler
+
+            duckdb_io_manager = build_duckdb_io_manager([DuckDBPyArrowTypeHandler()])
+
+            @asset(
+                partitions_def=DailyPartitionsDefinition(start_date="2022-01-01"),
+                metadata={"partition_expr": "event_time"},
+            )
+            def events() -> pa.Table:
+                ...
+
+            @asset(ins={"events": AssetIn(metadata={"columns": ["user_id", "event_time"]})})
+            def users(events: pa.RecordBatchReader) -> pa.Table:
+                ...
+
+            @repository
+            def my_repo():
+                return with_resources([events, users], {"io_manager": duckdb_io_manager})
+
+    Args:
+        batch_size (int): The maximum number of rows in each batch produced when loading inputs
+            annotated as ``pyarrow.RecordBatchReader``.
+    """
+
+    def __init__(self, batch_size: int = 1_000_000):
+        self._batch_size = check.int_param(batch_size, "batch_size")
+
+    def handle_output(
+        self,
+        context: OutputContext,
+        obj: ArrowData,
+        conn: duckdb.DuckDBPyConnection,
+        base_path: str,
+    ):
+        """Registers the Arrow data with duckdb and writes it to a table."""
+        if isinstance(obj, pa.RecordBatch):
+            # wraps the batch's buffers without copying them
+            obj = pa.Table.from_batches([obj])
+
+        schema = self._schema(context, context)
+        table_path = self._table_path(context, context)
+
+        conn.register(_ARROW_VIEW_NAME, obj)
+        try:
+            conn.execute(f"create schema if not exists {schema};")
+            if context.has_asset_partitions:
+                partition_where = self._partition_where_clause(context, context)
+                # a RecordBatchReader can only be read once, so the table is created from an empty
+                # table with the same schema rather than from the output itself
+                conn.register(_ARROW_SCHEMA_VIEW_NAME, obj.schema.empty_table())
+                try:
+                    conn.execute(
+                        f"create table if not exists {table_path} as "
+                        f"select * from {_ARROW_SCHEMA_VIEW_NAME};"
+                    )
+                finally:
+                    conn.unregister(_ARROW_SCHEMA_VIEW_NAME)
+                conn.execute(f"delete from {table_path} {partition_where};")
+                row_count = conn.execute(
+                    f"insert into {table_path} select * from {_ARROW_VIEW_NAME};"
+                ).fetchone()[0]
+            else:
+                conn.execute(
+                    f"create or replace table {table_path} as select * from {_ARROW_VIEW_NAME};"
+                )
+                row_count = conn.execute(f"select count(*) from {table_path};").fetchone()[0]
+        finally:
+            conn.unregister(_ARROW_VIEW_NAME)
+
+        context.add_output_metadata({"row_count": row_count, "table": table_path})
+
+    def load_input(self, context: InputContext, conn: duckdb.DuckDBPyConnection) -> ArrowData:
+        """Loads the input as a PyArrow Table, or as a RecordBatchReader over the query results."""
+        upstream_output = cast(OutputContext, context.upstream_output)
+        columns: Optional[Sequence[str]] = (context.metadata or {}).get("columns")
+        col_str = ", ".join(columns) if columns else "*"
+
+        query = f"select {col_str} from {self._table_path(context, upstream_output)}"
+        if context.has_asset_partitions:
+            query += f" {self._partition_where_clause(context, upstream_output)}"
+
+        if context.dagster_type.typing_type == pa.RecordBatchReader:
+            # the batches are read before returning, so that the connection is closed and the
+            # database file is unlocked while the downstream op runs
+            reader = conn.execute(query).fetch_record_batch(self._batch_size)
+            return pa.RecordBatchReader.from_batches(reader.schema, list(reader))
+
+        return conn.execute(query).fetch_arrow_table()
+
+    def _partition_where_clause(self, context, output_context: OutputContext) -> str:
+        partition_expr = (output_context.metadata or {}).get("partition_expr")
+        check.invariant(
+            partition_expr is not None,
+            f"Asset '{context.asset_key.to_user_string()}' has partitions, but no "
+            "'partition_expr' metadata value, so the rows of each partition can't be identified.",
+        )
+
+        start_dt, end_dt = context.asset_partitions_time_window
+        start_dt_str = start_dt.strftime(DUCKDB_DATETIME_FORMAT)
+        end_dt_str = end_dt.strftime(DUCKDB_DATETIME_FORMAT)
+        return f"where {partition_expr} >= '{start_dt_str}' and {partition_expr} < '{end_dt_str}'"
+
+    @property
+    def supported_output_types(self):
+        return [pa.Table, pa.RecordBatch, pa.RecordBatchReader]
+
+    @property
+    def supported_input_types(self):
+        return [pa.Table, pa.RecordBatchReader]
+
+    def _get_path(self, context: OutputContext, base_path: str) -> Path:
+        # outputs are stored as tables in the duckdb database itself rather than as files under
+        # the base path
+        return Path(context.resource_config["duckdb_path"])
@@ -0,0 +1,206 @@
+import os
+
+import duckdb
+import pyarrow as pa
+import pyarrow.compute as pc
+import pytest
+from dagster_duckdb.io_manager import build_duckdb_io_manager
+from dagster_duckdb_pyarrow import DuckDBPyArrowTypeHandler
+
+from dagster import (
+    AssetIn,
+    DailyPartitionsDefinition,
+    PartitionedConfig,
+    asset,
+    graph,
+    materialize,
+    op,
+)
+from dagster._check import CheckError
+from dagster._core.definitions import build_assets_job
+
+
+@op
+def a_table() -> pa.Table:
+    return pa.table({"a": [1, 2, 3], "b": [4, 5, 6]})
+
+
+@op
+def add_one(table: pa.Table) -> pa.RecordBatch:
+    return pa.RecordBatch.from_arrays(
+        [pc.add(table.column(name), 1).combine_chunks() for name in table.column_names],
+        names=table.column_names,
+    )
+
+
+@graph
+def add_one_to_table():
+    add_one(a_table())
+
+
+def test_duckdb_io_manager_with_ops(tmp_path):
+    duckdb_path = os.path.join(tmp_path, "unit_test.duckdb")
+    duckdb_io_manager = build_duckdb_io_manager([DuckDBPyArrowTypeHandler()])
+    resource_defs = {"io_manager": duckdb_io_manager.configured({"duckdb_path": duckdb_path})}
+
+    job = add_one_to_table.to_job(resource_defs=resource_defs)
+
+    res = job.execute_in_process()
+    assert res.success
+
+    conn = duckdb.connect(database=duckdb_path)
+    assert conn.execute("select a, b from public.result order by a").fetchall() == [
+        (2, 5),
+        (3, 6),
+        (4, 7),
+    ]
+    conn.close()
+
+
+@asset(key_prefix=["my_schema"])
+def b_table() -> pa.Table:
+    return pa.table({"a": [1, 2, 3], "b": [4, 5, 6]})
+
+
+@asset(key_prefix=["my_schema"], ins={"b_table": AssetIn(metadata={"columns": ["a"]})})
+def b_table_a_column(b_table: pa.Table) -> pa.Table:
+    assert b_table.column_names == ["a"]
+    return b_table
+
+
+@asset(key_prefix=["my_schema"])
+def b_table_batches(b_table: pa.RecordBatchReader) -> pa.RecordBatchReader:
+    batches = list(b_table)
+    assert all(batch.num_rows <= 2 for batch in batches)
+    return pa.RecordBatchReader.from_batches(batches[0].schema, iter(batches))
+
+
+def test_duckdb_io_manager_with_assets(tmp_path):
+    duckdb_path = os.path.join(tmp_path, "unit_test.duckdb")
+    duckdb_io_manager = build_duckdb_io_manager([DuckDBPyArrowTypeHandler(batch_size=2)])
+    resource_defs = {"io_manager": duckdb_io_manager.configured({"duckdb_path": duckdb_path})}
+
+    res = materialize([b_table, b_table_a_column, b_table_batches], resources=resource_defs)
+    assert res.success
+
+    conn = duckdb.connect(database=duckdb_path)
+    assert conn.execute("select * from my_schema.b_table_a_column order by a").fetchall() == [
+        (1,),
+        (2,),
+        (3,),
+    ]
+    assert conn.execute("select count(*) from my_schema.b_table_batches").fetchone()[0] == 3
+    conn.close()
+
+
+@asset(
+    key_prefix=["my_schema"],
+    partitions_def=DailyPartitionsDefinition(start_date="2022-01-01"),
+    metadata={"partition_expr": "time"},
+    config_schema={"value": int},
+)
+def daily_table(context) -> pa.Table:
+    start, _ = context.output_asset_partitions_time_window()
+    return pa.table(
+        {
+            "time": pa.array([start, start], type=pa.timestamp("s")),
+            "value": [context.op_config["value"]] * 2,
+        }
+    )
+
+
+@asset(
+    key_prefix=["my_schema"],
+    partitions_def=DailyPartitionsDefinition(start_date="2022-01-01"),
+)
+def downstream_daily_table(daily_table: pa.Table) -> None:
+    assert daily_table.num_rows == 2
+    assert len(set(daily_table.column("time").to_pylist())) == 1
+
+
+def test_duckdb_io_manager_with_partitioned_assets(tmp_path):
+    duckdb_path = os.path.join(tmp_path, "unit_test.duckdb")
+    duckdb_io_manager = build_duckdb_io_manager([DuckDBPyArrowTypeHandler()])
+    resource_defs = {"io_manager": duckdb_io_manager.configured({"duckdb_path": duckdb_path})}
+
+    partitions_def = DailyPartitionsDefinition(start_date="2022-01-01")
+    values = {}
+    daily_job = build_assets_job(
+        "daily_job",
+        [daily_table, downstream_daily_table],
+        resource_defs=resource_defs,
+        partitions_def=partitions_def,
+        config=PartitionedConfig(
+            partitions_def=partitions_def,
+            run_config_for_partition_fn=lambda partition: {
+                "ops": {"my_schema__daily_table": {"config": {"value": values[partition.name]}}}
+            },
+        ),
+    )
+
+    def _materialize(partition_key, value):
+        values[partition_key] = value
+        return daily_job.execute_in_process(partition_key=partition_key)
+
+    assert _materialize("2022-01-01", 1).success
+    assert _materialize("2022-01-02", 2).success
+    # rematerializing a partition replaces its rows
+    assert _materialize("2022-01-01", 3).success
+
+    conn = duckdb.connect(database=duckdb_path)
+    assert conn.execute(
+        "select strftime(time, '%Y-%m-%d'), sum(value) from my_schema.daily_table "
+        "group by 1 order by 1"
+    ).fetchall() == [("2022-01-01", 6), ("2022-01-02", 4)]
+    conn.close()
+
+
+@asset(
+    key_prefix=["my_schema"],
+    partitions_def=DailyPartitionsDefinition(start_date="2022-01-01"),
+    metadata={"partition_expr": "time"},
+)
+def daily_batches(context) -> pa.RecordBatchReader:
+    start, _ = context.output_asset_partitions_time_window()
+    batches = [
+        pa.RecordBatch.from_arrays(
+            [pa.array([start, start], type=pa.timestamp("s")), pa.array([i, i])],
+            names=["time", "value"],
+        )
+        for i in range(3)
+    ]
+    return pa.RecordBatchReader.from_batches(batches[0].schema, iter(batches))
+
+
+def test_duckdb_io_manager_with_partitioned_record_batch_reader(tmp_path):
+    duckdb_path = os.path.join(tmp_path, "unit_test.duckdb")
+    duckdb_io_manager = build_duckdb_io_manager([DuckDBPyArrowTypeHandler()])
+    resource_defs = {"io_manager": duckdb_io_manager.configured({"duckdb_path": duckdb_path})}
+
+    for partition_key in ["2022-01-01", "2022-01-02"]:
+        res = materialize([daily_batches], partition_key=partition_key, resources=resource_defs)
+        assert res.success
+
+    conn = duckdb.connect(database=duckdb_path)
+    assert conn.execute(
+        "select strftime(time, '%Y-%m-%d'), count(*) from my_schema.daily_batches "
+        "group by 1 order by 1"
+    ).fetchall() == [("2022-01-01", 6), ("2022-01-02", 6)]
+    conn.close()
+
+
+@asset(key_prefix=["my_schema"], partitions_def=DailyPartitionsDefinition(start_date="2022-01-01"))
+def missing_partition_expr() -> pa.Table:
+    return pa.table({"a": [1]})
+
+
+def test_partitioned_asset_requires_partition_expr(tmp_path):
+    duckdb_io_manager = build_duckdb_io_manager([DuckDBPyArrowTypeHandler()])
+    resource_defs = {
+        "io_manager": duckdb_io_manager.configured(
+            {"duckdb_path": os.path.join(tmp_path, "unit_test.duckdb")}
+        ),
+    }
+
+    with pytest.raises(CheckError, match="no 'partition_expr' metadata value"):
+        materialize([missing_partition_expr], partition_key="2022-01-01", resources=resource_defs)
@@ -111,10 +111,6 @@ def load_input(self, context: InputContext):
             f"for types '{', '.join([str(handler_type) for handler_type in self._input_handlers_by_type.keys()])}'",
         )
 
-        check.invariant(
-            not context.has_asset_partitions, "DuckDBIOManager can't load partitioned inputs"
-        )
-
         conn = self._connect_duckdb(context).cursor()
         ret = self._input_handlers_by_type[obj_type].load_input(context, conn=conn)
         conn.close()
@@ -132,7 +128,8 @@ def build_duckdb_io_manager(type_handlers: Sequence[DbTypeHandler]) -> IOManager
     """
     Builds an IO manager definition that reads inputs from and writes outputs to DuckDB.
 
-    Note that the DuckDBIOManager cannot load partitioned assets.
+    Whether partitioned assets can be stored and loaded depends on the type handler - e.g. the
+    ``DuckDBPyArrowTypeHandler`` supports them, while the ``DuckDBPandasTypeHandler`` does not.
 
     Args:
         type_handlers (Sequence[DbTypeHandler]): Each handler defines how to translate between
@@ -1,5 +1,6 @@
 import logging
 import sys
+import threading
 import time
 from enum import Enum
 from typing import Optional
@@ -10,6 +11,8 @@
 from dagster import _check as check
 from dagster._core.storage.pipeline_run import PipelineRunStatus
 
+from .watch_cache import K8sWatchCache, K8sWatchCaches
+
 DEFAULT_WAIT_TIMEOUT = 86400.0  # 1 day
 DEFAULT_WAIT_BETWEEN_ATTEMPTS = 10.0  # 10 seconds
 DEFAULT_JOB_POD_COUNT = 1  # expect job:pod to be 1:1 by default
@@ -127,24 +130,77 @@ class KubernetesWaitingReasons:
     CreateContainerConfigError = "CreateContainerConfigError"
 
 
+# The jobs and pods created by Dagster, which are the only ones watched by the production clients
+DAGSTER_LABEL_SELECTOR = "app.kubernetes.io/part-of=dagster"
+
+# The watch caches shared by the production clients of this process, started on first use
+_production_watch_caches: Optional[K8sWatchCaches] = None
+_production_watch_caches_lock = threading.Lock()
+
+
+def _get_production_watch_caches() -> K8sWatchCaches:
+    global _production_watch_caches  # pylint: disable=global-statement
+    with _production_watch_caches_lock:
+        if not _production_watch_caches:
+            _production_watch_caches = K8sWatchCaches(
+                kubernetes.client.BatchV1Api(),
+                kubernetes.client.CoreV1Api(),
+                label_selector=DAGSTER_LABEL_SELECTOR,
+            )
+        return _production_watch_caches
+
+
 class DagsterKubernetesClient:
-    def __init__(self, batch_api, core_api, logger, sleeper, timer):
+    def __init__(
+        self,
+        batch_api,
+        core_api,
+        logger,
+        sleeper,
+        timer,
+        watch_caches: Optional[K8sWatchCaches] = None,
+    ):
         self.batch_api = batch_api
         self.core_api = core_api
         self.logger = logger
         self.sleeper = sleeper
         self.timer = timer
+        # If set, job and pod state is read from watch caches rather than by polling the API, and
+        # waits between attempts end as soon as the watched object changes
+        self.watch_caches = check.opt_inst_param(watch_caches, "watch_caches", K8sWatchCaches)
 
     @staticmethod
-    def production_client():
+    def production_client(use_watch_cache=False):
+        """A client of the Kubernetes API of the current kubernetes config.
+
+        If ``use_watch_cache`` is True, the client reads the state of the jobs and pods created by
+        Dagster from watch caches that are shared by every such production client of the process,
+        so that waiting on any number of them only opens one watch of each kind per namespace that
+        is read from. Jobs and pods without the Dagster labels are read from the API.
+        """
         return DagsterKubernetesClient(
             kubernetes.client.BatchV1Api(),
             kubernetes.client.CoreV1Api(),
             logging.info,
             time.sleep,
             time.time,
+            watch_caches=_get_production_watch_caches() if use_watch_cache else None,
         )
 
+    def _job_cache(self, namespace) -> Optional[K8sWatchCache]:
+        return self.watch_caches.jobs(namespace) if self.watch_caches else None
+
+    def _pod_cache(self, namespace) -> Optional[K8sWatchCache]:
+        return self.watch_caches.pods(namespace) if self.watch_caches else None
+
+    def _wait_between_attempts(
+        self, cache: Optional[K8sWatchCache], wait_time_between_attempts, name=None
+    ):
+        if cache and not cache.has_failed:
+            cache.wait_for_update(wait_time_between_attempts, name=name)
+        else:
+            self.sleeper(wait_time_between_attempts)
+
     ### Job operations ###
 
     def wait_for_job(
@@ -199,13 +255,18 @@ def _get_jobs_for_namespace():
                 else:
                     return None
 
-            job = k8s_api_retry(
-                _get_jobs_for_namespace, max_retries=3, timeout=wait_time_between_attempts
-            )
+            job_cache = self._job_cache(namespace)
+            # jobs that aren't in the cache may not match its label selector, so they are read
+            # from the API
+            job = job_cache.get(job_name) if job_cache else None
+            if not job:
+                job = k8s_api_retry(
+                    _get_jobs_for_namespace, max_retries=3, timeout=wait_time_between_attempts
+                )
 
             if not job:
                 self.logger('Job "{job_name}" not yet launched, waiting'.format(job_name=job_name))
-                self.sleeper(wait_time_between_attempts)
+                self._wait_between_attempts(job_cache, wait_time_between_attempts, name=job_name)
 
     def wait_for_job_to_have_pods(
         self,
@@ -235,7 +296,7 @@ def _get_pods():
             self.logger(
                 'Job "{job_name}" does not yet have pods, waiting'.format(job_name=job_name)
             )
-            self.sleeper(wait_time_between_attempts)
+            self._wait_between_attempts(self._pod_cache(namespace), wait_time_between_attempts)
 
     def wait_for_job_success(
         self,
@@ -321,9 +382,14 @@ def _get_job_status():
                 job = self.batch_api.read_namespaced_job_status(job_name, namespace=namespace)
                 return job.status
 
-            status = k8s_api_retry(
-                _get_job_status, max_retries=3, timeout=wait_time_between_attempts
-            )
+            job_cache = self._job_cache(namespace)
+            cached_job = job_cache.get(job_name) if job_cache else None
+            if cached_job:
+                status = cached_job.status
+            else:
+                status = k8s_api_retry(
+                    _get_job_status, max_retries=3, timeout=wait_time_between_attempts
+                )
 
             # status.succeeded represents the number of pods which reached phase Succeeded.
             if status.succeeded == num_pods_to_wait_for:
@@ -347,7 +413,7 @@ def _get_job_status():
                 if pipeline_run_status != PipelineRunStatus.STARTED:
                     raise DagsterK8sPipelineStatusException()
 
-            self.sleeper(wait_time_between_attempts)
+            self._wait_between_attempts(job_cache, wait_time_between_attempts, name=job_name)
 
     def delete_job(
         self,
@@ -413,6 +479,16 @@ def get_pods_in_job(self, job_name, namespace):
         check.str_param(job_name, "job_name")
         check.str_param(namespace, "namespace")
 
+        pod_cache = self._pod_cache(namespace)
+        if pod_cache:
+            pods = [
+                pod
+                for pod in pod_cache.list()
+                if (pod.metadata.labels or {}).get("job-name") == job_name
+            ]
+            if pods:
+                return pods
+
         return self.core_api.list_namespaced_pod(
             namespace=namespace, label_selector="job-name={}".format(job_name)
         ).items
@@ -468,11 +544,13 @@ def wait_for_pod(
         start = start_time or self.timer()
 
         while True:
-
-            pods = self.core_api.list_namespaced_pod(
-                namespace=namespace, field_selector="metadata.name=%s" % pod_name
-            ).items
-            pod = pods[0] if pods else None
+            pod_cache = self._pod_cache(namespace)
+            pod = pod_cache.get(pod_name) if pod_cache else None
+            if not pod:
+                pods = self.core_api.list_namespaced_pod(
+                    namespace=namespace, field_selector="metadata.name=%s" % pod_name
+                ).items
+                pod = pods[0] if pods else None
 
             if wait_timeout and self.timer() - start > wait_timeout:
                 raise DagsterK8sError(
@@ -481,12 +559,12 @@ def wait_for_pod(
 
             if pod is None:
                 self.logger('Waiting for pod "%s" to launch...' % pod_name)
-                self.sleeper(wait_time_between_attempts)
+                self._wait_between_attempts(pod_cache, wait_time_between_attempts, name=pod_name)
                 continue
 
             if not pod.status.container_statuses:
                 self.logger("Waiting for pod container status to be set by kubernetes...")
-                self.sleeper(wait_time_between_attempts)
+                self._wait_between_attempts(pod_cache, wait_time_between_attempts, name=pod_name)
                 continue
 
             # https://kubernetes.io/docs/reference/generated/kubernetes-api/v1.18/#containerstatus-v1-core
@@ -502,7 +580,9 @@ def wait_for_pod(
                     ready = container_status.ready
                     if not ready:
                         self.logger('Waiting for pod "%s" to become ready...' % pod_name)
-                        self.sleeper(wait_time_between_attempts)
+                        self._wait_between_attempts(
+                            pod_cache, wait_time_between_attempts, name=pod_name
+                        )
                         continue
                     else:
                         self.logger('Pod "%s" is ready, done waiting' % pod_name)
@@ -511,25 +591,33 @@ def wait_for_pod(
                     check.invariant(
                         wait_for_state == WaitForPodState.Terminated, "New invalid WaitForPodState"
                     )
-                    self.sleeper(wait_time_between_attempts)
+                    self._wait_between_attempts(
+                        pod_cache, wait_time_between_attempts, name=pod_name
+                    )
                     continue
 
             elif state.waiting is not None:
                 # https://kubernetes.io/docs/reference/generated/kubernetes-api/v1.18/#containerstatewaiting-v1-core
                 if state.waiting.reason == KubernetesWaitingReasons.PodInitializing:
                     self.logger('Waiting for pod "%s" to initialize...' % pod_name)
-                    self.sleeper(wait_time_between_attempts)
+                    self._wait_between_attempts(
+                        pod_cache, wait_time_between_attempts, name=pod_name
+                    )
                     continue
                 if state.waiting.reason == KubernetesWaitingReasons.CreateContainerConfigError:
                     self.logger(
                         'Pod "%s" is waiting due to a CreateContainerConfigError with message "%s" - trying again to see if it recovers'
                         % (pod_name, state.waiting.message)
                     )
-                    self.sleeper(wait_time_between_attempts)
+                    self._wait_between_attempts(
+                        pod_cache, wait_time_between_attempts, name=pod_name
+                    )
                     continue
                 elif state.waiting.reason == KubernetesWaitingReasons.ContainerCreating:
                     self.logger("Waiting for container creation...")
-                    self.sleeper(wait_time_between_attempts)
+                    self._wait_between_attempts(
+                        pod_cache, wait_time_between_attempts, name=pod_name
+                    )
                     continue
                 elif state.waiting.reason in [
                     KubernetesWaitingReasons.ErrImagePull,
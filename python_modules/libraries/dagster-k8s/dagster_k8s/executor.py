@@ -1,4 +1,4 @@
-from typing import Iterator, List, Optional, cast
+from typing import Iterator, List, Optional, Sequence, cast
 
 import kubernetes
 from dagster_k8s.launcher import K8sRunLauncher
@@ -27,7 +27,8 @@
     get_k8s_job_name,
     get_user_defined_k8s_config,
 )
-from .utils import delete_job
+from .utils import delete_job, sanitize_k8s_label
+from .watch_cache import K8sWatchCaches
 
 
 @executor(
@@ -43,6 +44,12 @@
                 description="Limit on the number of pods that will run concurrently within the scope "
                 "of a Dagster run. Note that this limit is per run, not global.",
             ),
+            "launch_parallelism": Field(
+                IntSource,
+                is_required=False,
+                description="The number of threads used to create Kubernetes Jobs when several "
+                "steps become ready to execute at once. Defaults to 1.",
+            ),
         },
     ),
     requirements=multiple_process_executor_requirements(),
@@ -73,11 +80,15 @@ def k8s_job_executor(init_context: InitExecutorContext) -> Executor:
             env_vars: ...
             job_image: ... # leave out if using userDeployments
             max_concurrent: ...
+            launch_parallelism: ...
 
     `max_concurrent` limits the number of pods that will execute concurrently for one run. By default
     there is no limit- it will maximally parallel as allowed by the DAG. Note that this is not a
     global limit.
 
+    `launch_parallelism` sets how many threads create Kubernetes Jobs at once when many steps become
+    ready at the same time, e.g. after a wide fan-out. By default Jobs are created one at a time.
+
     Configuration set on the Kubernetes Jobs and Pods created by the `K8sRunLauncher` will also be
     set on Kubernetes Jobs and Pods created by the `k8s_job_executor`.
     """
@@ -112,9 +123,11 @@ def k8s_job_executor(init_context: InitExecutorContext) -> Executor:
             container_context=k8s_container_context,
             load_incluster_config=run_launcher.load_incluster_config,
             kubeconfig_file=run_launcher.kubeconfig_file,
+            use_watch_cache=run_launcher.use_watch_cache,
         ),
         retries=RetryMode.from_config(exc_cfg["retries"]),  # type: ignore
         max_concurrent=check.opt_int_elem(exc_cfg, "max_concurrent"),
+        launch_parallelism=check.opt_int_elem(exc_cfg, "launch_parallelism"),
         should_verify_step=True,
     )
 
@@ -131,6 +144,7 @@ def __init__(
         load_incluster_config: bool,
         kubeconfig_file: Optional[str],
         k8s_client_batch_api=None,
+        use_watch_cache: bool = False,
     ):
         super().__init__()
 
@@ -140,6 +154,8 @@ def __init__(
         )
 
         self._fixed_k8s_client_batch_api = k8s_client_batch_api
+        self._use_watch_cache = check.bool_param(use_watch_cache, "use_watch_cache")
+        self._watch_caches: Optional[K8sWatchCaches] = None
 
         if load_incluster_config:
             check.invariant(
@@ -162,6 +178,24 @@ def _get_container_context(self, step_handler_context: StepHandlerContext):
     def _batch_api(self):
         return self._fixed_k8s_client_batch_api or kubernetes.client.BatchV1Api()
 
+    def _get_watch_caches(self, run_id: str) -> K8sWatchCaches:
+        # the handler executes the steps of a single run, so only its step jobs are watched
+        if not self._watch_caches:
+            self._watch_caches = K8sWatchCaches(
+                self._batch_api,
+                kubernetes.client.CoreV1Api(),
+                label_selector=(
+                    "app.kubernetes.io/component=step_worker,"
+                    f"dagster/run-id={sanitize_k8s_label(run_id)}"
+                ),
+            )
+        return self._watch_caches
+
+    def dispose(self):
+        if self._watch_caches:
+            self._watch_caches.stop()
+            self._watch_caches = None
+
     def _get_k8s_step_job_name(self, step_handler_context):
         step_key = step_handler_context.execute_step_args.step_keys_to_execute[0]
 
@@ -178,33 +212,57 @@ def _get_k8s_step_job_name(self, step_handler_context):
         return "dagster-step-%s" % (name_key)
 
     def launch_step(self, step_handler_context: StepHandlerContext) -> Iterator[DagsterEvent]:
-        step_keys_to_execute = cast(
-            List[str], step_handler_context.execute_step_args.step_keys_to_execute
-        )
-        assert len(step_keys_to_execute) == 1, "Launching multiple steps is not currently supported"
-        step_key = step_keys_to_execute[0]
+        yield from self.launch_steps([step_handler_context])
 
-        job_name = self._get_k8s_step_job_name(step_handler_context)
-        pod_name = job_name
+    def launch_steps(
+        self, step_handler_contexts: Sequence[StepHandlerContext]
+    ) -> Iterator[DagsterEvent]:
+        if not step_handler_contexts:
+            return
 
-        container_context = self._get_container_context(step_handler_context)
+        # The container context and base job config are the same for every step in the run, so
+        # they (and the API client) are only set up once for the whole batch
+        first_context = step_handler_contexts[0]
+        container_context = self._get_container_context(first_context)
 
         job_config = container_context.get_k8s_job_config(
-            self._executor_image, step_handler_context.instance.run_launcher
-        )
-
-        args = step_handler_context.execute_step_args.get_command_args(
-            skip_serialized_namedtuple=True
+            self._executor_image, first_context.instance.run_launcher
         )
 
         if not job_config.job_image:
             job_config = job_config.with_image(
-                step_handler_context.execute_step_args.pipeline_origin.repository_origin.container_image
+                first_context.execute_step_args.pipeline_origin.repository_origin.container_image
             )
 
         if not job_config.job_image:
             raise Exception("No image included in either executor config or the job")
 
+        batch_api = self._batch_api
+        for step_handler_context in step_handler_contexts:
+            yield from self._launch_step_job(
+                step_handler_context, container_context, job_config, batch_api
+            )
+
+    def _launch_step_job(
+        self,
+        step_handler_context: StepHandlerContext,
+        container_context: K8sContainerContext,
+        job_config: DagsterK8sJobConfig,
+        batch_api,
+    ) -> Iterator[DagsterEvent]:
+        step_keys_to_execute = cast(
+            List[str], step_handler_context.execute_step_args.step_keys_to_execute
+        )
+        assert len(step_keys_to_execute) == 1, "Launching multiple steps is not currently supported"
+        step_key = step_keys_to_execute[0]
+
+        job_name = self._get_k8s_step_job_name(step_handler_context)
+        pod_name = job_name
+
+        args = step_handler_context.execute_step_args.get_command_args(
+            skip_serialized_namedtuple=True
+        )
+
         user_defined_k8s_config = get_user_defined_k8s_config(
             frozentags(step_handler_context.step_tags[step_key])
         )
@@ -232,7 +290,7 @@ def launch_step(self, step_handler_context: StepHandlerContext) -> Iterator[Dags
             ],
         )
 
-        self._batch_api.create_namespaced_job(body=job, namespace=container_context.namespace)
+        batch_api.create_namespaced_job(body=job, namespace=container_context.namespace)
 
     def check_step_health(self, step_handler_context: StepHandlerContext) -> CheckStepHealthResult:
         step_keys_to_execute = cast(
@@ -245,9 +303,19 @@ def check_step_health(self, step_handler_context: StepHandlerContext) -> CheckSt
 
         container_context = self._get_container_context(step_handler_context)
 
-        job = self._batch_api.read_namespaced_job(
-            namespace=container_context.namespace, name=job_name
+        job_cache = (
+            self._get_watch_caches(step_handler_context.pipeline_run.run_id).jobs(
+                container_context.namespace
+            )
+            if self._use_watch_cache
+            else None
         )
+        job = job_cache.get(job_name) if job_cache else None
+        if not job:
+            # jobs that were just launched may not have reached the watch cache yet
+            job = self._batch_api.read_namespaced_job(
+                namespace=container_context.namespace, name=job_name
+            )
         if job.status.failed:
             return CheckStepHealthResult.unhealthy(
                 reason=f"Discovered failed Kubernetes job {job_name} for step {step_key}.",
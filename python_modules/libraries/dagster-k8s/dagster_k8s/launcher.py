@@ -24,6 +24,10 @@
     get_user_defined_k8s_config,
 )
 from .utils import delete_job
+from .watch_cache import K8sWatchCaches
+
+# Selects the Kubernetes jobs and pods that the run launcher creates
+RUN_WORKER_LABEL_SELECTOR = "app.kubernetes.io/component=run_worker"
 
 
 class K8sRunLauncher(RunLauncher, ConfigurableClass):
@@ -70,6 +74,7 @@ def __init__(
         fail_pod_on_run_failure=None,
         resources=None,
         scheduler_name=None,
+        use_watch_cache=False,
     ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.job_namespace = check.str_param(job_namespace, "job_namespace")
@@ -115,6 +120,8 @@ def __init__(
         )
         self._resources = check.opt_dict_param(resources, "resources")
         self._scheduler_name = check.opt_str_param(scheduler_name, "scheduler_name")
+        self._use_watch_cache = check.bool_param(use_watch_cache, "use_watch_cache")
+        self._watch_caches: Optional[K8sWatchCaches] = None
 
         super().__init__()
 
@@ -170,10 +177,27 @@ def labels(self) -> Dict[str, str]:
     def fail_pod_on_run_failure(self) -> Optional[bool]:
         return self._fail_pod_on_run_failure
 
+    @property
+    def use_watch_cache(self) -> bool:
+        return self._use_watch_cache
+
     @property
     def _batch_api(self):
         return self._fixed_batch_api if self._fixed_batch_api else kubernetes.client.BatchV1Api()
 
+    def _get_watch_caches(self) -> K8sWatchCaches:
+        if not self._watch_caches:
+            self._watch_caches = K8sWatchCaches(
+                self._batch_api,
+                kubernetes.client.CoreV1Api(),
+                label_selector=RUN_WORKER_LABEL_SELECTOR,
+            )
+        return self._watch_caches
+
+    def dispose(self):
+        if self._watch_caches:
+            self._watch_caches.stop()
+
     @classmethod
     def config_type(cls):
         """Include all arguments required for DagsterK8sJobConfig along with additional arguments
@@ -183,6 +207,15 @@ def config_type(cls):
 
         run_launcher_extra_cfg = {
             "job_namespace": Field(StringSource, is_required=False, default_value="default"),
+            "use_watch_cache": Field(
+                bool,
+                is_required=False,
+                default_value=False,
+                description="Whether the run launcher and the k8s_job_executor should track the "
+                "status of the Kubernetes Jobs they create with a single watch per namespace, "
+                "instead of reading each Job from the Kubernetes API every time its health is "
+                "checked. Requires permission to list and watch Jobs.",
+            ),
         }
         return merge_dicts(job_cfg, run_launcher_extra_cfg)
 
@@ -356,10 +389,18 @@ def check_run_worker_health(self, run: PipelineRun):
         job_name = get_job_name_from_run_id(
             run.run_id, resume_attempt_number=self._instance.count_resume_run_attempts(run.run_id)
         )
+        job_cache = (
+            self._get_watch_caches().jobs(container_context.namespace)
+            if self._use_watch_cache
+            else None
+        )
         try:
-            job = self._batch_api.read_namespaced_job(
-                namespace=container_context.namespace, name=job_name
-            )
+            job = job_cache.get(job_name) if job_cache else None
+            if not job:
+                # jobs that were just launched may not have reached the watch cache yet
+                job = self._batch_api.read_namespaced_job(
+                    namespace=container_context.namespace, name=job_name
+                )
         except Exception:
             return CheckRunHealthResult(
                 WorkerStatus.UNKNOWN, str(serializable_error_info_from_exc_info(sys.exc_info()))
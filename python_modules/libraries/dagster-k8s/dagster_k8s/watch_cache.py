@@ -0,0 +1,269 @@
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import kubernetes
+
+from dagster import _check as check
+
+WATCH_TIMEOUT_SECONDS = 300  # reconnect the watch every 5 minutes
+RELIST_BACKOFF_SECONDS = 5.0
+WATCH_CACHE_SYNC_TIMEOUT = 10.0
+
+# Returned by the API server when the resource version a watch resumes from is too old
+HTTP_GONE = 410
+
+# Errors that listing again won't resolve, such as missing RBAC permissions to list or watch
+NON_RETRIABLE_K8S_STATUS_CODES = [
+    401,  # Unauthorized
+    403,  # Forbidden
+    404,  # Not found
+]
+
+
+class K8sWatchCache:
+    """A local copy of the Kubernetes objects of one kind in a namespace, optionally filtered by a
+    label selector.
+
+    Like a client-go informer, the objects are loaded with a single list call and then kept up to
+    date by a watch that resumes from the resource version of that list, running in a background
+    thread. Reads are served from memory, so any number of callers can track any number of objects
+    with a single open watch. If the watch can't be resumed (the API server returns 410 Gone), the
+    objects are listed again. If the API server rejects the list or watch with an error that
+    retrying won't resolve, such as a missing RBAC permission, the cache stops and reports that it
+    has failed, so that callers read from the API instead.
+
+    Args:
+        list_fn (Callable): The namespaced list function of the Kubernetes API to list and watch, e.g.
+            ``BatchV1Api().list_namespaced_job``.
+        namespace (str): The namespace of the objects.
+        label_selector (Optional[str]): Only objects matching this label selector are tracked.
+        watch_factory (Optional[Callable[[], kubernetes.watch.Watch]]): Creates the watch used to
+            stream changes. Defaults to ``kubernetes.watch.Watch``.
+    """
+
+    def __init__(
+        self,
+        list_fn: Callable,
+        namespace: str,
+        label_selector: Optional[str] = None,
+        watch_factory: Optional[Callable[[], Any]] = None,
+    ):
+        self._list_fn = check.callable_param(list_fn, "list_fn")
+        self._namespace = check.str_param(namespace, "namespace")
+        self._label_selector = check.opt_str_param(label_selector, "label_selector")
+        self._watch_factory = watch_factory or kubernetes.watch.Watch
+
+        self._condition = threading.Condition()
+        self._objects: Dict[str, Any] = {}
+        self._object_versions: Dict[str, int] = {}
+        self._update_count = 0
+        # bumped on every relist, since any object may have changed
+        self._list_version = 0
+        self._synced = False
+        self._failed = False
+
+        self._shutdown_event = threading.Event()
+        self._watch: Optional[Any] = None
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"k8s-watch-cache-{namespace}",
+            daemon=True,
+        )
+
+    def start(self) -> "K8sWatchCache":
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._shutdown_event.set()
+        watch = self._watch
+        if watch:
+            watch.stop()
+        with self._condition:
+            self._condition.notify_all()
+
+    @property
+    def has_synced(self) -> bool:
+        with self._condition:
+            return self._synced
+
+    @property
+    def has_failed(self) -> bool:
+        with self._condition:
+            return self._failed
+
+    def wait_for_sync(self, timeout: float) -> bool:
+        """Blocks until the initial list has completed, returning False if it didn't complete
+        within the timeout or the cache has failed."""
+        with self._condition:
+            self._condition.wait_for(lambda: self._synced or self._failed, timeout)
+            return self._synced and not self._failed
+
+    def get(self, name: str) -> Optional[Any]:
+        with self._condition:
+            return self._objects.get(name)
+
+    def list(self) -> List[Any]:
+        with self._condition:
+            return list(self._objects.values())
+
+    def wait_for_update(self, timeout: float, name: Optional[str] = None):
+        """Blocks until an object in the cache changes - or the object named ``name``, if set - or
+        until the timeout elapses."""
+
+        def _versions() -> Tuple[int, int]:
+            return (
+                self._list_version,
+                self._object_versions.get(name, 0) if name else self._update_count,
+            )
+
+        with self._condition:
+            versions = _versions()
+            self._condition.wait_for(
+                lambda: self._shutdown_event.is_set() or _versions() != versions, timeout
+            )
+
+    def _list_kwargs(self) -> Dict[str, str]:
+        kwargs = {"namespace": self._namespace}
+        if self._label_selector:
+            kwargs["label_selector"] = self._label_selector
+        return kwargs
+
+    def _run(self):
+        while not self._shutdown_event.is_set():
+            try:
+                resource_version = self._relist()
+                self._watch_from(resource_version)
+            except Exception as e:
+                if (
+                    isinstance(e, kubernetes.client.rest.ApiException)
+                    and e.status in NON_RETRIABLE_K8S_STATUS_CODES
+                ):
+                    logging.exception(
+                        f"Unable to watch Kubernetes objects in namespace {self._namespace}, "
+                        "reading them from the API instead"
+                    )
+                    self._fail()
+                    return
+
+                logging.exception(
+                    f"Error while watching Kubernetes objects in namespace {self._namespace}, "
+                    f"listing them again in {RELIST_BACKOFF_SECONDS} seconds"
+                )
+                self._shutdown_event.wait(RELIST_BACKOFF_SECONDS)
+
+    def _fail(self):
+        with self._condition:
+            self._failed = True
+            self._objects = {}
+            self._shutdown_event.set()
+            self._condition.notify_all()
+
+    def _relist(self) -> str:
+        object_list = self._list_fn(**self._list_kwargs())
+        with self._condition:
+            self._objects = {obj.metadata.name: obj for obj in object_list.items}
+            self._list_version += 1
+            self._synced = True
+            self._condition.notify_all()
+        return object_list.metadata.resource_version
+
+    def _watch_from(self, resource_version: str):
+        # Each watch is closed by the API server after WATCH_TIMEOUT_SECONDS, and then resumed from
+        # the last resource version that was seen
+        while not self._shutdown_event.is_set():
+            self._watch = self._watch_factory()
+            try:
+                for event in self._watch.stream(
+                    self._list_fn,
+                    resource_version=resource_version,
+                    timeout_seconds=WATCH_TIMEOUT_SECONDS,
+                    **self._list_kwargs(),
+                ):
+                    if event["type"] == "ERROR":
+                        # the resource version expired, so the objects need to be listed again
+                        return
+
+                    obj = event["object"]
+                    name = obj.metadata.name
+                    resource_version = obj.metadata.resource_version
+                    with self._condition:
+                        if event["type"] == "DELETED":
+                            self._objects.pop(name, None)
+                        else:
+                            self._objects[name] = obj
+                        self._object_versions[name] = self._object_versions.get(name, 0) + 1
+                        self._update_count += 1
+                        self._condition.notify_all()
+            except kubernetes.client.rest.ApiException as e:
+                if e.status == HTTP_GONE:
+                    return
+                raise
+            finally:
+                self._watch = None
+
+
+class K8sWatchCaches:
+    """The watch caches of the jobs and pods matching a label selector, started on demand for each
+    namespace and shared by every caller.
+
+    Args:
+        batch_api (kubernetes.client.BatchV1Api): The API used to list and watch jobs.
+        core_api (kubernetes.client.CoreV1Api): The API used to list and watch pods.
+        label_selector (Optional[str]): Only jobs and pods matching this label selector are tracked.
+        watch_factory (Optional[Callable[[], kubernetes.watch.Watch]]): Creates the watches used to
+            stream changes. Defaults to ``kubernetes.watch.Watch``.
+    """
+
+    def __init__(
+        self,
+        batch_api,
+        core_api,
+        label_selector: Optional[str] = None,
+        watch_factory: Optional[Callable[[], Any]] = None,
+    ):
+        self._batch_api = batch_api
+        self._core_api = core_api
+        self._label_selector = check.opt_str_param(label_selector, "label_selector")
+        self._watch_factory = watch_factory
+
+        self._lock = threading.Lock()
+        # each cache, with the deadline for its initial list
+        self._caches: Dict[Tuple[str, str], Tuple[K8sWatchCache, float]] = {}
+
+    def jobs(self, namespace: str) -> Optional[K8sWatchCache]:
+        """The cache of jobs in the namespace, or None if it hasn't finished its initial list, in
+        which case callers should read from the API instead."""
+        return self._get_cache("jobs", namespace, lambda: self._batch_api.list_namespaced_job)
+
+    def pods(self, namespace: str) -> Optional[K8sWatchCache]:
+        """The cache of pods in the namespace, or None if it hasn't finished its initial list, in
+        which case callers should read from the API instead."""
+        return self._get_cache("pods", namespace, lambda: self._core_api.list_namespaced_pod)
+
+    def stop(self):
+        with self._lock:
+            for cache, _sync_deadline in self._caches.values():
+                cache.stop()
+            self._caches = {}
+
+    def _get_cache(self, kind: str, namespace: str, get_list_fn) -> Optional[K8sWatchCache]:
+        check.str_param(namespace, "namespace")
+        with self._lock:
+            cache, sync_deadline = self._caches.get((kind, namespace), (None, 0.0))
+            if not cache:
+                cache = K8sWatchCache(
+                    get_list_fn(),
+                    namespace,
+                    label_selector=self._label_selector,
+                    watch_factory=self._watch_factory,
+                ).start()
+                sync_deadline = time.monotonic() + WATCH_CACHE_SYNC_TIMEOUT
+                self._caches[(kind, namespace)] = (cache, sync_deadline)
+
+        # wait outside of the lock, so that a namespace that is slow to list doesn't hold up the
+        # callers of other namespaces. Callers only wait until the deadline set when the cache was
+        # started, so a cache that can't list its objects doesn't hold up every call.
+        return cache if cache.wait_for_sync(max(0.0, sync_deadline - time.monotonic())) else None
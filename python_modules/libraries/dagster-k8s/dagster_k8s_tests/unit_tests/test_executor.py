@@ -300,6 +300,54 @@ def test_step_handler(kubeconfig_file, k8s_instance):
     assert kwargs["body"].spec.template.spec.containers[0].image == "bizbuz"
 
 
+def test_step_handler_launch_steps(kubeconfig_file, k8s_instance):
+    mock_k8s_client_batch_api = mock.MagicMock()
+    handler = K8sStepHandler(
+        image="bizbuz",
+        container_context=K8sContainerContext(
+            namespace="foo",
+        ),
+        load_incluster_config=False,
+        kubeconfig_file=kubeconfig_file,
+        k8s_client_batch_api=mock_k8s_client_batch_api,
+    )
+
+    step_handler_contexts = []
+    for _ in range(2):
+        run = create_run_for_test(
+            k8s_instance,
+            pipeline_name="bar",
+            pipeline_code_origin=reconstructable(bar).get_python_origin(),
+        )
+        step_handler_contexts.append(
+            _step_handler_context(
+                pipeline=reconstructable(bar),
+                pipeline_run=run,
+                instance=k8s_instance,
+                executor=_get_executor(
+                    k8s_instance,
+                    reconstructable(bar),
+                ),
+            )
+        )
+
+    events = list(handler.launch_steps(step_handler_contexts))
+    assert len(events) == 2
+
+    # one job is created for each step in the batch
+    mock_method_calls = mock_k8s_client_batch_api.method_calls
+    assert [method_name for method_name, _args, _kwargs in mock_method_calls] == [
+        "create_namespaced_job",
+        "create_namespaced_job",
+    ]
+    job_names = [kwargs["body"].metadata.name for _name, _args, kwargs in mock_method_calls]
+    assert len(set(job_names)) == 2
+    assert all(
+        kwargs["body"].spec.template.spec.containers[0].image == "bizbuz"
+        for _name, _args, kwargs in mock_method_calls
+    )
+
+
 def test_step_handler_user_defined_config(kubeconfig_file, k8s_instance):
 
     mock_k8s_client_batch_api = mock.MagicMock()
@@ -438,3 +486,21 @@ def test_step_handler_with_container_context(
 
         assert envs["FOO_TEST"] == "bar"
         assert envs["BAZ_TEST"] == "blergh"
+
+
+def test_step_handler_stops_watch_caches(kubeconfig_file):
+    handler = K8sStepHandler(
+        image="bizbuz",
+        container_context=K8sContainerContext(namespace="foo"),
+        load_incluster_config=False,
+        kubeconfig_file=kubeconfig_file,
+        k8s_client_batch_api=mock.MagicMock(),
+        use_watch_cache=True,
+    )
+    with mock.patch("kubernetes.client.CoreV1Api"):
+        watch_caches = handler._get_watch_caches("abc")  # pylint: disable=protected-access
+
+    with mock.patch.object(watch_caches, "stop", wraps=watch_caches.stop) as stop:
+        handler.dispose()
+    assert stop.called
+    assert handler._watch_caches is None  # pylint: disable=protected-access
@@ -0,0 +1,367 @@
+import threading
+import time
+from unittest import mock
+
+import pytest
+from dagster_k8s import client as client_module
+from dagster_k8s.client import DagsterKubernetesClient
+from dagster_k8s.watch_cache import K8sWatchCache, K8sWatchCaches
+from kubernetes.client.models import (
+    V1Job,
+    V1JobList,
+    V1JobStatus,
+    V1ListMeta,
+    V1ObjectMeta,
+    V1Pod,
+    V1PodList,
+)
+from kubernetes.client.rest import ApiException
+
+
+class FakeWatch:
+    def __init__(self, api):
+        self._api = api
+        self._stopped = False
+
+    def stop(self):
+        self._stopped = True
+
+    def stream(
+        self, list_fn, namespace, resource_version, timeout_seconds, label_selector=None
+    ):  # pylint: disable=unused-argument
+        kind = "jobs" if list_fn.__name__ == "list_namespaced_job" else "pods"
+        self._api.watch_calls += 1
+        resource_version = int(resource_version)
+        deadline = time.time() + 1  # close the watch early, so that resuming it is tested
+
+        while not self._stopped and time.time() < deadline:
+            with self._api.condition:
+                if resource_version < self._api.oldest_resource_version:
+                    yield {"type": "ERROR", "object": {"code": 410, "reason": "Expired"}}
+                    return
+
+                events = [
+                    event
+                    for event in self._api.events
+                    if event[0] > resource_version
+                    and event[1] == kind
+                    and event[3].metadata.namespace == namespace
+                    and _matches(event[3], label_selector)
+                ]
+                if not events:
+                    self._api.condition.wait(0.05)
+                    continue
+
+            for event_resource_version, _kind, event_type, obj in events:
+                resource_version = event_resource_version
+                yield {"type": event_type, "object": obj}
+
+
+def _matches(obj, label_selector):
+    if not label_selector:
+        return True
+    labels = obj.metadata.labels or {}
+    return all(
+        labels.get(key) == value
+        for key, value in (term.split("=") for term in label_selector.split(","))
+    )
+
+
+class FakeK8sApi:
+    """Stands in for the Kubernetes API server: keeps jobs and pods in memory, serves namespaced
+    list calls over them, and streams their changes to watches."""
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.objects = {"jobs": {}, "pods": {}}
+        self.events = []
+        self.resource_version = 0
+        self.oldest_resource_version = 0
+        self.list_calls = 0
+        self.watch_calls = 0
+
+    def watch(self):
+        return FakeWatch(self)
+
+    def _list(self, kind, namespace, label_selector):
+        with self.condition:
+            self.list_calls += 1
+            return (
+                str(self.resource_version),
+                [
+                    obj
+                    for obj in self.objects[kind].values()
+                    if obj.metadata.namespace == namespace and _matches(obj, label_selector)
+                ],
+            )
+
+    def list_namespaced_job(self, namespace, label_selector=None):
+        resource_version, items = self._list("jobs", namespace, label_selector)
+        return V1JobList(metadata=V1ListMeta(resource_version=resource_version), items=items)
+
+    def list_namespaced_pod(self, namespace, label_selector=None):
+        resource_version, items = self._list("pods", namespace, label_selector)
+        return V1PodList(metadata=V1ListMeta(resource_version=resource_version), items=items)
+
+    def put(self, kind, obj, event_type="MODIFIED"):
+        with self.condition:
+            self.resource_version += 1
+            obj.metadata.resource_version = str(self.resource_version)
+            if event_type == "DELETED":
+                self.objects[kind].pop(obj.metadata.name, None)
+            else:
+                self.objects[kind][obj.metadata.name] = obj
+            self.events.append((self.resource_version, kind, event_type, obj))
+            self.condition.notify_all()
+
+    def compact(self):
+        """Discards the event history, so watches resuming from an older version get 410 Gone."""
+        with self.condition:
+            self.events = []
+            self.oldest_resource_version = self.resource_version
+            self.condition.notify_all()
+
+
+def _job(name, namespace="default", labels=None, succeeded=0, failed=0):
+    return V1Job(
+        metadata=V1ObjectMeta(name=name, namespace=namespace, labels=labels),
+        status=V1JobStatus(succeeded=succeeded, failed=failed),
+    )
+
+
+def _pod(name, job_name, namespace="default"):
+    return V1Pod(
+        metadata=V1ObjectMeta(name=name, namespace=namespace, labels={"job-name": job_name})
+    )
+
+
+def _wait_until(cache, condition, timeout=10):
+    start = time.time()
+    while not condition():
+        assert time.time() - start < timeout, "Timed out waiting for the watch cache"
+        cache.wait_for_update(0.1)
+
+
+@pytest.fixture
+def fake_api():
+    return FakeK8sApi()
+
+
+def test_watch_cache_tracks_changes(fake_api):
+    fake_api.put("jobs", _job("existing"), "ADDED")
+    fake_api.put("jobs", _job("other_namespace", namespace="other"), "ADDED")
+
+    cache = K8sWatchCache(
+        fake_api.list_namespaced_job, "default", watch_factory=fake_api.watch
+    ).start()
+    try:
+        assert cache.wait_for_sync(10)
+        assert [job.metadata.name for job in cache.list()] == ["existing"]
+
+        fake_api.put("jobs", _job("new"), "ADDED")
+        _wait_until(cache, lambda: cache.get("new") is not None)
+
+        fake_api.put("jobs", _job("new", succeeded=1))
+        _wait_until(cache, lambda: cache.get("new").status.succeeded == 1)
+
+        fake_api.put("jobs", _job("existing"), "DELETED")
+        _wait_until(cache, lambda: cache.get("existing") is None)
+
+        # every change was streamed from the same list, and expiring watches were resumed
+        time.sleep(1.5)
+        assert fake_api.list_calls == 1
+        assert fake_api.watch_calls > 1
+    finally:
+        cache.stop()
+
+
+def test_watch_cache_label_selector(fake_api):
+    cache = K8sWatchCache(
+        fake_api.list_namespaced_job,
+        "default",
+        label_selector="dagster/run-id=foo",
+        watch_factory=fake_api.watch,
+    ).start()
+    try:
+        assert cache.wait_for_sync(10)
+        fake_api.put("jobs", _job("other_run", labels={"dagster/run-id": "bar"}), "ADDED")
+        fake_api.put("jobs", _job("this_run", labels={"dagster/run-id": "foo"}), "ADDED")
+        _wait_until(cache, lambda: cache.get("this_run") is not None)
+        assert cache.get("other_run") is None
+    finally:
+        cache.stop()
+
+
+def test_watch_cache_relists_when_resource_version_expires(fake_api):
+    cache = K8sWatchCache(
+        fake_api.list_namespaced_job, "default", watch_factory=fake_api.watch
+    ).start()
+    try:
+        assert cache.wait_for_sync(10)
+
+        # the change is compacted away before the watch sees it
+        with fake_api.condition:
+            fake_api.put("jobs", _job("missed"), "ADDED")
+            fake_api.compact()
+
+        _wait_until(cache, lambda: cache.get("missed") is not None)
+        assert fake_api.list_calls == 2
+    finally:
+        cache.stop()
+
+
+def test_watch_caches_fall_back_until_synced():
+    failing_api = mock.MagicMock()
+    failing_api.list_namespaced_job.side_effect = Exception("Forbidden")
+
+    with mock.patch("dagster_k8s.watch_cache.WATCH_CACHE_SYNC_TIMEOUT", 0.1):
+        caches = K8sWatchCaches(failing_api, failing_api, watch_factory=mock.MagicMock())
+        try:
+            assert caches.jobs("default") is None
+        finally:
+            caches.stop()
+
+
+def test_watch_caches_wait_for_sync_outside_lock(fake_api):
+    slow_api = mock.MagicMock()
+    list_started = threading.Event()
+    release_list = threading.Event()
+
+    def _slow_list(namespace, label_selector=None):
+        list_started.set()
+        release_list.wait(10)
+        return fake_api.list_namespaced_job(namespace, label_selector=label_selector)
+
+    slow_api.list_namespaced_job.side_effect = _slow_list
+    slow_api.list_namespaced_job.__name__ = "list_namespaced_job"
+
+    caches = K8sWatchCaches(slow_api, fake_api, watch_factory=fake_api.watch)
+    try:
+        thread = threading.Thread(target=lambda: caches.jobs("slow"))
+        thread.start()
+        assert list_started.wait(10)
+
+        # the pods of another namespace are served while the jobs are still being listed
+        start = time.time()
+        assert caches.pods("default") is not None
+        assert time.time() - start < 5
+
+        release_list.set()
+        thread.join()
+        assert caches.jobs("slow") is not None
+    finally:
+        release_list.set()
+        caches.stop()
+
+
+def test_watch_caches_only_wait_for_initial_sync_once():
+    failing_api = mock.MagicMock()
+    failing_api.list_namespaced_job.side_effect = Exception("Forbidden")
+
+    with mock.patch("dagster_k8s.watch_cache.WATCH_CACHE_SYNC_TIMEOUT", 0.5):
+        caches = K8sWatchCaches(failing_api, failing_api, watch_factory=mock.MagicMock())
+        try:
+            assert caches.jobs("default") is None
+            # once the cache failed its initial list, callers read from the API without waiting
+            start = time.time()
+            assert caches.jobs("default") is None
+            assert time.time() - start < 0.25
+        finally:
+            caches.stop()
+
+
+def test_production_clients_share_watch_caches():
+    with mock.patch.object(client_module, "_production_watch_caches", None), mock.patch(
+        "kubernetes.client.BatchV1Api"
+    ), mock.patch("kubernetes.client.CoreV1Api"):
+        assert DagsterKubernetesClient.production_client().watch_caches is None
+
+        first = DagsterKubernetesClient.production_client(use_watch_cache=True)
+        second = DagsterKubernetesClient.production_client(use_watch_cache=True)
+        assert first.watch_caches is not None
+        assert first.watch_caches is second.watch_caches
+        # only the jobs and pods created by dagster are watched
+        assert (
+            first.watch_caches._label_selector  # pylint: disable=protected-access
+            == client_module.DAGSTER_LABEL_SELECTOR
+        )
+
+
+def test_client_waits_on_watch_cache(fake_api):
+    caches = K8sWatchCaches(fake_api, fake_api, watch_factory=fake_api.watch)
+    # jobs that aren't in the cache are read from the API, which hasn't launched the job yet
+    batch_api = mock.Mock(spec_set=["list_namespaced_job"])
+    batch_api.list_namespaced_job.return_value = V1JobList(metadata=V1ListMeta(), items=[])
+    client = DagsterKubernetesClient(
+        batch_api=batch_api,
+        core_api=mock.Mock(spec_set=[]),  # the pods are served by the caches
+        logger=mock.MagicMock(),
+        sleeper=mock.MagicMock(),
+        timer=time.time,
+        watch_caches=caches,
+    )
+
+    def _run_job():
+        time.sleep(0.5)
+        fake_api.put("jobs", _job("a_job"), "ADDED")
+        fake_api.put("pods", _pod("a_job-abcde", "a_job"), "ADDED")
+        time.sleep(0.5)
+        fake_api.put("jobs", _job("a_job", succeeded=1))
+
+    thread = threading.Thread(target=_run_job)
+    thread.start()
+    try:
+        client.wait_for_job_success("a_job", "default", wait_time_between_attempts=30)
+        assert client.get_pod_names_in_job("a_job", "default") == ["a_job-abcde"]
+    finally:
+        thread.join()
+        caches.stop()
+
+    # waits ended as soon as the job changed, rather than after the polling interval
+    assert not client.sleeper.called
+
+
+def test_watch_cache_stops_on_non_retriable_errors():
+    forbidden_api = mock.MagicMock()
+    forbidden_api.list_namespaced_job.side_effect = ApiException(status=403, reason="Forbidden")
+
+    caches = K8sWatchCaches(forbidden_api, forbidden_api, watch_factory=mock.MagicMock())
+    try:
+        assert caches.jobs("default") is None
+        cache, _sync_deadline = caches._caches[  # pylint: disable=protected-access
+            ("jobs", "default")
+        ]
+        cache._thread.join(10)  # pylint: disable=protected-access
+        assert cache.has_failed
+
+        # the objects aren't listed again, and callers read from the API without waiting
+        assert forbidden_api.list_namespaced_job.call_count == 1
+        start = time.time()
+        assert caches.jobs("default") is None
+        assert time.time() - start < 0.25
+    finally:
+        caches.stop()
+
+
+def test_client_reads_jobs_outside_of_watch_cache(fake_api):
+    caches = K8sWatchCaches(
+        fake_api, fake_api, label_selector="dagster/run-id=foo", watch_factory=fake_api.watch
+    )
+    batch_api = mock.MagicMock()
+    batch_api.list_namespaced_job.return_value = V1JobList(
+        metadata=V1ListMeta(), items=[_job("unlabeled_job")]
+    )
+    client = DagsterKubernetesClient(
+        batch_api=batch_api,
+        core_api=mock.MagicMock(),
+        logger=mock.MagicMock(),
+        sleeper=mock.MagicMock(),
+        timer=time.time,
+        watch_caches=caches,
+    )
+    try:
+        # the job doesn't match the label selector of the cache, so it is read from the API
+        client.wait_for_job("unlabeled_job", "default")
+        assert batch_api.list_namespaced_job.called
+    finally:
+        caches.stop()
@@ -134,6 +134,7 @@ def upgrade(self):
         alembic_config = mysql_alembic_config(__file__)
         with self.connect() as conn:
             run_alembic_upgrade(alembic_config, conn)
+        self._clear_schema_cache()
 
     def has_built_index(self, migration_name):
         if migration_name not in self._index_migration_cache:
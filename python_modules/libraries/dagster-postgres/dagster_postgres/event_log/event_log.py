@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Mapping, Optional, Sequence
 
 import sqlalchemy as db
 
@@ -13,6 +13,11 @@
 )
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
+from dagster._core.storage.event_log.sql_event_log import (
+    STORE_EVENTS_BATCH_SIZE,
+    chunk_events,
+    is_asset_index_event,
+)
 from dagster._core.storage.sql import (
     check_alembic_revision,
     create_engine,
@@ -163,6 +168,35 @@ def store_event(self, event):
         ):
             self.store_asset_event(event)
 
+    def store_events(self, events):
+        """Store a batch of events with multi-row inserts, notifying listeners of all of the
+        inserted rows in a single round trip.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.list_param(events, "events", of_type=EventLogEntry)
+
+        with self._connect() as conn:
+            for chunk in chunk_events(events, STORE_EVENTS_BATCH_SIZE):
+                result = conn.execute(
+                    self.prepare_insert_events(chunk).returning(
+                        SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id
+                    )
+                )
+                rows = result.fetchall()
+                result.close()
+                conn.execute(
+                    """SELECT pg_notify('{channel}', payload) FROM unnest(%s::text[]) AS payload; """.format(
+                        channel=CHANNEL_NAME
+                    ),
+                    ([run_id + "_" + str(record_id) for run_id, record_id in rows],),
+                )
+
+        for event in events:
+            if is_asset_index_event(event):
+                self.store_asset_event(event)
+
     def store_asset_event(self, event):
         check.inst_param(event, "event", EventLogEntry)
         if not event.is_dagster_event or not event.dagster_event.asset_key:
@@ -242,19 +276,24 @@ def watch(self, run_id, cursor, callback):
             self._event_watcher = PostgresEventWatcher(
                 self.postgres_url,
                 [CHANNEL_NAME],
-                self._gen_event_log_entry_from_cursor,
+                self._gen_event_log_entries_from_cursors,
             )
 
         self._event_watcher.watch_run(run_id, cursor, callback)
 
-    def _gen_event_log_entry_from_cursor(self, cursor) -> EventLogEntry:
+    def _gen_event_log_entries_from_cursors(
+        self, cursors: Sequence[int]
+    ) -> Mapping[int, EventLogEntry]:
         with self._engine.connect() as conn:
             cursor_res = conn.execute(
-                db.select([SqlEventLogStorageTable.c.event]).where(
-                    SqlEventLogStorageTable.c.id == cursor
+                db.select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event]).where(
+                    SqlEventLogStorageTable.c.id.in_(cursors)
                 ),
             )
-            return deserialize_as(cursor_res.scalar(), EventLogEntry)
+            return {
+                record_id: deserialize_as(json_str, EventLogEntry)
+                for record_id, json_str in cursor_res.fetchall()
+            }
 
     def end_watch(self, run_id, handler):
         if self._event_watcher is None:
@@ -1,14 +1,14 @@
 import logging
 import threading
 from collections import defaultdict
-from typing import Callable, List, MutableMapping, Optional
+from typing import Callable, Dict, List, Mapping, MutableMapping, Optional, Sequence
 
 import dagster._check as check
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.storage.event_log.polling_event_watcher import CallbackAfterCursor
 
-from ..pynotify import await_pg_notifications
+from ..pynotify import await_pg_notification_batches
 
 POLLING_CADENCE = 0.25
 
@@ -20,9 +20,9 @@ def watcher_thread(
     watcher_thread_exit: threading.Event,
     watcher_thread_started: threading.Event,
     channels: List[str],
-    gen_event_log_entry_from_cursor: Callable[[int], EventLogEntry],
+    gen_event_log_entries_from_cursors: Callable[[Sequence[int]], Mapping[int, EventLogEntry]],
 ):
-    for notif in await_pg_notifications(
+    for notify_list in await_pg_notification_batches(
         conn_string,
         channels=channels,
         timeout=POLLING_CADENCE,
@@ -30,32 +30,50 @@ def watcher_thread(
         exit_event=watcher_thread_exit,
         started_event=watcher_thread_started,
     ):
-        if notif is None:
+        if notify_list is None:
             if watcher_thread_exit.is_set():
                 break
-        else:
-            run_id, index_str = notif.payload.split("_")
+            continue
+
+        # only fetch the records for runs that are currently being watched, and fetch all of them
+        # in a single query per wakeup
+        indices_by_run_id: Dict[str, List[int]] = defaultdict(list)
+        with dict_lock:
+            for notif in notify_list:
+                run_id, index_str = notif.payload.split("_")
+                if run_id in handlers_dict:
+                    indices_by_run_id[run_id].append(int(index_str))
+
+        if not indices_by_run_id:
+            continue
+
+        dagster_events_by_index = gen_event_log_entries_from_cursors(
+            [index for indices in indices_by_run_id.values() for index in indices]
+        )
+
+        for run_id, indices in indices_by_run_id.items():
             with dict_lock:
-                if run_id not in handlers_dict:
+                handlers = list(handlers_dict.get(run_id, []))
+
+            for index in sorted(indices):
+                dagster_event = dagster_events_by_index.get(index)
+                if dagster_event is None:
                     continue
 
-            index = int(index_str)
-            with dict_lock:
-                handlers = handlers_dict.get(run_id, [])
-
-            dagster_event = gen_event_log_entry_from_cursor(index)
-
-            for callback_with_cursor in handlers:
-                try:
-                    if (
-                        callback_with_cursor.cursor is None
-                        or EventLogCursor.parse(callback_with_cursor.cursor).storage_id() < index
-                    ):
-                        callback_with_cursor.callback(
-                            dagster_event, str(EventLogCursor.from_storage_id(index))
+                for callback_with_cursor in handlers:
+                    try:
+                        if (
+                            callback_with_cursor.cursor is None
+                            or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
+                            < index
+                        ):
+                            callback_with_cursor.callback(
+                                dagster_event, str(EventLogCursor.from_storage_id(index))
+                            )
+                    except:
+                        logging.exception(
+                            "Exception in callback for event watch on run %s.", run_id
                         )
-                except:
-                    logging.exception("Exception in callback for event watch on run %s.", run_id)
 
 
 class PostgresEventWatcher:
@@ -63,7 +81,7 @@ def __init__(
         self,
         conn_string: str,
         channels: List[str],
-        gen_event_log_entry_from_cursor: Callable[[int], EventLogEntry],
+        gen_event_log_entries_from_cursors: Callable[[Sequence[int]], Mapping[int, EventLogEntry]],
     ):
         self._conn_string: str = check.str_param(conn_string, "conn_string")
         self._handlers_dict: MutableMapping[str, List[CallbackAfterCursor]] = defaultdict(list)
@@ -72,9 +90,11 @@ def __init__(
         self._watcher_thread_started: Optional[threading.Event] = None
         self._watcher_thread: Optional[threading.Thread] = None
         self._channels: List[str] = check.list_param(channels, "channels")
-        self._gen_event_log_entry_from_cursor: Callable[
-            [int], EventLogEntry
-        ] = check.callable_param(gen_event_log_entry_from_cursor, "gen_event_log_entry_from_cursor")
+        self._gen_event_log_entries_from_cursors: Callable[
+            [Sequence[int]], Mapping[int, EventLogEntry]
+        ] = check.callable_param(
+            gen_event_log_entries_from_cursors, "gen_event_log_entries_from_cursors"
+        )
 
     def watch_run(
         self,
@@ -99,7 +119,7 @@ def watch_run(
                     self._watcher_thread_exit,
                     self._watcher_thread_started,
                     self._channels,
-                    self._gen_event_log_entry_from_cursor,
+                    self._gen_event_log_entries_from_cursors,
                 ),
                 name="postgres-event-watch",
             )
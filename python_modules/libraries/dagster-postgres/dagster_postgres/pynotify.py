@@ -98,6 +98,45 @@ def await_pg_notifications(
             1: None, in case of timeout
             2: Notify, in case of successful notification reception
     """
+    for notify_list in await_pg_notification_batches(
+        conn_string,
+        channels=channels,
+        timeout=timeout,
+        yield_on_timeout=yield_on_timeout,
+        exit_event=exit_event,
+        started_event=started_event,
+    ):
+        if notify_list is None:
+            yield None
+        else:
+            for notif in notify_list:
+                yield notif
+
+
+def await_pg_notification_batches(
+    conn_string: str,
+    channels: Optional[List[str]] = None,
+    timeout: float = 5.0,
+    yield_on_timeout: bool = False,
+    exit_event: Optional[Event] = None,
+    started_event: Optional[Event] = None,
+) -> Iterator[Optional[List[Notify]]]:
+    """Subscribe to PostgreSQL notifications, yielding all of the notifications received on each
+    wakeup of the listening connection together, so that consumers can process them in bulk.
+
+    Args:
+        conn_string (str): connection string to PG DB
+        channels (Optional[List[str]], optional): List of channel names to listen to. Defaults to None.
+        timeout (float, optional): Timeout interval. Defaults to 5.0.
+        yield_on_timeout (bool, optional): Should the function yield on timeout. Defaults to False.
+        exit_event (Optional[Event], optional): Event that indicates that polling for new notifications should stop. Defaults to None.
+        started_event (Optional[Event], optional): Event that this function can set to notify that the subscription has been established. Defaults to None.
+
+    Yields:
+        Iterator[Optional[List[Notify]]]: Can yield one of two types:
+            1: None, in case of timeout
+            2: List[Notify], the non-empty list of notifications received on a wakeup
+    """
 
     check.str_param(conn_string, "conn_string")
     channels = None if channels is None else check.list_param(channels, "channels", of_type=str)
@@ -130,8 +169,8 @@ def await_pg_notifications(
 
                     # copy the conn.notifies list/queue & empty it
                     notify_list, connection.notifies = connection.notifies, []
-                    for notif in notify_list:
-                        yield notif
+                    if notify_list:
+                        yield notify_list
 
             except select.error as e:
                 if e.errno == errno.EINTR:
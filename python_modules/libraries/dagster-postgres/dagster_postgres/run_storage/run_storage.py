@@ -127,6 +127,7 @@ def connect(self):
     def upgrade(self):
         with self.connect() as conn:
             run_alembic_upgrade(pg_alembic_config(__file__), conn)
+        self._clear_schema_cache()
 
     def has_built_index(self, migration_name):
         if migration_name not in self._index_migration_cache:
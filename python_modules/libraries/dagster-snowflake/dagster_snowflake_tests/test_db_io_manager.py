@@ -6,10 +6,25 @@
 from dagster_snowflake.db_io_manager import DbClient, DbIOManager, TablePartition, TableSlice
 from pendulum import datetime
 
-from dagster import AssetKey, InputContext, OutputContext, build_output_context
+from dagster import (
+    AssetKey,
+    DailyPartitionsDefinition,
+    InputContext,
+    OutputContext,
+    asset,
+    build_output_context,
+    in_process_executor,
+    io_manager,
+)
+from dagster._core.definitions import build_assets_job
 from dagster._core.definitions.time_window_partitions import TimeWindow
 from dagster._core.errors import DagsterInvalidDefinitionError
+from dagster._core.storage.tags import (
+    ASSET_PARTITION_RANGE_END_TAG,
+    ASSET_PARTITION_RANGE_START_TAG,
+)
 from dagster._core.types.dagster_type import resolve_dagster_type
+from dagster._legacy import execute_pipeline
 
 resource_config = {
     "database": "database_abc",
@@ -148,6 +163,54 @@ def test_asset_out_partitioned():
     assert handler.handle_input_calls[0][1] == table_slice
 
 
+def test_asset_out_partition_range():
+    handler = IntHandler()
+    db_client = MagicMock(spec=DbClient, get_select_statement=MagicMock(return_value=""))
+    manager = DbIOManager(type_handlers=[handler], db_client=db_client)
+
+    @io_manager(config_schema={"database": str})
+    def db_io_manager(_):
+        return manager
+
+    @asset(
+        key_prefix=["schema1"],
+        partitions_def=DailyPartitionsDefinition(start_date="2020-01-01"),
+        metadata={"partition_expr": "abc"},
+    )
+    def table1() -> int:
+        return 5
+
+    asset_job = build_assets_job(
+        "asset_job",
+        assets=[table1],
+        resource_defs={"io_manager": db_io_manager.configured({"database": "database_abc"})},
+        executor_def=in_process_executor,
+    )
+    result = execute_pipeline(
+        asset_job,
+        tags={
+            ASSET_PARTITION_RANGE_START_TAG: "2020-01-02",
+            ASSET_PARTITION_RANGE_END_TAG: "2020-01-04",
+        },
+    )
+    assert result.success
+
+    # a run covering a range of partitions replaces the whole range with one delete and one write
+    table_slice = TableSlice(
+        database="database_abc",
+        schema="schema1",
+        table="table1",
+        partition=TablePartition(
+            time_window=TimeWindow(datetime(2020, 1, 2), datetime(2020, 1, 5)),
+            partition_expr="abc",
+        ),
+    )
+    assert len(handler.handle_output_calls) == 1
+    assert handler.handle_output_calls[0][1:] == (table_slice, 5)
+    db_client.delete_table_slice.assert_called_once()
+    assert db_client.delete_table_slice.call_args[0][1] == table_slice
+
+
 def test_different_output_and_input_types():
     int_handler = IntHandler()
     str_handler = StringHandler()
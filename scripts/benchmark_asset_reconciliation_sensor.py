@@ -0,0 +1,85 @@
+# pylint: disable=print-call
+"""Times ticks of an asset reconciliation sensor against asset graphs of increasing size.
+
+Each graph is made of layers of ``LAYER_WIDTH`` assets, where every asset depends on the asset at
+the same position in the previous layer. The assets of the first layer are materialized before the
+first tick, and one of them again before the last tick. Every tick rebuilds the instance from its
+ref, like the sensor daemon does.
+
+Usage:
+
+    python benchmark_asset_reconciliation_sensor.py [NUM_ASSETS ...]
+"""
+import sys
+import time
+
+from dagster import (
+    AssetSelection,
+    DagsterInstance,
+    asset,
+    build_asset_reconciliation_sensor,
+    build_multi_asset_sensor_context,
+    materialize,
+    repository,
+)
+from dagster._core.test_utils import instance_for_test
+
+LAYER_WIDTH = 10
+DEFAULT_NUM_ASSETS = [100, 500, 1000, 2000]
+
+
+def layered_assets(num_assets):
+    def _make_asset(i):
+        deps = {f"asset_{i - LAYER_WIDTH}"} if i >= LAYER_WIDTH else set()
+
+        @asset(name=f"asset_{i}", non_argument_deps=deps)
+        def _asset():
+            return 1
+
+        return _asset
+
+    return [_make_asset(i) for i in range(num_assets)]
+
+
+def timed_tick(sensor, repository_def, instance, cursor):
+    context = build_multi_asset_sensor_context(
+        repository_def=repository_def,
+        asset_selection=AssetSelection.all(),
+        instance=DagsterInstance.from_ref(instance.get_ref()),
+        cursor=cursor,
+    )
+    start = time.perf_counter()
+    result = sensor.evaluate_tick(context)
+    return result, time.perf_counter() - start
+
+
+def benchmark(num_assets):
+    assets = layered_assets(num_assets)
+    sensor = build_asset_reconciliation_sensor(AssetSelection.all(), name="reconciliation_sensor")
+
+    @repository
+    def repo():
+        return [assets, sensor]
+
+    with instance_for_test() as instance:
+        materialize(assets[:LAYER_WIDTH], instance=instance)
+        first_tick, first_time = timed_tick(sensor, repo, instance, None)
+        _, idle_time = timed_tick(sensor, repo, instance, first_tick.cursor)
+        materialize(assets[:1], instance=instance)
+        _, update_time = timed_tick(sensor, repo, instance, first_tick.cursor)
+
+    print(
+        f"{num_assets:>8} {first_time * 1000:>14.1f} {idle_time * 1000:>14.1f}"
+        f" {update_time * 1000:>14.1f}"
+    )
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_NUM_ASSETS
+    print(f"{'assets':>8} {'first tick ms':>14} {'idle tick ms':>14} {'update tick ms':>14}")
+    for num_assets in sizes:
+        benchmark(num_assets)
+
+
+if __name__ == "__main__":
+    main()
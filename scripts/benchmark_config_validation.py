@@ -0,0 +1,106 @@
+# pylint: disable=print-call
+"""Times validating run config and resolving its defaults for jobs of increasing size.
+
+Each job is a chain of ``NUM_OPS`` ops, each with a nested config schema with defaults. Half of the
+ops are configured in the run config. The run config schema is built once per job, and
+``process_config`` and ``ResolvedRunConfig.build`` are timed against it, like launching a run does.
+
+Usage:
+
+    python benchmark_config_validation.py [NUM_OPS ...]
+"""
+import sys
+import time
+
+from dagster import Array, Field, In, Noneable, Selector, job, op
+from dagster._config import process_config
+from dagster._core.system_config.objects import ResolvedRunConfig
+
+DEFAULT_NUM_OPS = [100, 400, 800]
+NUM_REPETITIONS = 5
+
+OP_CONFIG_SCHEMA = {
+    "threshold": Field(float, default_value=0.5),
+    "labels": Field(Array(str), default_value=[]),
+    "storage": Field(
+        Selector(
+            {
+                "filesystem": {"base_dir": Field(str, default_value="/tmp")},
+                "memory": Field({}),
+            }
+        ),
+        default_value={"filesystem": {}},
+    ),
+    "retry": {
+        "max_retries": Field(int, default_value=3),
+        "delay": Field(Noneable(float), default_value=None),
+    },
+}
+
+
+def chained_job(num_ops):
+    def _make_op(i):
+        @op(name=f"op_{i}", config_schema=OP_CONFIG_SCHEMA, ins={"value": In(default_value=0)})
+        def _op(value):
+            return value
+
+        return _op
+
+    ops = [_make_op(i) for i in range(num_ops)]
+
+    @job(name=f"chained_job_{num_ops}")
+    def _job():
+        value = ops[0]()
+        for next_op in ops[1:]:
+            value = next_op(value)
+
+    return _job
+
+
+def run_config_for(num_ops):
+    return {
+        "ops": {
+            f"op_{i}": {"config": {"threshold": 0.1, "retry": {"max_retries": 1}}}
+            for i in range(0, num_ops, 2)
+        }
+    }
+
+
+def timed(fn):
+    # the first call includes building any cached state, later calls are steady-state
+    start = time.perf_counter()
+    fn()
+    first = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(NUM_REPETITIONS):
+        fn()
+    return first, (time.perf_counter() - start) / NUM_REPETITIONS
+
+
+def benchmark(num_ops):
+    job_def = chained_job(num_ops)
+    run_config = run_config_for(num_ops)
+    config_type = job_def.get_run_config_schema("default").config_type
+
+    process_first, process_time = timed(lambda: process_config(config_type, run_config))
+    build_first, build_time = timed(lambda: ResolvedRunConfig.build(job_def, run_config))
+
+    print(
+        f"{num_ops:>8} {process_first * 1000:>14.1f} {process_time * 1000:>14.1f}"
+        f" {build_first * 1000:>14.1f} {build_time * 1000:>14.1f}"
+    )
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_NUM_OPS
+    print(
+        f"{'ops':>8} {'process 1st ms':>14} {'process ms':>14} {'build 1st ms':>14}"
+        f" {'build ms':>14}"
+    )
+    for num_ops in sizes:
+        benchmark(num_ops)
+
+
+if __name__ == "__main__":
+    main()
@@ -78,6 +78,7 @@ def main(quiet: bool, extra_packages: List[str]) -> None:
         "-e python_modules/libraries/dagster-msteams",
         "-e python_modules/libraries/dagster-duckdb",
         "-e python_modules/libraries/dagster-duckdb-pandas",
+        "-e python_modules/libraries/dagster-duckdb-pyarrow",
         "-e python_modules/libraries/dagster-duckdb-pyspark",
         "-e helm/dagster/schema[test]",
     ]